@@ -0,0 +1,59 @@
+"""
+Throughput of float and exact conversions: for every quantity, conversions
+per second of a float scalar, of an exact (Fraction) scalar, and of floats
+converted in bulk with convert_many, plus the largest relative error of the
+float conversions against the exact ones over every unit pair.
+
+Run from the repository root after `pip install -e .`:
+
+    python benchmarks/exact_conversion.py
+"""
+
+import timeit
+from fractions import Fraction
+
+import numpy as np
+
+from physics_TUI.unit_converter import catalog
+
+CALLS = 20_000
+BULK = 1_000_000
+
+
+def per_second(stmt, number: int) -> float:
+    """Calls per second of `stmt`, best of three runs"""
+    return number / min(timeit.repeat(stmt, number=number, repeat=3))
+
+
+def main() -> None:
+    print(f"{'quantity':10} {'float/s':>12} {'exact/s':>12} {'ratio':>7} {'bulk/s':>12} {'max float error':>16}")
+
+    for quantity in catalog():
+        units = list(quantity.get_units())
+        first, last = units[0], units[-1]
+
+        floats = per_second(lambda: quantity.conversion(1.5, first, last), CALLS)
+        exact = per_second(lambda: quantity.conversion(1.5, first, last, exact=True), CALLS)
+
+        values = np.ones(BULK)
+
+        def there_and_back() -> None:
+            quantity.convert_many(values, first, last)
+            quantity.convert_many(values, last, first)
+
+        bulk = per_second(there_and_back, 10) * 2 * BULK
+
+        error = max(
+            abs(Fraction(quantity.conversion(1.5, a, b)) / quantity.conversion(1.5, a, b, exact=True) - 1)
+            for a in units
+            for b in units
+        )
+
+        print(
+            f"{quantity.id:10} {floats:12,.0f} {exact:12,.0f} {floats / exact:6.1f}x "
+            f"{bulk:12.3g} {float(error):16.2e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
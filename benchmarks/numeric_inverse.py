@@ -0,0 +1,69 @@
+"""
+Cost of the numeric inverse solves: for every unknown without a closed-form
+branch, the mean iterations and latency of one solve and of a run of
+nearby solves, plus the per-element time of an array solve.
+
+Run from the repository root after `pip install -e .`:
+
+    python benchmarks/numeric_inverse.py
+"""
+
+import random
+import sys
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from solver_dispatch import calculable_equations, sample_knowns  # noqa: E402
+
+ROWS = 100_000
+
+
+def main() -> None:
+    print(
+        f"{'equation':58} {'unknown':14} {'once it':>8} {'once':>9} "
+        f"{'nearby it':>9} {'nearby':>9} {'array/row':>10}"
+    )
+
+    for _, equation in calculable_equations():
+        solver = equation.solver
+        for unknown in solver.numeric_unknowns:
+            knowns = sample_knowns(solver, unknown)
+            if knowns is None:
+                continue
+            solve = equation.solver_for(unknown)
+            stats = solver.stats[unknown]
+
+            stats.reset()
+            solve(**knowns)
+            once_iterations, once_latency = stats.mean_iterations, stats.mean_latency
+
+            # Nearby problems, as when a user edits one value at a time
+            rng = random.Random(1)
+            stats.reset()
+            for _ in range(200):
+                try:
+                    solve(**{k: v * rng.uniform(0.99, 1.01) for k, v in knowns.items()})
+                except ValueError:
+                    pass
+            nearby_iterations, nearby_latency = stats.mean_iterations, stats.mean_latency
+
+            columns = {
+                k: v * np.random.default_rng(2).uniform(0.9, 1.1, ROWS) for k, v in knowns.items()
+            }
+            start = perf_counter()
+            solver.solve_array(unknown, columns)
+            per_row = (perf_counter() - start) / ROWS
+
+            print(
+                f"{solver.qualname:58} {unknown:14} {once_iterations:8.1f} "
+                f"{once_latency * 1e6:7.1f}us {nearby_iterations:9.1f} "
+                f"{nearby_latency * 1e6:7.1f}us {per_row * 1e9:8.0f}ns"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+"""
+Per-call latency of solving every calculable equation for every unknown
+with the pre-bound solver returned by Equation.solver_for, against the
+Calculate methods, which re-discover the missing argument on each call.
+
+Calculate is timed twice: in this tree and in BASELINE_REVISION, the last
+revision before the solvers were added. The baseline is exported with
+`git archive` to a temporary directory and timed in a child interpreter,
+one round at a time in step with this one, so that drift in machine load
+affects every column alike. Each sample is sized to take about TARGET
+seconds, so a full run takes a few seconds per round.
+
+Run from the repository root:
+
+    python benchmarks/solver_dispatch.py
+    python benchmarks/solver_dispatch.py --only Chapter7 --rounds 3
+"""
+
+import argparse
+import inspect
+import io
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+import timeit
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from physics_TUI.base_chapter import Equation, PhysicsChapter  # noqa: E402
+from physics_TUI.registry import default_registry  # noqa: E402
+from physics_TUI.solver import EquationSolver  # noqa: E402
+
+BASELINE_REVISION = "ec0bcc8"  # parent of the first solver commit, a7110c8
+TARGET = 0.001  # seconds per sample
+ROUNDS = 5
+
+Case = Tuple[str, str, str, Dict[str, Optional[float]], int]  # module, class, method, kwargs, calls
+
+WORKER = """
+import importlib, json, sys, timeit
+
+cases = json.loads(sys.stdin.readline())
+timers = []
+for module, chapter, method, kwargs, number in cases:
+    try:
+        calculation = getattr(getattr(importlib.import_module(module), chapter).Calculate, method)
+        calculation(**kwargs)
+    except Exception:
+        timers.append((None, 1))
+        continue
+    call = ", ".join(f"{key}=_{i}" for i, key in enumerate(kwargs))
+    names = {f"_{i}": value for i, value in enumerate(kwargs.values())}
+    timers.append((timeit.Timer(f"f({call})", globals={"f": calculation, **names}), number))
+
+for _ in sys.stdin:
+    print(json.dumps([t.timeit(n) / n if t else None for t, n in timers]), flush=True)
+"""
+
+
+def calculable_equations() -> Iterator[Tuple[PhysicsChapter, Equation]]:
+    """Yields every equation that has a solver, with its chapter"""
+    for chapter in default_registry().get_chapters():
+        for equation in chapter.get_calculable_equations():
+            if equation.solver is not None:
+                yield chapter, equation
+
+
+def sample_knowns(
+    solver: EquationSolver, unknown: str, seed: int = 0, attempts: int = 200
+) -> Optional[Dict[str, float]]:
+    """
+    Finds values for every variable but `unknown` that the solver accepts.
+    Values are drawn at random, then one other variable is solved for so the
+    set is consistent with the equation.
+    """
+    rng = random.Random(seed)
+
+    for _ in range(attempts):
+        values = {
+            var: rng.uniform(10.0, 60.0) if "theta" in var else rng.uniform(0.5, 5.0)
+            for var in solver.variables
+        }
+        anchors = [var for var in solver.unknowns if var != unknown]
+        anchor = rng.choice(anchors) if anchors else None
+
+        try:
+            if anchor is not None:
+                del values[anchor]
+                values[anchor] = solver.solve(
+                    anchor, {k: v for k, v in values.items() if k != unknown}
+                    | {unknown: values[unknown]}
+                )
+            knowns = {k: v for k, v in values.items() if k != unknown}
+            solver.solve(unknown, knowns)
+        except ValueError:
+            continue
+
+        return knowns
+
+    return None
+
+
+def timer(function: Callable[..., Any], kwargs: Dict[str, Optional[float]]) -> timeit.Timer:
+    """
+    Timer for function(**kwargs). The call is written out with literal
+    keywords so the timing loop adds as little as possible.
+    """
+
+    names = {f"_{i}": value for i, value in enumerate(kwargs.values())}
+    call = ", ".join(f"{key}=_{i}" for i, key in enumerate(kwargs))
+    return timeit.Timer(f"function({call})", globals={"function": function, **names})
+
+
+def calls_per_sample(t: timeit.Timer) -> int:
+    """Number of calls that makes one sample of `t` take about TARGET seconds"""
+    number = 1
+    while (elapsed := t.timeit(number)) < TARGET / 10:
+        number *= 10
+    return max(1, int(number * TARGET / elapsed))
+
+
+def calculation_call(
+    equation: Equation, unknown: str, knowns: Dict[str, float]
+) -> Optional[Dict[str, Optional[float]]]:
+    """Arguments for the Calculate method, or None if it cannot handle the unknown"""
+    if equation.calculation is None:
+        return None
+
+    parameters = inspect.signature(equation.calculation).parameters
+    kwargs: Dict[str, Optional[float]] = dict(knowns)
+    kwargs[unknown] = None
+
+    if set(kwargs) != set(parameters):
+        return None
+
+    try:
+        equation.calculation(**kwargs)
+    except Exception:
+        return None
+
+    return kwargs
+
+
+def export_revision(revision: str, directory: str) -> Path:
+    """Extracts the src tree of a git revision into `directory` and returns its path"""
+    archive = subprocess.run(
+        ["git", "archive", "--format=tar", revision, "src"],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+    ).stdout
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(directory)
+    return Path(directory) / "src"
+
+
+class BaselineCalculate:
+    """
+    Child interpreter timing Calculate methods of another source tree. Each
+    call to sample() times every case once and returns the per-call times
+    in seconds, None where the baseline cannot make the call.
+    """
+
+    def __init__(self, source: Path, cases: List[Case]) -> None:
+        self.process = subprocess.Popen(
+            [sys.executable, "-c", WORKER],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            env=dict(os.environ, PYTHONPATH=str(source)),
+        )
+        self.send(json.dumps(cases))
+
+    def send(self, line: str) -> None:
+        assert self.process.stdin is not None
+        self.process.stdin.write(line + "\n")
+        self.process.stdin.flush()
+
+    def sample(self) -> List[Optional[float]]:
+        assert self.process.stdout is not None
+        self.send("")
+        return json.loads(self.process.stdout.readline())
+
+    def close(self) -> None:
+        assert self.process.stdin is not None
+        self.process.stdin.close()
+        self.process.wait()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--revision", default=BASELINE_REVISION, help=f"baseline revision (default: {BASELINE_REVISION})")
+    parser.add_argument("--rounds", type=int, default=ROUNDS, help=f"samples per timer (default: {ROUNDS})")
+    parser.add_argument("--only", metavar="PREFIX", help="only time equations whose name starts with PREFIX")
+    args = parser.parse_args(argv)
+
+    names: List[Tuple[str, str]] = []
+    timers: List[Tuple[timeit.Timer, Optional[timeit.Timer], int]] = []
+    cases: List[Case] = []
+
+    for chapter, equation in calculable_equations():
+        solver = equation.solver
+        if args.only is not None and not solver.qualname.startswith(args.only):
+            continue
+        for unknown in solver.unknowns:
+            knowns = sample_knowns(solver, unknown)
+            if knowns is None:
+                continue
+
+            after = timer(equation.solver_for(unknown), knowns)
+            kwargs = calculation_call(equation, unknown, knowns)
+            current = timer(equation.calculation, kwargs) if kwargs is not None else None
+            number = calls_per_sample(current or after)
+
+            names.append((solver.qualname, unknown))
+            timers.append((after, current, number))
+            cases.append(
+                (type(chapter).__module__, type(chapter).__name__, equation.calculation.__name__, kwargs, number)
+                if kwargs is not None
+                else ("", "", "", {}, 1)
+            )
+
+    # (baseline Calculate, Calculate, solver_for) per solve, best of the rounds
+    best = [[float("inf")] * 3 for _ in names]
+    with tempfile.TemporaryDirectory() as directory:
+        baseline = BaselineCalculate(export_revision(args.revision, directory), cases)
+        for _ in range(args.rounds):
+            for row, before in zip(best, baseline.sample()):
+                row[0] = min(row[0], before if before is not None else float("inf"))
+            for row, (after, current, number) in zip(best, timers):
+                if current is not None:
+                    row[1] = min(row[1], current.timeit(number) / number)
+                row[2] = min(row[2], after.timeit(number) / number)
+        baseline.close()
+
+    def text(seconds: float) -> str:
+        return f"{seconds * 1e9:8.0f} ns" if seconds < float("inf") else f"{'n/a':>11}"
+
+    print(f"{'equation':58} {'unknown':22} {args.revision + ' Calc':>11} {'Calculate':>11} {'solver_for':>11} {'speedup':>8}")
+    for (name, unknown), (before, current, after) in zip(names, best):
+        speedup = f"{before / after:7.2f}x" if before < float("inf") else f"{'':>8}"
+        print(f"{name:58} {unknown:22} {text(before)} {text(current)} {text(after)} {speedup}")
+
+    speedups = [before / after for before, _, after in best if before < float("inf")]
+    if speedups:
+        print(
+            f"\n{len(best)} solves, {len(speedups)} also handled by Calculate at {args.revision}: "
+            f"solver_for geometric mean speedup {statistics.geometric_mean(speedups):.2f}x, "
+            f"range {min(speedups):.2f}x to {max(speedups):.2f}x, "
+            f"faster on {sum(s > 1 for s in speedups)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
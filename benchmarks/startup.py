@@ -0,0 +1,69 @@
+"""
+Time to first frame of the TUI, with chapters loaded lazily from the
+manifest (the default) and with every chapter imported and constructed
+up front as the app used to do. Each run is a fresh interpreter so that
+import costs are included.
+
+Run from the repository root after `pip install -e .`:
+
+    python benchmarks/startup.py
+"""
+
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+RUNS = 7
+
+CHILD = """
+from time import perf_counter
+start = perf_counter()
+
+import asyncio
+from physics_TUI.app import physicsTUIApp
+
+if {eager}:
+    from physics_TUI.registry import default_registry
+    default_registry().get_chapters()
+
+async def first_frame():
+    app = physicsTUIApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        print(perf_counter() - start)
+
+asyncio.run(first_frame())
+"""
+
+
+def time_to_first_frame(eager: bool) -> float:
+    """Seconds from interpreter start-up to the first rendered frame"""
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD.format(eager=eager)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(output.split()[-1])
+
+
+def main() -> None:
+    timings: Dict[str, List[float]] = {"eager": [], "lazy": []}
+
+    # Alternate the modes so that drift in machine load affects both alike
+    for _ in range(RUNS):
+        for mode in timings:
+            timings[mode].append(time_to_first_frame(mode == "eager"))
+
+    for mode, values in timings.items():
+        print(
+            f"{mode:6} median {statistics.median(values) * 1e3:7.1f} ms  "
+            f"best {min(values) * 1e3:7.1f} ms"
+        )
+    speedup = statistics.median(timings["eager"]) / statistics.median(timings["lazy"])
+    print(f"\nLazy loading starts {speedup:.2f}x faster")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,352 @@
+"""
+Benchmark suite with regression checks. It times:
+
+- every Calculate method for each unknown it accepts
+- Quantity.conversion for every pair of units
+- Quantity.convert_many over a million values for every quantity
+- a projectile sweep and the best launch angle over a million launches
+- rendering the equations and definitions pages of every chapter, which
+  is what update_content_equations and update_content_definitions cost
+  on a cache miss
+- cold start of physicsTUIApp to its first frame
+
+Every metric is sampled once per round and the best sample is kept, so
+that a burst of machine load only spoils one sample of each metric.
+Samples are divided by the time of a fixed reference workload measured
+alongside them. This cancels out changes in machine speed, both during a
+run and between runs.
+
+Every Calculate metric is also compared with the same method at
+BASELINE_REVISION, the tree before the solvers were added, timed in a
+child interpreter in step with the other samples. This catches a Calculate
+that got slower than the original cascade even when the baseline file was
+recorded after the slowdown.
+
+The results are compared with a baseline JSON file, which is specific to
+the machine it was recorded on and is not committed. The run fails when a
+metric is slower than its baseline by more than the threshold and by more
+than a small absolute margin, below which timings are mostly noise.
+Without a baseline file, or with --update, the results become the new
+baseline.
+
+Run from the repository root after `pip install -e .`:
+
+    python benchmarks/suite.py                      # compare with benchmarks/baseline.json
+    python benchmarks/suite.py --update             # record a new baseline
+    python benchmarks/suite.py --threshold 0.5 --only convert.
+    python benchmarks/suite.py --revision ""        # skip the Calculate comparison
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import timeit
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from solver_dispatch import (  # noqa: E402
+    BASELINE_REVISION,
+    BaselineCalculate,
+    Case,
+    calculable_equations,
+    calculation_call,
+    calls_per_sample,
+    export_revision,
+    sample_knowns,
+    timer,
+)
+from startup import time_to_first_frame  # noqa: E402
+
+from physics_TUI.registry import default_registry  # noqa: E402
+
+BASELINE = Path(__file__).parent / "baseline.json"
+THRESHOLD = 0.25  # allowed slowdown as a fraction of the baseline
+MIN_DELTA = 100e-9  # slowdowns smaller than this many seconds are ignored
+TARGET = 0.005  # seconds per sample
+ROUNDS = 7
+REFERENCE_EVERY = 20  # metrics sampled between reference samples
+
+Metric = Tuple[str, Callable[[], float]]  # name and a function taking one sample
+
+
+def per_call(stmt: Callable[[], object]) -> Callable[[], float]:
+    """
+    Sampler of the per-call time of `stmt` in seconds. The first sample
+    sizes the number of calls so that each sample takes about TARGET.
+    """
+
+    timer = timeit.Timer(stmt)
+    number = 0
+
+    def sample() -> float:
+        nonlocal number
+        if not number:
+            number = 1
+            while timer.timeit(number) < TARGET / 10:
+                number *= 10
+            number = max(1, int(number * TARGET / max(timer.timeit(number), 1e-9)))
+        return timer.timeit(number) / number
+
+    return sample
+
+
+def reference_workload() -> float:
+    """Fixed mix of dict lookups and float arithmetic that metrics are measured in"""
+    factors = {"from": 1.5, "to": 0.25}
+    total = 0.0
+    for i in range(100):
+        total += i * factors["from"] / factors["to"]
+    return total
+
+
+@lru_cache(maxsize=None)
+def calculate_calls() -> Tuple[Tuple[str, Callable[..., float], Case], ...]:
+    """
+    Metric name, Calculate method and the same call as a case for
+    BaselineCalculate, for every Calculate method and unknown it accepts
+    """
+
+    calls = []
+    for chapter, equation in calculable_equations():
+        for unknown in equation.solver.unknowns:
+            knowns = sample_knowns(equation.solver, unknown)
+            if knowns is None:
+                continue
+            kwargs = calculation_call(equation, unknown, knowns)
+            if kwargs is None:
+                continue
+            calculation = equation.calculation
+            case: Case = (
+                type(chapter).__module__,
+                type(chapter).__name__,
+                calculation.__name__,
+                kwargs,
+                calls_per_sample(timer(calculation, kwargs)),
+            )
+            calls.append((f"calculate.{equation.id}.{unknown}", calculation, case))
+    return tuple(calls)
+
+
+def calculate_metrics() -> Iterator[Metric]:
+    """
+    One metric per Calculate method and unknown, timed with the same calls
+    per sample and the same harness as BaselineCalculate uses
+    """
+
+    for name, calculation, (*_, kwargs, number) in calculate_calls():
+        yield name, lambda t=timer(calculation, kwargs), number=number: t.timeit(number) / number
+
+
+def conversion_metrics() -> Iterator[Metric]:
+    """One metric per quantity and ordered pair of units"""
+
+    for quantity in default_registry().get_quantities():
+        for from_unit in quantity.get_units():
+            for to_unit in quantity.get_units():
+                yield f"convert.{quantity.id}.{from_unit}.{to_unit}", per_call(
+                    lambda quantity=quantity, from_unit=from_unit, to_unit=to_unit: (
+                        quantity.conversion(1.5, from_unit, to_unit)
+                    )
+                )
+
+
+def bulk_conversion_metrics() -> Iterator[Metric]:
+    """
+    One metric per quantity, converting a million values in place there and
+    back, so that repeated calls do not drive them to overflow or underflow
+    """
+
+    import numpy as np
+
+    values = np.ones(1_000_000)
+
+    def there_and_back(quantity, from_unit, to_unit) -> None:
+        quantity.convert_many(values, from_unit, to_unit)
+        quantity.convert_many(values, to_unit, from_unit)
+
+    for quantity in default_registry().get_quantities():
+        units = list(quantity.get_units())
+        yield f"convert_many.{quantity.id}", per_call(
+            lambda quantity=quantity, units=units: there_and_back(quantity, units[0], units[-1])
+        )
+
+
+def sweep_metrics() -> Iterator[Metric]:
+    """A thousand by thousand projectile sweep, and a million best launch angles"""
+
+    import numpy as np
+
+    from physics_TUI.projectile import best_launch_angle, projectile_sweep
+
+    theta = np.linspace(0.0, 90.0, 1000)
+    speeds = np.linspace(1.0, 100.0, 1000)
+    yield "sweep.projectile", per_call(lambda: projectile_sweep(theta, speeds, 2.0))
+
+    launches = np.linspace(1.0, 100.0, 1_000_000)
+    yield "sweep.best_launch_angle", per_call(lambda: best_launch_angle(launches, 2.0, max_apex=50.0))
+
+
+def render_metrics() -> Iterator[Metric]:
+    """One metric per chapter page, timing the uncached render"""
+
+    from textual.content import Content
+
+    from physics_TUI.app import physicsTUIApp
+
+    app = physicsTUIApp()
+    for chapter in default_registry().get_chapters():
+        for view, render in (
+            ("equations", app.render_equations),
+            ("definitions", app.render_definitions),
+        ):
+            yield f"render.{chapter.id}.{view}", per_call(
+                lambda render=render, chapter=chapter: Content.from_markup(render(chapter))
+            )
+
+
+def startup_metrics() -> Iterator[Metric]:
+    """Time to the first frame of a freshly started app"""
+    yield "startup.first_frame", lambda: time_to_first_frame(eager=False)
+
+
+SUITES = (
+    calculate_metrics,
+    conversion_metrics,
+    bulk_conversion_metrics,
+    sweep_metrics,
+    render_metrics,
+    startup_metrics,
+)
+
+
+def run(
+    only: Optional[str] = None, revision: str = BASELINE_REVISION
+) -> Tuple[Dict[str, float], Dict[str, float], float]:
+    """
+    Best of ROUNDS samples of every metric whose name starts with `only`,
+    and of the Calculate metrics at `revision` unless it is empty, both in
+    units of the reference workload, and the reference time in seconds.
+    """
+
+    metrics = [
+        (name, sample)
+        for suite in SUITES
+        for name, sample in suite()
+        if only is None or name.startswith(only)
+    ]
+    selected = {name for name, _ in metrics}
+    calls = [(name, case) for name, _, case in calculate_calls() if name in selected] if revision else []
+    reference = per_call(reference_workload)
+    reference_seconds = float("inf")
+
+    results: Dict[str, float] = {}
+    before: Dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        baseline = (
+            BaselineCalculate(export_revision(revision, directory), [case for _, case in calls])
+            if calls
+            else None
+        )
+        for _ in range(ROUNDS):
+            for i, (name, sample) in enumerate(metrics):
+                if i % REFERENCE_EVERY == 0:
+                    current = reference()
+                    reference_seconds = min(reference_seconds, current)
+                    if baseline is not None and i == 0:
+                        for (call, _), seconds in zip(calls, baseline.sample()):
+                            if seconds is not None:
+                                before[call] = min(before.get(call, float("inf")), seconds / current)
+                results[name] = min(results.get(name, float("inf")), sample() / current)
+        if baseline is not None:
+            baseline.close()
+    return results, before, reference_seconds
+
+
+def compare(
+    results: Dict[str, float],
+    baseline: Dict[str, float],
+    threshold: float,
+    min_delta: float = 0.0,
+) -> List[Tuple[str, float, float]]:
+    """
+    Metrics slower than their baseline by more than the fraction
+    `threshold` and by more than `min_delta` in absolute terms
+    """
+    return [
+        (name, baseline[name], value)
+        for name, value in results.items()
+        if name in baseline
+        and value > baseline[name] * (1 + threshold)
+        and value - baseline[name] > min_delta
+    ]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--baseline", type=Path, default=BASELINE, help="baseline JSON file")
+    parser.add_argument("--update", action="store_true", help="record the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help=f"allowed slowdown (default: {THRESHOLD})")
+    parser.add_argument("--min-delta", type=float, default=MIN_DELTA, help=f"ignored slowdown in seconds (default: {MIN_DELTA:g})")
+    parser.add_argument("--only", metavar="PREFIX", help="only run metrics whose name starts with PREFIX")
+    parser.add_argument("--revision", default=BASELINE_REVISION, help=f"revision to compare Calculate with (default: {BASELINE_REVISION})")
+    args = parser.parse_args(argv)
+
+    results, before, reference_seconds = run(args.only, args.revision)
+    slower = compare(results, before, args.threshold, args.min_delta / reference_seconds)
+    for name, then, now in slower:
+        print(
+            f"SLOWER THAN {args.revision} {name:66} {then * reference_seconds * 1e6:10.3f} us -> "
+            f"{now * reference_seconds * 1e6:10.3f} us ({now / then:.2f}x)"
+        )
+    if before:
+        ratios = [results[name] / value for name, value in before.items()]
+        print(
+            f"{len(before)} Calculate metrics compared with {args.revision}, geometric mean "
+            f"{statistics.geometric_mean(ratios):.2f}x, {len(slower)} over the {args.threshold:.0%} threshold\n"
+        )
+
+    if args.update or not args.baseline.exists():
+        metrics = results
+        if args.baseline.exists() and args.only is not None:
+            metrics = {**json.loads(args.baseline.read_text())["metrics"], **results}
+        document = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "unit": "reference workload",
+            "reference_seconds": reference_seconds,
+            "metrics": dict(sorted(metrics.items())),
+        }
+        args.baseline.write_text(json.dumps(document, indent=2) + "\n")
+        print(f"Recorded {len(results)} metrics in {args.baseline}")
+        return 1 if slower else 0
+
+    baseline = json.loads(args.baseline.read_text())["metrics"]
+    regressions = compare(results, baseline, args.threshold, args.min_delta / reference_seconds)
+    ratios = [value / baseline[name] for name, value in results.items() if name in baseline]
+
+    print(f"Reference workload: {reference_seconds * 1e6:.3f} us per call")
+    for name, before, after in regressions:
+        print(
+            f"REGRESSION {name:80} {before * reference_seconds * 1e6:10.3f} us -> "
+            f"{after * reference_seconds * 1e6:10.3f} us ({after / before:.2f}x)"
+        )
+    new = sorted(set(results) - set(baseline))
+    if new:
+        print(f"{len(new)} metrics have no baseline yet, e.g. {new[0]}")
+    if ratios:
+        print(
+            f"{len(ratios)} metrics compared, geometric mean {statistics.geometric_mean(ratios):.2f}x "
+            f"of baseline, {len(regressions)} over the {args.threshold:.0%} threshold"
+        )
+
+    return 1 if regressions or slower else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,86 +1,230 @@
-from typing import Any, List, Dict, Tuple, Optional
+from functools import partial
+from math import isnan
+from typing import TYPE_CHECKING, Any, List, Dict, Tuple, Optional
 import re
 
+from rich.segment import Segment
+from rich.style import Style
+
+from textual import events
 from textual.app import App, ComposeResult
 from textual.binding import Binding
-from textual.widgets import Header, Footer, Tree, Button, Static, Input, OptionList, Select
+from textual.timer import Timer
+from textual.widgets import Header, Footer, Tree, Button, Static, Input, OptionList, Select, LoadingIndicator, DataTable
+from textual.worker import Worker, WorkerState
 from textual.containers import Horizontal, VerticalScroll
+from textual.content import Content
+from textual.geometry import Size
 from textual.screen import Screen
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+from textual.suggester import Suggester
 
 from physics_TUI.base_chapter import *
-from physics_TUI.chapters.chapter3 import Chapter3
-from physics_TUI.chapters.chapter4 import Chapter4
-from physics_TUI.chapters.chapter5 import Chapter5
-from physics_TUI.chapters.chapter6 import Chapter6
-from physics_TUI.chapters.chapter7 import Chapter7
-from physics_TUI.chapters.chapter8 import Chapter8
-from physics_TUI.chapters.chapter9 import Chapter9
-from physics_TUI.chapters.chapter10 import Chapter10
-from physics_TUI.chapters.chapter11 import Chapter11
-from physics_TUI.chapters.chapter12 import Chapter12
-from physics_TUI.chapters.chapter13 import Chapter13
-from physics_TUI.chapters.chapter14 import Chapter14
-
-from physics_TUI.unit_converter import Length, Time, Mass, Force, Energy, Pressure, Speed
+from physics_TUI.registry import Registry, default_registry
+from physics_TUI.unit_converter import Quantity
+from physics_TUI.unit_index import UnitIndex, default_unit_index
+
+# The tool screens import their modules when first used, so starting the
+# app does not load the grid, the plot or the chapter 4 solvers
+if TYPE_CHECKING:
+    from physics_TUI.grid import Grid
+    from physics_TUI.plot import TrajectoryPlot
+    from physics_TUI.unit_parser import CompoundUnit
+
+# Cached chapter pages are keyed by (chapter id, view)
+RenderKey = Tuple[str, str]
+
+# Seconds a calculation may run before it is abandoned
+CALCULATION_TIMEOUT: float = 10.0
+
+# Decimal places results are shown with
+RESULT_DECIMALS: int = 4
+
+# Seconds of typing inactivity before the all-units table is recomputed
+CONVERSION_DEBOUNCE: float = 0.15
+
+# Seconds after the last resize before a trajectory is plotted at the new size
+PLOT_DEBOUNCE: float = 0.1
+
+
+class UnitSuggester(Suggester):
+    """Completes unit names and symbols from the unit index"""
+
+    def __init__(self, index: UnitIndex) -> None:
+        super().__init__(case_sensitive=True)
+        self.index = index
+
+    async def get_suggestion(self, value: str) -> Optional[str]:
+        matches = self.index.prefix(value, limit=1)
+        return value + matches[0].key[len(value):] if matches and value else None
 
 
 class UnitConverterScreen(Screen):
-    """Screen for displaying the unit converter form for conversions"""
+    """
+    Screen for displaying the unit converter form for conversions. Besides
+    the single conversion of the Convert button, a table shows the entered
+    value in every unit of the quantity, kept up to date as the user types.
+    A unit can also be searched for by name or symbol, which selects its
+    quantity as well.
+    """
 
     BINDINGS = [
         Binding("escape", "go_back", "Back")
     ]
 
-    def __init__(self) -> None:
+    def __init__(self, registry: Optional[Registry] = None) -> None:
         super().__init__()
-        self.quantity_list: List[Any] = [
-            Length(),
-            Time(),
-            Mass(),
-            Force(),
-            Energy(),
-            Pressure(),
-            Speed(),
-        ]
+        self.registry: Registry = registry or default_registry()
+        self.quantity_list: List[Quantity] = self.registry.get_quantities()
+        self.table_timer: Optional[Timer] = None
+        self.table_quantity: Optional[Quantity] = None  # quantity whose units are the table rows
+        self.unit_index: UnitIndex = default_unit_index()
+        self.units_quantity: Optional[str] = None  # quantity the unit options belong to
 
     def compose(self) -> ComposeResult:
         """Creates the unit converter selection layout"""
         
-        quantity_options: List[Tuple[str, str]]= [(quantity.name, quantity.name) for quantity in self.quantity_list]
+        quantity_options: List[Tuple[str, str]]= [(quantity.name, quantity.id) for quantity in self.quantity_list]
         yield Header()
 
         with VerticalScroll(id="unit-converter-contianer"):
             yield Static("Unit Converter Tool", id="unit-converter-title")
+            yield Input(placeholder="Find a unit, e.g. mi/h or psi", id="unit-search", suggester=UnitSuggester(self.unit_index))
             yield Select(quantity_options, prompt="Select a quantity type",id="quantity-selection")
             yield Input(placeholder="Enter a value", id="unit-converter-input")
             yield Select(options=(), allow_blank=True, prompt="Select unit you are converting from", id="unit-converter-unit1-selection")
             yield Select(options=(), allow_blank=True, prompt="Select unit you are converting to", id="unit-converter-unit2-selection") 
             yield Button("Convert", id="convert-button", variant="primary")
+            yield Input(placeholder="Or type a conversion, e.g. 500 J/s to hp", id="expression-input")
             yield Static("", id="conversion-result")
+            yield DataTable(id="all-units-table", cursor_type="row", zebra_stripes=True)
             yield Footer()
+
+    def on_mount(self) -> None:
+        """Sets up the columns of the all-units table"""
+        table = self.query_one("#all-units-table", DataTable)
+        table.add_column("Unit", key="unit")
+        table.add_column("Value", key="value")
     
     def on_select_changed(self, event: Select.Changed) -> None:
         """Handle quantity selection change to populate unit options"""
         if event.select.id == "quantity-selection":
-            selected_quantity_name = event.value
-            
-            # Find the selected quantity object
-            selected_quantity = None
-            for quantity in self.quantity_list:
-                if quantity.name == selected_quantity_name:
-                    selected_quantity = quantity
-                    break
-            
-            if selected_quantity:
-                # Get unit options for the selected quantity
-                unit_options = [(unit, unit) for unit in selected_quantity.get_units().keys()]
-                
-                # Update both unit selection widgets
-                unit1_select = self.query_one("#unit-converter-unit1-selection", Select)
-                unit2_select = self.query_one("#unit-converter-unit2-selection", Select)
-                
-                unit1_select.set_options(unit_options)
-                unit2_select.set_options(unit_options)
+            if event.value == Select.BLANK:
+                return
+
+            # The option values are quantity ids
+            self.show_units(event.value)
+
+        self.schedule_table_update()
+
+    def show_units(self, quantity_id: str) -> None:
+        """Fills both unit selections with the units of a quantity, unless they already hold them"""
+
+        if quantity_id == self.units_quantity:
+            return
+        self.units_quantity = quantity_id
+        selected_quantity = self.registry.quantity(quantity_id)
+
+        # Get unit options for the selected quantity
+        unit_options = [(unit, unit) for unit in selected_quantity.get_units().keys()]
+
+        # Update both unit selection widgets
+        self.query_one("#unit-converter-unit1-selection", Select).set_options(unit_options)
+        self.query_one("#unit-converter-unit2-selection", Select).set_options(unit_options)
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Recomputes the all-units table once the user pauses typing"""
+        if event.input.id == "unit-converter-input":
+            self.schedule_table_update()
+        elif event.input.id == "unit-search":
+            # Select a unit as soon as its exact name or symbol is typed
+            match = self.unit_index.resolve(event.value)
+            if match is not None:
+                self.select_unit(match.quantity_id, match.unit)
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        """Selects the best match of the unit search, or converts a typed expression"""
+        if not event.value.strip():
+            return
+        if event.input.id == "expression-input":
+            self.convert_expression(event.value)
+            return
+        if event.input.id != "unit-search":
+            return
+
+        result = self.query_one("#conversion-result", Static)
+        matches = self.unit_index.search(event.value, limit=5)
+        if not matches:
+            result.update(f"[red]Error: No unit matches '{event.value}'[/]")
+            return
+
+        self.select_unit(matches[0].quantity_id, matches[0].unit)
+        if len(matches) > 1 and self.unit_index.resolve(event.value) is None:
+            others = ", ".join(match.key for match in matches[1:])
+            result.update(f"Selected {matches[0].unit}. Other matches: {others}")
+
+    def convert_expression(self, text: str) -> None:
+        """Converts a typed expression such as "500 J/s to hp" between any units of the same dimension"""
+
+        from physics_TUI.conversion_plan import convert_expression
+
+        result = self.query_one("#conversion-result", Static)
+        try:
+            value, plan = convert_expression(text)
+        except ValueError as e:
+            result.update(f"[red]Error: {e}[/]")
+            return
+        result.update(f"[green]✓ {text.strip()} = {value:.6g} {plan.target}[/]\n[dim]{plan}[/]")
+
+    def select_unit(self, quantity_id: str, unit: str) -> None:
+        """Selects a quantity and the unit being converted from"""
+
+        self.query_one("#quantity-selection", Select).value = quantity_id
+        self.show_units(quantity_id)
+        self.query_one("#unit-converter-unit1-selection", Select).value = unit
+        self.query_one("#conversion-result", Static).update(
+            f"{unit} ({self.registry.quantity(quantity_id).name})"
+        )
+        self.schedule_table_update()
+
+    def schedule_table_update(self) -> None:
+        """Restarts the debounce timer of the all-units table"""
+        if self.table_timer is not None:
+            self.table_timer.stop()
+        self.table_timer = self.set_timer(CONVERSION_DEBOUNCE, self.update_table)
+
+    def update_table(self) -> None:
+        """
+        Fills the all-units table with the entered value converted from the
+        selected unit. The table is emptied while the input is incomplete.
+        """
+
+        self.table_timer = None
+        table = self.query_one("#all-units-table", DataTable)
+        quantity_id = self.query_one("#quantity-selection", Select).value
+        from_unit = self.query_one("#unit-converter-unit1-selection", Select).value
+
+        try:
+            value = float(self.query_one("#unit-converter-input", Input).value)
+        except ValueError:
+            value = None
+        quantity = self.registry.quantities.get(quantity_id)
+        if value is None or quantity is None or from_unit not in quantity.get_units():
+            table.clear()
+            self.table_quantity = None
+            return
+
+        values = quantity.convert_to_all(value, from_unit).tolist()
+
+        # Quantities are shared and immutable, so the same object has the same rows
+        if quantity is not self.table_quantity:
+            table.clear()
+            table.add_rows([unit, f"{result:.6g}"] for unit, result in zip(quantity.units, values))
+            self.table_quantity = quantity
+        else:
+            for row, result in enumerate(values):
+                table.update_cell_at((row, 1), f"{result:.6g}")
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle convert button press"""
@@ -132,11 +276,7 @@ class UnitConverterScreen(Screen):
                 to_unit = unit2_select.value
                 
                 # Find the quantity object
-                selected_quantity = None
-                for quantity in self.quantity_list:
-                    if quantity.name == quantity_select.value:
-                        selected_quantity = quantity
-                        break
+                selected_quantity = self.registry.quantities.get(quantity_select.value)
                 
                 if selected_quantity:
                     # Perform conversion
@@ -161,21 +301,39 @@ class UnitConverterScreen(Screen):
         self.app.pop_screen()
 
 class CalculatorScreen(Screen):
-    """Screen for displaying calculator form for an equation"""
+    """
+    Screen for displaying calculator form for an equation. Calculations run
+    in a worker thread so the interface stays responsive; Escape cancels a
+    running calculation, and one that exceeds `timeout` seconds is dropped.
+    Inputs may carry a unit, e.g. "36 km/h", and are converted to the unit
+    in the variable's description.
+    """
 
     BINDINGS = [
         Binding("escape", "go_back", "Back")
     ]
 
-    def __init__(self, equation: Equation, current_chapter: Optional[PhysicsChapter] = None) -> None:
+    def __init__(
+        self,
+        equation: Equation,
+        current_chapter: Optional[PhysicsChapter] = None,
+        timeout: Optional[float] = CALCULATION_TIMEOUT,
+    ) -> None:
         super().__init__()
         self.equation = equation
         self.calc_inputs: Dict[str, Input] = {}
+        self.input_units: Dict[str, "CompoundUnit"] = {}  # unit each variable is solved in
         self.current_chapter = current_chapter
+        self.timeout = timeout
+        self.calculation: Optional[Worker] = None
+        self.timeout_timer: Optional[Timer] = None
+        self.timed_out = False
 
     def compose(self) -> ComposeResult:
         """Create the calculator form layout"""
 
+        from physics_TUI.unit_parser import description_unit
+
         yield Header()
 
         # Single scrollable container
@@ -199,9 +357,13 @@ class CalculatorScreen(Screen):
 
                 input_field.id = f"input-{sanitized_var}"
                 self.calc_inputs[var] = input_field
+                unit = description_unit(desc)
+                if unit is not None:
+                    self.input_units[var] = unit
                 yield input_field
 
             yield Button("Calculate", id="calc-button", variant="primary")
+            yield LoadingIndicator(id="calc-progress", classes="hidden")
             yield Static("", id="calc-result")
 
         yield Footer()
@@ -209,6 +371,8 @@ class CalculatorScreen(Screen):
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle calculate button press"""
 
+        from physics_TUI.unit_parser import parse_value
+
         if event.button.id == "calc-button":
             try:
                 # Get values from input fields
@@ -219,11 +383,10 @@ class CalculatorScreen(Screen):
                     value_str = input_widget.value.strip()
                     if value_str:
                         try:
-                            input_values[var] = float(value_str)
-                        except ValueError:
+                            input_values[var] = parse_value(value_str, self.input_units.get(var))
+                        except ValueError as e:
                             self.query_one("#calc-result", Static).update(
-                                f"[red]Error: '{
-                                    value_str}' is not a valid number for {var}[/]"
+                                f"[red]Error: {e} for {var}[/]"
                             )
                             return
                     else:
@@ -259,30 +422,7 @@ class CalculatorScreen(Screen):
                     else:
                         empty_calc_var = empty_field
 
-                    mapped_values[empty_calc_var] = None
-
-                    # Call the calculation function
-                    if self.equation.calculation:
-                        result = self.equation.calculation(**mapped_values)
-
-                        result_text = f"[green]✓ {empty_field} = {result}[/]"
-
-                        # Add units if available in variable description
-                        if empty_field in self.equation.variables:
-                            var_desc = self.equation.variables[empty_field]
-                            # Try to extract units from description
-                            if '(' in var_desc and ')' in var_desc:
-                                units = var_desc[var_desc.find(
-                                    '(')+1:var_desc.find(')')]
-                                result_text = f"[green]✓ {
-                                    empty_field} = {result} {units} [/]"
-
-                        self.query_one(
-                            "#calc-result", Static).update(result_text)
-                    else:
-                        self.query_one("#calc-result", Static).update(
-                            "[red]Error: No calculation function available for this equation[/]"
-                        )
+                    self.start_calculation(empty_field, empty_calc_var, mapped_values)
                 else:
                     self.query_one("#calc-result", Static).update(
                         "[red]Error: No chapter context available[/]"
@@ -294,8 +434,430 @@ class CalculatorScreen(Screen):
                 self.query_one(
                     "#calc-result", Static).update(f"[red]Error: {error_msg}[/]")
 
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Shows what a value typed with a unit converts to, below its input"""
+
+        from physics_TUI.unit_parser import parse_measurement, parse_value
+
+        var = next((var for var, field in self.calc_inputs.items() if field is event.input), None)
+        if var is None:
+            return
+
+        value_str = event.value.strip()
+        try:
+            if not value_str or parse_measurement(value_str)[1] is None:
+                event.input.border_subtitle = ""
+                return
+            value = parse_value(value_str, self.input_units.get(var))
+        except ValueError as e:
+            event.input.border_subtitle = str(e)
+            return
+
+        desc = self.equation.variables[var]
+        units = desc[desc.rfind('(')+1:desc.rfind(')')]
+        event.input.border_subtitle = f"= {value:.6g} {units}"
+
+    def start_calculation(
+        self, empty_field: str, unknown: str, knowns: Dict[str, float]
+    ) -> None:
+        """Solve for the unknown in a worker thread, replacing any running calculation"""
+
+        self.cancel_calculation()
+        self.timed_out = False
+
+        # Solve through the shared result cache, so repeated
+        # inputs are answered without recalculating
+        self.calculation = self.run_worker(
+            partial(self.equation.solve, unknown, knowns),
+            name=empty_field,
+            group="calculation",
+            exclusive=True,
+            thread=True,
+            exit_on_error=False,
+        )
+        if self.timeout is not None:
+            self.timeout_timer = self.set_timer(self.timeout, self.on_calculation_timeout)
+
+        self.query_one("#calc-progress").remove_class("hidden")
+        self.query_one("#calc-result", Static).update("[#565f89]Calculating... press Escape to cancel[/]")
+
+    def cancel_calculation(self) -> bool:
+        """Cancel the running calculation, returning whether there was one"""
+
+        if self.timeout_timer is not None:
+            self.timeout_timer.stop()
+            self.timeout_timer = None
+
+        worker, self.calculation = self.calculation, None
+        if worker is None or worker.is_finished:
+            return False
+
+        # A thread cannot be interrupted, so its result is simply discarded
+        worker.cancel()
+        self.query_one("#calc-progress").add_class("hidden")
+        return True
+
+    def on_calculation_timeout(self) -> None:
+        """Give up on a calculation that ran longer than the timeout"""
+        self.timeout_timer = None
+        if self.calculation is not None and not self.calculation.is_finished:
+            self.timed_out = True
+            self.calculation.cancel()
+
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        """Show the outcome of the current calculation"""
+
+        worker = event.worker
+        if worker is not self.calculation or not worker.is_finished:
+            return
+
+        self.calculation = None
+        if self.timeout_timer is not None:
+            self.timeout_timer.stop()
+            self.timeout_timer = None
+        self.query_one("#calc-progress").add_class("hidden")
+        result_widget = self.query_one("#calc-result", Static)
+
+        if event.state == WorkerState.SUCCESS:
+            result_widget.update(self.result_text(worker.name, worker.result))
+        elif event.state == WorkerState.ERROR:
+            result_widget.update(f"[red]Error: {worker.error}[/]")
+        elif self.timed_out:
+            result_widget.update(
+                f"[red]Error: Calculation timed out after {self.timeout:g} seconds[/]"
+            )
+
+    def result_text(self, empty_field: str, result: float) -> str:
+        """Markup showing the solved value with its units"""
+
+        # Results too small to show in RESULT_DECIMALS places keep as many significant digits
+        shown = round(result, RESULT_DECIMALS)
+        if result and abs(shown) < 10 ** (1 - RESULT_DECIMALS):
+            shown = float(f"{result:.{RESULT_DECIMALS}g}")
+        result_text = f"[green]✓ {empty_field} = {shown}[/]"
+
+        # Add units if available in variable description
+        if empty_field in self.equation.variables:
+            var_desc = self.equation.variables[empty_field]
+            # Try to extract units from description
+            if '(' in var_desc and ')' in var_desc:
+                units = var_desc[var_desc.find(
+                    '(')+1:var_desc.find(')')]
+                result_text = f"[green]✓ {
+                    empty_field} = {shown} {units} [/]"
+
+        return result_text
+
     def action_go_back(self) -> None:
-        """Go back to the previous screen"""
+        """Cancel the running calculation, or go back to the previous screen"""
+        if self.cancel_calculation():
+            self.query_one("#calc-result", Static).update("[#e0af68]Calculation cancelled[/]")
+            return
+        self.app.pop_screen()
+
+
+class GridView(ScrollView):
+    """
+    Table of a Grid that formats only the rows in view, so scrolling a grid
+    of a million rows costs no more than scrolling one of ten. The header
+    row stays in place while the rows scroll beneath it.
+    """
+
+    COMPONENT_CLASSES = {"grid-view--header", "grid-view--error"}
+    COLUMN_WIDTH = 14
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.grid: Optional["Grid"] = None
+        self.styles_cache: Optional[Tuple[Style, Style, Style]] = None
+
+    def notify_style_update(self) -> None:
+        super().notify_style_update()
+        self.styles_cache = None
+
+    def line_styles(self) -> Tuple[Style, Style, Style]:
+        """Styles of the background, the header and failed rows, which are costly to resolve per line"""
+        if self.styles_cache is None:
+            base = self.rich_style
+            self.styles_cache = (
+                base,
+                base + self.get_component_rich_style("grid-view--header"),
+                base + self.get_component_rich_style("grid-view--error"),
+            )
+        return self.styles_cache
+
+    def show(self, grid: "Grid") -> None:
+        """Replaces the table with `grid`, scrolled to its first row"""
+        self.grid = grid
+        width = self.COLUMN_WIDTH * len(grid.columns) + 2 + max(map(len, grid.messages))
+        self.virtual_size = Size(width, len(grid) + 1)
+        self.scroll_to(0, 0, animate=False)
+        self.refresh()
+
+    def render_line(self, y: int) -> Strip:
+        scroll_x, scroll_y = self.scroll_offset
+        width = self.size.width
+        grid = self.grid
+        base, header, error = self.line_styles()
+        if grid is None:
+            return Strip.blank(width, base)
+
+        style = base
+        if y == 0:
+            text = "".join(f"{column:>{self.COLUMN_WIDTH}}" for column in grid.columns)
+            style = header
+        else:
+            row = scroll_y + y - 1
+            if row >= len(grid):
+                return Strip.blank(width, base)
+            text = "".join(
+                f"{'—' if isnan(value) else format(value, '.6g'):>{self.COLUMN_WIDTH}}"
+                for value in grid.values[row].tolist()
+            )
+            if grid.status[row]:
+                text += f"  {grid.error(row)}"
+                style = error
+
+        return Strip([Segment(text, style)]).crop_extend(scroll_x, scroll_x + width, base)
+
+
+class FreeFallGridScreen(Screen):
+    """
+    Screen tabulating a free fall over a grid of times or heights. The whole
+    grid is solved in one vectorized pass in a worker thread, and shown in
+    a GridView that formats only the rows in view.
+    """
+
+    BINDINGS = [
+        Binding("escape", "go_back", "Back")
+    ]
+
+    # Input id, label, and the unit of the value when the grid is over time and over height
+    FIELDS: Tuple[Tuple[str, str, str, str], ...] = (
+        ("grid-y0", "y₀: Initial height", "m", "m"),
+        ("grid-v0", "v₀: Initial velocity, positive upwards", "m/s", "m/s"),
+        ("grid-start", "First grid value", "s", "m"),
+        ("grid-stop", "Last grid value", "s", "m"),
+    )
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.generation: Optional[Worker] = None
+
+    def compose(self) -> ComposeResult:
+        """Create the grid form beside the table"""
+
+        from physics_TUI.grid import FREE_FALL_AXES
+
+        yield Header()
+        with Horizontal():
+            with VerticalScroll(id="grid-form"):
+                yield Static("Free Fall Grid", id="grid-title")
+                yield Select(
+                    [(f"Over {axis}", axis) for axis in FREE_FALL_AXES],
+                    value=FREE_FALL_AXES[0],
+                    allow_blank=False,
+                    id="grid-axis",
+                )
+                for field_id, label, time_unit, _ in self.FIELDS:
+                    yield Static(f"{label} ({time_unit})", id=f"{field_id}-label", classes="input-label")
+                    yield Input(placeholder="Enter a value", id=field_id)
+                yield Static("Steps", classes="input-label")
+                yield Input("10000", placeholder="Number of grid points", id="grid-steps", type="integer")
+                yield Button("Generate", id="grid-button", variant="primary")
+                yield Static("", id="grid-summary")
+            yield GridView(id="grid-view")
+        yield Footer()
+
+    def on_select_changed(self, event: Select.Changed) -> None:
+        """Relabels the grid fields with the units of the chosen axis"""
+        column = 2 if event.value == "time" else 3
+        for field in self.FIELDS:
+            self.query_one(f"#{field[0]}-label", Static).update(f"{field[1]} ({field[column]})")
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        """Submitting any field generates the grid"""
+        self.generate()
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "grid-button":
+            self.generate()
+
+    def generate(self) -> None:
+        """Reads the form and solves the grid in a worker thread"""
+
+        from physics_TUI.grid import free_fall_grid
+        from physics_TUI.unit_parser import parse_unit, parse_value
+
+        summary = self.query_one("#grid-summary", Static)
+        axis = self.query_one("#grid-axis", Select).value
+        column = 2 if axis == "time" else 3
+
+        values = []
+        for field_id, label, *units in self.FIELDS:
+            text = self.query_one(f"#{field_id}", Input).value.strip()
+            if not text:
+                summary.update(f"[red]Error: Enter a value for {label}[/]")
+                return
+            try:
+                values.append(parse_value(text, parse_unit(units[column - 2])))
+            except ValueError as e:
+                summary.update(f"[red]Error: {e} for {label}[/]")
+                return
+
+        try:
+            steps = int(self.query_one("#grid-steps", Input).value)
+        except ValueError:
+            summary.update("[red]Error: Steps must be a whole number[/]")
+            return
+
+        y_0, v_0, start, stop = values
+        self.generation = self.run_worker(
+            partial(free_fall_grid, y_0, v_0, axis, start, stop, steps),
+            group="grid",
+            exclusive=True,
+            thread=True,
+            exit_on_error=False,
+        )
+        summary.update("[#565f89]Generating...[/]")
+
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        """Shows the generated grid"""
+
+        worker = event.worker
+        if worker is not self.generation or not worker.is_finished:
+            return
+
+        self.generation = None
+        summary = self.query_one("#grid-summary", Static)
+        if event.state == WorkerState.SUCCESS:
+            grid: "Grid" = worker.result
+            self.query_one(GridView).show(grid)
+            summary.update(f"[green]✓ {int(grid.valid.sum()):,} of {len(grid):,} rows solved[/]")
+        elif event.state == WorkerState.ERROR:
+            summary.update(f"[red]Error: {worker.error}[/]")
+
+    def action_go_back(self) -> None:
+        """Return to the previous screen"""
+        self.app.pop_screen()
+
+
+class TrajectoryScreen(Screen):
+    """
+    Screen plotting the path of a projectile launch in braille characters.
+    The path is rasterized in a worker thread to fit the plot area, and
+    rasters are cached by launch and size, so plotting a launch again or
+    returning to an earlier terminal size shows the cached raster.
+    """
+
+    BINDINGS = [
+        Binding("escape", "go_back", "Back")
+    ]
+
+    # Input id, label and unit of each launch parameter
+    FIELDS: Tuple[Tuple[str, str, str], ...] = (
+        ("trajectory-theta", "θ: Launch angle", "deg"),
+        ("trajectory-v0", "v₀: Initial speed", "m/s"),
+        ("trajectory-height", "h: Launch height", "m"),
+    )
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.launch: Optional[Tuple[float, float, float]] = None  # theta, v_0 and height being plotted
+        self.plotting: Optional[Worker] = None
+        self.resize_timer: Optional[Timer] = None
+
+    def compose(self) -> ComposeResult:
+        """Create the launch form beside the plot"""
+
+        yield Header()
+        with Horizontal():
+            with VerticalScroll(id="trajectory-form"):
+                yield Static("Trajectory Plot", id="trajectory-title")
+                for field_id, label, unit in self.FIELDS:
+                    yield Static(f"{label} ({unit})", classes="input-label")
+                    yield Input("0" if field_id == "trajectory-height" else "", placeholder="Enter a value", id=field_id)
+                yield Button("Plot", id="trajectory-button", variant="primary")
+                yield Static("", id="trajectory-summary")
+            yield Static("", id="trajectory-plot", markup=False)
+        yield Footer()
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        """Submitting any field plots the launch"""
+        self.plot()
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "trajectory-button":
+            self.plot()
+
+    def plot(self) -> None:
+        """Reads the launch from the form and draws it"""
+
+        from physics_TUI.unit_parser import parse_unit, parse_value
+
+        summary = self.query_one("#trajectory-summary", Static)
+        values = []
+        for field_id, label, unit in self.FIELDS:
+            text = self.query_one(f"#{field_id}", Input).value.strip()
+            if not text:
+                summary.update(f"[red]Error: Enter a value for {label}[/]")
+                return
+            try:
+                values.append(parse_value(text, parse_unit(unit)))
+            except ValueError as e:
+                summary.update(f"[red]Error: {e} for {label}[/]")
+                return
+
+        theta, v_0, height = values
+        self.launch = (theta, v_0, height)
+        self.draw()
+
+    def draw(self) -> None:
+        """Rasterizes the launch to fit the plot area in a worker thread"""
+
+        from physics_TUI.plot import plot_trajectory
+
+        self.resize_timer = None
+        size = self.query_one("#trajectory-plot", Static).content_size
+        if self.launch is None or not size.area:
+            return
+
+        self.plotting = self.run_worker(
+            partial(plot_trajectory, *self.launch, size.width, size.height),
+            group="trajectory",
+            exclusive=True,
+            thread=True,
+            exit_on_error=False,
+        )
+
+    def on_resize(self, event: events.Resize) -> None:
+        """Plots the launch again once the terminal stops resizing"""
+        if self.resize_timer is not None:
+            self.resize_timer.stop()
+        self.resize_timer = self.set_timer(PLOT_DEBOUNCE, self.draw)
+
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        """Shows the finished plot"""
+
+        worker = event.worker
+        if worker is not self.plotting or not worker.is_finished:
+            return
+
+        self.plotting = None
+        summary = self.query_one("#trajectory-summary", Static)
+        if event.state == WorkerState.SUCCESS:
+            plot: "TrajectoryPlot" = worker.result
+            self.query_one("#trajectory-plot", Static).update("\n".join(plot.lines))
+            summary.update(
+                f"[green]✓ Range {plot.range:.4g} m, apex {plot.apex:.4g} m, flight {plot.flight_time:.4g} s[/]\n"
+                f"[#565f89]One dot is {plot.metres_per_dot:.3g} m across and high[/]"
+            )
+        elif event.state == WorkerState.ERROR:
+            self.query_one("#trajectory-plot", Static).update("")
+            summary.update(f"[red]Error: {worker.error}[/]")
+
+    def action_go_back(self) -> None:
+        """Return to the previous screen"""
         self.app.pop_screen()
 
 
@@ -309,25 +871,14 @@ class physicsTUIApp(App):
         Binding("q", "quit", "Quit"),
     ]
 
-    def __init__(self) -> None:
+    def __init__(self, registry: Optional[Registry] = None) -> None:
         super().__init__()
-        self.chapters: List[PhysicsChapter] = [
-            Chapter3(),
-            Chapter4(),
-            Chapter5(),
-            Chapter6(),
-            Chapter7(),
-            Chapter8(),
-            Chapter9(),
-            Chapter10(),
-            Chapter11(),
-            Chapter12(),
-            Chapter13(),
-            Chapter14()
-        ]
+        # Chapters are only listed here; each is loaded when its node is expanded
+        self.registry: Registry = registry or default_registry()
         self.current_chapter: Optional[PhysicsChapter] = None
         self.showing_equation_list = False
         self.calculable_equations: List[Equation] = []
+        self.render_cache: Dict[RenderKey, Content] = {}
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
@@ -343,20 +894,14 @@ class physicsTUIApp(App):
     def on_mount(self) -> None:
 
         physics_tui_tree = self.query_one(Tree)
-        physics_tui_tree.root.add("Tools").add_leaf("Unit Converter")
-
-        for chapter in self.chapters:
-            chapter_branch = physics_tui_tree.root.add(chapter.title)
-
-            if chapter.equations:
-                chapter_branch.add_leaf("Equations")
-
-            if chapter.definitions:
-                chapter_branch.add_leaf("Definitions")
+        tools = physics_tui_tree.root.add("Tools")
+        tools.add_leaf("Unit Converter")
+        tools.add_leaf("Free Fall Grid")
+        tools.add_leaf("Trajectory Plot")
 
-            # Add Calculations leaf only if the chapter has equations with calculation functions
-            if any(hasattr(eq, 'calculation') and eq.calculation is not None for eq in chapter.equations):
-                chapter_branch.add_leaf("Calculations")
+        # Every node of a chapter carries its id for lookup on selection
+        for entry in self.registry.entries.values():
+            physics_tui_tree.root.add(entry.title, data=entry.id, allow_expand=True)
 
         # Set initial content
         welcome_content_widget = self.query_one("#welcome_content", Static)
@@ -388,6 +933,24 @@ class physicsTUIApp(App):
 
         welcome_content_widget.update(welcome_content)
 
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
+        """Load a chapter and add its leaves the first time its node is expanded"""
+        chapter_branch = event.node
+        if chapter_branch.data not in self.registry.entries or chapter_branch.children:
+            return
+
+        chapter = self.registry.chapter(chapter_branch.data)
+
+        if chapter.equations:
+            chapter_branch.add_leaf("Equations", data=chapter.id)
+
+        if chapter.definitions:
+            chapter_branch.add_leaf("Definitions", data=chapter.id)
+
+        # Add Calculations leaf only if the chapter has equations that can be solved
+        if chapter.get_calculable_equations():
+            chapter_branch.add_leaf("Calculations", data=chapter.id)
+
     def on_tree_node_selected(self, event: Tree.NodeSelected) -> None:
         """Update the content area when a node is selected."""
         selected_path = []
@@ -403,23 +966,39 @@ class physicsTUIApp(App):
             parent, chapter_title, leaf_type = selected_path
 
             if leaf_type == "Unit Converter":
-                self.push_screen(UnitConverterScreen())
+                self.push_screen(UnitConverterScreen(self.registry))
+                return
+
+            if leaf_type == "Free Fall Grid":
+                self.push_screen(FreeFallGridScreen())
+                return
+
+            if leaf_type == "Trajectory Plot":
+                self.push_screen(TrajectoryScreen())
+                return
 
             # Find the selected chapter
-            for chapter in self.chapters:
-                if chapter.title == chapter_title:
-                    self.current_chapter = chapter  # Set current chapter
-
-                    if leaf_type == "Equations":
-                        self.update_content_equations(chapter)
-                    elif leaf_type == "Definitions":
-                        self.update_content_definitions(chapter)
-                    elif leaf_type == "Calculations":
-                        self.show_calculations_list(chapter)
-                    break
+            if event.node.data in self.registry.entries:
+                chapter = self.registry.chapter(event.node.data)
+                self.current_chapter = chapter  # Set current chapter
+
+                if leaf_type == "Equations":
+                    self.update_content_equations(chapter)
+                elif leaf_type == "Definitions":
+                    self.update_content_definitions(chapter)
+                elif leaf_type == "Calculations":
+                    self.show_calculations_list(chapter)
 
     def update_content_equations(self, chapter: PhysicsChapter) -> None:
         """Update the content area with chapter equations."""
+        self.show_chapter_page(chapter, "equations")
+
+    def update_content_definitions(self, chapter: PhysicsChapter) -> None:
+        """Update the content area with chapter definitions"""
+        self.show_chapter_page(chapter, "definitions")
+
+    def show_chapter_page(self, chapter: PhysicsChapter, view: str) -> None:
+        """Show a chapter's equations or definitions page in the content area"""
         self.showing_equation_list = False
 
         # Hide equation list and show content
@@ -432,63 +1011,63 @@ class physicsTUIApp(App):
         content_widget = self.query_one("#content", Static)
         content_widget.remove_class("hidden")
 
-        # Build content string
+        content_widget.update(self.chapter_page(chapter, view))
+
+    def chapter_page(self, chapter: PhysicsChapter, view: str) -> Content:
+        """
+        Returns the parsed page for a chapter view, rendering it on the
+        first visit. The markup uses fixed colours and reflows on resize, so
+        one page per view is enough.
+        """
+        key: RenderKey = (chapter.id, view)
+        page = self.render_cache.get(key)
+        if page is None:
+            render = self.render_equations if view == "equations" else self.render_definitions
+            page = self.render_cache[key] = Content.from_markup(render(chapter))
+        return page
+
+    @staticmethod
+    def chapter_banner(chapter: PhysicsChapter, heading: str) -> str:
+        """Markup for the title box at the top of a chapter page"""
         title_length = len(chapter.title)
         padding = max(0, (50 - title_length) // 2)
 
-        content = f"""┏━{'━' * 50}━┓
+        return f"""┏━{'━' * 50}━┓
 ┃{' ' * padding}{chapter.title.upper()}{' ' * (50 - title_length - padding)}  ┃
 ┗━{'━' * 50}━┛
 
 ╔══════════════════════════════════════════════════╗
-║{'EQUATIONS'.center(50)}║
+║{heading.center(50)}║
 ╚══════════════════════════════════════════════════╝\n"""
 
+    def render_equations(self, chapter: PhysicsChapter) -> str:
+        """Markup for a chapter's equations page"""
+        parts = [self.chapter_banner(chapter, "EQUATIONS")]
+
         for eq in chapter.get_equations():
             name_padding = max(0, 45 - len(eq.name))
-            content += f"\n[bold #2ac3de]┌─ {
-                eq.name} {'─' * name_padding}┐[/]\n"
-            content += f"[#c0caf5]│ Formula:[/] [#e0af68]{eq.formula}[/]\n"
+            parts.append(f"\n[bold #2ac3de]┌─ {eq.name} {'─' * name_padding}┐[/]\n")
+            parts.append(f"[#c0caf5]│ Formula:[/] [#e0af68]{eq.formula}[/]\n")
 
             if eq.variables:
-                content += f"[#c0caf5]│[/]\n"
-                content += f"[#c0caf5]│ Variables:[/]\n"
+                parts.append("[#c0caf5]│[/]\n")
+                parts.append("[#c0caf5]│ Variables:[/]\n")
                 for var, desc in eq.variables.items():
-                    content += f"[#c0caf5]│[/]   [#9ece6a]◆[/] [bold #ff9e64]{
-                        var}[/]: [#c0caf5]{desc}[/]\n"
-
-            content += f"[bold #2ac3de]└{'─' * 48}┘[/]"
-
-        content_widget.update(content)
-
-    def update_content_definitions(self, chapter: PhysicsChapter) -> None:
-        """Update the content area with chapter definitions"""
-        self.showing_equation_list = False
-
-        equation_list = self.query_one("#equation-list")
-        equation_list.add_class("hidden")
-
-        welcome_content_widget = self.query_one("#welcome_content", Static)
-        welcome_content_widget.add_class("hidden")
-
-        content_widget = self.query_one("#content", Static)
-        content_widget.remove_class("hidden")
+                    parts.append(
+                        f"[#c0caf5]│[/]   [#9ece6a]◆[/] [bold #ff9e64]{var}[/]: [#c0caf5]{desc}[/]\n"
+                    )
 
-        title_length = len(chapter.title)
-        padding = max(0, (50 - title_length) // 2)
+            parts.append(f"[bold #2ac3de]└{'─' * 48}┘[/]")
 
-        content = f"""┏━{'━' * 50}━┓
-┃{' ' * padding}{chapter.title.upper()}{' ' * (50 - title_length - padding)}  ┃
-┗━{'━' * 50}━┛
+        return "".join(parts)
 
-╔══════════════════════════════════════════════════╗
-║{'DEFINITIONS'.center(50)}║
-╚══════════════════════════════════════════════════╝\n"""
+    def render_definitions(self, chapter: PhysicsChapter) -> str:
+        """Markup for a chapter's definitions page"""
+        parts = [self.chapter_banner(chapter, "DEFINITIONS")]
 
         for defn in chapter.get_definitions():
             term_padding = max(0, 45 - len(defn.term))
-            content += f"\n[bold #2ac3de]╭─ {
-                defn.term} {'─' * term_padding}╮[/]\n"
+            parts.append(f"\n[bold #2ac3de]╭─ {defn.term} {'─' * term_padding}╮[/]\n")
 
             words = defn.meaning.split()
             lines = []
@@ -505,21 +1084,19 @@ class physicsTUIApp(App):
                 lines.append(current_line)
 
             for line in lines:
-                content += f"[#c0caf5]│ {line:<47}│[/]\n"
+                parts.append(f"[#c0caf5]│ {line:<47}│[/]\n")
 
-            content += f"[bold #2ac3de]╰{'─' * 48}╯[/]"
+            parts.append(f"[bold #2ac3de]╰{'─' * 48}╯[/]")
 
-        content_widget.update(content)
+        return "".join(parts)
 
     def show_calculations_list(self, chapter: PhysicsChapter) -> None:
         """Show list of calculable equations using OptionList"""
         self.showing_equation_list = True
         self.current_chapter = chapter
 
-        # Get equations with calculation functions
-        self.calculable_equations = [
-            eq for eq in chapter.equations if hasattr(eq, 'calculation') and eq.calculation is not None
-        ]
+        # Get equations with calculation functions or solvers
+        self.calculable_equations = chapter.get_calculable_equations()
 
         if not self.calculable_equations:
 
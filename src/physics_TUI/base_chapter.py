@@ -1,5 +1,12 @@
-from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional
+from dataclasses import dataclass, field
+from importlib import import_module
+from typing import TYPE_CHECKING, Callable, Dict, List, Mapping, Optional
+
+from .result_cache import RESULT_CACHE, ResultCache
+
+if TYPE_CHECKING:
+    # Only chapters that define solvers need NumPy, so it is not imported here
+    from .solver import EquationSolver
 
 
 @dataclass
@@ -9,6 +16,68 @@ class Equation:
     formula: str
     variables: Dict[str, str]  # variable_name: description
     calculation: Optional[Callable] = None  # optional reference to calculation function
+    solver: Optional["EquationSolver"] = None  # optional vectorized counterpart of calculation
+    id: str = field(default="", compare=False)  # stable id assigned by the registry
+
+    def solver_for(self, unknown: str) -> Callable[..., float]:
+        """
+        Returns the pre-bound solver for an unknown. It takes the remaining
+        variables as keyword arguments and returns the unknown's value. The
+        solver is built on first use and reused after that.
+
+        Raises:
+            ValueError: if the equation cannot be solved for the unknown.
+        """
+        if self.solver is None or unknown not in self.solver.unknowns:
+            raise ValueError(f"Cannot solve for {unknown} with this equation.")
+        return self.solver.compiled(unknown)
+
+    @property
+    def qualname(self) -> str:
+        """Qualified name of the solver or calculation behind the equation"""
+        if self.solver is not None and self.solver.qualname:
+            return self.solver.qualname
+        if self.calculation is not None:
+            return self.calculation.__qualname__
+        return self.name
+
+    def solve(
+        self,
+        unknown: str,
+        knowns: Mapping[str, float],
+        cache: Optional[ResultCache] = RESULT_CACHE,
+    ) -> float:
+        """
+        Solves the equation for `unknown` given the other variables by their
+        calculation names. The pre-bound solver is used when it covers the
+        unknown, otherwise the calculation function. Results are memoized in
+        `cache`, unless a known is missing or not a finite number; pass None
+        to always recompute.
+
+        Raises:
+            ValueError: if the values are invalid or nothing can solve for the unknown.
+        """
+
+        solver = self.solver
+        if (
+            solver is not None
+            and unknown in solver.unknowns
+            and set(knowns) <= set(solver.variables)
+        ):
+            solve_for = solver.compiled(unknown)
+            compute = lambda: solve_for(**knowns)
+        elif self.calculation is not None:
+            calculation = self.calculation
+            compute = lambda: calculation(**knowns, **{unknown: None})
+        else:
+            raise ValueError("No calculation function available for this equation")
+
+        if cache is not None:
+            key = cache.key(self.id or self.qualname, unknown, knowns)
+            if key is not None:
+                result: float = cache.get_or_compute(key, compute)
+                return result
+        return compute()
 
 @dataclass
 class Definition:
@@ -22,6 +91,7 @@ class PhysicsChapter:
     """Base class for all physics chapters"""
     def __init__(self, title: str, description: str = ""):
         self.title: str = title
+        self.id: str = ""  # stable id assigned by the registry
         self.description: str = description
         self.equations: List[Equation] = []
         self.definitions: List[Definition] = []
@@ -39,3 +109,16 @@ class PhysicsChapter:
     def get_calculable_equations(self) -> List[Equation]:
         """Returns the list of equations that have calculation functions"""
         return [eq for eq in self.equations if eq.calculation is not None]
+
+
+@dataclass(frozen=True)
+class ChapterEntry:
+    """Manifest entry describing a chapter without importing it"""
+    id: str
+    title: str
+    module: str  # dotted path of the module defining the chapter
+    class_name: str
+
+    def load(self) -> PhysicsChapter:
+        """Imports the chapter's module and constructs the chapter"""
+        return getattr(import_module(self.module), self.class_name)()
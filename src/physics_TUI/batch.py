@@ -0,0 +1,269 @@
+"""
+Headless batch solving. Rows are streamed from CSV or JSON Lines, solved a
+chunk at a time and written out as each chunk finishes, so memory use is
+bounded by the chunk size whatever the size of the input. Chunks are solved
+with the equation's array solver where it covers the unknown, and otherwise
+row by row through the calculation function in a process pool.
+"""
+
+import csv
+import inspect
+import json
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Mapping, Optional, TextIO, Tuple
+
+import numpy as np
+
+from .base_chapter import Equation
+
+CHUNK_SIZE: int = 10_000
+ERROR_FIELD: str = "error"
+FORMATS: Tuple[str, ...] = ("csv", "jsonl")
+
+Row = Dict[str, Any]
+Outcome = Tuple[Optional[float], str]  # solved value, or None and an error message
+
+
+@dataclass
+class BatchStats:
+    """Counts of the rows processed by a batch run"""
+
+    rows: int = 0
+    failed: int = 0
+
+
+def format_for(path: str) -> str:
+    """Guesses the format of a file from its extension, defaulting to CSV"""
+    return "jsonl" if path.lower().endswith((".jsonl", ".ndjson")) else "csv"
+
+
+def read_rows(source: TextIO, fmt: str) -> Tuple[List[str], Iterator[Row]]:
+    """
+    Returns the field names and an iterator over the rows of `source`. For
+    JSON Lines the field names are those of the first row.
+    """
+
+    if fmt == "csv":
+        reader = csv.DictReader(source)
+        return list(reader.fieldnames or []), iter(reader)
+
+    if fmt == "jsonl":
+        rows = (
+            _parse_json(line, number) for number, line in enumerate(source, 1) if line.strip()
+        )
+        first = next(rows, None)
+        if first is None:
+            return [], iter(())
+        return list(first), _prepend(first, rows)
+
+    raise ValueError(f"Unknown format: {fmt}")
+
+
+def _parse_json(line: str, number: int) -> Row:
+    try:
+        row = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Line {number} is not valid JSON: {e.msg}") from None
+    if not isinstance(row, dict):
+        raise ValueError(f"Line {number} is not a JSON object")
+    return row
+
+
+def _prepend(first: Row, rows: Iterator[Row]) -> Iterator[Row]:
+    yield first
+    yield from rows
+
+
+class BatchSolver:
+    """
+    Solves an equation for one unknown over chunks of rows. Columns are
+    matched to variables by calculation name (e.g. `v_0`) or by the
+    chapter's display symbol (e.g. `v₀`).
+    """
+
+    def __init__(
+        self,
+        equation: Equation,
+        unknown: str,
+        var_mapping: Optional[Mapping[str, str]] = None,
+        workers: Optional[int] = None,
+    ) -> None:
+        var_mapping = dict(var_mapping or {})
+        self.equation = equation
+        self.unknown = var_mapping.get(unknown, unknown)
+        self.var_mapping = var_mapping
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self._executor: Optional[Executor] = None
+
+        solver = equation.solver
+        if solver is not None and self.unknown in solver.unknowns:
+            self.vectorized = True
+            variables = solver.variables
+        elif equation.calculation is not None:
+            self.vectorized = False
+            variables = tuple(inspect.signature(equation.calculation).parameters)
+        else:
+            raise ValueError(f"Cannot solve for {unknown} with this equation.")
+
+        if self.unknown not in variables:
+            raise ValueError(f"Cannot solve for {unknown} with this equation.")
+        self.knowns: Tuple[str, ...] = tuple(var for var in variables if var != self.unknown)
+
+    def columns(self, fieldnames: List[str]) -> Dict[str, str]:
+        """
+        Maps every known variable to the input column that holds it.
+
+        Raises:
+            ValueError: if a known variable has no column.
+        """
+
+        found: Dict[str, str] = {}
+        for field in fieldnames:
+            name = self.var_mapping.get(field, field)
+            if name in self.knowns:
+                found.setdefault(name, field)
+
+        missing = [name for name in self.knowns if name not in found]
+        if missing:
+            raise ValueError(f"Missing columns for: {', '.join(missing)}")
+        return found
+
+    def solve_chunk(self, rows: List[Row], columns: Mapping[str, str]) -> List[Outcome]:
+        """Solves each row, returning its value or error message in order"""
+
+        errors = [""] * len(rows)
+        arrays = {name: np.full(len(rows), np.nan) for name in self.knowns}
+        for i, row in enumerate(rows):
+            for name, field in columns.items():
+                value = row.get(field)
+                if value is None or value == "":
+                    errors[i] = errors[i] or f"Missing value for {field}"
+                    continue
+                try:
+                    arrays[name][i] = float(value)
+                except (TypeError, ValueError):
+                    errors[i] = errors[i] or f"'{value}' is not a valid number for {field}"
+
+        if self.vectorized:
+            result = self.equation.solver.solve_array(self.unknown, arrays)
+            return [
+                (None, errors[i] or result.message(code)) if errors[i] or code else (value, "")
+                for i, (value, code) in enumerate(zip(result.values.tolist(), result.status.tolist()))
+            ]
+
+        pending = [i for i in range(len(rows)) if not errors[i]]
+        knowns = [{name: float(arrays[name][i]) for name in self.knowns} for i in pending]
+        outcomes: List[Outcome] = [(None, error) for error in errors]
+        for i, outcome in zip(pending, self._map(knowns)):
+            outcomes[i] = outcome
+        return outcomes
+
+    def _map(self, knowns: List[Dict[str, float]]) -> Iterator[Outcome]:
+        """Solves rows through the calculation, in worker processes if possible"""
+
+        if self.workers <= 1 or not self.equation.id or len(knowns) < 2:
+            return (_solve_row(self.equation, self.unknown, values) for values in knowns)
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.equation.id, self.unknown),
+            )
+        chunksize = max(1, len(knowns) // (self.workers * 4))
+        return self._executor.map(_solve_in_worker, knowns, chunksize=chunksize)
+
+    def close(self) -> None:
+        """Shuts down the worker processes, if any were started"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+def _solve_row(equation: Equation, unknown: str, knowns: Dict[str, float]) -> Outcome:
+    try:
+        return float(equation.solve(unknown, knowns, cache=None)), ""
+    except (ArithmeticError, ValueError) as e:
+        return None, str(e)
+
+
+_worker_task: Optional[Tuple[Equation, str]] = None
+
+
+def _init_worker(equation_id: str, unknown: str) -> None:
+    # Worker processes look the equation up again, since it cannot be pickled
+    global _worker_task
+    from .registry import default_registry
+
+    _worker_task = (default_registry().equation(equation_id), unknown)
+
+
+def _solve_in_worker(knowns: Dict[str, float]) -> Outcome:
+    equation, unknown = _worker_task
+    return _solve_row(equation, unknown, knowns)
+
+
+def run_batch(
+    solver: BatchSolver,
+    source: TextIO,
+    sink: TextIO,
+    input_format: str = "csv",
+    output_format: Optional[str] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> BatchStats:
+    """
+    Streams rows from `source` through the solver and writes them to `sink`
+    with the unknown and an error column added. Rows are read, solved and
+    written `chunk_size` at a time.
+
+    Raises:
+        ValueError: if the input lacks a column for a known variable.
+
+    Returns:
+        BatchStats: how many rows were processed and how many failed.
+    """
+
+    output_format = output_format or input_format
+    if output_format not in FORMATS:
+        raise ValueError(f"Unknown format: {output_format}")
+
+    fieldnames, rows = read_rows(source, input_format)
+    stats = BatchStats()
+    if not fieldnames:
+        return stats
+
+    columns = solver.columns(fieldnames)
+    unknown = solver.unknown
+    output_fields = [field for field in fieldnames if field not in (unknown, ERROR_FIELD)]
+    output_fields += [unknown, ERROR_FIELD]
+
+    writer = None
+    if output_format == "csv":
+        writer = csv.DictWriter(sink, output_fields, extrasaction="ignore", lineterminator="\n")
+        writer.writeheader()
+
+    try:
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+
+            for row, (value, error) in zip(chunk, solver.solve_chunk(chunk, columns)):
+                row[unknown] = value
+                row[ERROR_FIELD] = error
+                stats.failed += bool(error)
+                if writer is not None:
+                    row[unknown] = "" if value is None else repr(value)
+                    writer.writerow(row)
+                else:
+                    sink.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+            stats.rows += len(chunk)
+            sink.flush()
+    finally:
+        solver.close()
+
+    return stats
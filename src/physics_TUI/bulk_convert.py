@@ -0,0 +1,168 @@
+"""
+Streaming unit conversion of large files. CSV columns and raw binary float
+files are read a block at a time, converted in place with
+`Quantity.convert_many` and written out before the next block is read, so
+memory use depends on the chunk size and not on the size of the input.
+"""
+
+import csv
+from itertools import islice
+from typing import BinaryIO, List, Optional, Protocol, Sequence, TextIO, Tuple
+
+import numpy as np
+
+from .batch import CHUNK_SIZE, BatchStats
+from .unit_converter import Quantity
+
+CONVERT_FORMATS = ("csv", "raw")
+RAW_EXTENSIONS = (".bin", ".raw", ".dat", ".f32", ".f64")
+
+
+class RawSource(Protocol):
+    """A binary stream that can read into a buffer, such as `io.BufferedReader`"""
+
+    def readinto(self, buffer: memoryview, /) -> Optional[int]: ...
+
+
+def convert_format_for(path: str) -> str:
+    """Guesses the format of a file from its extension, defaulting to CSV"""
+    return "raw" if path.lower().endswith(RAW_EXTENSIONS) else "csv"
+
+
+def convert_csv(
+    quantity: Quantity,
+    from_unit: str,
+    to_unit: str,
+    source: TextIO,
+    sink: TextIO,
+    columns: Sequence[str],
+    chunk_size: int = CHUNK_SIZE,
+) -> BatchStats:
+    """
+    Converts the named columns of a CSV file with a header row and writes
+    every row to `sink`, `chunk_size` rows at a time. Cells that are not
+    numbers are written unchanged and counted as failed.
+
+    Raises:
+        KeyError: if either unit does not belong to the quantity.
+        ValueError: if the input lacks one of the columns.
+
+    Returns:
+        BatchStats: how many rows were processed and how many cells failed.
+    """
+
+    quantity.factor(from_unit, to_unit)  # fail on unknown units before writing anything
+    reader = csv.reader(source)
+    writer = csv.writer(sink, lineterminator="\n")
+    stats = BatchStats()
+
+    header = next(reader, None)
+    if header is None:
+        return stats
+    missing = [column for column in columns if column not in header]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+    indices = sorted({header.index(column) for column in columns})
+    writer.writerow(header)
+
+    while True:
+        chunk = list(islice(reader, chunk_size))
+        if not chunk:
+            break
+
+        for index in indices:
+            cells = [row[index] if index < len(row) else "" for row in chunk]
+            values, valid = _parse_floats(cells)
+            quantity.convert_many(values, from_unit, to_unit)
+            for row, value, ok in zip(chunk, values.tolist(), valid.tolist()):
+                if ok:
+                    row[index] = repr(value)
+            stats.failed += len(chunk) - int(valid.sum())
+
+        writer.writerows(chunk)
+        stats.rows += len(chunk)
+        sink.flush()
+
+    return stats
+
+
+def _parse_floats(cells: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """The cells as a float array, and a mask of the cells that were numbers"""
+    try:
+        return np.array(cells, dtype=np.float64), np.ones(len(cells), dtype=bool)
+    except ValueError:
+        pass
+
+    values = np.full(len(cells), np.nan)
+    valid = np.zeros(len(cells), dtype=bool)
+    for i, cell in enumerate(cells):
+        try:
+            values[i] = float(cell)
+            valid[i] = True
+        except ValueError:
+            pass
+    return values, valid
+
+
+def convert_raw(
+    quantity: Quantity,
+    from_unit: str,
+    to_unit: str,
+    source: RawSource,
+    sink: BinaryIO,
+    dtype: str = "float64",
+    chunk_size: int = CHUNK_SIZE,
+) -> BatchStats:
+    """
+    Converts a stream of packed binary floats, such as a file written with
+    `ndarray.tofile`. Each block is read straight into a reused buffer,
+    converted in place and written out.
+
+    Raises:
+        KeyError: if either unit does not belong to the quantity.
+        ValueError: if `dtype` is not a float type or the input ends partway
+            through a value.
+
+    Returns:
+        BatchStats: how many values were converted.
+    """
+
+    item = np.dtype(dtype)
+    if item.kind != "f":
+        raise ValueError(f"Raw values must be floats, not {item}")
+    quantity.factor(from_unit, to_unit)
+
+    block = np.empty(chunk_size, dtype=item)
+    buffer = memoryview(block.view(np.uint8))
+    stats = BatchStats()
+    filled = 0
+
+    while True:
+        read = source.readinto(buffer[filled:])
+        if not read:
+            break
+        filled += read
+        count = filled // item.itemsize
+        if filled < len(buffer) and count < chunk_size // 2:
+            continue  # short read from a pipe; fill more of the block first
+
+        quantity.convert_many(block[:count], from_unit, to_unit)
+        end = count * item.itemsize
+        sink.write(buffer[:end])
+        stats.rows += count
+
+        # Keep the bytes of a value split across reads for the next block
+        leftover = filled - end
+        buffer[:leftover] = buffer[end:filled]
+        filled = leftover
+
+    count = filled // item.itemsize
+    if count:
+        quantity.convert_many(block[:count], from_unit, to_unit)
+        sink.write(buffer[: count * item.itemsize])
+        stats.rows += count
+    if filled % item.itemsize:
+        raise ValueError(f"Input ends with a partial value of {filled % item.itemsize} bytes")
+
+    sink.flush()
+    return stats
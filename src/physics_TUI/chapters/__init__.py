@@ -1,18 +1,40 @@
-"""Physics chapters module"""
-
-from .chapter3 import Chapter3
-from .chapter4 import Chapter4
-from .chapter5 import Chapter5
-from .chapter6 import Chapter6
-from .chapter7 import Chapter7
-from .chapter8 import Chapter8
-from .chapter9 import Chapter9
-from .chapter10 import Chapter10
-from .chapter11 import Chapter11
-from .chapter12 import Chapter12
-from .chapter13 import Chapter13
+"""
+Physics chapters module. Chapters are listed in MANIFEST and their modules
+are only imported when a chapter class is first used.
+"""
+
+from importlib import import_module
+from typing import Any, Dict, List
+
+from physics_TUI.base_chapter import ChapterEntry
+
+MANIFEST: List[ChapterEntry] = [
+    ChapterEntry("ch3", "Ch.3 - Motion Along a Straight Line", f"{__name__}.chapter3", "Chapter3"),
+    ChapterEntry("ch4", "Ch.4 - Motion in Two and Three Dimensions", f"{__name__}.chapter4", "Chapter4"),
+    ChapterEntry("ch5", "Ch.5 - Newton's Laws of Motion", f"{__name__}.chapter5", "Chapter5"),
+    ChapterEntry("ch6", "Ch.6 - Applications of Newton's Laws", f"{__name__}.chapter6", "Chapter6"),
+    ChapterEntry("ch7", "Ch.7 - Work and Kinetic Energy", f"{__name__}.chapter7", "Chapter7"),
+    ChapterEntry("ch8", "Ch.8 - Potential Energy & Conservation of Energy", f"{__name__}.chapter8", "Chapter8"),
+    ChapterEntry("ch9", "Ch.9 - Linear Momentum and Collisions", f"{__name__}.chapter9", "Chapter9"),
+    ChapterEntry("ch10", "Ch.10 - Fixed-Axis Rotation", f"{__name__}.chapter10", "Chapter10"),
+    ChapterEntry("ch11", "Ch.11 - Angular Momentum", f"{__name__}.chapter11", "Chapter11"),
+    ChapterEntry("ch12", "Ch.12 - Static Equilibrium and Elasticity", f"{__name__}.chapter12", "Chapter12"),
+    ChapterEntry("ch13", "Ch.13 - Gravitation", f"{__name__}.chapter13", "Chapter13"),
+    ChapterEntry("ch14", "Ch.14 - Fluid Dynamics", f"{__name__}.chapter14", "Chapter14"),
+]
+
+_MODULES: Dict[str, str] = {entry.class_name: entry.module for entry in MANIFEST}
+
+
+def __getattr__(name: str) -> Any:
+    # Imports the chapter module on first access to one of its classes
+    if name in _MODULES:
+        return getattr(import_module(_MODULES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
+    "MANIFEST",
     "Chapter3", 
     "Chapter4", 
     "Chapter5",
@@ -25,4 +47,4 @@ __all__ = [
     "Chapter12",
     "Chapter13",
     "Chapter14",
-    ]
\ No newline at end of file
+    ]
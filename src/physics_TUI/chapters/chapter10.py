@@ -1,5 +1,7 @@
-from typing import List, Optional, Dict, Tuple
+from typing import List, Optional, Dict
 from physics_TUI.base_chapter import PhysicsChapter, Equation, Definition
+from physics_TUI.quadratic import earliest_time
+from physics_TUI.solver import Branch, Check, EquationSolver
 from math import sqrt, sin, asin, pi
 
 
@@ -42,6 +44,7 @@ class Chapter10(PhysicsChapter):
                     "r": "Radius (m)",
                 },
                 calculation=self.Calculate.angular_position,
+                solver=self.Solvers.angular_position,
             ),
             Equation(
                 name="Angular velocity",
@@ -60,6 +63,7 @@ class Chapter10(PhysicsChapter):
                     "ω": "Angular velocity (rads/s)",
                 },
                 calculation=self.Calculate.tangential_speed,
+                solver=self.Solvers.tangential_speed,
             ),
             Equation(
                 name="Angular acceleration",
@@ -87,6 +91,7 @@ class Chapter10(PhysicsChapter):
                     "ω(f)": "Final angular velocity (rad/s)",
                 },
                 calculation=self.Calculate.average_angular_vel,
+                solver=self.Solvers.average_angular_vel,
             ),
             Equation(
                 name="Angular displacement",
@@ -98,6 +103,7 @@ class Chapter10(PhysicsChapter):
                     "t": "time (s)",
                 },
                 calculation=self.Calculate.angular_displacement,
+                solver=self.Solvers.angular_displacement,
             ),
             Equation(
                 name="Angular velocity from constant angular acceleration",
@@ -109,6 +115,7 @@ class Chapter10(PhysicsChapter):
                     "t": "time (s)",
                 },
                 calculation=self.Calculate.angular_vel_const_accel,
+                solver=self.Solvers.angular_vel_const_accel,
             ),
             Equation(
                 name="Angular displacement from angular velocity and constant angular acceleration",
@@ -121,6 +128,7 @@ class Chapter10(PhysicsChapter):
                     "α": "Angular acceleration (rads/s²)",
                 },
                 calculation=self.Calculate.angular_displacement_const_accel,
+                solver=self.Solvers.angular_displacement_const_accel,
             ),
             Equation(
                 name="Change in angular velocity",
@@ -132,6 +140,7 @@ class Chapter10(PhysicsChapter):
                     "Δθ": "Change in angular position (rads)",
                 },
                 calculation=self.Calculate.change_angular_velocity,
+                solver=self.Solvers.change_angular_velocity,
             ),
             Equation(
                 name="Total Acceleration",
@@ -169,6 +178,7 @@ class Chapter10(PhysicsChapter):
                     "ω": "Angular velocity (rads/s)",
                 },
                 calculation=self.Calculate.rotational_ke,
+                solver=self.Solvers.rotational_ke,
             ),
             Equation(
                 name="Moment of inertia of a continuous object",
@@ -216,6 +226,7 @@ class Chapter10(PhysicsChapter):
                     "θ": "The angle of the applied force relative to r (rads)",
                 },
                 calculation=self.Calculate.magnitude_of_torque,
+                solver=self.Solvers.magnitude_of_torque,
             ),
             Equation(
                 name="Total torque",
@@ -348,33 +359,6 @@ class Chapter10(PhysicsChapter):
         Class holds methods to calculate equations in Chapter 10
         """
 
-        @staticmethod
-        def quadratic_eq(a: float, b: float, c: float) -> Optional[Tuple[float, float]]:
-            """
-            Function calculates the roots of a quadratic equation ax^2 + bx + c = 0
-            accurately in all cases.
-
-            Returns a tuple containing the two roots.
-            """
-
-            discriminant: float = b**2 - 4 * a * c
-
-            if discriminant < 0:
-                return None
-
-            if b == 0 and c == 0:
-                return (0.0, 0.0)
-
-            # Choose the appropriate formula based on the sign of b
-            if b >= 0:
-                x1: float = (-b - sqrt(discriminant)) / (2 * a)
-                x2: float = (2 * c) / (-b - sqrt(discriminant))
-            else:
-                x1: float = (2 * c) / (-b + sqrt(discriminant))
-                x2: float = (-b + sqrt(discriminant)) / (2 * a)
-
-            return (x1, x2)
-
         @staticmethod
         def angular_position(
             theta: Optional[float] = None,
@@ -634,22 +618,10 @@ class Chapter10(PhysicsChapter):
 
             if time is None:
 
-                # Calculates for time
-                c: float = theta_init - theta_final
-                b: float = init_angular_vel
-                a: float = 0.5 * const_angular_accel
-                roots: Tuple[float, float] = Chapter10.Calculate.quadratic_eq(a, b, c)
-
-                if roots is None:
-                    raise ValueError("No real solution for time")
-
-                # Return the non-negative root, preferring the smaller positive one
-                valid_roots: List[float] = [r for r in roots if r >= 0]
-
-                if not valid_roots:
-                    raise ValueError("No positive time solution")
-
-                return round(min(valid_roots), 4)
+                # Calculates for the earliest non-negative time
+                return round(
+                    earliest_time(0.5 * const_angular_accel, init_angular_vel, theta_init - theta_final), 4
+                )
 
             return (
                 theta_init
@@ -827,3 +799,302 @@ class Chapter10(PhysicsChapter):
                 return asin(argument) * (180 / pi)
 
             return radius * force * sin(theta_radians)
+
+    class Solvers:
+        """
+        Array-capable counterparts of the Calculate methods in Chapter 10.
+        """
+
+        angular_position = EquationSolver(
+            ("theta", "arc_length", "radius"),
+            Branch("theta", lambda xp, arc_length, radius: arc_length / radius),
+            Branch("arc_length", lambda xp, theta, radius: theta * radius),
+            Branch(
+                "radius",
+                lambda xp, theta, arc_length: arc_length / theta,
+                checks=(Check(lambda theta: theta == 0, "Division by zero is undefined."),),
+            ),
+            checks=(
+                Check(
+                    lambda radius: radius <= 0,
+                    "Radius of rotational trajectory cannot be less than or equal to zero.",
+                ),
+                Check(lambda arc_length: arc_length < 0, "An arc length cannot be a negative value."),
+            ),
+        )
+
+        tangential_speed = EquationSolver(
+            ("tang_speed", "radius", "angular_vel"),
+            Branch("tang_speed", lambda xp, radius, angular_vel: radius * angular_vel),
+            Branch(
+                "radius",
+                lambda xp, tang_speed, angular_vel: tang_speed / angular_vel,
+                checks=(Check(lambda angular_vel: angular_vel == 0, "Divison by zero is undefined."),),
+            ),
+            Branch("angular_vel", lambda xp, tang_speed, radius: tang_speed / radius),
+            checks=(Check(lambda radius: radius <= 0, "Radius must be greater than zero."),),
+        )
+
+        average_angular_vel = EquationSolver(
+            ("ave_angular_vel", "init_angular_vel", "final_angular_vel"),
+            Branch(
+                "ave_angular_vel",
+                lambda xp, init_angular_vel, final_angular_vel: (init_angular_vel + final_angular_vel)
+                / 2.0,
+            ),
+            Branch(
+                "init_angular_vel",
+                lambda xp, ave_angular_vel, final_angular_vel: (2.0 * ave_angular_vel)
+                - final_angular_vel,
+            ),
+            Branch(
+                "final_angular_vel",
+                lambda xp, ave_angular_vel, init_angular_vel: (2.0 * ave_angular_vel)
+                - init_angular_vel,
+            ),
+        )
+
+        angular_displacement = EquationSolver(
+            ("theta_final", "theta_init", "ave_angular_vel", "time"),
+            Branch(
+                "theta_final",
+                lambda xp, theta_init, ave_angular_vel, time: theta_init + (ave_angular_vel * time),
+            ),
+            Branch(
+                "theta_init",
+                lambda xp, theta_final, ave_angular_vel, time: theta_final - (ave_angular_vel * time),
+            ),
+            Branch(
+                "ave_angular_vel",
+                lambda xp, theta_final, theta_init, time: (theta_final - theta_init) / time,
+                checks=(Check(lambda time: time == 0, "Division by zero is undefined."),),
+            ),
+            Branch(
+                "time",
+                lambda xp, theta_final, theta_init, ave_angular_vel: (theta_final - theta_init)
+                / ave_angular_vel,
+                checks=(
+                    Check(lambda ave_angular_vel: ave_angular_vel == 0, "Division by zero is undefined."),
+                    Check(lambda result: result < 0, "Time cannot be a negative value."),
+                ),
+            ),
+            checks=(Check(lambda time: time < 0, "Time cannot be a negative value."),),
+        )
+
+        angular_vel_const_accel = EquationSolver(
+            ("final_angular_vel", "init_angular_vel", "const_angular_accel", "time"),
+            Branch(
+                "final_angular_vel",
+                lambda xp, init_angular_vel, const_angular_accel, time: init_angular_vel
+                + (const_angular_accel * time),
+            ),
+            Branch(
+                "init_angular_vel",
+                lambda xp, final_angular_vel, const_angular_accel, time: final_angular_vel
+                - (const_angular_accel * time),
+            ),
+            Branch(
+                "const_angular_accel",
+                lambda xp, final_angular_vel, init_angular_vel, time: (
+                    final_angular_vel - init_angular_vel
+                )
+                / time,
+                checks=(Check(lambda time: time == 0, "Division by zero is undefined."),),
+            ),
+            Branch(
+                "time",
+                lambda xp, final_angular_vel, init_angular_vel, const_angular_accel: (
+                    final_angular_vel - init_angular_vel
+                )
+                / const_angular_accel,
+                checks=(
+                    Check(
+                        lambda const_angular_accel: const_angular_accel == 0,
+                        "Division by zero is undefined.",
+                    ),
+                    Check(lambda result: result < 0, "Time cannot be a negative value."),
+                ),
+            ),
+            checks=(Check(lambda time: time < 0, "Time cannot be a negative value."),),
+        )
+
+        angular_displacement_const_accel = EquationSolver(
+            ("theta_final", "theta_init", "init_angular_vel", "time", "const_angular_accel"),
+            Branch(
+                "theta_final",
+                lambda xp, theta_init, init_angular_vel, time, const_angular_accel: theta_init
+                + (init_angular_vel * time)
+                + (0.5 * const_angular_accel * (time * time)),
+            ),
+            Branch(
+                "theta_init",
+                lambda xp, theta_final, init_angular_vel, time, const_angular_accel: theta_final
+                - (init_angular_vel * time)
+                - (0.5 * const_angular_accel * (time * time)),
+            ),
+            Branch(
+                "init_angular_vel",
+                lambda xp, theta_final, theta_init, time, const_angular_accel: (
+                    theta_final - theta_init - (0.5 * const_angular_accel * (time * time))
+                )
+                / time,
+                checks=(Check(lambda time: time == 0, "Division by zero is undefined."),),
+            ),
+            Branch(
+                "time",
+                lambda xp, theta_final, theta_init, init_angular_vel, const_angular_accel: (
+                    xp.first_nonnegative(
+                        *xp.roots(0.5 * const_angular_accel, init_angular_vel, theta_init - theta_final)
+                    )
+                ),
+                checks=(
+                    Check(
+                        lambda theta_final, theta_init, init_angular_vel, const_angular_accel: (
+                            (init_angular_vel * init_angular_vel)
+                            - 2 * const_angular_accel * (theta_init - theta_final)
+                            < 0
+                        ),
+                        "No real solution for time",
+                    ),
+                    Check(lambda xp, result: xp.isnan(result), "No positive time solution"),
+                ),
+            ),
+            Branch(
+                "const_angular_accel",
+                lambda xp, theta_final, theta_init, init_angular_vel, time: (
+                    theta_final - theta_init - (init_angular_vel * time)
+                )
+                * (2.0 / (time * time)),
+                checks=(Check(lambda time: time == 0, "Division by zero is undefined."),),
+            ),
+            checks=(Check(lambda time: time < 0, "Time cannot be a negative value."),),
+        )
+
+        change_angular_velocity = EquationSolver(
+            ("final_angular_vel", "init_angular_vel", "const_angular_accel", "delta_theta"),
+            Branch(
+                "final_angular_vel",
+                lambda xp, init_angular_vel, const_angular_accel, delta_theta: xp.sqrt(
+                    (init_angular_vel * init_angular_vel) + 2 * const_angular_accel * delta_theta
+                ),
+                checks=(
+                    Check(
+                        lambda init_angular_vel, const_angular_accel, delta_theta: (
+                            (init_angular_vel * init_angular_vel)
+                            + 2 * const_angular_accel * delta_theta
+                            < 0
+                        ),
+                        "A negative radicand yields an imaginary number. Check your values.",
+                    ),
+                ),
+            ),
+            Branch(
+                "init_angular_vel",
+                lambda xp, final_angular_vel, const_angular_accel, delta_theta: xp.sqrt(
+                    (final_angular_vel * final_angular_vel) - 2 * const_angular_accel * delta_theta
+                ),
+                checks=(
+                    Check(
+                        lambda final_angular_vel, const_angular_accel, delta_theta: (
+                            (final_angular_vel * final_angular_vel)
+                            - 2 * const_angular_accel * delta_theta
+                            < 0
+                        ),
+                        "A negative radicand yields an imaginary number. Check your values.",
+                    ),
+                ),
+            ),
+            Branch(
+                "const_angular_accel",
+                lambda xp, final_angular_vel, init_angular_vel, delta_theta: (
+                    (final_angular_vel * final_angular_vel) - (init_angular_vel * init_angular_vel)
+                )
+                / (2 * delta_theta),
+                checks=(Check(lambda delta_theta: delta_theta == 0, "Divison by zero is undefined."),),
+            ),
+            Branch(
+                "delta_theta",
+                lambda xp, final_angular_vel, init_angular_vel, const_angular_accel: (
+                    (final_angular_vel * final_angular_vel) - (init_angular_vel * init_angular_vel)
+                )
+                / (2 * const_angular_accel),
+                checks=(
+                    Check(
+                        lambda const_angular_accel: const_angular_accel == 0,
+                        "Division by zero is undefined.",
+                    ),
+                ),
+            ),
+        )
+
+        rotational_ke = EquationSolver(
+            ("kinetic_energy", "moment_inertia", "angular_vel"),
+            Branch(
+                "kinetic_energy",
+                lambda xp, moment_inertia, angular_vel: 0.5 * moment_inertia * (angular_vel * angular_vel),
+            ),
+            Branch(
+                "moment_inertia",
+                lambda xp, kinetic_energy, angular_vel: (2.0 * kinetic_energy)
+                / (angular_vel * angular_vel),
+                checks=(Check(lambda angular_vel: angular_vel == 0, "Divison by zero is undefined."),),
+            ),
+            Branch(
+                "angular_vel",
+                lambda xp, kinetic_energy, moment_inertia: xp.sqrt((2.0 * kinetic_energy) / moment_inertia),
+                checks=(
+                    Check(lambda moment_inertia: moment_inertia == 0, "Divison by zero is undefined."),
+                    Check(
+                        lambda kinetic_energy: kinetic_energy < 0,
+                        "A negative radicand yields an imaginary number. Check your values.",
+                    ),
+                ),
+            ),
+            checks=(
+                Check(
+                    lambda moment_inertia: moment_inertia < 0,
+                    "The moment of inertia cannot be a negative value.",
+                ),
+            ),
+        )
+
+        magnitude_of_torque = EquationSolver(
+            ("torque", "radius", "force", "theta"),
+            Branch(
+                "torque",
+                lambda xp, radius, force, theta: radius * force * xp.sin(xp.radians(theta)),
+            ),
+            Branch(
+                "radius",
+                lambda xp, torque, force, theta: torque / (force * xp.sin(xp.radians(theta))),
+                checks=(
+                    Check(
+                        lambda theta, force: (force == 0) | (theta % 180 == 0),
+                        "Division by zero is undefined.",
+                    ),
+                ),
+            ),
+            Branch(
+                "force",
+                lambda xp, torque, radius, theta: torque / (radius * xp.sin(xp.radians(theta))),
+                checks=(Check(lambda theta: theta % 180 == 0, "Division by zero is undefined."),),
+            ),
+            Branch(
+                "theta",
+                lambda xp, torque, radius, force: xp.degrees(xp.asin(torque / (radius * force))),
+                checks=(
+                    Check(lambda force: force == 0, "Division by zero is undefined."),
+                    Check(
+                        lambda torque, radius, force: abs(torque / (radius * force)) > 1,
+                        "Torque cannot exceed the product of radius and force.",
+                    ),
+                ),
+            ),
+            checks=(
+                Check(
+                    lambda radius: radius <= 0,
+                    "The length of the center of axis to applied force cannot be less "
+                    "than or equal to zero.",
+                ),
+            ),
+        )
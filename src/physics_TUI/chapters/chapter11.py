@@ -1,5 +1,6 @@
 from typing import List, Optional, Dict
 from physics_TUI.base_chapter import PhysicsChapter, Equation, Definition
+from physics_TUI.solver import Branch, Check, EquationSolver
 from math import sqrt, sin, asin, pi
 
 # Global constant
@@ -66,6 +67,7 @@ class Chapter11(PhysicsChapter):
                     "θ": "The angle between the normal force and gravitational force (rads)",
                 },
                 calculation=self.Calculate.accel_without_slipping,
+                solver=self.Solvers.accel_without_slipping,
             ),
             Equation(
                 name="Angular momentum",
@@ -95,6 +97,7 @@ class Chapter11(PhysicsChapter):
                     "ω": "Angular velocity (m/s)",
                 },
                 calculation=self.Calculate.ang_momentum_rigid_body,
+                solver=self.Solvers.ang_momentum_rigid_body,
             ),
             Equation(
                 name="Conservation of angular momentum",
@@ -117,6 +120,7 @@ class Chapter11(PhysicsChapter):
                     "ω": "Angular velocity (rads/s)",
                 },
                 calculation=self.Calculate.processional_ang_vel,
+                solver=self.Solvers.processional_ang_vel,
             ),
         ]
 
@@ -374,3 +378,171 @@ class Chapter11(PhysicsChapter):
             denominator: float = moment_inertia * angular_vel
 
             return numerator / denominator
+
+    class Solvers:
+        """
+        Array-capable counterparts of the Calculate methods in Chapter 11.
+        """
+
+        accel_without_slipping = EquationSolver(
+            ("accel", "mass", "moment_inertia", "radius", "theta"),
+            Branch(
+                "accel",
+                lambda xp, mass, moment_inertia, radius, theta: (mass * g * xp.sin(xp.radians(theta)))
+                / (mass + (moment_inertia / (radius * radius))),
+            ),
+            Branch(
+                "mass",
+                lambda xp, accel, moment_inertia, radius, theta: (accel * moment_inertia)
+                / ((radius * radius) * ((g * xp.sin(xp.radians(theta))) - accel)),
+                checks=(
+                    Check(
+                        lambda xp, accel, theta: g * xp.sin(xp.radians(theta)) == accel,
+                        "Division by zero is undefined.",
+                    ),
+                    Check(
+                        lambda result: result <= 0,
+                        "We are operating with massive objects. Check your values.",
+                    ),
+                ),
+            ),
+            Branch(
+                "moment_inertia",
+                lambda xp, accel, mass, radius, theta: (((g * xp.sin(xp.radians(theta))) / accel) - 1.0)
+                * mass
+                * (radius * radius),
+                checks=(
+                    Check(lambda accel: accel == 0, "Division by zero is undefined."),
+                    Check(
+                        lambda result: result < 0,
+                        "The moment of inertia cannot be a negative value.",
+                    ),
+                ),
+            ),
+            Branch(
+                "radius",
+                lambda xp, accel, mass, moment_inertia, theta: xp.sqrt(
+                    moment_inertia / ((((g * xp.sin(xp.radians(theta))) / accel) - 1.0) * mass)
+                ),
+                checks=(
+                    Check(lambda accel: accel == 0, "Division by zero is undefined."),
+                    Check(
+                        lambda xp, accel, theta: g * xp.sin(xp.radians(theta)) < accel,
+                        "Negative radicand yields an imaginary number. Check your values.",
+                    ),
+                ),
+            ),
+            Branch(
+                "theta",
+                lambda xp, accel, mass, moment_inertia, radius: xp.degrees(
+                    xp.asin((accel * (mass + (moment_inertia / (radius * radius)))) / (mass * g))
+                ),
+                checks=(
+                    Check(
+                        lambda accel, mass, moment_inertia, radius: abs(
+                            (accel * (mass + (moment_inertia / (radius * radius)))) / (mass * g)
+                        )
+                        > 1,
+                        "Acceleration is too large for any incline angle.",
+                    ),
+                ),
+            ),
+            checks=(
+                Check(
+                    lambda mass: mass <= 0,
+                    "We are operating with massive objects. "
+                    "Make sure all objects have a mass greater than zero.",
+                ),
+                Check(
+                    lambda moment_inertia: moment_inertia < 0,
+                    "The moment of inertia cannot be a negative value.",
+                ),
+                Check(lambda radius: radius <= 0, "Radius cannot be less than or equal to zero."),
+            ),
+        )
+
+        ang_momentum_rigid_body = EquationSolver(
+            ("angular_momentum", "moment_inertia", "angular_vel"),
+            Branch("angular_momentum", lambda xp, moment_inertia, angular_vel: moment_inertia * angular_vel),
+            Branch(
+                "moment_inertia",
+                lambda xp, angular_momentum, angular_vel: angular_momentum / angular_vel,
+                checks=(Check(lambda angular_vel: angular_vel == 0, "Division by zero is undefined."),),
+            ),
+            Branch(
+                "angular_vel",
+                lambda xp, angular_momentum, moment_inertia: angular_momentum / moment_inertia,
+                checks=(
+                    Check(lambda moment_inertia: moment_inertia == 0, "Divison by zero is undefined."),
+                ),
+            ),
+            checks=(
+                Check(
+                    lambda moment_inertia: moment_inertia < 0,
+                    "The moment of inertia cannot be a negative value.",
+                ),
+            ),
+        )
+
+        processional_ang_vel = EquationSolver(
+            ("processional_ang_vel", "radius", "mass", "moment_inertia", "angular_vel"),
+            Branch(
+                "processional_ang_vel",
+                lambda xp, radius, mass, moment_inertia, angular_vel: (radius * mass * g)
+                / (moment_inertia * angular_vel),
+                checks=(
+                    Check(
+                        lambda moment_inertia, angular_vel: (moment_inertia == 0) | (angular_vel == 0),
+                        "Division by zero is undefined.",
+                    ),
+                ),
+            ),
+            Branch(
+                "radius",
+                lambda xp, processional_ang_vel, mass, moment_inertia, angular_vel: processional_ang_vel
+                * (moment_inertia * angular_vel)
+                / (mass * g),
+            ),
+            Branch(
+                "mass",
+                lambda xp, processional_ang_vel, radius, moment_inertia, angular_vel: processional_ang_vel
+                * (moment_inertia * angular_vel)
+                / (radius * g),
+            ),
+            Branch(
+                "moment_inertia",
+                lambda xp, processional_ang_vel, radius, mass, angular_vel: (radius * mass * g)
+                / (processional_ang_vel * angular_vel),
+                checks=(
+                    Check(
+                        lambda processional_ang_vel, angular_vel: (processional_ang_vel == 0)
+                        | (angular_vel == 0),
+                        "Division by zero is undefined.",
+                    ),
+                ),
+            ),
+            Branch(
+                "angular_vel",
+                lambda xp, processional_ang_vel, radius, mass, moment_inertia: (radius * mass * g)
+                / (processional_ang_vel * moment_inertia),
+                checks=(
+                    Check(
+                        lambda processional_ang_vel, moment_inertia: (processional_ang_vel == 0)
+                        | (moment_inertia == 0),
+                        "Division by zero is undefined.",
+                    ),
+                ),
+            ),
+            checks=(
+                Check(
+                    lambda mass: mass <= 0,
+                    "We are operating with massive objects. "
+                    "Make sure all objects have a mass greater than zero.",
+                ),
+                Check(
+                    lambda moment_inertia: moment_inertia < 0,
+                    "The moment of inertia cannot be a negative value.",
+                ),
+                Check(lambda radius: radius <= 0, "Radius cannot be less than or equal to zero."),
+            ),
+        )
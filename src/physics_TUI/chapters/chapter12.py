@@ -1,5 +1,6 @@
 from typing import List, Optional, Dict
 from physics_TUI.base_chapter import PhysicsChapter, Equation, Definition
+from physics_TUI.solver import Branch, Check, EquationSolver
 
 
 class Chapter12(PhysicsChapter):
@@ -47,6 +48,7 @@ class Chapter12(PhysicsChapter):
                     "ΔL": "Change of length after deformation (m)",
                 },
                 calculation=self.Calculate.young_modulus,
+                solver=self.Solvers.young_modulus,
             ),
             Equation(
                 name="Bulk modulus",
@@ -58,6 +60,7 @@ class Chapter12(PhysicsChapter):
                     "ΔV": "Change in volume (m³)",
                 },
                 calculation=self.Calculate.bulk_modulus,
+                solver=self.Solvers.bulk_modulus,
             ),
             Equation(
                 name="Shear modulus",
@@ -70,6 +73,7 @@ class Chapter12(PhysicsChapter):
                     "Δx": "a gradual shift of layers in the direction tangent to the acting forces.",
                 },
                 calculation=self.Calculate.shear_modulus,
+                solver=self.Solvers.shear_modulus,
             ),
         ]
 
@@ -313,3 +317,178 @@ class Chapter12(PhysicsChapter):
                 return numerator / denominator
 
             return (force / cross_section) * (init_length / delta_layers)
+
+    class Solvers:
+        """
+        Array-capable counterparts of the Calculate methods in Chapter 12.
+        """
+
+        young_modulus = EquationSolver(
+            ("young_mod", "force", "cross_section", "init_length", "delta_length"),
+            Branch(
+                "young_mod",
+                lambda xp, force, cross_section, init_length, delta_length: (force / cross_section)
+                * (init_length / delta_length),
+                checks=(
+                    Check(
+                        lambda cross_section, delta_length: (cross_section == 0) | (delta_length == 0),
+                        "Division by zero is undefined.",
+                    ),
+                ),
+            ),
+            Branch(
+                "force",
+                lambda xp, young_mod, cross_section, init_length, delta_length: (
+                    delta_length * cross_section * young_mod
+                )
+                / init_length,
+            ),
+            Branch(
+                "cross_section",
+                lambda xp, young_mod, force, init_length, delta_length: (init_length * force)
+                / (young_mod * delta_length),
+                checks=(
+                    Check(
+                        lambda young_mod, delta_length: (young_mod == 0) | (delta_length == 0),
+                        "Division by zero is undefined.",
+                    ),
+                ),
+            ),
+            Branch(
+                "init_length",
+                lambda xp, young_mod, force, cross_section, delta_length: (
+                    young_mod * delta_length * cross_section
+                )
+                / force,
+                checks=(Check(lambda force: force == 0, "Division by zero is undefined."),),
+            ),
+            Branch(
+                "delta_length",
+                lambda xp, young_mod, force, cross_section, init_length: (init_length * force)
+                / (young_mod * cross_section),
+                checks=(
+                    Check(
+                        lambda young_mod, cross_section: (young_mod == 0) | (cross_section == 0),
+                        "Divison by zero is undefined.",
+                    ),
+                ),
+            ),
+            checks=(
+                Check(
+                    lambda init_length: init_length <= 0,
+                    "The initial length and cross section cannot be less than or equal to zero.",
+                ),
+                Check(
+                    lambda cross_section: cross_section < 0,
+                    "The initial length and cross section cannot be less than or equal to zero.",
+                ),
+                Check(
+                    lambda delta_length: delta_length < 0,
+                    "The change in length cannot be less than zero.",
+                ),
+            ),
+        )
+
+        bulk_modulus = EquationSolver(
+            ("bulk_mod", "delta_pressure", "init_volume", "delta_volume"),
+            Branch(
+                "bulk_mod",
+                lambda xp, delta_pressure, init_volume, delta_volume: (-delta_pressure * init_volume)
+                / delta_volume,
+                checks=(Check(lambda delta_volume: delta_volume == 0, "Division by zero is undefined."),),
+            ),
+            Branch(
+                "delta_pressure",
+                lambda xp, bulk_mod, init_volume, delta_volume: -(bulk_mod * delta_volume) / init_volume,
+            ),
+            Branch(
+                "init_volume",
+                lambda xp, bulk_mod, delta_pressure, delta_volume: -(bulk_mod * delta_volume)
+                / delta_pressure,
+                checks=(
+                    Check(lambda delta_pressure: delta_pressure == 0, "Division by zero is undefined."),
+                    Check(
+                        lambda result: result <= 0,
+                        "The volume of the object must be greater than zero.",
+                    ),
+                ),
+            ),
+            Branch(
+                "delta_volume",
+                lambda xp, bulk_mod, delta_pressure, init_volume: (-delta_pressure * init_volume)
+                / bulk_mod,
+                checks=(Check(lambda bulk_mod: bulk_mod == 0, "Division by zero is undefined."),),
+            ),
+            checks=(
+                Check(
+                    lambda init_volume: init_volume <= 0,
+                    "The volume of the object must be greater than zero.",
+                ),
+            ),
+        )
+
+        shear_modulus = EquationSolver(
+            ("shear_mod", "force", "cross_section", "init_length", "delta_layers"),
+            Branch(
+                "shear_mod",
+                lambda xp, force, cross_section, init_length, delta_layers: (force / cross_section)
+                * (init_length / delta_layers),
+                checks=(
+                    Check(
+                        lambda cross_section, delta_layers: (cross_section == 0) | (delta_layers == 0),
+                        "Division by zero is undefined.",
+                    ),
+                ),
+            ),
+            Branch(
+                "force",
+                lambda xp, shear_mod, cross_section, init_length, delta_layers: (
+                    delta_layers * cross_section * shear_mod
+                )
+                / init_length,
+            ),
+            Branch(
+                "cross_section",
+                lambda xp, shear_mod, force, init_length, delta_layers: (init_length * force)
+                / (shear_mod * delta_layers),
+                checks=(
+                    Check(
+                        lambda shear_mod, delta_layers: (shear_mod == 0) | (delta_layers == 0),
+                        "Division by zero is undefined.",
+                    ),
+                ),
+            ),
+            Branch(
+                "init_length",
+                lambda xp, shear_mod, force, cross_section, delta_layers: (
+                    shear_mod * delta_layers * cross_section
+                )
+                / force,
+                checks=(Check(lambda force: force == 0, "Division by zero is undefined."),),
+            ),
+            Branch(
+                "delta_layers",
+                lambda xp, shear_mod, force, cross_section, init_length: (init_length * force)
+                / (shear_mod * cross_section),
+                checks=(
+                    Check(
+                        lambda shear_mod, cross_section: (shear_mod == 0) | (cross_section == 0),
+                        "Divison by zero is undefined.",
+                    ),
+                ),
+            ),
+            checks=(
+                Check(
+                    lambda init_length: init_length <= 0,
+                    "The initial length and cross section cannot be less than or equal to zero.",
+                ),
+                Check(
+                    lambda cross_section: cross_section < 0,
+                    "The initial length and cross section cannot be less than or equal to zero.",
+                ),
+                Check(
+                    lambda delta_layers: delta_layers < 0,
+                    "The change in length cannot be less than zero.",
+                ),
+            ),
+        )
@@ -1,5 +1,6 @@
 from typing import List, Optional, Dict
 from physics_TUI.base_chapter import PhysicsChapter, Equation, Definition
+from physics_TUI.solver import Branch, Check, EquationSolver
 from math import sqrt, cos, acos, cbrt
 
 # Global constants
@@ -51,6 +52,7 @@ class Chapter13(PhysicsChapter):
                     "r": "Distance between the centers of mass of m(1) to m(2) (m)",
                 },
                 calculation=self.Calculate.law_of_gravitation,
+                solver=self.Solvers.law_of_gravitation,
             ),
             Equation(
                 name="Acceleration due to gravity at the surface of a stellar body",
@@ -62,6 +64,7 @@ class Chapter13(PhysicsChapter):
                     "r": "Radius of the stellar body (m)",
                 },
                 calculation=self.Calculate.gravitational_acceleration,
+                solver=self.Solvers.gravitational_acceleration,
             ),
             Equation(
                 name="Gravitational potential energy beyond a stellar body",
@@ -74,6 +77,7 @@ class Chapter13(PhysicsChapter):
                     "r": "Distance from the center of mass of M to  m (m)",
                 },
                 calculation=self.Calculate.gravitational_potential,
+                solver=self.Solvers.gravitational_potential,
             ),
             Equation(
                 name="Conservation of energy",
@@ -88,6 +92,7 @@ class Chapter13(PhysicsChapter):
                     "r(2)": "Distance from the center of mass M to m (m)",
                 },
                 calculation=self.Calculate.conservation_of_grav_energy,
+                solver=self.Solvers.conservation_of_grav_energy,
             ),
             Equation(
                 name="Escape velocity",
@@ -99,6 +104,7 @@ class Chapter13(PhysicsChapter):
                     "R": "Radius of the stellar body (m)",
                 },
                 calculation=self.Calculate.escape_velocity,
+                solver=self.Solvers.escape_velocity,
             ),
             Equation(
                 name="Orbital speed",
@@ -110,6 +116,7 @@ class Chapter13(PhysicsChapter):
                     "r": "Altitude of the orbiting body (m)",
                 },
                 calculation=self.Calculate.orbital_velocity,
+                solver=self.Solvers.orbital_velocity,
             ),
             Equation(
                 name="Orbital period",
@@ -121,6 +128,7 @@ class Chapter13(PhysicsChapter):
                     "M": "Mass of the stellar body (kg)",
                 },
                 calculation=self.Calculate.orbital_period,
+                solver=self.Solvers.orbital_period,
             ),
             Equation(
                 name="Energy in circular orbit",
@@ -143,6 +151,7 @@ class Chapter13(PhysicsChapter):
                     "θ": "Angle from periapsis (rads)",
                 },
                 calculation=self.Calculate.orbital_equation,
+                solver=self.Solvers.orbital_equation,
             ),
             Equation(
                 name="Kepler's third law",
@@ -154,6 +163,7 @@ class Chapter13(PhysicsChapter):
                     "M": "Mass of the stellar body (kg)",
                 },
                 calculation=self.Calculate.keplers_third_law,
+                solver=self.Solvers.keplers_third_law,
             ),
             Equation(
                 name="Schwarzschild radius",
@@ -165,6 +175,7 @@ class Chapter13(PhysicsChapter):
                     "c": "Speed of light: 2.998 × 10⁸ m/s (constant) ",
                 },
                 calculation=self.Calculate.schwarzschild_radius,
+                solver=self.Solvers.schwarzschild_radius,
             ),
         ]
 
@@ -950,3 +961,380 @@ class Chapter13(PhysicsChapter):
                 return shwarz_radius * ((c * c) / (2.0 * G))
 
             return (2.0 * G * mass_body) / (c * c)
+
+    class Solvers:
+        """
+        Array-capable counterparts of the Calculate methods in Chapter 13.
+        """
+
+        law_of_gravitation = EquationSolver(
+            ("force_12", "mass_1", "mass_2", "distance"),
+            Branch(
+                "force_12",
+                lambda xp, mass_1, mass_2, distance: (G * mass_1 * mass_2) / (distance * distance),
+                checks=(Check(lambda distance: distance == 0, "Division by zero is undefined."),),
+            ),
+            Branch(
+                "mass_1",
+                lambda xp, force_12, mass_2, distance: (force_12 * (distance * distance)) / (G * mass_2),
+            ),
+            Branch(
+                "mass_2",
+                lambda xp, force_12, mass_1, distance: (force_12 * (distance * distance)) / (G * mass_1),
+            ),
+            Branch(
+                "distance",
+                lambda xp, force_12, mass_1, mass_2: xp.sqrt((G * mass_1 * mass_2) / force_12),
+                checks=(
+                    Check(lambda force_12: force_12 == 0, "Division by zero is undefined."),
+                    Check(
+                        lambda force_12: force_12 < 0,
+                        "Negative radicand yields a imaginary number. Check your values.",
+                    ),
+                ),
+            ),
+            checks=(
+                Check(
+                    lambda mass_1: mass_1 <= 0,
+                    "We are operating with massive objects. "
+                    "Make sure all objects have a mass greater than zero.",
+                ),
+                Check(
+                    lambda mass_2: mass_2 <= 0,
+                    "We are operating with massive objects. "
+                    "Make sure all objects have a mass greater than zero.",
+                ),
+                Check(lambda distance: distance < 0, "Distance cannot be a negative value."),
+            ),
+        )
+
+        gravitational_acceleration = EquationSolver(
+            ("g", "mass_body", "distance"),
+            Branch("g", lambda xp, mass_body, distance: (G * mass_body) / (distance * distance)),
+            Branch("mass_body", lambda xp, g, distance: (g * (distance * distance)) / G),
+            Branch(
+                "distance",
+                lambda xp, g, mass_body: xp.sqrt((G * mass_body) / g),
+                checks=(
+                    Check(lambda g: g == 0, "Division by zero is undefined."),
+                    Check(
+                        lambda g, mass_body: (G * mass_body) / g < 0,
+                        "Distance cannot be a negative value.",
+                    ),
+                ),
+            ),
+            checks=(
+                Check(
+                    lambda distance: distance <= 0,
+                    "Distance cannot be a value that is less than or equal to zero.",
+                ),
+            ),
+        )
+
+        gravitational_potential = EquationSolver(
+            ("potential_energy", "mass_body", "mass_object", "distance"),
+            Branch(
+                "potential_energy",
+                lambda xp, mass_body, mass_object, distance: -(G * mass_body * mass_object) / distance,
+            ),
+            Branch(
+                "mass_body",
+                lambda xp, potential_energy, mass_object, distance: -(potential_energy * distance)
+                / (G * mass_object),
+                checks=(Check(lambda result: result < 0, "Mass cannot be negative. Check your values."),),
+            ),
+            Branch(
+                "mass_object",
+                lambda xp, potential_energy, mass_body, distance: -(potential_energy * distance)
+                / (G * mass_body),
+                checks=(Check(lambda result: result < 0, "Mass cannot be negative. Check your values."),),
+            ),
+            Branch(
+                "distance",
+                lambda xp, potential_energy, mass_body, mass_object: -(G * mass_body * mass_object)
+                / potential_energy,
+                checks=(
+                    Check(lambda potential_energy: potential_energy == 0, "Division by zero is undefined."),
+                    Check(lambda result: result < 0, "Distance cannot be negative. Check your values."),
+                ),
+            ),
+            checks=(
+                Check(
+                    lambda distance: distance <= 0,
+                    "Distance between the two bodies must be greater than zero.",
+                ),
+                Check(
+                    lambda mass_body: mass_body <= 0,
+                    "We are operating with massive objects. "
+                    "Make sure all objects have a mass greater than zero.",
+                ),
+                Check(
+                    lambda mass_object: mass_object <= 0,
+                    "We are operating with massive objects. "
+                    "Make sure all objects have a mass greater than zero.",
+                ),
+            ),
+        )
+
+        # The orbiting mass cancels out of the energy balance, so it cannot be
+        # solved for and is only validated.
+        conservation_of_grav_energy = EquationSolver(
+            ("mass_object", "mass_body", "velocity_1", "velocity_2", "distance_1", "distance_2"),
+            Branch(
+                "mass_body",
+                lambda xp, velocity_1, velocity_2, distance_1, distance_2: (
+                    0.5 * ((velocity_1 * velocity_1) - (velocity_2 * velocity_2))
+                )
+                / (G * ((1.0 / distance_1) - (1.0 / distance_2))),
+                checks=(
+                    Check(
+                        lambda distance_1, distance_2: distance_1 == distance_2,
+                        "Divison by zero is undefined.",
+                    ),
+                    Check(
+                        lambda result: result <= 0,
+                        "We are operating with massive objects. Check your values.",
+                    ),
+                ),
+            ),
+            Branch(
+                "velocity_1",
+                lambda xp, mass_body, velocity_2, distance_1, distance_2: xp.sqrt(
+                    (velocity_2 * velocity_2)
+                    + 2.0 * G * mass_body * ((1.0 / distance_1) - (1.0 / distance_2))
+                ),
+                checks=(
+                    Check(
+                        lambda mass_body, velocity_2, distance_1, distance_2: (
+                            (velocity_2 * velocity_2)
+                            + 2.0 * G * mass_body * ((1.0 / distance_1) - (1.0 / distance_2))
+                            < 0
+                        ),
+                        "Negative radicand yields a imaginary number. Check your values.",
+                    ),
+                ),
+            ),
+            Branch(
+                "velocity_2",
+                lambda xp, mass_body, velocity_1, distance_1, distance_2: xp.sqrt(
+                    (velocity_1 * velocity_1)
+                    - 2.0 * G * mass_body * ((1.0 / distance_1) - (1.0 / distance_2))
+                ),
+                checks=(
+                    Check(
+                        lambda mass_body, velocity_1, distance_1, distance_2: (
+                            (velocity_1 * velocity_1)
+                            - 2.0 * G * mass_body * ((1.0 / distance_1) - (1.0 / distance_2))
+                            < 0
+                        ),
+                        "Negative radicand yields a imaginary number. Check your values.",
+                    ),
+                ),
+            ),
+            Branch(
+                "distance_1",
+                lambda xp, mass_body, velocity_1, velocity_2, distance_2: 1.0
+                / (
+                    (1.0 / distance_2)
+                    + ((velocity_1 * velocity_1) - (velocity_2 * velocity_2)) / (2.0 * G * mass_body)
+                ),
+                checks=(
+                    Check(
+                        lambda result: result <= 0,
+                        "Distance cannot be a negative value.",
+                    ),
+                ),
+            ),
+            Branch(
+                "distance_2",
+                lambda xp, mass_body, velocity_1, velocity_2, distance_1: 1.0
+                / (
+                    (1.0 / distance_1)
+                    - ((velocity_1 * velocity_1) - (velocity_2 * velocity_2)) / (2.0 * G * mass_body)
+                ),
+                checks=(
+                    Check(
+                        lambda result: result <= 0,
+                        "Distance cannot be a negative value.",
+                    ),
+                ),
+            ),
+            checks=(
+                Check(lambda distance_1: distance_1 <= 0, "Distance cannot be a negative value."),
+                Check(lambda distance_2: distance_2 <= 0, "Distance cannot be a negative value."),
+                Check(
+                    lambda mass_object: mass_object <= 0,
+                    "We are operating with massive objects. "
+                    "Make sure all objects have a mass greater than zero.",
+                ),
+                Check(
+                    lambda mass_body: mass_body <= 0,
+                    "We are operating with massive objects. "
+                    "Make sure all objects have a mass greater than zero.",
+                ),
+            ),
+        )
+
+        escape_velocity = EquationSolver(
+            ("escape_vel", "mass_body", "radius"),
+            Branch("escape_vel", lambda xp, mass_body, radius: xp.sqrt((2.0 * G * mass_body) / radius)),
+            Branch(
+                "mass_body",
+                lambda xp, escape_vel, radius: ((escape_vel * escape_vel) * radius) / (2.0 * G),
+            ),
+            Branch(
+                "radius",
+                lambda xp, escape_vel, mass_body: (2.0 * G * mass_body) / (escape_vel * escape_vel),
+                checks=(Check(lambda escape_vel: escape_vel == 0, "Divison by zero is undefined."),),
+            ),
+            checks=(
+                Check(
+                    lambda mass_body: mass_body <= 0,
+                    "We are operating with massive objects. "
+                    "Make sure all objects have a mass greater than zero.",
+                ),
+                Check(lambda radius: radius <= 0, "Radius of stellar body must be greater than zero."),
+                Check(
+                    lambda escape_vel: escape_vel < 0,
+                    "Negative square root yields a imaginary number. Check your values.",
+                ),
+            ),
+        )
+
+        orbital_velocity = EquationSolver(
+            ("orbital_vel", "mass_body", "distance"),
+            Branch("orbital_vel", lambda xp, mass_body, distance: xp.sqrt((G * mass_body) / distance)),
+            Branch(
+                "mass_body",
+                lambda xp, orbital_vel, distance: ((orbital_vel * orbital_vel) * distance) / G,
+            ),
+            Branch(
+                "distance",
+                lambda xp, orbital_vel, mass_body: (G * mass_body) / (orbital_vel * orbital_vel),
+                checks=(Check(lambda orbital_vel: orbital_vel == 0, "Divison by zero is undefined."),),
+            ),
+            checks=(
+                Check(
+                    lambda mass_body: mass_body <= 0,
+                    "We are operating with massive objects. "
+                    "Make sure all objects have a mass greater than zero.",
+                ),
+                Check(lambda distance: distance <= 0, "Radius of stellar body must be greater than zero."),
+                Check(
+                    lambda orbital_vel: orbital_vel < 0,
+                    "Negative square root yields a imaginary number. Check your values.",
+                ),
+            ),
+        )
+
+        orbital_period = EquationSolver(
+            ("period", "distance", "mass_body"),
+            Branch(
+                "period",
+                lambda xp, distance, mass_body: 2 * xp.pi * xp.sqrt((distance**3) / (G * mass_body)),
+            ),
+            Branch(
+                "distance",
+                lambda xp, period, mass_body: xp.cbrt(((period / (2 * xp.pi)) ** 2) * (G * mass_body)),
+            ),
+            Branch(
+                "mass_body",
+                lambda xp, period, distance: ((2 * xp.pi / period) ** 2) * (distance**3) / G,
+                checks=(Check(lambda period: period == 0, "Division by zero is undefined."),),
+            ),
+            checks=(
+                Check(
+                    lambda mass_body: mass_body <= 0,
+                    "We are operating with massive objects. "
+                    "Make sure all objects have a mass greater than zero.",
+                ),
+            ),
+        )
+
+        orbital_equation = EquationSolver(
+            ("semi_latus_rectum", "eccentricity", "distance", "theta"),
+            Branch(
+                "semi_latus_rectum",
+                lambda xp, eccentricity, distance, theta: distance
+                * (1 + eccentricity * xp.cos(xp.radians(theta))),
+            ),
+            Branch(
+                "eccentricity",
+                lambda xp, semi_latus_rectum, distance, theta: ((semi_latus_rectum / distance) - 1)
+                / xp.cos(xp.radians(theta)),
+                checks=(Check(lambda theta: theta % 180 == 90, "Division by zero is undefined."),),
+            ),
+            Branch(
+                "distance",
+                lambda xp, semi_latus_rectum, eccentricity, theta: semi_latus_rectum
+                / (1 + eccentricity * xp.cos(xp.radians(theta))),
+                checks=(
+                    Check(
+                        lambda xp, eccentricity, theta: 1 + eccentricity * xp.cos(xp.radians(theta)) == 0,
+                        "Divison by zero is undefined.",
+                    ),
+                    Check(lambda result: result <= 0, "Distance cannot be less than or equal to zero."),
+                ),
+            ),
+            Branch(
+                "theta",
+                lambda xp, semi_latus_rectum, eccentricity, distance: xp.degrees(
+                    xp.acos(((semi_latus_rectum / distance) - 1) / eccentricity)
+                ),
+                checks=(
+                    Check(lambda eccentricity: eccentricity == 0, "Divison by zero is undefined."),
+                    Check(
+                        lambda semi_latus_rectum, eccentricity, distance: abs(
+                            ((semi_latus_rectum / distance) - 1) / eccentricity
+                        )
+                        > 1,
+                        "No angle satisfies the orbit for these values.",
+                    ),
+                ),
+            ),
+            checks=(
+                Check(lambda distance: distance <= 0, "Distance cannot be less than or equal to zero."),
+            ),
+        )
+
+        keplers_third_law = EquationSolver(
+            ("period", "semi_major_axis", "mass_body"),
+            Branch(
+                "period",
+                lambda xp, semi_major_axis, mass_body: xp.sqrt(
+                    (4.0 * xp.pi * xp.pi) * semi_major_axis**3 / (G * mass_body)
+                ),
+            ),
+            Branch(
+                "semi_major_axis",
+                lambda xp, period, mass_body: xp.cbrt(
+                    (period * period) * (G * mass_body) / (4.0 * xp.pi * xp.pi)
+                ),
+            ),
+            Branch(
+                "mass_body",
+                lambda xp, period, semi_major_axis: (4.0 * xp.pi * xp.pi * semi_major_axis**3)
+                / (G * (period * period)),
+                checks=(Check(lambda period: period == 0, "Divison by zero is undefined."),),
+            ),
+            checks=(
+                Check(
+                    lambda mass_body: mass_body <= 0,
+                    "We are operating with massive objects. "
+                    "Make sure all objects have a mass greater than zero.",
+                ),
+            ),
+        )
+
+        schwarzschild_radius = EquationSolver(
+            ("schwarz_radius", "mass_body"),
+            Branch("schwarz_radius", lambda xp, mass_body: (2.0 * G * mass_body) / (c * c)),
+            Branch("mass_body", lambda xp, schwarz_radius: schwarz_radius * ((c * c) / (2.0 * G))),
+            checks=(
+                Check(
+                    lambda mass_body: mass_body <= 0,
+                    "We are operating with massive objects. "
+                    "Make sure all objects have a mass greater than zero.",
+                ),
+            ),
+        )
@@ -1,5 +1,6 @@
 from typing import List, Optional, Dict
 from physics_TUI.base_chapter import PhysicsChapter, Equation, Definition
+from physics_TUI.solver import Branch, Check, EquationSolver
 
 # Global constant
 g: float = 9.82  # Acceleration due to gravity on Earth [m/s^2]
@@ -23,7 +24,7 @@ class Chapter14(PhysicsChapter):
             "F(2)": "force_2",
             "A(2)": "area_2",
             "v(1)": "velocity_1",
-            "v(2)": "Velocity_2",
+            "v(2)": "velocity_2",
             "ρ(1)": "density_1",
             "ρ(2)": "density_2",
             "p(1)": "pressure_1",
@@ -66,6 +67,7 @@ class Chapter14(PhysicsChapter):
                     "h": "Depth (m)",
                 },
                 calculation=self.Calculate.hydrostatic_pressure,
+                solver=self.Solvers.hydrostatic_pressure,
             ),
             Equation(
                 name="Pressure gradiant in a fluid of constant density",
@@ -94,6 +96,7 @@ class Chapter14(PhysicsChapter):
                     "A(2)": "Area of piston 2 (m²)",
                 },
                 calculation=self.Calculate.pascals_principle,
+                solver=self.Solvers.pascals_principle,
             ),
             Equation(
                 name="Volume flow rate",
@@ -113,6 +116,7 @@ class Chapter14(PhysicsChapter):
                     "v(2)": "Velocity of fluid in nozzle 2 (m/s)",
                 },
                 calculation=self.Calculate.continuity_const_density,
+                solver=self.Solvers.continuity_const_density,
             ),
             Equation(
                 name="Continuity equation (general form)",
@@ -127,6 +131,7 @@ class Chapter14(PhysicsChapter):
                    
                 },
                 calculation=self.Calculate.continuity_const_general,
+                solver=self.Solvers.continuity_const_general,
             ),
             Equation(
                 name="Bernoulli's equation",
@@ -141,6 +146,7 @@ class Chapter14(PhysicsChapter):
                     "y(2)": "Height of the fluid in moment 1 (m)",
                 },
                 calculation=self.Calculate.bernoullis_equation,
+                solver=self.Solvers.bernoullis_equation,
             ),
             Equation(
                 name="Viscocity",
@@ -153,6 +159,7 @@ class Chapter14(PhysicsChapter):
                     "v": "Velocity of the fluid (m/s)",
                 },
                 calculation=self.Calculate.viscocity,
+                solver=self.Solvers.viscocity,
             ),
             Equation(
                 name="Poiseuille’s law for resistance",
@@ -164,6 +171,7 @@ class Chapter14(PhysicsChapter):
                     "r": "Radius of the tube (m)",
                 },
                 calculation=self.Calculate.poiseuilles_law_resistance,
+                solver=self.Solvers.poiseuilles_law_resistance,
             ),
             Equation(
                 name="Poiseuille’s law",
@@ -177,6 +185,7 @@ class Chapter14(PhysicsChapter):
                     "p(2)": "Pressure at point 2 (Pa)",
                 },
                 calculation=self.Calculate.poiseuilles_law,
+                solver=self.Solvers.poiseuilles_law,
             ),
         ]
 
@@ -755,4 +764,409 @@ class Chapter14(PhysicsChapter):
 
             return numerator / denominator
 
+    class Solvers:
+        """
+        Array-capable counterparts of the Calculate methods in Chapter 14.
+        """
+
+        hydrostatic_pressure = EquationSolver(
+            ("pressure", "pressure_atm", "density", "depth"),
+            Branch("pressure", lambda xp, pressure_atm, density, depth: pressure_atm + (density * g * depth)),
+            Branch("pressure_atm", lambda xp, pressure, density, depth: pressure - (density * g * depth)),
+            Branch(
+                "density",
+                lambda xp, pressure, pressure_atm, depth: (pressure - pressure_atm) / (g * depth),
+                checks=(Check(lambda depth: depth == 0, "Division by zero is undefined."),),
+            ),
+            Branch(
+                "depth",
+                lambda xp, pressure, pressure_atm, density: (pressure - pressure_atm) / (g * density),
+                checks=(Check(lambda density: density == 0, "Division by zero is undefined."),),
+            ),
+            checks=(
+                Check(
+                    lambda pressure: pressure < 0,
+                    "Hydrostatic or atmospheric pressure cannot be a negative value.",
+                ),
+                Check(
+                    lambda pressure_atm: pressure_atm < 0,
+                    "Hydrostatic or atmospheric pressure cannot be a negative value.",
+                ),
+            ),
+        )
+
+        pascals_principle = EquationSolver(
+            ("force_1", "area_1", "force_2", "area_2"),
+            Branch(
+                "force_1",
+                lambda xp, area_1, force_2, area_2: (force_2 / area_2) * area_1,
+                checks=(Check(lambda area_2: area_2 == 0, "Division by zero is undefined."),),
+            ),
+            Branch(
+                "area_1",
+                lambda xp, force_1, force_2, area_2: (force_1 * area_2) / force_2,
+                checks=(Check(lambda force_2: force_2 == 0, "Division by zero is undefined."),),
+            ),
+            Branch(
+                "force_2",
+                lambda xp, force_1, area_1, area_2: (force_1 / area_1) * area_2,
+                checks=(Check(lambda area_1: area_1 == 0, "Division by zero is undefined."),),
+            ),
+            Branch(
+                "area_2",
+                lambda xp, force_1, area_1, force_2: (force_2 * area_1) / force_1,
+                checks=(Check(lambda force_1: force_1 == 0, "Division by zero is undefined."),),
+            ),
+        )
+
+        continuity_const_density = EquationSolver(
+            ("area_1", "velocity_1", "area_2", "velocity_2"),
+            Branch(
+                "area_1",
+                lambda xp, velocity_1, area_2, velocity_2: (area_2 * velocity_2) / velocity_1,
+                checks=(Check(lambda velocity_1: velocity_1 == 0, "Divison by zero is undefined."),),
+            ),
+            Branch("velocity_1", lambda xp, area_1, area_2, velocity_2: (area_2 * velocity_2) / area_1),
+            Branch(
+                "area_2",
+                lambda xp, area_1, velocity_1, velocity_2: (area_1 * velocity_1) / velocity_2,
+                checks=(Check(lambda velocity_2: velocity_2 == 0, "Divison by zero is undefined."),),
+            ),
+            Branch("velocity_2", lambda xp, area_1, velocity_1, area_2: (area_1 * velocity_1) / area_2),
+            checks=(
+                Check(lambda area_1: area_1 <= 0, "Area cannot be less than or equal to zero."),
+                Check(lambda area_2: area_2 <= 0, "Area cannot be less than or equal to zero."),
+            ),
+        )
+
+        continuity_const_general = EquationSolver(
+            ("density_1", "area_1", "velocity_1", "density_2", "area_2", "velocity_2"),
+            Branch(
+                "density_1",
+                lambda xp, area_1, velocity_1, density_2, area_2, velocity_2: (
+                    density_2 * area_2 * velocity_2
+                )
+                / (area_1 * velocity_1),
+                checks=(Check(lambda velocity_1: velocity_1 == 0, "Division by zero is undefined."),),
+            ),
+            Branch(
+                "area_1",
+                lambda xp, density_1, velocity_1, density_2, area_2, velocity_2: (
+                    density_2 * area_2 * velocity_2
+                )
+                / (density_1 * velocity_1),
+                checks=(Check(lambda velocity_1: velocity_1 == 0, "Division by zero is undefined."),),
+            ),
+            Branch(
+                "velocity_1",
+                lambda xp, density_1, area_1, density_2, area_2, velocity_2: (
+                    density_2 * area_2 * velocity_2
+                )
+                / (density_1 * area_1),
+            ),
+            Branch(
+                "density_2",
+                lambda xp, density_1, area_1, velocity_1, area_2, velocity_2: (
+                    density_1 * area_1 * velocity_1
+                )
+                / (area_2 * velocity_2),
+                checks=(Check(lambda velocity_2: velocity_2 == 0, "Division by zero is undefined."),),
+            ),
+            Branch(
+                "area_2",
+                lambda xp, density_1, area_1, velocity_1, density_2, velocity_2: (
+                    density_1 * area_1 * velocity_1
+                )
+                / (density_2 * velocity_2),
+                checks=(Check(lambda velocity_2: velocity_2 == 0, "Division by zero is undefined."),),
+            ),
+            Branch(
+                "velocity_2",
+                lambda xp, density_1, area_1, velocity_1, density_2, area_2: (
+                    density_1 * area_1 * velocity_1
+                )
+                / (density_2 * area_2),
+            ),
+            checks=(
+                Check(lambda area_1: area_1 <= 0, "Area cannot be less than or equal to zero."),
+                Check(lambda area_2: area_2 <= 0, "Area cannot be less than or equal to zero."),
+                Check(
+                    lambda density_1: density_1 <= 0,
+                    "Density of a fluid cannot be less than or equal to zero.",
+                ),
+                Check(
+                    lambda density_2: density_2 <= 0,
+                    "Density of a fluid cannot be less than or equal to zero.",
+                ),
+            ),
+        )
+
+        bernoullis_equation = EquationSolver(
+            ("density", "pressure_1", "velocity_1", "height_1", "pressure_2", "velocity_2", "height_2"),
+            Branch(
+                "density",
+                lambda xp, pressure_1, velocity_1, height_1, pressure_2, velocity_2, height_2: (
+                    pressure_2 - pressure_1
+                )
+                / (
+                    (0.5 * velocity_1 * velocity_1 + g * height_1)
+                    - (0.5 * velocity_2 * velocity_2 + g * height_2)
+                ),
+                checks=(
+                    Check(
+                        lambda velocity_1, height_1, velocity_2, height_2: (
+                            0.5 * velocity_1 * velocity_1 + g * height_1
+                            == 0.5 * velocity_2 * velocity_2 + g * height_2
+                        ),
+                        "Divison by zero is undefined.",
+                    ),
+                    Check(
+                        lambda result: result <= 0,
+                        "Density of a fluid cannot be less than or equal to zero.",
+                    ),
+                ),
+            ),
+            Branch(
+                "pressure_1",
+                lambda xp, density, velocity_1, height_1, pressure_2, velocity_2, height_2: pressure_2
+                + density
+                * (
+                    (0.5 * velocity_2 * velocity_2 + g * height_2)
+                    - (0.5 * velocity_1 * velocity_1 + g * height_1)
+                ),
+            ),
+            Branch(
+                "velocity_1",
+                lambda xp, density, pressure_1, height_1, pressure_2, velocity_2, height_2: xp.sqrt(
+                    2.0
+                    * (
+                        (pressure_2 - pressure_1) / density
+                        + 0.5 * velocity_2 * velocity_2
+                        + g * (height_2 - height_1)
+                    )
+                ),
+                checks=(
+                    Check(
+                        lambda density, pressure_1, height_1, pressure_2, velocity_2, height_2: (
+                            (pressure_2 - pressure_1) / density
+                            + 0.5 * velocity_2 * velocity_2
+                            + g * (height_2 - height_1)
+                            < 0
+                        ),
+                        "Negative radicand yields an imaginary number",
+                    ),
+                ),
+            ),
+            Branch(
+                "height_1",
+                lambda xp, density, pressure_1, velocity_1, pressure_2, velocity_2, height_2: (
+                    (pressure_2 - pressure_1) / density
+                    + 0.5 * velocity_2 * velocity_2
+                    + g * height_2
+                    - 0.5 * velocity_1 * velocity_1
+                )
+                / g,
+            ),
+            Branch(
+                "pressure_2",
+                lambda xp, density, pressure_1, velocity_1, height_1, velocity_2, height_2: pressure_1
+                + density
+                * (
+                    (0.5 * velocity_1 * velocity_1 + g * height_1)
+                    - (0.5 * velocity_2 * velocity_2 + g * height_2)
+                ),
+            ),
+            Branch(
+                "velocity_2",
+                lambda xp, density, pressure_1, velocity_1, height_1, pressure_2, height_2: xp.sqrt(
+                    2.0
+                    * (
+                        (pressure_1 - pressure_2) / density
+                        + 0.5 * velocity_1 * velocity_1
+                        + g * (height_1 - height_2)
+                    )
+                ),
+                checks=(
+                    Check(
+                        lambda density, pressure_1, velocity_1, height_1, pressure_2, height_2: (
+                            (pressure_1 - pressure_2) / density
+                            + 0.5 * velocity_1 * velocity_1
+                            + g * (height_1 - height_2)
+                            < 0
+                        ),
+                        "Negative radicand yields an imaginary number",
+                    ),
+                ),
+            ),
+            Branch(
+                "height_2",
+                lambda xp, density, pressure_1, velocity_1, height_1, pressure_2, velocity_2: (
+                    (pressure_1 - pressure_2) / density
+                    + 0.5 * velocity_1 * velocity_1
+                    + g * height_1
+                    - 0.5 * velocity_2 * velocity_2
+                )
+                / g,
+            ),
+            checks=(
+                Check(
+                    lambda density: density <= 0,
+                    "Density of a fluid cannot be less than or equal to zero.",
+                ),
+            ),
+        )
+
+        viscocity = EquationSolver(
+            ("viscocity", "force", "distance", "area", "velocity"),
+            Branch(
+                "viscocity",
+                lambda xp, force, distance, area, velocity: (force * distance) / (velocity * area),
+                checks=(Check(lambda velocity: velocity == 0, "Division by zero is undefined."),),
+            ),
+            Branch(
+                "force",
+                lambda xp, viscocity, distance, area, velocity: viscocity * ((velocity * area) / distance),
+            ),
+            Branch(
+                "distance",
+                lambda xp, viscocity, force, area, velocity: viscocity * ((velocity * area) / force),
+                checks=(Check(lambda force: force == 0, "Division by zero is undefined."),),
+            ),
+            Branch(
+                "area",
+                lambda xp, viscocity, force, distance, velocity: (force * distance) / (viscocity * velocity),
+                checks=(
+                    Check(
+                        lambda viscocity, velocity: (velocity == 0) | (viscocity == 0),
+                        "Division by zero is undefined.",
+                    ),
+                ),
+            ),
+            Branch(
+                "velocity",
+                lambda xp, viscocity, force, distance, area: (force * distance) / (viscocity * area),
+                checks=(Check(lambda viscocity: viscocity == 0, "Division by zero is undefined."),),
+            ),
+            checks=(
+                Check(
+                    lambda distance: distance <= 0,
+                    "Dimensions of length and area cannot be less than or equal to zero.",
+                ),
+                Check(
+                    lambda area: area <= 0,
+                    "Dimensions of length and area cannot be less than or equal to zero.",
+                ),
+            ),
+        )
 
+        poiseuilles_law_resistance = EquationSolver(
+            ("resistance", "viscocity", "length", "radius"),
+            Branch(
+                "resistance",
+                lambda xp, viscocity, length, radius: (8.0 * viscocity * length) / (xp.pi * radius**4),
+            ),
+            Branch(
+                "viscocity",
+                lambda xp, resistance, length, radius: (resistance * xp.pi * radius**4) / (8.0 * length),
+            ),
+            Branch(
+                "length",
+                lambda xp, resistance, viscocity, radius: (resistance * xp.pi * radius**4)
+                / (8.0 * viscocity),
+                checks=(Check(lambda viscocity: viscocity == 0, "Division by zero is undefined."),),
+            ),
+            Branch(
+                "radius",
+                lambda xp, resistance, viscocity, length: xp.sqrt(
+                    xp.sqrt((8.0 * viscocity * length) / (xp.pi * resistance))
+                ),
+                checks=(
+                    Check(lambda resistance: resistance == 0, "Division by zero is undefined."),
+                    Check(
+                        lambda resistance, viscocity: viscocity / resistance < 0,
+                        "Negative radicand yields an imaginary number",
+                    ),
+                ),
+            ),
+            checks=(
+                Check(
+                    lambda length: length <= 0,
+                    "Dimensions of length and radius cannot be less than or equal to zero.",
+                ),
+                Check(
+                    lambda radius: radius <= 0,
+                    "Dimensions of length and radius cannot be less than or equal to zero.",
+                ),
+            ),
+        )
+
+        poiseuilles_law = EquationSolver(
+            ("flow", "viscocity", "length", "radius", "pressure_1", "pressure_2"),
+            Branch(
+                "flow",
+                lambda xp, viscocity, length, radius, pressure_1, pressure_2: (
+                    (pressure_1 - pressure_2) * xp.pi * radius**4
+                )
+                / (8.0 * viscocity * length),
+                checks=(Check(lambda viscocity: viscocity == 0, "Division by zero is undefined."),),
+            ),
+            Branch(
+                "viscocity",
+                lambda xp, flow, length, radius, pressure_1, pressure_2: (
+                    (pressure_1 - pressure_2) * xp.pi * radius**4
+                )
+                / (8.0 * length * flow),
+                checks=(Check(lambda flow: flow == 0, "Division by zero is undefined."),),
+            ),
+            Branch(
+                "length",
+                lambda xp, flow, viscocity, radius, pressure_1, pressure_2: (
+                    (pressure_1 - pressure_2) * xp.pi * radius**4
+                )
+                / (8.0 * viscocity * flow),
+                checks=(
+                    Check(
+                        lambda flow, viscocity: (viscocity == 0) | (flow == 0),
+                        "Division by zero is undefined.",
+                    ),
+                ),
+            ),
+            Branch(
+                "radius",
+                lambda xp, flow, viscocity, length, pressure_1, pressure_2: xp.sqrt(
+                    xp.sqrt((flow * 8.0 * viscocity * length) / ((pressure_1 - pressure_2) * xp.pi))
+                ),
+                checks=(
+                    Check(
+                        lambda pressure_1, pressure_2: pressure_1 == pressure_2,
+                        "Division by zero is undefined.",
+                    ),
+                    Check(
+                        lambda flow, viscocity, pressure_1, pressure_2: (flow * viscocity)
+                        / (pressure_1 - pressure_2)
+                        < 0,
+                        "Negative radicand yields an imaginary number",
+                    ),
+                ),
+            ),
+            Branch(
+                "pressure_1",
+                lambda xp, flow, viscocity, length, radius, pressure_2: pressure_2
+                + (flow * 8.0 * viscocity * length) / (xp.pi * radius**4),
+            ),
+            Branch(
+                "pressure_2",
+                lambda xp, flow, viscocity, length, radius, pressure_1: pressure_1
+                - (flow * 8.0 * viscocity * length) / (xp.pi * radius**4),
+            ),
+            checks=(
+                Check(
+                    lambda length: length <= 0,
+                    "Dimensions of length and radius cannot be less than or equal to zero.",
+                ),
+                Check(
+                    lambda radius: radius <= 0,
+                    "Dimensions of length and radius cannot be less than or equal to zero.",
+                ),
+            ),
+        )
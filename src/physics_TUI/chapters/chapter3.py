@@ -1,5 +1,7 @@
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Optional
 from physics_TUI.base_chapter import PhysicsChapter, Equation, Definition
+from physics_TUI.quadratic import earliest_time
+from physics_TUI.solver import Branch, Check, EquationSolver
 from math import sqrt
 
 # Constant
@@ -92,6 +94,7 @@ class Chapter3(PhysicsChapter):
                     "x": "Final Position (m)",
                 },
                 calculation=self.Calculate.position_from_vel_and_accel,
+                solver=self.Solvers.position_from_vel_and_accel,
             ),
             Equation(
                 name="Velocity from distance",
@@ -104,6 +107,7 @@ class Chapter3(PhysicsChapter):
                     "v": "Final velocity (m/s)",
                 },
                 calculation=self.Calculate.velocity_from_distance,
+                solver=self.Solvers.velocity_from_distance,
             ),
             Equation(
                 name="Velocity of free fall",
@@ -120,9 +124,10 @@ class Chapter3(PhysicsChapter):
                     "y₀": "Initial height (m)",
                     "v₀": "Initial velocity (m/s)",
                     "t": "Time (s)",
-                    "y": "Final Position (s)",
+                    "y": "Final position (m)",
                 },
                 calculation=self.Calculate.height_of_free_fall,
+                solver=self.Solvers.height_of_free_fall,
             ),
             Equation(
                 name="Velocity of free fall from height",
@@ -134,6 +139,7 @@ class Chapter3(PhysicsChapter):
                     "v": "Final velocity (m/s)",
                 },
                 calculation=self.Calculate.vel_free_fall_from_height,
+                solver=self.Solvers.vel_free_fall_from_height,
             ),
             Equation(
                 name="Velocity from acceleration",
@@ -214,33 +220,6 @@ class Chapter3(PhysicsChapter):
         Class holds methods to calculate equations in Chapter 3
         """
 
-        @staticmethod
-        def quadratic_eq(a: float, b: float, c: float) -> Optional[Tuple[float, float]]:
-            """
-            Function calculates the roots of a quadratic equation ax^2 + bx + c = 0
-            accurately in all cases.
-
-            Returns a tuple containing the two roots.
-            """
-
-            discriminant: float = (b * b) - 4 * a * c
-
-            if discriminant < 0:
-                return None
-
-            if b == 0 and c == 0:
-                return (0.0, 0.0)
-
-            # Choose the appropriate formula based on the sign of b
-            if b >= 0:
-                x1: float = (-b - sqrt(discriminant)) / (2 * a)
-                x2: float = (2 * c) / (-b - sqrt(discriminant))
-            else:
-                x1: float = (2 * c) / (-b + sqrt(discriminant))
-                x2: float = (-b + sqrt(discriminant)) / (2 * a)
-
-            return (x1, x2)
-
         @staticmethod
         def position_from_vel_and_accel(
             x_0: Optional[float] = None,
@@ -280,15 +259,8 @@ class Chapter3(PhysicsChapter):
                 if accel == 0 and v_0 == 0:
                     raise ValueError("v₀ and a cannot both be equal to zero")
 
-                c: float = x_0 - x_f
-                b: float = v_0
-                a: float = 0.5 * accel
-                roots: Tuple[float, float] = Chapter3.Calculate.quadratic_eq(a, b, c)
-
-                if roots[0] < 0:
-                    return round(roots[1], 4)
-                if roots[1] < 0:
-                    return round(roots[0], 4)
+                # Returns the earliest non-negative time
+                return round(earliest_time(0.5 * accel, v_0, x_0 - x_f), 4)
 
             if (
                 accel is None
@@ -397,21 +369,8 @@ class Chapter3(PhysicsChapter):
 
             elif t is None:
                 # Solves for t (elapsed time)
-                c: float = y_0 - y_f
-                b: float = v_0
-                a: float = 0.5 * g
-                roots: Tuple[float, float] = Chapter3.Calculate.quadratic_eq(a, b, c)
-
-                if roots is None:
-                    raise ValueError("No real solution for time")
-
-                # Return the non-negative root, preferring the smaller positive one
-                valid_roots: List[float] = [r for r in roots if r >= 0]
-
-                if not valid_roots:
-                    raise ValueError("No positive time solution")
-
-                return round(min(valid_roots), 4)
+                # Returns the earliest non-negative time
+                return round(earliest_time(0.5 * g, v_0, y_0 - y_f), 4)
 
             else:  # y_f is None
                 # Solves for y_f (final position)
@@ -463,3 +422,132 @@ class Chapter3(PhysicsChapter):
 
             # Returns v_f (final velocity)
             return round(sqrt(discriminant), 4)
+
+
+    class Solvers:
+        """
+        Array-capable counterparts of the Calculate methods in Chapter 3.
+        Every argument may be a scalar or a NumPy array.
+        """
+
+        position_from_vel_and_accel = EquationSolver(
+            ("x_0", "v_0", "t", "accel", "x_f"),
+            Branch("x_0", lambda xp, v_0, t, accel, x_f: x_f - (v_0 * t) - (0.5 * accel * t * t)),
+            Branch(
+                "v_0",
+                lambda xp, x_0, t, accel, x_f: (x_f - x_0 - (0.5 * accel * t * t)) / t,
+                checks=(Check(lambda t: t == 0, "Division by zero is undefined"),),
+            ),
+            Branch(
+                "t",
+                lambda xp, x_0, v_0, accel, x_f: xp.first_nonnegative(
+                    *xp.roots(0.5 * accel, v_0, x_0 - x_f)
+                ),
+                checks=(
+                    Check(
+                        lambda v_0, accel: (accel == 0) & (v_0 == 0),
+                        "v₀ and a cannot both be equal to zero",
+                    ),
+                    Check(
+                        lambda x_0, v_0, accel, x_f: (v_0 * v_0) - 2 * accel * (x_0 - x_f) < 0,
+                        "No real solution for time",
+                    ),
+                    Check(lambda xp, result: xp.isnan(result), "No positive time solution"),
+                ),
+            ),
+            Branch(
+                "accel",
+                lambda xp, x_0, v_0, t, x_f: (x_f - x_0 - (v_0 * t)) * 2 / (t * t),
+                checks=(Check(lambda t: t == 0, "Divison by zero is undefined."),),
+            ),
+            Branch("x_f", lambda xp, x_0, v_0, t, accel: x_0 + (v_0 * t) + (0.5 * accel * t * t)),
+            checks=(Check(lambda t: t < 0, "Time cannot be a negative value"),),
+        )
+
+        velocity_from_distance = EquationSolver(
+            ("x_0", "v_0", "accel", "x_f", "v_f"),
+            Branch(
+                "x_0",
+                lambda xp, v_0, accel, x_f, v_f: x_f - ((v_f * v_f) - (v_0 * v_0)) / (2 * accel),
+                checks=(Check(lambda accel: accel == 0, "acceleration cannot be equal to zero"),),
+            ),
+            Branch(
+                "v_0",
+                lambda xp, x_0, accel, x_f, v_f: xp.sqrt((v_f * v_f) - (2 * accel * (x_f - x_0))),
+                checks=(
+                    Check(
+                        lambda x_0, accel, x_f, v_f: (v_f * v_f) - (2 * accel * (x_f - x_0)) < 0,
+                        "The discriminant cannot be negative",
+                    ),
+                ),
+            ),
+            Branch(
+                "accel",
+                lambda xp, x_0, v_0, x_f, v_f: ((v_f * v_f) - (v_0 * v_0)) / (2 * (x_f - x_0)),
+                checks=(Check(lambda x_0, x_f: x_f == x_0, "x_f and x_0 cannot be equal"),),
+            ),
+            Branch(
+                "x_f",
+                lambda xp, x_0, v_0, accel, v_f: x_0 + ((v_f * v_f) - (v_0 * v_0)) / (2 * accel),
+                checks=(Check(lambda accel: accel == 0, "acceleration cannot be equal to zero"),),
+            ),
+            Branch(
+                "v_f",
+                lambda xp, x_0, v_0, accel, x_f: xp.sqrt((v_0 * v_0) + 2 * accel * (x_f - x_0)),
+                checks=(
+                    Check(
+                        lambda x_0, v_0, accel, x_f: (v_0 * v_0) + 2 * accel * (x_f - x_0) < 0,
+                        "The discriminant cannot be negative",
+                    ),
+                ),
+            ),
+        )
+
+        height_of_free_fall = EquationSolver(
+            ("y_0", "v_0", "t", "y_f"),
+            Branch("y_0", lambda xp, v_0, t, y_f: y_f - (v_0 * t) - (0.5 * g * t * t)),
+            Branch(
+                "v_0",
+                lambda xp, y_0, t, y_f: (y_f - y_0 - (0.5 * g * t * t)) / t,
+                checks=(Check(lambda t: t == 0, "Cannot solve for v_0 when t=0"),),
+            ),
+            Branch(
+                "t",
+                lambda xp, y_0, v_0, y_f: xp.first_nonnegative(*xp.roots(0.5 * g, v_0, y_0 - y_f)),
+                checks=(
+                    Check(
+                        lambda y_0, v_0, y_f: (v_0 * v_0) - 2 * g * (y_0 - y_f) < 0,
+                        "No real solution for time",
+                    ),
+                    Check(lambda xp, result: xp.isnan(result), "No positive time solution"),
+                ),
+            ),
+            Branch("y_f", lambda xp, y_0, v_0, t: y_0 + (v_0 * t) + (0.5 * g * t * t)),
+            checks=(Check(lambda t: t < 0, "Time cannot be a negative value"),),
+        )
+
+        vel_free_fall_from_height = EquationSolver(
+            ("y_0", "v_0", "y_f", "v_f"),
+            Branch("y_0", lambda xp, v_0, y_f, v_f: y_f - ((v_f * v_f) - (v_0 * v_0)) / (2 * g)),
+            Branch(
+                "v_0",
+                lambda xp, y_0, y_f, v_f: xp.sqrt((v_f * v_f) - (2 * g * (y_f - y_0))),
+                checks=(
+                    Check(
+                        lambda y_0, y_f, v_f: (v_f * v_f) - (2 * g * (y_f - y_0)) < 0,
+                        "The discriminant cannot be negative",
+                    ),
+                ),
+            ),
+            Branch("y_f", lambda xp, y_0, v_0, v_f: y_0 + ((v_f * v_f) - (v_0 * v_0)) / (2 * g)),
+            Branch(
+                "v_f",
+                lambda xp, y_0, v_0, y_f: xp.sqrt((v_0 * v_0) + 2 * g * (y_f - y_0)),
+                checks=(
+                    Check(
+                        lambda y_0, v_0, y_f: (v_0 * v_0) + 2 * g * (y_f - y_0) < 0,
+                        "The discriminant cannot be negative",
+                    ),
+                ),
+            ),
+        )
@@ -1,6 +1,7 @@
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional
 from physics_TUI.base_chapter import PhysicsChapter, Equation, Definition
-from math import sin, cos, asin, tan, pi, sqrt
+from physics_TUI.solver import Branch, Check, EquationSolver
+from math import sin, cos, asin, tan, pi, sqrt, inf
 
 # Constants
 
@@ -74,6 +75,7 @@ class Chapter4(PhysicsChapter):
                     "θ": "Launch angle (degrees)",
                 },
                 calculation=self.Calculate.time_of_flight,
+                solver=self.Solvers.time_of_flight,
             ),
             Equation(
                 name="Trajectory",
@@ -84,6 +86,7 @@ class Chapter4(PhysicsChapter):
                     "x": "Position along he x-axis (m)",
                 },
                 calculation=self.Calculate.trajectory,
+                solver=self.Solvers.trajectory,
             ),
             Equation(
                 name="Range",
@@ -93,12 +96,14 @@ class Chapter4(PhysicsChapter):
                     "v₀": "Initial velocity (m/2)",
                 },
                 calculation=self.Calculate.projectile_range,
+                solver=self.Solvers.projectile_range,
             ),
             Equation(
                 name="Centripetal acceleration",
                 formula="a_c = v² / r",
                 variables={"v": "Velocity (m/s)", "r": "Radius (m)"},
                 calculation=self.Calculate.centripetal_accel,
+                solver=self.Solvers.centripetal_accel,
             ),
             Equation(
                 name="Position vector (uniform cirular motion)",
@@ -245,33 +250,6 @@ class Chapter4(PhysicsChapter):
         Class holds methods to calculate equations in chapter 4.
         """
 
-        @staticmethod
-        def quadratic_eq(a: float, b: float, c: float) -> Optional[Tuple[float, float]]:
-            """
-            Function calculates the roots of a quadratic equation ax^2 + bx + c = 0
-            accurately in all cases.
-
-            Returns a tuple containing the two roots.
-            """
-
-            discriminant: float = b**2 - 4 * a * c
-
-            if discriminant < 0:
-                return None
-
-            if b == 0 and c == 0:
-                return (0.0, 0.0)
-
-            # Choose the appropriate formula based on the sign of b
-            if b >= 0:
-                x1: float = (-b - sqrt(discriminant)) / (2 * a)
-                x2: float = (2 * c) / (-b - sqrt(discriminant))
-            else:
-                x1: float = (2 * c) / (-b + sqrt(discriminant))
-                x2: float = (-b + sqrt(discriminant)) / (2 * a)
-
-            return (x1, x2)
-
         @staticmethod
         def time_of_flight(
             v_0: Optional[float] = None,
@@ -290,17 +268,25 @@ class Chapter4(PhysicsChapter):
             Returns:
                 float: the result of whichever variable was left equal to None
             """
-            if theta is not None:
-                # Converts degrees to radians
-                theta_radians: float = theta * (pi / 180)
-            else:
-                raise ValueError(
-                    "Cannot solve for theta with this equation. Yields complex numbers. \n Please input a value for theta."
-                )
-
             if t is not None and t < 0:
                 raise ValueError("Time cannot be a negative value")
 
+            if theta is None:
+
+                if v_0 == 0:
+                    raise ValueError("Division by zero is undefined.")
+
+                # Solves for theta, the launch angle below 90 degrees
+                argument: float = (t * g) / (2.0 * v_0)
+
+                if argument > 1:
+                    raise ValueError("No real solution exists. Time too long for given velocity.")
+
+                return asin(argument) * (180 / pi)
+
+            # Converts degrees to radians
+            theta_radians: float = theta * (pi / 180)
+
             if v_0 is None:
                 # Solves for v_0 (initial velocity)
                 return (t * g) / (2.0 * sin(theta_radians))
@@ -340,18 +326,21 @@ class Chapter4(PhysicsChapter):
 
             if v_0 is None:
 
-                if y == 0:
+                # Height the launch line reaches at x, above the point (x, y)
+                rise: float = x * tan(theta_radian) - y
+
+                if rise == 0:
                     raise ValueError("Division by zero is undefined")
 
                 # Solves for v_0 (initial velocity)
-                radicand: float = (g / 2) * (((-(x**2)) / y) + (x / tan(theta_radian)))
+                radicand: float = g / (2 * rise)
 
                 if radicand < 0:
                     raise ValueError(
                         "Radicand cannot be negative. Outputs imaginary number."
                     )
 
-                return sqrt(radicand) / cos(theta_radian)
+                return x * sqrt(radicand) / cos(theta_radian)
 
             if x is None:
 
@@ -466,3 +455,135 @@ class Chapter4(PhysicsChapter):
                 return (velocity**2) / accel
 
             return (velocity**2) / radius
+
+    class Solvers:
+        """
+        Array-capable counterparts of the Calculate methods in chapter 4.
+        Angles are in degrees, as in Calculate.
+        """
+
+        time_of_flight = EquationSolver(
+            ("v_0", "theta", "t"),
+            Branch(
+                "v_0",
+                lambda xp, theta, t: (t * g) / (2.0 * xp.sin(xp.radians(theta))),
+                checks=(
+                    Check(
+                        lambda xp, theta: xp.sin(xp.radians(theta)) == 0,
+                        "Division by zero is undefined.",
+                    ),
+                ),
+            ),
+            Branch(
+                "theta",
+                lambda xp, v_0, t: xp.degrees(xp.asin((t * g) / (2.0 * v_0))),
+                checks=(
+                    Check(lambda v_0: v_0 == 0, "Division by zero is undefined."),
+                    Check(
+                        lambda v_0, t: abs((t * g) / (2.0 * v_0)) > 1,
+                        "No real solution exists. Time too long for given velocity.",
+                    ),
+                ),
+            ),
+            Branch("t", lambda xp, v_0, theta: (2 * v_0 * xp.sin(xp.radians(theta))) / g),
+            checks=(Check(lambda t: t < 0, "Time cannot be a negative value"),),
+        )
+
+        trajectory = EquationSolver(
+            ("theta", "v_0", "x", "y"),
+            Branch(
+                "v_0",
+                lambda xp, theta, x, y: xp.sqrt(
+                    (g * x * x)
+                    / (2 * xp.cos(xp.radians(theta)) ** 2 * (x * xp.tan(xp.radians(theta)) - y))
+                ),
+                checks=(
+                    Check(
+                        lambda xp, theta, x, y: x * xp.tan(xp.radians(theta)) == y,
+                        "Division by zero is undefined",
+                    ),
+                    Check(
+                        lambda xp, theta, x, y: x * xp.tan(xp.radians(theta)) - y < 0,
+                        "Radicand cannot be negative. Outputs imaginary number.",
+                    ),
+                ),
+            ),
+            Branch(
+                "y",
+                lambda xp, theta, v_0, x: xp.tan(xp.radians(theta)) * x
+                - (g / (2 * (v_0 * xp.cos(xp.radians(theta))) ** 2)) * (x * x),
+                checks=(
+                    Check(
+                        lambda xp, theta, v_0: (v_0 == 0) | (theta % 180 == 90),
+                        "Division by zero is undefined",
+                    ),
+                ),
+            ),
+            # theta and x are found numerically from the height. Of the two
+            # launch angles that reach a point the search from 0° finds the
+            # lower one, and of the two points at a height the nearer one
+            bounds={"theta": (-90.0, 90.0), "x": (0.0, inf)},
+        )
+
+        projectile_range = EquationSolver(
+            ("r_total", "v_0", "theta"),
+            Branch(
+                "r_total",
+                lambda xp, v_0, theta: ((v_0 * v_0) * xp.sin(2 * xp.radians(theta))) / g,
+            ),
+            Branch(
+                "v_0",
+                lambda xp, r_total, theta: xp.sqrt((r_total * g) / xp.sin(2 * xp.radians(theta))),
+                checks=(
+                    Check(
+                        lambda xp, theta: xp.sin(2 * xp.radians(theta)) == 0,
+                        "Division by zero is undefined.",
+                    ),
+                    Check(
+                        lambda xp, r_total, theta: (r_total * g) / xp.sin(2 * xp.radians(theta)) < 0,
+                        "Radicand cannot be negative. Outputs imaginary number.",
+                    ),
+                ),
+            ),
+            Branch(
+                "theta",
+                lambda xp, r_total, v_0: xp.degrees(xp.asin((r_total * g) / (v_0 * v_0))) / 2.0,
+                checks=(
+                    Check(lambda v_0: v_0 == 0, "Division by zero is undefined."),
+                    Check(
+                        lambda r_total, v_0: (r_total * g) / (v_0 * v_0) > 1,
+                        "No real solution exists. Range too large for given velocity.",
+                    ),
+                    Check(lambda r_total: r_total < 0, "Range cannot be negative."),
+                ),
+            ),
+        )
+
+        centripetal_accel = EquationSolver(
+            ("accel", "velocity", "radius"),
+            Branch("accel", lambda xp, velocity, radius: (velocity * velocity) / radius),
+            Branch(
+                "velocity",
+                lambda xp, accel, radius: xp.sqrt(accel * radius),
+                checks=(
+                    Check(
+                        lambda accel, radius: accel * radius < 0,
+                        "Radicand cannot be negative. Yields an imaginary number.",
+                    ),
+                ),
+            ),
+            Branch(
+                "radius",
+                lambda xp, accel, velocity: (velocity * velocity) / accel,
+                checks=(
+                    Check(lambda accel: accel == 0, "Division by zero is undefined."),
+                    Check(
+                        lambda result: result <= 0,
+                        "Radius cannot be less than or equal to zero.",
+                    ),
+                ),
+            ),
+            checks=(
+                Check(lambda radius: radius <= 0, "Radius cannot be less than or equal to zero."),
+            ),
+        )
@@ -1,5 +1,6 @@
 from typing import Dict, List, Optional
 from physics_TUI.base_chapter import PhysicsChapter, Equation, Definition
+from physics_TUI.solver import Branch, Check, EquationSolver
 from math import pi, cos, acos
 
 # Constants
@@ -91,6 +92,7 @@ class Chapter5(PhysicsChapter):
                     "θ": "Angle between the normal vector and gravitational vector [radians]",
                 },
                 calculation=self.Calculate.normal_force,
+                solver=self.Solvers.normal_force,
             ),
             Equation(
                 name="Hooke's Law",
@@ -101,6 +103,7 @@ class Chapter5(PhysicsChapter):
                     "x": "Distance from point of equilibrium",
                 },
                 calculation=self.Calculate.hookes_law,
+                solver=self.Solvers.hookes_law,
             ),
         ]
 
@@ -300,3 +303,61 @@ class Chapter5(PhysicsChapter):
                 return -force / spring_const
 
             return -spring_const * displacement
+
+    class Solvers:
+        """
+        Array-capable counterparts of the Calculate methods in chapter 5.
+        """
+
+        normal_force = EquationSolver(
+            ("normal_F", "mass", "theta"),
+            Branch("normal_F", lambda xp, mass, theta: mass * g * xp.cos(xp.radians(theta))),
+            Branch(
+                "mass",
+                lambda xp, normal_F, theta: normal_F / (g * xp.cos(xp.radians(theta))),
+                checks=(
+                    Check(lambda theta: theta % 180 == 90, "Division by zero is undefined."),
+                    Check(lambda result: result < 0, "Mass cannot be negative."),
+                ),
+            ),
+            Branch(
+                "theta",
+                lambda xp, normal_F, mass: xp.degrees(xp.acos(normal_F / (mass * g))),
+                checks=(
+                    Check(lambda mass: mass == 0, "Division by zero is undefined."),
+                    Check(
+                        lambda normal_F, mass: abs(normal_F / (mass * g)) > 1,
+                        "Normal force cannot exceed the weight of the object.",
+                    ),
+                ),
+            ),
+            checks=(Check(lambda mass: mass < 0, "Mass cannot be negative."),),
+        )
+
+        hookes_law = EquationSolver(
+            ("force", "spring_const", "displacement"),
+            Branch("force", lambda xp, spring_const, displacement: -spring_const * displacement),
+            Branch(
+                "spring_const",
+                lambda xp, force, displacement: -force / displacement,
+                checks=(
+                    Check(lambda displacement: displacement == 0, "Divison by zero is undefined."),
+                    Check(
+                        lambda result: result < 0,
+                        "Spring constant cannot be negative. Consider the relation between "
+                        "the direction of displacment and the restorative force.",
+                    ),
+                ),
+            ),
+            Branch(
+                "displacement",
+                lambda xp, force, spring_const: -force / spring_const,
+                checks=(Check(lambda spring_const: spring_const == 0, "Divison by zero is undefined."),),
+            ),
+            checks=(
+                Check(
+                    lambda spring_const: spring_const < 0,
+                    "Spring constant (k) cannot be a negative value.",
+                ),
+            ),
+        )
@@ -1,5 +1,6 @@
 from typing import Dict, List, Optional
 from physics_TUI.base_chapter import PhysicsChapter, Equation, Definition
+from physics_TUI.solver import Branch, Check, EquationSolver
 from math import sqrt, tan, atan, pi
 
 # Global constant
@@ -58,7 +59,8 @@ class Chapter6(PhysicsChapter):
                     "v": "Tangential velocity (m/s)",
                     "r": "Radius (m)",
                 },
-                calculation=self.Calculate.centripetal_force_ang_vel,
+                calculation=self.Calculate.centripetal_force_tang_vel,
+                solver=self.Solvers.centripetal_force_tang_vel,
             ),
             Equation(
                 name="Centripetal force with angular velocity",
@@ -69,7 +71,8 @@ class Chapter6(PhysicsChapter):
                     "ω": "Tangential velocity (rads/s)",
                     "r": "Radius (m)",
                 },
-                calculation=self.Calculate.centripetal_force_tang_vel,
+                calculation=self.Calculate.centripetal_force_ang_vel,
+                solver=self.Solvers.centripetal_force_ang_vel,
             ),
             Equation(
                 name="Ideal angle of a banked curve",
@@ -80,6 +83,7 @@ class Chapter6(PhysicsChapter):
                     "r": "Radius of curvature (m)",
                 },
                 calculation=self.Calculate.ideal_ang_banked_curve,
+                solver=self.Solvers.ideal_ang_banked_curve,
             ),
             Equation(
                 name="Drag force",
@@ -92,6 +96,7 @@ class Chapter6(PhysicsChapter):
                     "v": "Velocity of the object (m/s)",
                 },
                 calculation=self.Calculate.drag_force,
+                solver=self.Solvers.drag_force,
             ),
             Equation(
                 name="Stoke's law",
@@ -103,6 +108,7 @@ class Chapter6(PhysicsChapter):
                     "v": "Velocity of the object (m/s)",
                 },
                 calculation=self.Calculate.stokes_law,
+                solver=self.Solvers.stokes_law,
             ),
             Equation(
                 name="Terminal velocity",
@@ -115,6 +121,7 @@ class Chapter6(PhysicsChapter):
                     "ρ": "Fluid density (kg/m³)",
                 },
                 calculation=self.Calculate.terminal_velocity,
+                solver=self.Solvers.terminal_velocity,
             ),
         ]
 
@@ -358,11 +365,11 @@ class Chapter6(PhysicsChapter):
 
             if radius == None:
 
-                if velocity == 0:
+                if velocity == 0 or theta == 0:
                     raise ValueError("Division by zero is undefined.")
 
                 # Calculates for radius
-                return ((velocity * velocity) / g) * tan(theta_radians)
+                return (velocity * velocity) / (g * tan(theta_radians))
 
             # Calculates the ideal angle theta
             argument: float = (velocity * velocity) / (radius * g)
@@ -558,11 +565,11 @@ class Chapter6(PhysicsChapter):
 
             if mass == None:
                 # Calculates the mass
-                return sqrt(terminal_vel) * ((drag_coeff * area * fluid_dens) / (2 * g))
+                return terminal_vel**2 * ((drag_coeff * area * fluid_dens) / (2 * g))
 
             if drag_coeff == None:
                 # Calculates the drag coefficient
-                return (2 * mass * g) / (sqrt(terminal_vel) * area * fluid_dens)
+                return (2 * mass * g) / (terminal_vel**2 * area * fluid_dens)
 
             if area == None:
 
@@ -570,16 +577,315 @@ class Chapter6(PhysicsChapter):
                     raise ValueError("Division by zero is undefined.")
 
                 # Calculates the area
-                return (2 * mass * g) / (sqrt(terminal_vel) * drag_coeff * fluid_dens)
+                return (2 * mass * g) / (terminal_vel**2 * drag_coeff * fluid_dens)
 
-            if fluid_dens == 0:
+            if fluid_dens == None:
 
                 if drag_coeff == 0:
                     raise ValueError("Division by zero is undefined.")
 
-                # Calculates the area
-                return (2 * mass * g) / (sqrt(terminal_vel) * drag_coeff * area)
+                # Calculates the fluid density
+                return (2 * mass * g) / (terminal_vel**2 * drag_coeff * area)
 
             radicand: float = (2 * mass * g) / (fluid_dens * drag_coeff * area)
             
             return sqrt(radicand)
+
+    class Solvers:
+        """
+        Array-capable counterparts of the Calculate methods in Chapter 6.
+        Drag forces are returned as magnitudes.
+        """
+
+        centripetal_force_tang_vel = EquationSolver(
+            ("centripetal_F", "mass", "velocity", "radius"),
+            Branch(
+                "centripetal_F",
+                lambda xp, mass, velocity, radius: (mass * (velocity * velocity)) / radius,
+            ),
+            Branch(
+                "mass",
+                lambda xp, centripetal_F, velocity, radius: (radius * centripetal_F)
+                / (velocity * velocity),
+                checks=(
+                    Check(lambda velocity: velocity == 0, "Divison by zero is undefined."),
+                    Check(
+                        lambda result: result <= 0,
+                        "We are operating with massive objects. Mass must be greater than zero. "
+                        "Check your signs.",
+                    ),
+                ),
+            ),
+            Branch(
+                "velocity",
+                lambda xp, centripetal_F, mass, radius: xp.sqrt((centripetal_F * radius) / mass),
+                checks=(
+                    Check(
+                        lambda centripetal_F: centripetal_F < 0,
+                        "Negative radicand produces an imaginary number. Check your signs.",
+                    ),
+                ),
+            ),
+            Branch(
+                "radius",
+                lambda xp, centripetal_F, mass, velocity: (mass * (velocity * velocity))
+                / centripetal_F,
+                checks=(
+                    Check(lambda centripetal_F: centripetal_F == 0, "Divison by zero is undefined."),
+                    Check(lambda result: result < 0, "Radius cannot be negative. Check your signs."),
+                ),
+            ),
+            checks=(
+                Check(
+                    lambda mass: mass <= 0,
+                    "We are operating with massive objects. Mass must be greater than zero.",
+                ),
+                Check(lambda radius: radius <= 0, "Radius must be greater than zero."),
+            ),
+        )
+
+        centripetal_force_ang_vel = EquationSolver(
+            ("centripetal_F", "mass", "angular_vel", "radius"),
+            Branch(
+                "centripetal_F",
+                lambda xp, mass, angular_vel, radius: mass * (angular_vel * angular_vel) * radius,
+            ),
+            Branch(
+                "mass",
+                lambda xp, centripetal_F, angular_vel, radius: centripetal_F
+                / (radius * (angular_vel * angular_vel)),
+                checks=(
+                    Check(lambda angular_vel: angular_vel == 0, "Division by zero is undefined."),
+                    Check(
+                        lambda centripetal_F: centripetal_F < 0,
+                        "Mass cannot be negative. Check your signs.",
+                    ),
+                ),
+            ),
+            Branch(
+                "angular_vel",
+                lambda xp, centripetal_F, mass, radius: xp.sqrt(centripetal_F / (mass * radius)),
+                checks=(
+                    Check(
+                        lambda centripetal_F: centripetal_F < 0,
+                        "Negative radicand produces an imaginary number.",
+                    ),
+                ),
+            ),
+            Branch(
+                "radius",
+                lambda xp, centripetal_F, mass, angular_vel: centripetal_F
+                / (mass * (angular_vel * angular_vel)),
+                checks=(
+                    Check(lambda angular_vel: angular_vel == 0, "Divison by zero is undefined."),
+                    Check(
+                        lambda centripetal_F: centripetal_F < 0,
+                        "Radius cannot be negative. Check your signs.",
+                    ),
+                ),
+            ),
+            checks=(
+                Check(
+                    lambda mass: mass <= 0,
+                    "We are operating with massive objects. Mass must be greater than zero.",
+                ),
+                Check(lambda radius: radius <= 0, "Radius must be greater than zero."),
+            ),
+        )
+
+        ideal_ang_banked_curve = EquationSolver(
+            ("theta", "velocity", "radius"),
+            Branch(
+                "theta",
+                lambda xp, velocity, radius: xp.degrees(xp.atan((velocity * velocity) / (radius * g))),
+            ),
+            Branch(
+                "velocity",
+                lambda xp, theta, radius: xp.sqrt(radius * g * xp.tan(xp.radians(theta))),
+                checks=(
+                    Check(
+                        lambda theta: theta % 180 == 90,
+                        "Tangent function is undefined at 90.0 and 270.0 degrees.",
+                    ),
+                ),
+            ),
+            Branch(
+                "radius",
+                lambda xp, theta, velocity: (velocity * velocity) / (g * xp.tan(xp.radians(theta))),
+                checks=(
+                    Check(
+                        lambda xp, theta, velocity: (velocity == 0) | (xp.tan(xp.radians(theta)) == 0),
+                        "Division by zero is undefined.",
+                    ),
+                ),
+            ),
+            checks=(
+                Check(
+                    lambda theta: theta < 0,
+                    "Reconsider if theta can physically be a negative value.",
+                ),
+                Check(lambda radius: radius <= 0, "Radius cannot be less than or equal to zero."),
+            ),
+        )
+
+        # The drag force comes out negative, opposing the motion, and is
+        # taken as a magnitude when solving for the other variables
+        drag_force = EquationSolver(
+            ("drag_F", "drag_coeff", "fluid_dens", "area", "velocity"),
+            Branch(
+                "drag_F",
+                lambda xp, drag_coeff, fluid_dens, area, velocity: -0.5
+                * drag_coeff
+                * fluid_dens
+                * area
+                * (velocity * velocity),
+            ),
+            Branch(
+                "drag_coeff",
+                lambda xp, drag_F, fluid_dens, area, velocity: abs(drag_F)
+                / (0.5 * fluid_dens * area * (velocity * velocity)),
+                checks=(
+                    Check(lambda velocity: velocity == 0, "Divison by zero is undefined."),
+                    Check(
+                        lambda velocity: velocity < 0,
+                        "Drag coefficient is a positive value. Check your signs.",
+                    ),
+                ),
+            ),
+            Branch(
+                "fluid_dens",
+                lambda xp, drag_F, drag_coeff, area, velocity: abs(drag_F)
+                / (0.5 * drag_coeff * area * (velocity * velocity)),
+                checks=(
+                    Check(lambda velocity: velocity == 0, "Divison by zero is undefined."),
+                    Check(
+                        lambda velocity: velocity < 0,
+                        "Fluid density is a positive value. Check your signs.",
+                    ),
+                ),
+            ),
+            Branch(
+                "area",
+                lambda xp, drag_F, drag_coeff, fluid_dens, velocity: abs(drag_F)
+                / (0.5 * drag_coeff * fluid_dens * (velocity * velocity)),
+                checks=(
+                    Check(lambda velocity: velocity == 0, "Divison by zero is undefined."),
+                    Check(lambda velocity: velocity < 0, "Area cannot be negative. Check your signs."),
+                ),
+            ),
+            Branch(
+                "velocity",
+                lambda xp, drag_F, drag_coeff, fluid_dens, area: xp.sqrt(
+                    abs(drag_F) / (0.5 * drag_coeff * fluid_dens * area)
+                ),
+            ),
+            checks=(
+                Check(
+                    lambda drag_coeff: drag_coeff <= 0,
+                    "The drag coefficient cannot be less than or equalt to zero.",
+                ),
+                Check(lambda area: area <= 0, "Area cannot be less than zero or equal to zero."),
+                Check(
+                    lambda fluid_dens: fluid_dens <= 0,
+                    "Fluid density cannot be less than or equal to zero.",
+                ),
+            ),
+        )
+
+        # Likewise the Stokes drag opposes the motion
+        stokes_law = EquationSolver(
+            ("drag_Fs", "radius", "viscosity", "velocity"),
+            Branch(
+                "drag_Fs",
+                lambda xp, radius, viscosity, velocity: -6 * xp.pi * radius * viscosity * velocity,
+            ),
+            Branch(
+                "radius",
+                lambda xp, drag_Fs, viscosity, velocity: abs(drag_Fs) / (6 * xp.pi * viscosity * velocity),
+                checks=(
+                    Check(
+                        lambda viscosity, velocity: (velocity == 0) | (viscosity == 0),
+                        "Divison by zero is undefined.",
+                    ),
+                    Check(lambda velocity: velocity < 0, "The radius cannot be negative. Check your signs."),
+                ),
+            ),
+            Branch(
+                "viscosity",
+                lambda xp, drag_Fs, radius, velocity: abs(drag_Fs) / (6 * xp.pi * radius * velocity),
+                checks=(
+                    Check(
+                        lambda velocity: velocity <= 0,
+                        "Velocity cannot be less than or euqal to 0. This makes viscosity a negative value.",
+                    ),
+                ),
+            ),
+            Branch(
+                "velocity",
+                lambda xp, drag_Fs, radius, viscosity: abs(drag_Fs) / (6 * xp.pi * radius * viscosity),
+                checks=(Check(lambda viscosity: viscosity == 0, "Divison by zero is undefined."),),
+            ),
+            checks=(
+                Check(lambda radius: radius <= 0, "Radius cannot be less than zero or equal to zero."),
+                Check(lambda viscosity: viscosity < 0, "Viscocity cannot be a negative value."),
+            ),
+        )
+
+        terminal_velocity = EquationSolver(
+            ("terminal_vel", "mass", "drag_coeff", "area", "fluid_dens"),
+            Branch(
+                "terminal_vel",
+                lambda xp, mass, drag_coeff, area, fluid_dens: xp.sqrt(
+                    (2 * mass * g) / (fluid_dens * drag_coeff * area)
+                ),
+                checks=(Check(lambda drag_coeff: drag_coeff == 0, "Division by zero is undefined."),),
+            ),
+            Branch(
+                "mass",
+                lambda xp, terminal_vel, drag_coeff, area, fluid_dens: (terminal_vel * terminal_vel)
+                * fluid_dens
+                * drag_coeff
+                * area
+                / (2 * g),
+            ),
+            Branch(
+                "drag_coeff",
+                lambda xp, terminal_vel, mass, area, fluid_dens: (2 * mass * g)
+                / ((terminal_vel * terminal_vel) * area * fluid_dens),
+                checks=(Check(lambda terminal_vel: terminal_vel == 0, "Division by zero is undefined."),),
+            ),
+            Branch(
+                "area",
+                lambda xp, terminal_vel, mass, drag_coeff, fluid_dens: (2 * mass * g)
+                / ((terminal_vel * terminal_vel) * drag_coeff * fluid_dens),
+                checks=(
+                    Check(
+                        lambda terminal_vel, drag_coeff: (terminal_vel == 0) | (drag_coeff == 0),
+                        "Division by zero is undefined.",
+                    ),
+                ),
+            ),
+            Branch(
+                "fluid_dens",
+                lambda xp, terminal_vel, mass, drag_coeff, area: (2 * mass * g)
+                / ((terminal_vel * terminal_vel) * drag_coeff * area),
+                checks=(
+                    Check(
+                        lambda terminal_vel, drag_coeff: (terminal_vel == 0) | (drag_coeff == 0),
+                        "Division by zero is undefined.",
+                    ),
+                ),
+            ),
+            checks=(
+                Check(lambda drag_coeff: drag_coeff < 0, "The drag coefficient cannot be a negative value."),
+                Check(lambda area: area <= 0, "Area cannot be less than zero or equal to zero."),
+                Check(
+                    lambda fluid_dens: fluid_dens <= 0,
+                    "Fluid density cannot be less than or equal to zero.",
+                ),
+                Check(
+                    lambda mass: mass <= 0,
+                    "We are operating with massive objects. Mass must be greater than zero.",
+                ),
+            ),
+        )
@@ -1,5 +1,6 @@
 from typing import List, Optional, Dict
 from physics_TUI.base_chapter import PhysicsChapter, Equation, Definition
+from physics_TUI.solver import Branch, Check, EquationSolver
 from math import pi, cos, acos, sqrt
 
 # Global constants
@@ -44,6 +45,7 @@ class Chapter7(PhysicsChapter):
                     "θ": "Angle between the direction of motion and force vector (degrees)",
                 },
                 calculation=self.Calculate.work_constant_force,
+                solver=self.Solvers.work_constant_force,
             ),
             Equation(
                 name="Work done by gravity",
@@ -55,6 +57,7 @@ class Chapter7(PhysicsChapter):
                     "y₂": "Final height (m)",
                 },
                 calculation=self.Calculate.work_by_gravity,
+                solver=self.Solvers.work_by_gravity,
             ),
             Equation(
                 name="Work done by a spring",
@@ -66,6 +69,7 @@ class Chapter7(PhysicsChapter):
                     "x₂": "Final position",
                 },
                 calculation=self.Calculate.work_by_spring,
+                solver=self.Solvers.work_by_spring,
             ),
             Equation(
                 name="Kinetic energy",
@@ -76,6 +80,7 @@ class Chapter7(PhysicsChapter):
                     "v": "Velocity (m/s)",
                 },
                 calculation=self.Calculate.kinetic_energy,
+                solver=self.Solvers.kinetic_energy,
             ),
             Equation(
                 name="Kinetic energy (momentum representation)",
@@ -86,6 +91,7 @@ class Chapter7(PhysicsChapter):
                     "p": "Momentum (N*s)",
                 },
                 calculation=self.Calculate.kinetic_energy_momentum,
+                solver=self.Solvers.kinetic_energy_momentum,
             ),
             Equation(
                 name="Work-Energy theorem",
@@ -97,6 +103,7 @@ class Chapter7(PhysicsChapter):
                     "v₁": "Initial velocity (m/s)",
                 },
                 calculation=self.Calculate.work_energy_theorem,
+                solver=self.Solvers.work_energy_theorem,
             ),
             Equation(
                 name="Average power",
@@ -276,11 +283,21 @@ class Chapter7(PhysicsChapter):
                     (final_xpos * final_xpos) - (initial_xpos * initial_xpos)
                 )
 
-            if initial_xpos == None:
-                return ((2.0 * work) / spring_const) + (final_xpos * final_xpos)
+            if initial_xpos == None or final_xpos == None:
 
-            if final_xpos == None:
-                return ((-2.0 * work) / spring_const) + (initial_xpos * initial_xpos)
+                if spring_const == 0:
+                    raise ValueError("Division by zero is undefined.")
+
+                # Calculates the distance of the missing position from equilibrium
+                if initial_xpos == None:
+                    radicand: float = ((2.0 * work) / spring_const) + (final_xpos * final_xpos)
+                else:
+                    radicand = ((-2.0 * work) / spring_const) + (initial_xpos * initial_xpos)
+
+                if radicand < 0:
+                    raise ValueError("Negative radicand produces an imaginary number. Check your signs.")
+
+                return sqrt(radicand)
 
             return (
                 -0.5
@@ -446,3 +463,281 @@ class Chapter7(PhysicsChapter):
             return (0.5 * mass) * (
                 (final_vel * final_vel) - (initial_vel * initial_vel)
             )
+
+    class Solvers:
+        """
+        Array-capable counterparts of the Calculate methods in Chapter 7.
+        Positions solved from a square are returned as the non-negative root.
+        """
+
+        work_constant_force = EquationSolver(
+            ("work", "const_F", "distance", "theta"),
+            Branch(
+                "work",
+                lambda xp, const_F, distance, theta: const_F * distance * xp.cos(xp.radians(theta)),
+            ),
+            Branch(
+                "const_F",
+                lambda xp, work, distance, theta: work / (xp.cos(xp.radians(theta)) * distance),
+                checks=(
+                    Check(
+                        lambda distance, theta: (theta % 180 == 90) | (distance == 0),
+                        "Division by zero is undefined.",
+                    ),
+                ),
+            ),
+            Branch(
+                "distance",
+                lambda xp, work, const_F, theta: work / (const_F * xp.cos(xp.radians(theta))),
+                checks=(
+                    Check(
+                        lambda const_F, theta: (theta % 180 == 90) | (const_F == 0),
+                        "Division by zero is undefined.",
+                    ),
+                ),
+            ),
+            Branch(
+                "theta",
+                lambda xp, work, const_F, distance: xp.degrees(xp.acos(work / (const_F * distance))),
+                checks=(
+                    Check(
+                        lambda const_F, distance: (const_F == 0) | (distance == 0),
+                        "Division by zero is undefined.",
+                    ),
+                    Check(
+                        lambda work, const_F, distance: abs(work / (const_F * distance)) > 1,
+                        "Work cannot exceed the product of force and distance.",
+                    ),
+                ),
+            ),
+        )
+
+        work_by_gravity = EquationSolver(
+            ("work", "mass", "initial_height", "final_height"),
+            Branch(
+                "work",
+                lambda xp, mass, initial_height, final_height: -mass
+                * g
+                * (final_height - initial_height),
+            ),
+            Branch(
+                "mass",
+                lambda xp, work, initial_height, final_height: -work
+                / (g * (final_height - initial_height)),
+                checks=(
+                    Check(
+                        lambda initial_height, final_height: final_height == initial_height,
+                        "Division by zero is undefined.",
+                    ),
+                    Check(
+                        lambda result: result < 0,
+                        "Mass cannot be negative. Check your signs or initial and final heights.",
+                    ),
+                ),
+            ),
+            Branch(
+                "initial_height",
+                lambda xp, work, mass, final_height: (work / (mass * g)) + final_height,
+            ),
+            Branch(
+                "final_height",
+                lambda xp, work, mass, initial_height: (-work / (mass * g)) + initial_height,
+            ),
+            checks=(
+                Check(
+                    lambda mass: mass <= 0,
+                    "We are operating with massive objects. Mass must be greater than zero.",
+                ),
+            ),
+        )
+
+        work_by_spring = EquationSolver(
+            ("work", "spring_const", "initial_xpos", "final_xpos"),
+            Branch(
+                "work",
+                lambda xp, spring_const, initial_xpos, final_xpos: -0.5
+                * spring_const
+                * ((final_xpos * final_xpos) - (initial_xpos * initial_xpos)),
+            ),
+            Branch(
+                "spring_const",
+                lambda xp, work, initial_xpos, final_xpos: (-2.0 * work)
+                / ((final_xpos * final_xpos) - (initial_xpos * initial_xpos)),
+                checks=(
+                    Check(
+                        lambda initial_xpos, final_xpos: abs(final_xpos) == abs(initial_xpos),
+                        "Division by zero is undefined.",
+                    ),
+                ),
+            ),
+            Branch(
+                "initial_xpos",
+                lambda xp, work, spring_const, final_xpos: xp.sqrt(
+                    ((2.0 * work) / spring_const) + (final_xpos * final_xpos)
+                ),
+                checks=(
+                    Check(lambda spring_const: spring_const == 0, "Division by zero is undefined."),
+                    Check(
+                        lambda work, spring_const, final_xpos: ((2.0 * work) / spring_const)
+                        + (final_xpos * final_xpos)
+                        < 0,
+                        "Negative radicand produces an imaginary number. Check your signs.",
+                    ),
+                ),
+            ),
+            Branch(
+                "final_xpos",
+                lambda xp, work, spring_const, initial_xpos: xp.sqrt(
+                    ((-2.0 * work) / spring_const) + (initial_xpos * initial_xpos)
+                ),
+                checks=(
+                    Check(lambda spring_const: spring_const == 0, "Division by zero is undefined."),
+                    Check(
+                        lambda work, spring_const, initial_xpos: ((-2.0 * work) / spring_const)
+                        + (initial_xpos * initial_xpos)
+                        < 0,
+                        "Negative radicand produces an imaginary number. Check your signs.",
+                    ),
+                ),
+            ),
+            checks=(
+                Check(
+                    lambda spring_const: spring_const < 0,
+                    "Spring constant cannot be a negative value.",
+                ),
+            ),
+        )
+
+        kinetic_energy = EquationSolver(
+            ("kinetic_E", "mass", "velocity"),
+            Branch("kinetic_E", lambda xp, mass, velocity: 0.5 * mass * (velocity * velocity)),
+            Branch(
+                "mass",
+                lambda xp, kinetic_E, velocity: kinetic_E * (2.0 / (velocity * velocity)),
+                checks=(
+                    Check(lambda velocity: velocity == 0, "Division by zero is undefined."),
+                    Check(
+                        lambda result: result < 0,
+                        "We are operating with massive objects. Mass must be greater than zero.",
+                    ),
+                ),
+            ),
+            Branch(
+                "velocity",
+                lambda xp, kinetic_E, mass: xp.sqrt(kinetic_E * (2.0 / mass)),
+                checks=(
+                    Check(
+                        lambda kinetic_E: kinetic_E < 0,
+                        "Negative radicand yields an imaginary number. "
+                        "Check the value of your kinetic energy",
+                    ),
+                ),
+            ),
+            checks=(
+                Check(
+                    lambda mass: mass <= 0,
+                    "We are operating with massive objects. Mass must be greater than zero.",
+                ),
+                Check(
+                    lambda velocity: velocity < 0,
+                    "This is a scalar product. Velocity cannot be negative",
+                ),
+            ),
+        )
+
+        kinetic_energy_momentum = EquationSolver(
+            ("kinetic_E", "mass", "momentum"),
+            Branch("kinetic_E", lambda xp, mass, momentum: (momentum * momentum) / (2.0 * mass)),
+            Branch(
+                "mass",
+                lambda xp, kinetic_E, momentum: (momentum * momentum) / (kinetic_E * 2.0),
+                checks=(
+                    Check(lambda kinetic_E: kinetic_E == 0, "Division by zero is undefined."),
+                    Check(
+                        lambda result: result < 0,
+                        "We are operating with massive objects. Mass must be greater than zero. "
+                        "Check your value for kinetic energy.",
+                    ),
+                ),
+            ),
+            Branch(
+                "momentum",
+                lambda xp, kinetic_E, mass: xp.sqrt(kinetic_E * 2.0 * mass),
+                checks=(
+                    Check(
+                        lambda kinetic_E: kinetic_E < 0,
+                        "Negative radicand yields an imaginary number. "
+                        "Check the value of your kinetic energy",
+                    ),
+                ),
+            ),
+            checks=(
+                Check(
+                    lambda mass: mass <= 0,
+                    "We are operating with massive objects. Mass must be greater than zero.",
+                ),
+                Check(
+                    lambda momentum: momentum < 0,
+                    "This is a scalar product. Velocity cannot be negative",
+                ),
+            ),
+        )
+
+        work_energy_theorem = EquationSolver(
+            ("net_work", "mass", "final_vel", "initial_vel"),
+            Branch(
+                "net_work",
+                lambda xp, mass, final_vel, initial_vel: (0.5 * mass)
+                * ((final_vel * final_vel) - (initial_vel * initial_vel)),
+            ),
+            Branch(
+                "mass",
+                lambda xp, net_work, final_vel, initial_vel: (2.0 * net_work)
+                / ((final_vel * final_vel) - (initial_vel * initial_vel)),
+                checks=(
+                    Check(
+                        lambda final_vel, initial_vel: abs(final_vel) == abs(initial_vel),
+                        "Division by zero is undefined.",
+                    ),
+                    Check(
+                        lambda result: result < 0,
+                        "We are operating with massive objects. Mass must be greater than zero. "
+                        "Check your values",
+                    ),
+                ),
+            ),
+            Branch(
+                "final_vel",
+                lambda xp, net_work, mass, initial_vel: xp.sqrt(
+                    ((2.0 * net_work) / mass) + (initial_vel * initial_vel)
+                ),
+                checks=(
+                    Check(
+                        lambda net_work, mass, initial_vel: ((2.0 * net_work) / mass)
+                        + (initial_vel * initial_vel)
+                        < 0,
+                        "Negative radicand produces an imaginary number. Check your signs.",
+                    ),
+                ),
+            ),
+            Branch(
+                "initial_vel",
+                lambda xp, net_work, mass, final_vel: xp.sqrt(
+                    ((-2.0 * net_work) / mass) + (final_vel * final_vel)
+                ),
+                checks=(
+                    Check(
+                        lambda net_work, mass, final_vel: ((-2.0 * net_work) / mass)
+                        + (final_vel * final_vel)
+                        < 0,
+                        "Negative radicand produces an imaginary number. Check your signs.",
+                    ),
+                ),
+            ),
+            checks=(
+                Check(
+                    lambda mass: mass <= 0,
+                    "We are operating with massive objects. Mass must be greater than zero.",
+                ),
+            ),
+        )
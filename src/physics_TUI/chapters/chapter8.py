@@ -19,7 +19,7 @@ class Chapter8(PhysicsChapter):
                 variables={
                     "ΔUαβ": "Change in gravitational potential energy (J)",
                     "Uβ": "Gravitational potential energy at final position (J)",
-                    "Uα": "Gravitational potential energy at final position (J)",
+                    "Uα": "Gravitational potential energy at initial position (J)",
                     "Wαβ": "Work done from point α to point β (J)",
                 },
             ),
@@ -1,5 +1,6 @@
 from typing import List, Optional, Dict
 from physics_TUI.base_chapter import PhysicsChapter, Equation, Definition
+from physics_TUI.solver import Branch, Check, EquationSolver
 from math import log, exp
 
 
@@ -107,6 +108,7 @@ class Chapter9(PhysicsChapter):
                     "v": "Velocity after the collision (m/s)",
                 },
                 calculation=self.Calculate.inelastic_collision_momentum,
+                solver=self.Solvers.inelastic_collision_momentum,
             ),
             Equation(
                 name="Elastic collision of two objects (momentum)",
@@ -120,6 +122,7 @@ class Chapter9(PhysicsChapter):
                     "v(f1)": "Final velocity of the second object (m/s)",
                 },
                 calculation=self.Calculate.elastic_collision_momentum,
+                solver=self.Solvers.elastic_collision_momentum,
             ),
             Equation(
                 name="External forces",
@@ -179,6 +182,7 @@ class Chapter9(PhysicsChapter):
                     "m": "Mass of the rocket after the fuel has been exhausted",
                 },
                 calculation=self.Calculate.rocket_equation,
+                solver=self.Solvers.rocket_equation,
             ),
         ]
 
@@ -561,3 +565,183 @@ class Chapter9(PhysicsChapter):
 
             # Calculates delta v of the rocket
             return vel_exhaust * log(initial_mass / final_mass)
+
+    class Solvers:
+        """
+        Array-capable counterparts of the Calculate methods in Chapter 9.
+        """
+
+        inelastic_collision_momentum = EquationSolver(
+            ("mass_1", "mass_2", "velocity_1", "velocity_2", "velocity_f", "mass_f"),
+            Branch(
+                "mass_1",
+                lambda xp, mass_2, velocity_1, velocity_2, velocity_f, mass_f: (
+                    (mass_f * velocity_f) - (mass_2 * velocity_2)
+                )
+                / velocity_1,
+                checks=(Check(lambda velocity_1: velocity_1 == 0, "Division by zero is undefined."),),
+            ),
+            Branch(
+                "mass_2",
+                lambda xp, mass_1, velocity_1, velocity_2, velocity_f, mass_f: (
+                    (mass_f * velocity_f) - (mass_1 * velocity_1)
+                )
+                / velocity_2,
+                checks=(Check(lambda velocity_2: velocity_2 == 0, "Division by zero is undefined."),),
+            ),
+            Branch(
+                "velocity_1",
+                lambda xp, mass_1, mass_2, velocity_2, velocity_f, mass_f: (
+                    (mass_f * velocity_f) - (mass_2 * velocity_2)
+                )
+                / mass_1,
+            ),
+            Branch(
+                "velocity_2",
+                lambda xp, mass_1, mass_2, velocity_1, velocity_f, mass_f: (
+                    (mass_f * velocity_f) - (mass_1 * velocity_1)
+                )
+                / mass_2,
+            ),
+            Branch(
+                "velocity_f",
+                lambda xp, mass_1, mass_2, velocity_1, velocity_2, mass_f: (
+                    (mass_1 * velocity_1) + (mass_2 * velocity_2)
+                )
+                / mass_f,
+            ),
+            Branch(
+                "mass_f",
+                lambda xp, mass_1, mass_2, velocity_1, velocity_2, velocity_f: (
+                    (mass_1 * velocity_1) + (mass_2 * velocity_2)
+                )
+                / velocity_f,
+                checks=(Check(lambda velocity_f: velocity_f == 0, "Division by zero is undefined."),),
+            ),
+            checks=(
+                Check(
+                    lambda mass_1: mass_1 <= 0,
+                    "We are operating with massive objects. "
+                    "Make sure all objects have a mass greater than zero.",
+                ),
+                Check(
+                    lambda mass_2: mass_2 <= 0,
+                    "We are operating with massive objects. "
+                    "Make sure all objects have a mass greater than zero.",
+                ),
+                Check(
+                    lambda mass_f: mass_f <= 0,
+                    "We are operating with massive objects. "
+                    "Make sure all objects have a mass greater than zero.",
+                ),
+            ),
+        )
+
+        elastic_collision_momentum = EquationSolver(
+            ("mass_1", "mass_2", "velocity_i1", "velocity_i2", "velocity_f1", "velocity_f2"),
+            Branch(
+                "mass_1",
+                lambda xp, mass_2, velocity_i1, velocity_i2, velocity_f1, velocity_f2: (
+                    (mass_2 * velocity_i2) - (mass_2 * velocity_f2)
+                )
+                / (velocity_f1 - velocity_i1),
+                checks=(
+                    Check(
+                        lambda velocity_i1, velocity_f1: velocity_f1 == velocity_i1,
+                        "Divison by zero is undefined.",
+                    ),
+                ),
+            ),
+            Branch(
+                "mass_2",
+                lambda xp, mass_1, velocity_i1, velocity_i2, velocity_f1, velocity_f2: (
+                    (mass_1 * velocity_i1) - (mass_1 * velocity_f1)
+                )
+                / (velocity_f2 - velocity_i2),
+                checks=(
+                    Check(
+                        lambda velocity_i2, velocity_f2: velocity_i2 == velocity_f2,
+                        "Divison by zero is undefined.",
+                    ),
+                ),
+            ),
+            Branch(
+                "velocity_i1",
+                lambda xp, mass_1, mass_2, velocity_i2, velocity_f1, velocity_f2: (
+                    (mass_1 * velocity_f1) + (mass_2 * velocity_f2) - (mass_2 * velocity_i2)
+                )
+                / mass_1,
+            ),
+            Branch(
+                "velocity_i2",
+                lambda xp, mass_1, mass_2, velocity_i1, velocity_f1, velocity_f2: (
+                    (mass_1 * velocity_f1) + (mass_2 * velocity_f2) - (mass_1 * velocity_i1)
+                )
+                / mass_2,
+            ),
+            Branch(
+                "velocity_f1",
+                lambda xp, mass_1, mass_2, velocity_i1, velocity_i2, velocity_f2: (
+                    (mass_1 * velocity_i1) + (mass_2 * velocity_i2) - (mass_2 * velocity_f2)
+                )
+                / mass_1,
+            ),
+            Branch(
+                "velocity_f2",
+                lambda xp, mass_1, mass_2, velocity_i1, velocity_i2, velocity_f1: (
+                    (mass_1 * velocity_i1) + (mass_2 * velocity_i2) - (mass_1 * velocity_f1)
+                )
+                / mass_2,
+            ),
+            checks=(
+                Check(
+                    lambda mass_1: mass_1 <= 0,
+                    "We are operating with massive objects. "
+                    "Make sure all objects have a mass greater than zero.",
+                ),
+                Check(
+                    lambda mass_2: mass_2 <= 0,
+                    "We are operating with massive objects. "
+                    "Make sure all objects have a mass greater than zero.",
+                ),
+            ),
+        )
+
+        rocket_equation = EquationSolver(
+            ("delta_v", "vel_exhaust", "initial_mass", "final_mass"),
+            Branch(
+                "delta_v",
+                lambda xp, vel_exhaust, initial_mass, final_mass: vel_exhaust
+                * xp.log(initial_mass / final_mass),
+            ),
+            Branch(
+                "vel_exhaust",
+                lambda xp, delta_v, initial_mass, final_mass: delta_v / xp.log(initial_mass / final_mass),
+                checks=(
+                    Check(
+                        lambda initial_mass, final_mass: initial_mass == final_mass,
+                        "Division by zero is undefined.",
+                    ),
+                ),
+            ),
+            Branch(
+                "initial_mass",
+                lambda xp, delta_v, vel_exhaust, final_mass: xp.exp(delta_v / vel_exhaust) * final_mass,
+                checks=(Check(lambda vel_exhaust: vel_exhaust == 0, "Division by zero is undefined."),),
+            ),
+            Branch(
+                "final_mass",
+                lambda xp, delta_v, vel_exhaust, initial_mass: initial_mass / xp.exp(delta_v / vel_exhaust),
+                checks=(Check(lambda vel_exhaust: vel_exhaust == 0, "Division by zero is undefined."),),
+            ),
+            checks=(
+                Check(
+                    lambda initial_mass: initial_mass <= 0,
+                    "We are operating with massive objects. Mass must be greater than zero.",
+                ),
+                Check(
+                    lambda final_mass: final_mass <= 0,
+                    "We are operating with massive objects. Mass must be greater than zero.",
+                ),
+            ),
+        )
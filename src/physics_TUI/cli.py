@@ -0,0 +1,192 @@
+"""
+Command line entry point. Without a subcommand the TUI is launched;
+`physics-tui batch` solves an equation for every row of a CSV or JSON Lines
+file without starting the interface, `physics-tui convert` converts
+columns of a CSV file or a raw binary float file between units, and
+`physics-tui integrate` integrates sampled acceleration into velocity and
+position.
+"""
+
+import argparse
+import io
+import sys
+from typing import List, Optional, cast
+
+from .batch import CHUNK_SIZE, FORMATS, BatchSolver, format_for, run_batch
+from .bulk_convert import CONVERT_FORMATS, convert_csv, convert_format_for, convert_raw
+from .integration import INTEGRATION_METHODS, integrate_csv
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Returns the argument parser for the `physics-tui` command"""
+
+    parser = argparse.ArgumentParser(
+        prog="physics-tui", description="Physics reference and calculator."
+    )
+    commands = parser.add_subparsers(dest="command")
+
+    batch = commands.add_parser(
+        "batch",
+        help="solve an equation for every row of a CSV or JSON Lines file",
+        description="Solve an equation for every row of a CSV or JSON Lines file. "
+        "Results are written to stdout with the solved column and an error column added.",
+    )
+    batch.add_argument("input", nargs="?", default="-", help="input file, or - for stdin (default)")
+    batch.add_argument("--equation", required=True, help="equation id, e.g. ch13.escape_velocity")
+    batch.add_argument("--solve", required=True, metavar="VARIABLE", help="variable to solve for")
+    batch.add_argument("--format", choices=FORMATS, help="input format (default: from the file extension, else csv)")
+    batch.add_argument("--output-format", choices=FORMATS, help="output format (default: the input format)")
+    batch.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help=f"rows solved at a time (default: {CHUNK_SIZE})")
+    batch.add_argument("--workers", type=int, help="processes for equations without an array solver (default: CPU count)")
+
+    convert = commands.add_parser(
+        "convert",
+        help="convert columns of a CSV file or a raw float file between units",
+        description="Convert values between units a block at a time, writing the result to stdout. "
+        "CSV files keep every column and convert the ones named with --column; "
+        "raw files are packed binary floats.",
+    )
+    convert.add_argument("input", nargs="?", default="-", help="input file, or - for stdin (default)")
+    convert.add_argument("--quantity", required=True, help="quantity id, e.g. length")
+    convert.add_argument("--from", dest="from_unit", required=True, metavar="UNIT", help="unit of the input values")
+    convert.add_argument("--to", dest="to_unit", required=True, metavar="UNIT", help="unit to convert to")
+    convert.add_argument("--column", action="append", default=[], help="CSV column to convert, may be repeated")
+    convert.add_argument("--format", choices=CONVERT_FORMATS, help="input format (default: raw for .bin, .raw, .dat, .f32 and .f64 files, else csv)")
+    convert.add_argument("--dtype", default="float64", help="type of raw values, e.g. float32 or >f8 (default: float64)")
+    convert.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help=f"rows or values converted at a time (default: {CHUNK_SIZE})")
+
+    integrate = commands.add_parser(
+        "integrate",
+        help="integrate acceleration samples of a CSV file into velocity and position",
+        description="Integrate the acceleration column of a CSV file a block at a time, writing every row "
+        "to stdout with velocity (v) and position (x) columns added. Times must increase but may be unevenly spaced.",
+    )
+    integrate.add_argument("input", nargs="?", default="-", help="input file, or - for stdin (default)")
+    integrate.add_argument("--time", default="t", metavar="COLUMN", help="column of sample times in s (default: t)")
+    integrate.add_argument("--accel", default="a", metavar="COLUMN", help="column of accelerations in m/s² (default: a)")
+    integrate.add_argument("--v0", type=float, default=0.0, help="velocity at the first sample in m/s (default: 0)")
+    integrate.add_argument("--x0", type=float, default=0.0, help="position at the first sample in m (default: 0)")
+    integrate.add_argument("--method", choices=INTEGRATION_METHODS, default="simpson", help="integration rule (default: simpson)")
+    integrate.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help=f"rows integrated at a time (default: {CHUNK_SIZE})")
+
+    return parser
+
+
+def run_batch_command(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    """Runs `physics-tui batch`, returning the exit status"""
+
+    from .registry import default_registry
+
+    registry = default_registry()
+    try:
+        equation = registry.equation(args.equation)
+    except KeyError as e:
+        parser.error(e.args[0])
+
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be positive")
+
+    input_format = args.format or format_for(args.input)
+    try:
+        solver = BatchSolver(
+            equation, args.solve, registry.chapter_of(equation).var_mapping, args.workers
+        )
+        if args.input == "-":
+            stats = run_batch(solver, sys.stdin, sys.stdout, input_format, args.output_format, args.chunk_size)
+        else:
+            with open(args.input, newline="", encoding="utf-8") as source:
+                stats = run_batch(solver, source, sys.stdout, input_format, args.output_format, args.chunk_size)
+    except (OSError, ValueError) as e:
+        print(f"physics-tui batch: error: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Solved {stats.rows - stats.failed} of {stats.rows} rows", file=sys.stderr)
+    return 0
+
+
+def run_convert_command(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    """Runs `physics-tui convert`, returning the exit status"""
+
+    from .registry import default_registry
+
+    try:
+        quantity = default_registry().quantity(args.quantity)
+    except KeyError as e:
+        parser.error(e.args[0])
+
+    for unit in (args.from_unit, args.to_unit):
+        if unit not in quantity.get_units():
+            parser.error(f"Unknown {quantity.id} unit: {unit} (choose from {', '.join(quantity.get_units())})")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be positive")
+
+    input_format = args.format or convert_format_for(args.input)
+    if input_format == "csv" and not args.column:
+        parser.error("--column is required for CSV input")
+
+    units = (quantity, args.from_unit, args.to_unit)
+    try:
+        if input_format == "raw":
+            sink = sys.stdout.buffer
+            if args.input == "-":
+                stdin = cast(io.BufferedReader, sys.stdin.buffer)
+                stats = convert_raw(*units, stdin, sink, args.dtype, args.chunk_size)
+            else:
+                with open(args.input, "rb") as source:
+                    stats = convert_raw(*units, source, sink, args.dtype, args.chunk_size)
+            print(f"Converted {stats.rows} values", file=sys.stderr)
+        else:
+            if args.input == "-":
+                stats = convert_csv(*units, sys.stdin, sys.stdout, args.column, args.chunk_size)
+            else:
+                with open(args.input, newline="", encoding="utf-8") as source:
+                    stats = convert_csv(*units, source, sys.stdout, args.column, args.chunk_size)
+            print(f"Converted {stats.rows} rows, {stats.failed} cells were not numbers", file=sys.stderr)
+    except (OSError, TypeError, ValueError) as e:
+        print(f"physics-tui convert: error: {e}", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+def run_integrate_command(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    """Runs `physics-tui integrate`, returning the exit status"""
+
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be positive")
+
+    options = (args.time, args.accel, args.v0, args.x0, args.method, args.chunk_size)
+    try:
+        if args.input == "-":
+            stats = integrate_csv(sys.stdin, sys.stdout, *options)
+        else:
+            with open(args.input, newline="", encoding="utf-8") as source:
+                stats = integrate_csv(source, sys.stdout, *options)
+    except (OSError, ValueError) as e:
+        print(f"physics-tui integrate: error: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Integrated {stats.rows} rows", file=sys.stderr)
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Main entry point of the `physics-tui` command."""
+
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == "batch":
+        sys.exit(run_batch_command(args, parser))
+    if args.command == "convert":
+        sys.exit(run_convert_command(args, parser))
+    if args.command == "integrate":
+        sys.exit(run_integrate_command(args, parser))
+
+    from .app import main as run_tui
+
+    run_tui()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Conversions between derived units, such as energy per time to horsepower
+or pressure times area to pound-force. Every unit in the `unit_converter`
+tables is related to its quantity's base unit, so the unit graph has the
+SI base units at its centre: a path between two expressions of the same
+dimension always runs from the source through SI to the target, and
+collapses to the single factor `unit_parser.conversion_factor` returns.
+Plans are cached per pair of expressions and can be applied to one value
+or, in place, to whole arrays.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Tuple
+
+from .unit_converter import FloatBuffer, scale_in_place
+from .unit_parser import MEASUREMENT, Dimension, conversion_factor, format_dimension, parse_unit
+
+# Words between the source and target of "<value> <unit> to <unit>", tried in
+# order and split at their last occurrence, so "2 in to cm" means inches
+SEPARATORS = (re.compile(r"\s+(?:to|->|→)(?=\s)"), re.compile(r"\s+in(?=\s)"))
+
+
+@dataclass(frozen=True)
+class ConversionPlan:
+    """The collapsed conversion from one unit expression to another"""
+
+    source: str
+    target: str
+    factor: float
+    dimension: Dimension
+
+    def apply(self, value: float) -> float:
+        """Converts one value"""
+        return value * self.factor
+
+    def apply_many(self, values: FloatBuffer) -> FloatBuffer:
+        """Converts a float NumPy array or buffer in place, returning it"""
+        return scale_in_place(values, self.factor)
+
+    @property
+    def path(self) -> Tuple[str, str, str]:
+        """The source, the SI base units it is converted through, and the target"""
+        return self.source, format_dimension(self.dimension), self.target
+
+    def __str__(self) -> str:
+        return " → ".join(self.path)
+
+
+@lru_cache(maxsize=4096)
+def plan_conversion(source: str, target: str) -> ConversionPlan:
+    """
+    Plans the conversion between two unit expressions.
+
+    Raises:
+        ValueError: if an expression cannot be parsed or the dimensions differ.
+    """
+
+    factor = conversion_factor(source, target)
+    return ConversionPlan(source, target, factor, parse_unit(source).dimension)
+
+
+def convert_expression(text: str) -> Tuple[float, ConversionPlan]:
+    """
+    Converts text such as `500 J/s to hp`, returning the converted value and
+    the plan used.
+
+    Raises:
+        ValueError: if the text is not a value with a unit followed by a
+            target unit of the same dimension.
+    """
+
+    for separator in SEPARATORS:
+        splits = list(separator.finditer(text))
+        if splits:
+            source, target = text[: splits[-1].start()], text[splits[-1].end():].strip()
+            break
+    else:
+        source, target = "", ""
+
+    measurement = MEASUREMENT.match(source)
+    if measurement is None or not measurement.group(2) or not target:
+        raise ValueError("Write a value, its unit and the unit to convert to, e.g. 500 J/s to hp")
+
+    plan = plan_conversion(measurement.group(2), target)
+    return plan.apply(float(measurement.group(1))), plan
@@ -0,0 +1,122 @@
+"""
+Evaluation of equations over a grid of values in one vectorized pass,
+through the array solvers of the chapters. A fall of ten thousand steps is
+solved as a handful of array operations instead of ten thousand calls,
+and the result is kept as one array that a table can page through.
+"""
+
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+
+from .solver import ArrayResult
+
+FREE_FALL_AXES = ("time", "height")
+MAX_GRID_STEPS = 10_000_000
+
+
+@dataclass(frozen=True)
+class Grid:
+    """
+    Table of values solved over a grid, one row per grid point. `values`
+    holds NaN wherever `status` is not zero; a non-zero status indexes the
+    reason the row failed in `messages`.
+    """
+
+    columns: Tuple[str, ...]
+    values: np.ndarray
+    status: np.ndarray
+    messages: Tuple[str, ...]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def valid(self) -> np.ndarray:
+        """Boolean mask of the rows that solved successfully"""
+        return self.status == 0
+
+    def error(self, row: int) -> str:
+        """The reason a row failed ('' if it did not)"""
+        return self.messages[self.status[row]]
+
+
+def linear_grid(start: float, stop: float, steps: int) -> np.ndarray:
+    """
+    `steps` evenly spaced values from `start` to `stop` inclusive.
+
+    Raises:
+        ValueError: if there are fewer than two or more than MAX_GRID_STEPS steps.
+    """
+
+    if not 2 <= steps <= MAX_GRID_STEPS:
+        raise ValueError(f"Steps must be between 2 and {MAX_GRID_STEPS:,}")
+    return np.linspace(start, stop, steps)
+
+
+def combine(axis: np.ndarray, columns: Tuple[str, ...], *results: ArrayResult) -> Grid:
+    """
+    Grid of the axis values followed by the values of each result. A row
+    fails with the first failure among the results.
+    """
+
+    values = np.column_stack([axis] + [result.values for result in results])
+    status = np.zeros(len(axis), dtype=np.int16)
+    messages: Tuple[str, ...] = ("",)
+    for result in results:
+        failed = (status == 0) & (result.status != 0)
+        status[failed] = result.status[failed] + len(messages) - 1
+        messages += result.messages[1:]
+
+    values[status != 0, 1:] = np.nan
+    return Grid(columns, values, status, messages)
+
+
+def free_fall_grid(
+    y_0: float, v_0: float, axis: str = "time", start: float = 0.0, stop: float = 1.0, steps: int = 100
+) -> Grid:
+    """
+    Height, time and velocity of a free fall over a grid of times or of
+    heights, solved with the array solvers of Chapter 3.
+
+    Over time the height comes from y(t) = y₀ + v₀t - (1/2)gt² and the
+    velocity is evaluated directly from v = v₀ - gt. Over height the time is
+    the first at which the height is reached, and the velocity from
+    v² = v₀² - 2g(y - y₀) is negative once the object is falling.
+
+    Args:
+        y_0: initial height [m].
+        v_0: initial velocity [m/s], positive upwards.
+        axis: "time" to step t from `start` to `stop` [s], or "height" to step y [m].
+        start: first grid value.
+        stop: last grid value.
+        steps: number of grid points.
+
+    Raises:
+        ValueError: if the axis is unknown or the number of steps is out of range.
+    """
+
+    from .chapters.chapter3 import Chapter3, g
+
+    solvers = Chapter3.Solvers
+    if axis == "time":
+        t = linear_grid(start, stop, steps)
+        knowns = {"y_0": y_0, "v_0": v_0, "t": t}
+        return combine(
+            t,
+            ("t (s)", "y (m)", "v (m/s)"),
+            solvers.height_of_free_fall.solve_array("y_f", knowns),
+            ArrayResult("v_f", v_0 + g * t, np.zeros(t.shape, dtype=np.int16), ("",)),
+        )
+
+    if axis == "height":
+        y = linear_grid(start, stop, steps)
+        knowns = {"y_0": y_0, "v_0": v_0, "y_f": y}
+        time = solvers.height_of_free_fall.solve_array("t", knowns)
+        speed = solvers.vel_free_fall_from_height.solve_array("v_f", knowns)
+        with np.errstate(invalid="ignore"):
+            np.copysign(speed.values, v_0 + g * time.values, out=speed.values)
+        return combine(y, ("y (m)", "t (s)", "v (m/s)"), time, speed)
+
+    raise ValueError(f"Unknown grid axis: {axis} (choose from {', '.join(FREE_FALL_AXES)})")
@@ -0,0 +1,279 @@
+"""
+Cumulative integration of sampled motion, for the integral equations of
+Chapter 3: v(t) = ∫ a(t)dt + C₁ and x(t) = ∫ v(t)dt + C₂. Acceleration
+given as samples, such as an accelerometer log, or as a function of time
+is integrated twice with vectorized trapezoid or Simpson rules. Samples
+may be unevenly spaced and can be fed a block at a time, so that logs of
+millions of samples are integrated without being held in memory.
+"""
+
+import csv
+from itertools import islice
+from typing import Callable, List, Sequence, TextIO, Tuple, Union
+
+import numpy as np
+
+from .batch import CHUNK_SIZE, BatchStats
+
+INTEGRATION_METHODS = ("trapezoid", "simpson")
+
+Samples = Tuple[np.ndarray, np.ndarray]  # sample times and values
+Series = Union[Sequence[float], np.ndarray]  # sample times or values, as given by the caller
+Acceleration = Union[Callable[[np.ndarray], np.ndarray], Series, float]
+
+
+def _simpson_first(
+    f1: np.ndarray, f2: np.ndarray, f3: np.ndarray, h1: np.ndarray, h2: np.ndarray
+) -> np.ndarray:
+    """
+    Integral over [t₁, t₂] of the parabola through three samples at
+    t₁ < t₂ < t₃, where h1 = t₂ - t₁ and h2 = t₃ - t₂
+    """
+    r = h1 / (h1 + h2)
+    q = h1 / h2
+    integral: np.ndarray = h1 / 6 * ((3 - r) * f1 + (3 + r * q + r) * f2 - (r * q) * f3)
+    return integral
+
+
+def _interval_integrals(t: np.ndarray, y: np.ndarray, method: str, first: bool, last: bool) -> np.ndarray:
+    """
+    Integrals over the intervals between consecutive samples. With Simpson's
+    rule an interval is integrated over the parabolas through it and the
+    sample on either side, averaged, so each interval needs the sample
+    before and after it. Unless the samples
+    begin the series (`first`), the first one is only context and its
+    interval is left out, and unless they end it (`last`) the final
+    interval waits for the next sample. The first and last intervals of a
+    series have a parabola on one side only.
+
+    Raises:
+        ValueError: if the times are not strictly increasing.
+    """
+
+    dt = np.diff(t)
+    if np.any(dt <= 0):
+        raise ValueError("Sample times must be strictly increasing")
+
+    if method == "trapezoid" or (first and last and len(t) == 2):
+        return 0.5 * dt * (y[1:] + y[:-1])
+    if len(t) < 3:
+        return np.empty(0)
+
+    # The parabola through the samples before and at an interval is the
+    # mirror image of the one through the interval and the sample after it
+    forward = _simpson_first(y[:-2], y[1:-1], y[2:], dt[:-1], dt[1:])
+    backward = _simpson_first(y[2:], y[1:-1], y[:-2], dt[1:], dt[:-1])
+    parts = [0.5 * (forward[1:] + backward[:-1])]
+    if first:
+        parts.insert(0, forward[:1])
+    if last:
+        parts.append(backward[-1:])
+    return np.concatenate(parts)
+
+
+class CumulativeIntegrator:
+    """
+    Running integral of a series fed a block of samples at a time. Each
+    push returns the integral at every sample it can complete. Simpson's
+    rule holds back the latest sample until the next one arrives, so the
+    result does not depend on how the series is split into blocks.
+    """
+
+    def __init__(self, initial: float = 0.0, method: str = "simpson") -> None:
+        """
+        Args:
+            initial: value of the integral at the first sample, the constant of integration.
+            method: "trapezoid" or "simpson".
+        """
+
+        if method not in INTEGRATION_METHODS:
+            raise ValueError(f"Unknown integration method: {method}")
+        self.method = method
+        self.total = float(initial)
+        self._context = 2 if method == "simpson" else 1
+        self._count = 0  # samples returned so far
+        self._start = 0  # index in the series of the first buffered sample
+        # Samples not returned yet, led by those before them that their intervals need
+        self._t = np.empty(0)
+        self._y = np.empty(0)
+
+    def push(self, t: Series, y: Series) -> Samples:
+        """
+        Adds samples at times `t`, returning the times and integrals of the
+        samples completed so far and not returned before.
+        """
+
+        times = np.asarray(t, dtype=np.float64)
+        values = np.asarray(y, dtype=np.float64)
+        if times.shape != values.shape or times.ndim != 1:
+            raise ValueError("Times and values must be one-dimensional and the same length")
+
+        self._t = np.concatenate((self._t, times))
+        self._y = np.concatenate((self._y, values))
+        return self._emit(last=False)
+
+    def finish(self) -> Samples:
+        """Ends the series, returning the samples still held back"""
+        return self._emit(last=True)
+
+    def _emit(self, last: bool) -> Samples:
+        intervals = _interval_integrals(self._t, self._y, self.method, self._count <= 1, last)
+        values = self.total + np.cumsum(intervals)
+        if self._count == 0 and len(self._t):
+            values = np.concatenate(([self.total], values))
+
+        offset = self._count - self._start
+        t = self._t[offset : offset + len(values)]
+        if len(values):
+            self._count += len(values)
+            self.total = float(values[-1])
+
+        start = max(0, self._count - self._context)
+        self._t, self._y = self._t[start - self._start :], self._y[start - self._start :]
+        self._start = start
+        return t, values
+
+
+class MotionIntegrator:
+    """
+    Streams acceleration samples into velocity and position by integrating
+    twice. Velocities are kept until the position at the same time is
+    known, so each push returns both for the same samples.
+    """
+
+    def __init__(self, v_0: float = 0.0, x_0: float = 0.0, method: str = "simpson") -> None:
+        self.velocity = CumulativeIntegrator(v_0, method)
+        self.position = CumulativeIntegrator(x_0, method)
+        self._v = np.empty(0)
+
+    def push(self, t: Series, accel: Series) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Adds acceleration samples, returning times, velocities and positions"""
+        times, v = self.velocity.push(t, accel)
+        return self._pair(*self.position.push(times, v), v)
+
+    def finish(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Ends the series, returning the samples still held back"""
+        t, v = self.velocity.finish()
+        pushed, finished = self.position.push(t, v), self.position.finish()
+        times, x = map(np.concatenate, zip(pushed, finished))
+        return self._pair(times, x, v)
+
+    def _pair(self, t: np.ndarray, x: np.ndarray, v: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        self._v = np.concatenate((self._v, v))
+        v, self._v = self._v[: len(x)], self._v[len(x) :]
+        return t, v, x
+
+
+def cumulative_integral(
+    y: Series, t: Series, initial: float = 0.0, method: str = "simpson"
+) -> np.ndarray:
+    """
+    Integral of the samples `y` at times `t` from the first sample to each
+    sample, plus `initial`.
+
+    Raises:
+        ValueError: if the method is unknown or the times are not strictly increasing.
+    """
+
+    integrator = CumulativeIntegrator(initial, method)
+    _, head = integrator.push(t, y)
+    _, tail = integrator.finish()
+    return np.concatenate((head, tail))
+
+
+def integrate_motion(
+    accel: Acceleration,
+    t: Series,
+    v_0: float = 0.0,
+    x_0: float = 0.0,
+    method: str = "simpson",
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Velocity and position at times `t` from an acceleration, given either
+    as samples at those times or as a vectorized function of time.
+
+    Args:
+        accel: acceleration samples [m/s^2], or a function of a time array returning them.
+        t: strictly increasing sample times [s].
+        v_0: velocity at the first sample [m/s].
+        x_0: position at the first sample [m].
+        method: "trapezoid" or "simpson".
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: velocities [m/s] and positions [m].
+    """
+
+    times = np.asarray(t, dtype=np.float64)
+    given = accel(times) if callable(accel) else accel
+    samples = np.broadcast_to(np.asarray(given, dtype=np.float64), times.shape)
+
+    v = cumulative_integral(samples, times, v_0, method)
+    return v, cumulative_integral(v, times, x_0, method)
+
+
+def integrate_csv(
+    source: TextIO,
+    sink: TextIO,
+    time_column: str,
+    accel_column: str,
+    v_0: float = 0.0,
+    x_0: float = 0.0,
+    method: str = "simpson",
+    chunk_size: int = CHUNK_SIZE,
+) -> BatchStats:
+    """
+    Integrates the acceleration column of a CSV file with a header row,
+    writing every row to `sink` with velocity and position columns `v` and
+    `x` added, `chunk_size` rows at a time.
+
+    Raises:
+        ValueError: if the input lacks one of the columns, a time or
+            acceleration is not a number, or the times do not increase.
+
+    Returns:
+        BatchStats: how many rows were integrated.
+    """
+
+    reader = csv.reader(source)
+    writer = csv.writer(sink, lineterminator="\n")
+    integrator = MotionIntegrator(v_0, x_0, method)
+    stats = BatchStats()
+
+    header = next(reader, None)
+    if header is None:
+        return stats
+    missing = [column for column in (time_column, accel_column) if column not in header]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+    time_index, accel_index = header.index(time_column), header.index(accel_column)
+    writer.writerow(header + ["v", "x"])
+
+    pending: List[List[str]] = []  # rows whose samples the integrator holds back
+
+    def write(t: np.ndarray, v: np.ndarray, x: np.ndarray) -> None:
+        rows = pending[: len(t)]
+        del pending[: len(t)]
+        writer.writerows(row + [repr(a), repr(b)] for row, a, b in zip(rows, v.tolist(), x.tolist()))
+        stats.rows += len(rows)
+
+    while True:
+        chunk = list(islice(reader, chunk_size))
+        if not chunk:
+            break
+
+        try:
+            t = np.array([row[time_index] for row in chunk], dtype=np.float64)
+            accel = np.array([row[accel_index] for row in chunk], dtype=np.float64)
+        except (IndexError, ValueError):
+            raise ValueError(
+                f"Rows {stats.rows + len(pending) + 1} to {stats.rows + len(pending) + len(chunk)} "
+                f"have a missing or non-numeric {time_column} or {accel_column}"
+            ) from None
+
+        pending.extend(chunk)
+        write(*integrator.push(t, accel))
+        sink.flush()
+
+    write(*integrator.finish())
+    sink.flush()
+    return stats
@@ -0,0 +1,125 @@
+"""
+Plots of curves drawn in braille characters, each of which holds a grid
+of two by four dots, so a terminal cell shows eight pixels instead of one.
+The dots of a braille cell are about as tall as they are wide, so curves
+are drawn to the same scale on both axes and keep their true shape.
+
+Plots of projectile paths are cached by launch and plot size, so showing
+a launch again, or returning to an earlier terminal size, reuses the
+raster instead of drawing it again.
+"""
+
+from typing import NamedTuple, Sequence, Tuple, Union
+
+import numpy as np
+
+from .projectile import trajectory_path
+from .result_cache import ResultCache
+
+BRAILLE = np.array([chr(0x2800 + bits) for bits in range(256)])
+
+# Bit of each dot of a braille cell, by dot row and dot column
+DOT_BITS = np.array([[0x01, 0x08], [0x02, 0x10], [0x04, 0x20], [0x40, 0x80]], dtype=np.uint8)
+
+PLOT_CACHE: ResultCache = ResultCache(max_entries=256)
+
+Points = Union[Sequence[float], np.ndarray]  # coordinates of the points of a curve along one axis
+
+
+class TrajectoryPlot(NamedTuple):
+    """Braille raster of a projectile path, with the scale and the figures of the flight"""
+
+    lines: Tuple[str, ...]
+    metres_per_dot: float
+    range: float
+    flight_time: float
+    apex: float
+
+
+def _polyline_dots(column: np.ndarray, row: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Dots along the straight segments joining consecutive points, at least
+    one per dot crossed so that the line has no gaps
+    """
+
+    d_column, d_row = np.diff(column), np.diff(row)
+    steps = np.maximum(np.ceil(np.maximum(np.abs(d_column), np.abs(d_row))), 1).astype(np.int64)
+    segment = np.repeat(np.arange(len(steps)), steps)
+    fraction = (np.arange(int(steps.sum())) - np.repeat(np.cumsum(steps) - steps, steps)) / steps[segment]
+
+    column = np.append(column[segment] + fraction * d_column[segment], column[-1])
+    row = np.append(row[segment] + fraction * d_row[segment], row[-1])
+    return np.rint(column).astype(np.int64), np.rint(row).astype(np.int64)
+
+
+def braille_raster(
+    curves: Sequence[Tuple[Points, Points]], columns: int, rows: int
+) -> Tuple[Tuple[str, ...], float]:
+    """
+    Draws curves as polylines on a braille canvas of `columns` by `rows`
+    cells, scaled together to fit it with equal scales on both axes and
+    the bottom left of their bounds in the bottom left corner.
+
+    Args:
+        curves: (x, y) pairs of point arrays.
+        columns: canvas width in cells.
+        rows: canvas height in cells.
+
+    Raises:
+        ValueError: if the canvas is empty or there are no points.
+
+    Returns:
+        Tuple[Tuple[str, ...], float]: the lines of the canvas, top first,
+            and the size of a dot in the units of the curves.
+    """
+
+    if columns < 1 or rows < 1:
+        raise ValueError("The canvas must be at least one cell wide and tall")
+
+    arrays = [(np.asarray(x, dtype=float), np.asarray(y, dtype=float)) for x, y in curves]
+    drawn = [(x, y) for x, y in arrays if len(x)]
+    if not drawn:
+        raise ValueError("There are no points to draw")
+
+    x_min = min(float(x.min()) for x, _ in drawn)
+    y_min = min(float(y.min()) for _, y in drawn)
+    x_span = max(float(x.max()) for x, _ in drawn) - x_min
+    y_span = max(float(y.max()) for _, y in drawn) - y_min
+
+    width, height = 2 * columns, 4 * rows
+    size = max(x_span / (width - 1) if width > 1 else 0.0, y_span / (height - 1), 0.0) or 1.0
+
+    cells = np.zeros((rows, columns), dtype=np.uint8)
+    for x, y in drawn:
+        dot_column, dot_row = _polyline_dots((x - x_min) / size, (height - 1) - (y - y_min) / size)
+        np.clip(dot_column, 0, width - 1, out=dot_column)
+        np.clip(dot_row, 0, height - 1, out=dot_row)
+        np.bitwise_or.at(cells, (dot_row // 4, dot_column // 2), DOT_BITS[dot_row % 4, dot_column % 2])
+
+    return tuple("".join(line) for line in BRAILLE[cells].tolist()), size
+
+
+def plot_trajectory(theta: float, v_0: float, height: float, columns: int, rows: int) -> TrajectoryPlot:
+    """
+    Braille plot of the path of a projectile above the ground it lands on,
+    fitted to `columns` by `rows` cells. Plots are cached in PLOT_CACHE.
+
+    Raises:
+        ValueError: if the projectile never lands or the canvas is empty.
+    """
+
+    key = ("trajectory", float(theta) + 0.0, float(v_0) + 0.0, float(height) + 0.0, int(columns), int(rows))
+    plot: TrajectoryPlot = PLOT_CACHE.get_or_compute(
+        key, lambda: _plot_trajectory(theta, v_0, height, columns, rows)
+    )
+    return plot
+
+
+def _plot_trajectory(theta: float, v_0: float, height: float, columns: int, rows: int) -> TrajectoryPlot:
+    # Enough samples that no segment is much longer than a few dots
+    path = trajectory_path(theta, v_0, height, samples=max(64, 4 * (columns + rows)))
+    x_end = float(path.x[-1])
+    ground = ([min(0.0, x_end), max(0.0, x_end)], [0.0, 0.0])
+
+    lines, size = braille_raster([ground, (path.x, path.y)], columns, rows)
+    return TrajectoryPlot(lines, size, x_end, float(path.t[-1]), float(path.y.max()))
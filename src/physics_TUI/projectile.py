@@ -0,0 +1,223 @@
+"""
+Projectile motion over whole grids of launch conditions, for Chapter 4.
+A sweep evaluates range, flight time and apex height for every combination
+of launch angle, initial speed and launch height in one vectorized pass,
+and the optimizer finds the angle of longest range under limits on the
+angle, the apex and the flight time. Both work on arrays of any size at
+the cost of a few array operations, with no loop over grid points. A
+single launch can also be sampled along its whole path, for plotting.
+
+The projectile lands when it returns to height zero, so a launch height
+above zero lengthens the flight, as from a cliff or a table.
+"""
+
+from dataclasses import dataclass
+from typing import Any, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from .chapters.chapter4 import g
+from .quadratic import array_roots
+
+PATH_SAMPLES = 256
+
+
+class Path(NamedTuple):
+    """Times [s] and positions [m] of samples along the path of one launch"""
+
+    t: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+
+
+@dataclass(frozen=True)
+class ProjectileSweep:
+    """
+    Range, flight time and apex height over a grid. Axis 0 runs over the
+    launch angles and axis 1 over the initial speeds; when several launch
+    heights are given, axis 2 runs over them. Values are NaN where the
+    projectile never comes down to height zero.
+    """
+
+    theta: np.ndarray
+    v_0: np.ndarray
+    height: Any
+    range: np.ndarray
+    flight_time: np.ndarray
+    apex: np.ndarray
+
+    @property
+    def valid(self) -> np.ndarray:
+        """Boolean mask of the grid points whose projectile lands"""
+        return ~np.isnan(self.flight_time)
+
+
+@dataclass(frozen=True)
+class BestLaunch:
+    """
+    Launch angle of longest range for each initial speed and launch height,
+    with the range, flight time and apex height it reaches. Values are NaN
+    where no angle meets the constraints.
+    """
+
+    theta: np.ndarray
+    range: np.ndarray
+    flight_time: np.ndarray
+    apex: np.ndarray
+
+    @property
+    def valid(self) -> np.ndarray:
+        """Boolean mask of the launches that meet the constraints"""
+        return ~np.isnan(self.theta)
+
+
+def flight(theta: Any, v_0: Any, height: Any = 0.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Range [m], flight time [s] and apex height [m] of projectiles launched at
+    `theta` degrees and `v_0` m/s from `height` m, all broadcast together.
+    """
+
+    theta = np.radians(theta)
+    v_0 = np.asarray(v_0, dtype=float)
+    height = np.asarray(height, dtype=float)
+    v_x = v_0 * np.cos(theta)
+    v_y = v_0 * np.sin(theta)
+
+    # The landing is the later root of height + v_y t - (1/2)gt² = 0; it is
+    # negative, or missing, when the projectile never comes down to zero
+    flight_time = array_roots(-0.5 * g, v_y, height)[1]
+    np.copyto(flight_time, np.nan, where=flight_time < 0.0)
+
+    apex = np.square(np.maximum(v_y, 0.0)) * (0.5 / g) + height
+    return np.asarray(v_x * flight_time), flight_time, np.asarray(apex)
+
+
+def projectile_sweep(theta: Any, v_0: Any, height: Any = 0.0) -> ProjectileSweep:
+    """
+    Evaluates every combination of launch angle, initial speed and launch
+    height at once.
+
+    Args:
+        theta: launch angles [degrees].
+        v_0: initial speeds [m/s].
+        height: launch height [m], or an array of heights to add a third axis.
+
+    Returns:
+        ProjectileSweep: arrays of shape (angles, speeds), or (angles, speeds, heights).
+    """
+
+    theta = np.atleast_1d(np.asarray(theta, dtype=float))
+    v_0 = np.atleast_1d(np.asarray(v_0, dtype=float))
+    if np.ndim(height):
+        height = np.asarray(height, dtype=float)
+        theta_axis, v_0_axis, height_axis = np.ix_(theta, v_0, height)
+    else:
+        height = float(height)
+        theta_axis, v_0_axis = np.ix_(theta, v_0)
+        height_axis = height
+
+    return ProjectileSweep(theta, v_0, height, *flight(theta_axis, v_0_axis, height_axis))
+
+
+def best_launch_angle(
+    v_0: Any,
+    height: Any = 0.0,
+    min_angle: float = 0.0,
+    max_angle: float = 90.0,
+    max_apex: Optional[float] = None,
+    max_flight_time: Optional[float] = None,
+) -> BestLaunch:
+    """
+    Finds the launch angle of longest range for each initial speed and
+    launch height. Range rises with the angle up to the unconstrained
+    optimum atan(v₀ / √(v₀² + 2gh)) and falls after it, and both the apex
+    and the flight time rise with the angle, so each constraint caps the
+    angle and the best angle is the optimum clipped to the allowed range.
+    No search is needed, whatever the number of launches.
+
+    Args:
+        v_0: initial speeds [m/s].
+        height: launch heights [m], broadcast against `v_0`.
+        min_angle: smallest allowed angle [degrees].
+        max_angle: largest allowed angle [degrees].
+        max_apex: highest allowed apex [m], such as a ceiling.
+        max_flight_time: longest allowed flight [s].
+
+    Raises:
+        ValueError: if the angle limits are outside [-90, 90] or reversed.
+    """
+
+    if not -90.0 <= min_angle <= max_angle <= 90.0:
+        raise ValueError("Angle limits must satisfy -90 ≤ min_angle ≤ max_angle ≤ 90")
+
+    v_0, height = np.broadcast_arrays(np.asarray(v_0, dtype=float), np.asarray(height, dtype=float))
+
+    with np.errstate(all="ignore"):
+        # NaN where the projectile cannot come down to height zero at any angle
+        theta = np.degrees(np.arctan2(v_0, np.sqrt(v_0 * v_0 + 2.0 * g * height)))
+
+        upper = np.full(v_0.shape, max_angle)
+        caps = []
+        if max_apex is not None:
+            caps.append(np.sqrt(2.0 * g * (max_apex - height)))
+        if max_flight_time is not None:
+            caps.append(0.5 * g * max_flight_time - height / max_flight_time)
+        for v_y_cap in caps:
+            # Largest angle whose vertical speed stays within the cap
+            angle = np.degrees(np.arcsin(np.clip(v_y_cap / v_0, -1.0, 1.0)))
+            upper = np.where(np.isnan(v_y_cap), np.nan, np.fmin(upper, angle))
+
+        theta = np.where(upper >= min_angle, np.clip(theta, min_angle, upper), np.nan)
+
+    return BestLaunch(theta, *flight(theta, v_0, height))
+
+
+def _clustered(start: float, stop: float, samples: int) -> np.ndarray:
+    """Chebyshev–Lobatto points from `start` to `stop`, closest together at both ends"""
+    return start + (stop - start) * 0.5 * (1.0 - np.cos(np.linspace(0.0, np.pi, samples)))
+
+
+def trajectory_path(theta: float, v_0: float, height: float = 0.0, samples: int = PATH_SAMPLES) -> Path:
+    """
+    Samples the path of a projectile from launch to landing. The rise and
+    the fall are each sampled at points that crowd together at their ends,
+    so the path is densest at launch, at the apex, where it bends most
+    sharply, and at impact. A polyline through the samples stays close to
+    the path with far fewer points than even spacing would need.
+
+    Args:
+        theta: launch angle [degrees], from -90 to 90.
+        v_0: initial speed [m/s].
+        height: launch height [m].
+        samples: number of samples, including launch, apex and landing.
+
+    Raises:
+        ValueError: if the angle is out of range, there are fewer than
+            three samples, or the projectile never lands after launch.
+    """
+
+    if not -90.0 <= theta <= 90.0:
+        raise ValueError("Launch angle must be between -90 and 90 degrees")
+    if samples < 3:
+        raise ValueError("A path needs at least three samples")
+
+    _, times, _ = flight(theta, v_0, height)
+    flight_time = float(times)
+    if not flight_time > 0.0:
+        raise ValueError("The projectile never lands after launch")
+
+    v_x = v_0 * np.cos(np.radians(theta))
+    v_y = v_0 * np.sin(np.radians(theta))
+
+    # Samples are shared between the rise and the fall by their duration
+    rise = min(max(v_y / g, 0.0), flight_time)
+    rise_samples = round(samples * rise / flight_time)
+    if rise_samples < 2:
+        t = _clustered(0.0, flight_time, samples)
+    else:
+        rise_samples = min(rise_samples, samples - 1)
+        t = np.concatenate(
+            (_clustered(0.0, rise, rise_samples), _clustered(rise, flight_time, samples - rise_samples + 1)[1:])
+        )
+
+    return Path(t, v_x * t, height + v_y * t - 0.5 * g * t * t)
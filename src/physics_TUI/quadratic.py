@@ -0,0 +1,135 @@
+"""
+Real roots of ax² + bx + c = 0, shared by the Calculate methods and the
+array solvers of every chapter. The scalar and array kernels use the same
+cancellation-free form of the quadratic formula, so a triple gives the
+same roots bit for bit whichever is used, and a root near zero keeps its
+precision when b² is much larger than 4ac.
+"""
+
+from math import copysign, isnan, nan, sqrt
+from typing import Any, NamedTuple, Tuple
+
+import numpy as np
+
+
+class QuadraticRoots(NamedTuple):
+    """Ascending roots of arrays of quadratics, NaN where `valid` is False"""
+
+    low: np.ndarray
+    high: np.ndarray
+    valid: np.ndarray
+
+
+def scalar_roots(a: float, b: float, c: float) -> Tuple[float, float]:
+    """
+    Real roots of ax² + bx + c = 0 in ascending order. Degenerates to the
+    linear root when a == 0 and returns (nan, nan) when no real root exists.
+    """
+
+    if a == 0.0:
+        if b == 0.0:
+            return (nan, nan)
+        root: float = -c / b
+        return (root, root)
+
+    discriminant: float = (b * b) - 4.0 * a * c
+
+    if discriminant < 0.0:
+        return (nan, nan)
+
+    q: float = -0.5 * (b + copysign(sqrt(discriminant), b))
+
+    if q == 0.0:
+        # Only happens when b == 0 and c == 0, so both roots are zero
+        return (0.0, 0.0)
+
+    x1: float = q / a
+    x2: float = c / q
+
+    return (min(x1, x2), max(x1, x2))
+
+
+def scalar_first_nonnegative(low: float, high: float) -> float:
+    """Returns the smallest of two ascending roots that is not negative"""
+    if low >= 0.0:
+        return low
+    if high >= 0.0:
+        return high
+    return nan
+
+
+def earliest_time(a: float, b: float, c: float) -> float:
+    """
+    Earliest time t ≥ 0 at which at² + bt + c = 0, as when solving
+    x = x₀ + v₀t + (1/2)at² for t.
+
+    Raises:
+        ValueError: if there is no real solution, or only negative ones.
+    """
+
+    low, high = scalar_roots(a, b, c)
+    if isnan(low):
+        raise ValueError("No real solution for time")
+
+    time = scalar_first_nonnegative(low, high)
+    if isnan(time):
+        raise ValueError("No positive time solution")
+    return time
+
+
+def array_roots(a: Any, b: Any, c: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Element-wise counterpart of scalar_roots. Works in place on as few
+    temporaries as possible, since allocation dominates on large arrays.
+    """
+
+    a, b, c = np.broadcast_arrays(
+        np.asarray(a, dtype=float), np.asarray(b, dtype=float), np.asarray(c, dtype=float)
+    )
+
+    with np.errstate(all="ignore"):
+        # Outputs are allocated explicitly so that 0-d inputs stay arrays.
+        # A negative discriminant makes q, and so both roots, NaN.
+        q = np.multiply(b, b, out=np.empty(b.shape))
+        x1 = np.multiply(a, c, out=np.empty(b.shape))
+        x1 *= 4.0
+        q -= x1
+        np.sqrt(q, out=q)
+        np.copysign(q, b, out=q)
+        q += b
+        q *= -0.5
+
+        np.divide(q, a, out=x1)
+        x2 = np.divide(c, q, out=np.empty(b.shape))
+
+    # With a == 0, q == -b and x2 is already the linear root -c/b. With
+    # q == 0 both roots are zero, which x1 holds.
+    np.copyto(x1, x2, where=a == 0.0)
+    np.copyto(x2, x1, where=q == 0.0)
+
+    low = np.minimum(x1, x2, out=np.empty(b.shape))
+    high = np.maximum(x1, x2, out=x1)
+
+    # a == b == 0 has no root at all
+    np.copyto(low, np.nan, where=np.isinf(low))
+    np.copyto(high, np.nan, where=np.isinf(high))
+
+    return low, high
+
+
+def quadratic_roots(a: Any, b: Any, c: Any) -> QuadraticRoots:
+    """
+    Ascending real roots of quadratics given as arrays (or scalars) of
+    coefficients of any mutually broadcastable shape, with a mask of the
+    quadratics that have real roots.
+    """
+
+    low, high = array_roots(a, b, c)
+    return QuadraticRoots(low, high, ~np.isnan(low))
+
+
+def array_first_nonnegative(low: Any, high: Any) -> np.ndarray:
+    """Element-wise counterpart of scalar_first_nonnegative"""
+    result = np.where(low >= 0.0, low, high)
+    np.copyto(result, np.nan, where=result < 0.0)
+    return result
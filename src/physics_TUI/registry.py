@@ -0,0 +1,175 @@
+"""
+Central index of the chapters, equations and unit quantities. Each object
+gets a stable id when it is registered, such as `ch13` for a chapter,
+`ch13.escape_velocity` for one of its equations and `length` for a
+quantity, and is looked up by id through a dictionary. Equations are named
+after their solver or calculation function, and can also be looked up by
+their name, e.g. `ch3.position_from_velocity_and_acceleration`. Chapters
+listed in a manifest are only imported and constructed when first looked up.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, Optional, TypeVar
+
+from .base_chapter import ChapterEntry, Equation, PhysicsChapter
+from .unit_converter import Quantity
+
+T = TypeVar("T")
+
+
+def slugify(text: str) -> str:
+    """Lowercase identifier made of the letters and digits in `text`"""
+    text = text.lower().replace("'", "").replace("’", "")
+    return re.sub(r"[^a-z0-9]+", "_", text).strip("_")
+
+
+def equation_slug(equation: Equation) -> str:
+    """Id of an equation within its chapter: its solver or calculation name if it has one"""
+    if equation.solver is not None and equation.solver.name:
+        return equation.solver.name
+    if equation.calculation is not None:
+        return equation.calculation.__name__
+    return slugify(equation.name)
+
+
+def chapter_id(chapter: PhysicsChapter) -> str:
+    """Stable id of a chapter, `ch<number>` for the numbered chapter classes"""
+    match = re.fullmatch(r"Chapter(\d+)", type(chapter).__name__)
+    return f"ch{match.group(1)}" if match else slugify(chapter.title)
+
+
+class Registry:
+    """
+    Dictionaries of chapters, equations and quantities by id. Registering
+    assigns the `id` attribute of every chapter and equation, so callers can
+    go from an object to its id and back without scanning. Quantities are
+    shared and immutable, and come with their id.
+
+    `entries` lists every chapter in order, loaded or not, while `chapters`
+    and `equations` only hold the chapters loaded so far and their
+    equations. Looking up a chapter or one of its equations loads it.
+    """
+
+    def __init__(
+        self,
+        chapters: Iterable[PhysicsChapter] = (),
+        quantities: Iterable[Quantity] = (),
+        manifest: Iterable[ChapterEntry] = (),
+    ) -> None:
+        self.entries: Dict[str, ChapterEntry] = {}
+        self.chapters: Dict[str, PhysicsChapter] = {}
+        self.equations: Dict[str, Equation] = {}
+        self.quantities: Dict[str, Quantity] = {}
+        self.aliases: Dict[str, str] = {}  # equation name slug: equation id
+        self._equation_chapters: Dict[str, PhysicsChapter] = {}
+
+        for entry in manifest:
+            self.add_entry(entry)
+        for chapter in chapters:
+            self.add_chapter(chapter)
+        for quantity in quantities:
+            self.add_quantity(quantity)
+
+    def add_entry(self, entry: ChapterEntry) -> None:
+        """Registers a chapter to be loaded on first lookup"""
+        if entry.id in self.entries:
+            raise ValueError(f"Duplicate chapter id: {entry.id}")
+        self.entries[entry.id] = entry
+
+    def add_chapter(self, chapter: PhysicsChapter) -> str:
+        """Registers a constructed chapter and its equations, returning the chapter id"""
+
+        identifier = _unique(chapter_id(chapter), self.entries)
+        self.entries[identifier] = ChapterEntry(
+            identifier, chapter.title, type(chapter).__module__, type(chapter).__name__
+        )
+        self._register(identifier, chapter)
+        return identifier
+
+    def _register(self, identifier: str, chapter: PhysicsChapter) -> None:
+        chapter.id = identifier
+        self.chapters[identifier] = chapter
+
+        for equation in chapter.equations:
+            equation_id = _unique(f"{identifier}.{equation_slug(equation)}", self.equations)
+            equation.id = equation_id
+            self.equations[equation_id] = equation
+            self._equation_chapters[equation_id] = chapter
+
+            alias = f"{identifier}.{slugify(equation.name)}"
+            if alias not in self.equations:
+                self.aliases.setdefault(alias, equation_id)
+
+    def add_quantity(self, quantity: Quantity) -> str:
+        """Registers a unit quantity under its own id, returning the id"""
+
+        if quantity.id in self.quantities:
+            raise ValueError(f"Duplicate quantity id: {quantity.id}")
+        self.quantities[quantity.id] = quantity
+        return quantity.id
+
+    def chapter(self, identifier: str) -> PhysicsChapter:
+        """Returns the chapter with the given id, loading it if needed"""
+        chapter = self.chapters.get(identifier)
+        if chapter is None:
+            entry = _lookup(self.entries, identifier, "chapter")
+            chapter = entry.load()
+            self._register(identifier, chapter)
+        return chapter
+
+    def is_loaded(self, identifier: str) -> bool:
+        """Whether the chapter with the given id has been constructed"""
+        return identifier in self.chapters
+
+    def equation(self, identifier: str) -> Equation:
+        """Returns the equation with the given id, loading its chapter if needed"""
+        chapter_part = identifier.partition(".")[0]
+        if identifier not in self.equations and chapter_part in self.entries:
+            self.chapter(chapter_part)
+        return _lookup(self.equations, self.aliases.get(identifier, identifier), "equation")
+
+    def quantity(self, identifier: str) -> Quantity:
+        """Returns the quantity with the given id"""
+        return _lookup(self.quantities, identifier, "quantity")
+
+    def chapter_of(self, equation: Equation) -> PhysicsChapter:
+        """Returns the chapter an equation belongs to"""
+        return _lookup(self._equation_chapters, equation.id, "equation")
+
+    def get_chapters(self) -> List[PhysicsChapter]:
+        """Loads and returns every chapter in the order they were registered"""
+        return [self.chapter(identifier) for identifier in self.entries]
+
+    def get_quantities(self) -> List[Quantity]:
+        """Returns the quantities in the order they were registered"""
+        return list(self.quantities.values())
+
+
+def _unique(identifier: str, taken: Mapping[str, object]) -> str:
+    """Appends a counter to an id that is already in use"""
+    if identifier not in taken:
+        return identifier
+    count = 2
+    while f"{identifier}_{count}" in taken:
+        count += 1
+    return f"{identifier}_{count}"
+
+
+def _lookup(index: Mapping[str, T], identifier: Optional[str], kind: str) -> T:
+    if identifier is None or identifier not in index:
+        raise KeyError(f"Unknown {kind} id: {identifier}")
+    return index[identifier]
+
+
+@lru_cache(maxsize=None)
+def default_registry() -> Registry:
+    """
+    The registry of every chapter and quantity shipped with the app. The
+    chapters come from the manifest and are loaded on demand.
+    """
+
+    from .chapters import MANIFEST
+    from .unit_converter import catalog
+
+    return Registry(quantities=catalog(), manifest=MANIFEST)
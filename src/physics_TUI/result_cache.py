@@ -0,0 +1,161 @@
+"""
+Bounded least-recently-used cache for calculator results. Entries are keyed
+by equation, unknown and the canonicalized known values, and the cache is
+capped both by entry count and by an estimate of the memory it holds.
+"""
+
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from math import isfinite
+from threading import Lock
+from typing import Any, Callable, Hashable, Mapping, Optional, Tuple
+
+MAX_ENTRIES: int = 4096
+MAX_BYTES: int = 4 * 1024 * 1024
+
+CacheKey = Tuple[str, str, Tuple[Tuple[str, float], ...]]
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of the counters of a ResultCache"""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResultCache:
+    """
+    Least-recently-used cache of solved values. The oldest entries are
+    evicted once either `max_entries` or `max_bytes` would be exceeded.
+    Failed calculations are not cached, so their errors are raised again
+    on every call.
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, max_bytes: int = MAX_BYTES) -> None:
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("Cache limits must be positive")
+
+        self.max_entries: int = max_entries
+        self.max_bytes: int = max_bytes
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._bytes: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(equation_id: str, unknown: str, knowns: Mapping[str, Any]) -> Optional[CacheKey]:
+        """
+        Builds the cache key for a solve. Known values are sorted by name
+        and converted to float, with -0.0 folded into 0.0, so equal inputs
+        given in any order or numeric type share an entry. Returns None if
+        a value is missing, not a number or not finite: such a solve is not
+        cached, so the solver reports the problem itself.
+        """
+
+        values = []
+        for name, value in knowns.items():
+            try:
+                number = float(value) + 0.0
+            except (TypeError, ValueError):
+                return None
+            if not isfinite(number):
+                return None
+            values.append((name, number))
+
+        return equation_id, unknown, tuple(sorted(values))
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Returns the cached value for `key`, or calls `compute`, stores its
+        result and returns it. Exceptions from `compute` propagate and
+        nothing is stored.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+
+        value = compute()
+        self.put(key, value)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Stores a value, evicting the least recently used entries as needed"""
+
+        size = _entry_size(key, value)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+
+            while self._entries and (
+                len(self._entries) >= self.max_entries or self._bytes + size > self.max_bytes
+            ):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._evictions += 1
+
+            self._entries[key] = (value, size)
+            self._bytes += size
+
+    def clear(self) -> None:
+        """Drops every entry. The counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def reset_stats(self) -> None:
+        """Sets the hit, miss and eviction counters back to zero"""
+        with self._lock:
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        """Returns the current counters"""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
+
+
+def _entry_size(key: Any, value: Any) -> int:
+    """Approximate memory held by one entry: its key, value and slot"""
+    return _deep_size(key) + _deep_size(value) + 100
+
+
+def _deep_size(obj: Any) -> int:
+    """sys.getsizeof including the items of nested tuples"""
+    size = sys.getsizeof(obj)
+    if isinstance(obj, tuple):
+        size += sum(_deep_size(item) for item in obj)
+    return size
+
+
+# Shared by the TUI and programmatic callers of Equation.solve
+RESULT_CACHE: ResultCache = ResultCache()
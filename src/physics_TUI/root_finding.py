@@ -0,0 +1,448 @@
+"""
+Root finding used to solve equations numerically for variables that have
+no closed-form branch. The search for a sign change always starts from the
+same place for the same interval, so the root found depends only on the
+problem: the smallest one when the interval has a finite lower bound.
+Scalar solves refine the first bracket with Brent's method; array solves
+bracket every element at once and refine the brackets together with
+Chandrupatla's method.
+"""
+
+from dataclasses import dataclass
+from itertools import zip_longest
+from math import inf, isfinite, nan
+from time import perf_counter
+from typing import Callable, Iterator, Optional, Tuple
+
+import numpy as np
+
+XTOL: float = 1e-12  # absolute tolerance on the root
+RTOL: float = 4 * float(np.finfo(float).eps)  # relative tolerance on the root
+MAXITER: int = 200  # refinement iterations per bracket
+EXPANSIONS: int = 110  # doublings of the search step, enough to reach ~1e31 from 1
+SUBDIVISIONS: int = 4  # samples per doubling, so neighbours are ~19% of the distance apart
+SCAN_INTERVALS: int = 64  # uniform steps across an interval bounded on both sides
+
+
+@dataclass
+class RootStats:
+    """Counters for the numeric solves of one unknown"""
+
+    solves: int = 0
+    failures: int = 0
+    iterations: int = 0
+    evaluations: int = 0
+    seconds: float = 0.0
+
+    @property
+    def mean_iterations(self) -> float:
+        """Average refinement iterations per solve"""
+        return self.iterations / self.solves if self.solves else 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        """Average wall time per solve in seconds"""
+        return self.seconds / self.solves if self.solves else 0.0
+
+    def reset(self) -> None:
+        """Sets every counter back to zero"""
+        self.solves = self.failures = self.iterations = self.evaluations = 0
+        self.seconds = 0.0
+
+
+class NoRootError(ValueError):
+    """Raised when no root can be found in the search interval"""
+
+
+def initial_guess(lower: float = -inf, upper: float = inf) -> float:
+    """Starting point for a search over the whole real line"""
+    if isfinite(lower) and isfinite(upper):
+        return 0.5 * (lower + upper)
+    if isfinite(lower):
+        return lower + 1.0
+    if isfinite(upper):
+        return upper - 1.0
+    return 1.0
+
+
+def find_root(
+    f: Callable[[float], float],
+    guess: float,
+    lower: float = -inf,
+    upper: float = inf,
+    stats: Optional[RootStats] = None,
+    xtol: float = XTOL,
+    rtol: float = RTOL,
+    maxiter: int = MAXITER,
+) -> float:
+    """
+    Finds x in [lower, upper] with f(x) = 0. Points where f raises an
+    arithmetic error or returns a non-finite value are treated as outside
+    its domain. When f has several roots, the search picks the same one on
+    every call: the smallest if `lower` is finite, else the largest if
+    `upper` is, else the first found searching outward from `guess`.
+
+    Args:
+        f (Callable[[float], float]): function whose root is wanted.
+        guess (float): center of the search when neither bound is finite.
+        lower (float, optional): lower bound of the root. Defaults to -inf.
+        upper (float, optional): upper bound of the root. Defaults to inf.
+        stats (Optional[RootStats], optional): counters to update. Defaults to None.
+
+    Raises:
+        NoRootError: if no sign change of f is found in [lower, upper].
+
+    Returns:
+        float: the root
+    """
+
+    start = perf_counter()
+    evaluations = 0
+    iterations = 0
+
+    def evaluate(x: float) -> float:
+        nonlocal evaluations
+        evaluations += 1
+        try:
+            y = float(f(x))
+        except (ArithmeticError, ValueError):
+            return nan
+        return y if isfinite(y) else nan
+
+    def attempt() -> float:
+        nonlocal iterations
+        for a, b, fa, fb in _brackets(evaluate, guess, lower, upper):
+            if fa == 0.0:
+                return a
+            if fb == 0.0:
+                return b
+            root, used = _brent(evaluate, a, b, fa, fb, xtol, rtol, maxiter)
+            iterations += used
+            if root is not None:
+                return root
+
+        raise NoRootError("No root found in the search interval")
+
+    try:
+        return attempt()
+    except NoRootError:
+        if stats is not None:
+            stats.failures += 1
+        raise
+    finally:
+        if stats is not None:
+            stats.solves += 1
+            stats.iterations += iterations
+            stats.evaluations += evaluations
+            stats.seconds += perf_counter() - start
+
+
+def _search(guess: float, lower: float, upper: float) -> Tuple[float, Tuple[Iterator[float], ...]]:
+    """
+    Where a search for sign changes starts, and the points it then visits
+    on each side in order. An interval bounded on both sides is scanned
+    upward from `lower` on a uniform grid, a half-bounded one from its
+    finite bound, and the real line outward from `guess`.
+    """
+
+    if isfinite(lower) and isfinite(upper):
+        width = (upper - lower) / SCAN_INTERVALS
+        return lower, (
+            (lower + width * k if k < SCAN_INTERVALS else upper for k in range(1, SCAN_INTERVALS + 1)),
+        )
+    if isfinite(lower):
+        return lower, (_ray(lower, 1.0, upper),)
+    if isfinite(upper):
+        return upper, (_ray(upper, -1.0, lower),)
+    center = guess if isfinite(guess) else initial_guess()
+    return center, (_ray(center, -1.0, lower), _ray(center, 1.0, upper))
+
+
+def _ray(start: float, direction: float, bound: float) -> Iterator[float]:
+    """
+    Points moving away from `start` in steps that grow geometrically,
+    doubling every SUBDIVISIONS points, up to and including `bound`
+    """
+
+    step = direction * 1e-2 * max(abs(start), 1.0)
+    for growth in _GROWTH:
+        x = start + step * growth
+        if (x >= bound) if direction > 0 else (x <= bound):
+            yield bound
+            return
+        yield x
+
+
+_GROWTH: Tuple[float, ...] = tuple(2.0 ** (k / SUBDIVISIONS) for k in range(EXPANSIONS * SUBDIVISIONS))
+
+
+def _brackets(
+    evaluate: Callable[[float], float], guess: float, lower: float, upper: float
+) -> Iterator[Tuple[float, float, float, float]]:
+    """
+    Yields intervals (a, b, f(a), f(b)) over which f changes sign, in the
+    order the search visits them (see _search). Only adjacent samples with
+    finite values form a bracket, so sign changes across a gap in the
+    domain are skipped.
+    """
+
+    start, rays = _search(guess, lower, upper)
+    f_start = evaluate(start)
+    if f_start == 0.0:
+        yield start, start, f_start, f_start
+    sides = [[start, f_start] for _ in rays]
+
+    for points in zip_longest(*rays):
+        for side, x in zip(sides, points):
+            if x is None:
+                continue
+            previous, f_previous = side
+            fx = evaluate(x)
+            side[0], side[1] = x, fx
+            if fx == 0.0 or (f_previous == f_previous and fx == fx and (fx < 0) != (f_previous < 0)):
+                yield (previous, x, f_previous, fx) if x > previous else (x, previous, fx, f_previous)
+
+
+def _brent(
+    f: Callable[[float], float],
+    a: float,
+    b: float,
+    fa: float,
+    fb: float,
+    xtol: float,
+    rtol: float,
+    maxiter: int,
+) -> Tuple[Optional[float], int]:
+    """
+    Brent's method on a bracket [a, b] with f(a) and f(b) of opposite sign.
+    Returns (None, iterations) if the bracket turns out to enclose a pole or
+    a gap in the domain of f rather than a root.
+    """
+
+    x_previous, x_current = a, b
+    f_previous, f_current = fa, fb
+    x_block = f_block = s_previous = s_current = 0.0
+
+    for i in range(1, maxiter + 1):
+        if f_previous != 0.0 and f_current != 0.0 and (f_previous < 0) != (f_current < 0):
+            x_block, f_block = x_previous, f_previous
+            s_previous = s_current = x_current - x_previous
+        if abs(f_block) < abs(f_current):
+            x_previous, x_current, x_block = x_current, x_block, x_current
+            f_previous, f_current, f_block = f_current, f_block, f_current
+
+        delta = 0.5 * (xtol + rtol * abs(x_current))
+        s_bisect = 0.5 * (x_block - x_current)
+        if f_current == 0.0 or abs(s_bisect) < delta:
+            # A pole also shrinks the bracket, but |f| grows towards it
+            if abs(f_current) > max(abs(fa), abs(fb)):
+                return None, i
+            return x_current, i
+
+        s_try: Optional[float] = None
+        if abs(s_previous) > delta and abs(f_current) < abs(f_previous):
+            if x_previous == x_block:
+                # Secant step
+                numerator = -f_current * (x_current - x_previous)
+                denominator = f_current - f_previous
+            else:
+                # Inverse quadratic interpolation
+                d_previous = (f_previous - f_current) / (x_previous - x_current)
+                d_block = (f_block - f_current) / (x_block - x_current)
+                numerator = -f_current * (f_block * d_block - f_previous * d_previous)
+                denominator = d_block * d_previous * (f_block - f_previous)
+            if denominator:
+                s_try = numerator / denominator
+                if not 2.0 * abs(s_try) < min(abs(s_previous), 3.0 * abs(s_bisect) - delta):
+                    s_try = None
+
+        if s_try is None:
+            s_previous = s_current = s_bisect
+        else:
+            s_previous, s_current = s_current, s_try
+
+        x_previous, f_previous = x_current, f_current
+        if abs(s_current) > delta:
+            x_current += s_current
+        else:
+            x_current += delta if s_bisect > 0 else -delta
+        f_current = f(x_current)
+        if f_current != f_current:
+            return None, i
+
+    return None, maxiter
+
+
+def find_roots(
+    f: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    size: int,
+    guess: float,
+    lower: float = -inf,
+    upper: float = inf,
+    active: Optional[np.ndarray] = None,
+    stats: Optional[RootStats] = None,
+    xtol: float = XTOL,
+    rtol: float = RTOL,
+    maxiter: int = MAXITER,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized counterpart of find_root for `size` independent problems.
+    `f(x, index)` evaluates the problems numbered by `index` at the points
+    `x` and must return NaN outside their domain.
+
+    Args:
+        f (Callable[[np.ndarray, np.ndarray], np.ndarray]): element-wise function.
+        size (int): number of problems.
+        guess (float): center of the search when neither bound is finite.
+        lower (float, optional): lower bound of the roots. Defaults to -inf.
+        upper (float, optional): upper bound of the roots. Defaults to inf.
+        active (Optional[np.ndarray], optional): boolean mask of the problems to solve. Defaults to all.
+        stats (Optional[RootStats], optional): counters to update. Defaults to None.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: the roots (NaN where none was found)
+        and a boolean mask of the problems that were solved.
+    """
+
+    start = perf_counter()
+    evaluations = 0
+
+    def evaluate(x: np.ndarray, index: np.ndarray) -> np.ndarray:
+        nonlocal evaluations
+        evaluations += len(index)
+        with np.errstate(all="ignore"):
+            y = np.asarray(f(x, index), dtype=float)
+        return np.where(np.isfinite(y), y, np.nan)
+
+    roots = np.full(size, np.nan)
+    found = np.zeros(size, dtype=bool)
+    index = np.flatnonzero(active) if active is not None else np.arange(size)
+
+    start, rays = _search(guess, lower, upper)
+    f_start = evaluate(np.full(len(index), start), index)
+    exact = f_start == 0.0
+    roots[index[exact]] = start
+    found[index[exact]] = True
+
+    # Walk every side of the search in step, keeping each pending problem's
+    # last sample per side, until each has a sign change between adjacent
+    # finite samples
+    a = np.full(size, np.nan)
+    b = np.full(size, np.nan)
+    fa = np.full(size, np.nan)
+    fb = np.full(size, np.nan)
+    pending = index[~exact]
+    edges = [np.full(size, np.nan) for _ in rays]
+    for f_edge in edges:
+        f_edge[index] = f_start
+    x_edges = [start] * len(rays)
+
+    for points in zip_longest(*rays):
+        if not len(pending):
+            break
+        bracketed = np.zeros(len(pending), dtype=bool)
+        for side, x in enumerate(points):
+            if x is None:
+                continue
+            previous, x_edges[side] = x_edges[side], x
+            members = pending[~bracketed]
+            fx = evaluate(np.full(len(members), x), members)
+            f_edge = edges[side]
+            f_previous = f_edge[members]
+            f_edge[members] = fx
+            change = (fx == 0.0) | (
+                ~np.isnan(fx) & ~np.isnan(f_previous) & ((fx < 0) != (f_previous < 0))
+            )
+            hit = members[change]
+            if x > previous:
+                a[hit], b[hit], fa[hit], fb[hit] = previous, x, f_previous[change], fx[change]
+            else:
+                a[hit], b[hit], fa[hit], fb[hit] = x, previous, fx[change], f_previous[change]
+            bracketed[np.flatnonzero(~bracketed)[change]] = True
+        pending = pending[~bracketed]
+
+    brackets = np.flatnonzero(~np.isnan(a) & ~found)
+    iterations = _chandrupatla(evaluate, brackets, a, b, fa, fb, roots, found, xtol, rtol, maxiter)
+
+    if stats is not None:
+        problems = len(index)
+        stats.solves += problems
+        stats.failures += problems - int(np.count_nonzero(found[index]))
+        stats.iterations += iterations
+        stats.evaluations += evaluations
+        stats.seconds += perf_counter() - start
+
+    return roots, found
+
+
+def _chandrupatla(
+    evaluate: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    index: np.ndarray,
+    a: np.ndarray,
+    b: np.ndarray,
+    fa: np.ndarray,
+    fb: np.ndarray,
+    roots: np.ndarray,
+    found: np.ndarray,
+    xtol: float,
+    rtol: float,
+    maxiter: int,
+) -> int:
+    """
+    Refines the brackets [a, b] of the problems in `index` together with
+    Chandrupatla's method, which switches between inverse quadratic
+    interpolation and bisection like Brent's method but with a test that
+    vectorizes. Writes into `roots` and `found`, and returns the total
+    number of iterations over all problems.
+    """
+
+    x1, f1 = b[index], fb[index]
+    x2, f2 = a[index], fa[index]
+    x3, f3 = x2.copy(), f2.copy()
+    bound = np.maximum(np.abs(fa[index]), np.abs(fb[index]))
+    t = np.full(len(index), 0.5)
+    iterations = 0
+
+    for _ in range(maxiter):
+        if not len(index):
+            break
+        iterations += len(index)
+
+        xt = x1 + t * (x2 - x1)
+        ft = evaluate(xt, index)
+        same = (ft < 0) == (f1 < 0)
+        x3 = np.where(same, x1, x2)
+        f3 = np.where(same, f1, f2)
+        x2 = np.where(same, x2, x1)
+        f2 = np.where(same, f2, f1)
+        x1, f1 = xt, ft
+
+        smaller = np.abs(f1) < np.abs(f2)
+        xm = np.where(smaller, x1, x2)
+        fm = np.where(smaller, f1, f2)
+        with np.errstate(all="ignore"):
+            tolerance = 2.0 * rtol * np.abs(xm) + xtol
+            t_limit = tolerance / np.abs(x2 - x1)
+            converged = (fm == 0.0) | (t_limit > 0.5)
+            failed = np.isnan(ft) | (converged & (np.abs(fm) > bound))
+
+            xi = (x1 - x2) / (x3 - x2)
+            phi = (f1 - f2) / (f3 - f2)
+            interpolate = (phi * phi < xi) & ((1.0 - phi) * (1.0 - phi) < 1.0 - xi)
+            t = np.where(
+                interpolate,
+                f1 / (f2 - f1) * f3 / (f2 - f3) + (x3 - x1) / (x2 - x1) * f1 / (f3 - f1) * f2 / (f3 - f2),
+                0.5,
+            )
+            t = np.clip(t, t_limit, 1.0 - t_limit)
+
+        done = converged & ~failed
+        roots[index[done]] = xm[done]
+        found[index[done]] = True
+
+        keep = ~(converged | failed)
+        index = index[keep]
+        x1, f1, x2, f2, x3, f3 = x1[keep], f1[keep], x2[keep], f2[keep], x3[keep], f3[keep]
+        bound, t = bound[keep], t[keep]
+
+    return iterations
@@ -0,0 +1,661 @@
+"""Per-unknown equation solvers that work on scalars and NumPy arrays"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from math import copysign, inf, isnan, nan
+from keyword import iskeyword
+from types import CodeType, SimpleNamespace
+import ast
+import builtins
+import copy
+import linecache
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+import math
+
+import numpy as np
+
+from .quadratic import array_first_nonnegative, array_roots, scalar_first_nonnegative, scalar_roots
+from .root_finding import NoRootError, RootStats, find_root, find_roots, initial_guess
+
+
+def _scalar_cbrt(x: float) -> float:
+    """Real cube root that also accepts negative values"""
+    return copysign(abs(x) ** (1.0 / 3.0), x)
+
+
+# Math namespaces handed to formulas as `xp`, so the same expression can be
+# evaluated on plain floats (fast, raises on bad input) or on whole arrays.
+SCALAR_MATH = SimpleNamespace(
+    pi=math.pi,
+    sqrt=math.sqrt,
+    cbrt=_scalar_cbrt,
+    sin=math.sin,
+    cos=math.cos,
+    tan=math.tan,
+    asin=math.asin,
+    acos=math.acos,
+    atan=math.atan,
+    log=math.log,
+    exp=math.exp,
+    radians=math.radians,
+    degrees=math.degrees,
+    isnan=isnan,
+    roots=scalar_roots,
+    first_nonnegative=scalar_first_nonnegative,
+)
+
+ARRAY_MATH = SimpleNamespace(
+    pi=np.pi,
+    sqrt=np.sqrt,
+    cbrt=np.cbrt,
+    sin=np.sin,
+    cos=np.cos,
+    tan=np.tan,
+    asin=np.arcsin,
+    acos=np.arccos,
+    atan=np.arctan,
+    log=np.log,
+    exp=np.exp,
+    radians=np.radians,
+    degrees=np.degrees,
+    isnan=np.isnan,
+    roots=array_roots,
+    first_nonnegative=array_first_nonnegative,
+)
+
+NON_FINITE_MESSAGE: str = "The result is not a finite number. Check your values."
+
+
+def _arg_names(function: Callable[..., Any]) -> Tuple[str, ...]:
+    """Returns the positional parameter names of a function"""
+    code = function.__code__
+    return tuple(code.co_varnames[: code.co_argcount])
+
+
+@dataclass(frozen=True)
+class Check:
+    """
+    Domain restriction for a solve. The predicate receives the variables it
+    names (plus `xp` and `result` if requested) and returns True, or a
+    boolean array, where the inputs are invalid.
+    """
+
+    invalid: Callable[..., Any]
+    message: str
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        return _arg_names(self.invalid)
+
+
+@dataclass(frozen=True)
+class Branch:
+    """
+    Closed-form expression of one unknown in terms of the other variables.
+    The formula takes the math namespace `xp` first, then the knowns it uses.
+    """
+
+    unknown: str
+    formula: Callable[..., Any]
+    checks: Tuple[Check, ...] = ()
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        return _arg_names(self.formula)[1:]
+
+
+@dataclass
+class ArrayResult:
+    """
+    Result of an array solve. `values` holds NaN wherever `status` is not
+    zero; a non-zero status indexes the failed check in `messages`.
+    """
+
+    unknown: str
+    values: np.ndarray
+    status: np.ndarray
+    messages: Tuple[str, ...]
+
+    @property
+    def valid(self) -> np.ndarray:
+        """Boolean mask of the elements that solved successfully"""
+        return self.status == 0
+
+    def message(self, code: int) -> str:
+        """Returns the error message for a status code ('' for success)"""
+        return self.messages[code]
+
+    def error_counts(self) -> Dict[str, int]:
+        """Returns how many elements failed for each reason"""
+        codes, counts = np.unique(self.status[self.status != 0], return_counts=True)
+        return {self.messages[int(code)]: int(count) for code, count in zip(codes, counts)}
+
+
+class EquationSolver:
+    """
+    Collection of closed-form branches for a single equation, one per
+    variable that can be isolated analytically. Checks given to the solver
+    itself mirror the validation preludes of the Calculate methods and are
+    applied whenever the variables they inspect are known.
+
+    Any other variable that appears in a branch's formula is solved for
+    numerically by inverting that formula, within `bounds` if given. The
+    root found depends only on the knowns (see find_root), and `stats`
+    counts the iterations and time spent per unknown.
+    """
+
+    def __init__(
+        self,
+        variables: Sequence[str],
+        *branches: Branch,
+        checks: Sequence[Check] = (),
+        bounds: Optional[Mapping[str, Tuple[float, float]]] = None,
+    ) -> None:
+        self.variables: Tuple[str, ...] = tuple(variables)
+        for var in self.variables:
+            # Variables become parameter names of the compiled solvers
+            if not var.isidentifier() or iskeyword(var) or var.startswith("_"):
+                raise ValueError(f"Invalid variable name: {var!r}")
+        self.branches: Dict[str, Branch] = {branch.unknown: branch for branch in branches}
+        self.checks: Tuple[Check, ...] = tuple(checks)
+        self.bounds: Dict[str, Tuple[float, float]] = dict(bounds or {})
+        self.name: str = ""
+        self.qualname: str = ""
+        self.stats: Dict[str, RootStats] = {var: RootStats() for var in self.numeric_unknowns}
+        self._compiled: Dict[str, Callable[..., float]] = {}
+
+        for branch in branches:
+            names = set(branch.names)
+            for check in branch.checks:
+                names.update(check.names)
+            names -= {"xp", "result"}
+            unknown_names = names - set(self.variables)
+            if unknown_names or branch.unknown in names:
+                raise ValueError(
+                    f"Branch for {branch.unknown} uses invalid variables: {sorted(names)}"
+                )
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        self.qualname = f"{owner.__qualname__}.{name}"
+
+    def __repr__(self) -> str:
+        return f"EquationSolver({self.qualname or self.variables!r})"
+
+    @property
+    def unknowns(self) -> Tuple[str, ...]:
+        """Variables that can be solved for, in signature order"""
+        numeric = self.numeric_unknowns
+        return tuple(var for var in self.variables if var in self.branches or var in numeric)
+
+    @property
+    def numeric_unknowns(self) -> Tuple[str, ...]:
+        """
+        Variables without a closed-form branch that appear in another
+        branch's formula, so they can be found by inverting it numerically
+        """
+        return tuple(
+            var
+            for var in self.variables
+            if var not in self.branches
+            and any(var in branch.names for branch in self.branches.values())
+        )
+
+    def unknown_of(self, values: Mapping[str, Any]) -> str:
+        """
+        Determines which variable is being solved for: the single variable
+        that is missing from `values` or set to None.
+        """
+
+        unknown_names = set(values) - set(self.variables)
+        if unknown_names:
+            raise ValueError(f"Unexpected variables: {', '.join(sorted(unknown_names))}")
+
+        missing: List[str] = [
+            var for var in self.variables if values.get(var) is None
+        ]
+        if len(missing) != 1:
+            raise ValueError("Leave exactly one variable empty to solve for it")
+
+        return missing[0]
+
+    def branch(self, unknown: str) -> Branch:
+        """Returns the closed-form branch for an unknown"""
+        if unknown not in self.variables:
+            raise ValueError(f"{unknown} is not a variable of this equation")
+        if unknown not in self.branches:
+            raise ValueError(f"Cannot solve for {unknown} with this equation.")
+        return self.branches[unknown]
+
+    def inverse(self, unknown: str) -> Branch:
+        """
+        Returns the branch that is inverted numerically to solve for an
+        unknown without a closed form: the one using it with the fewest
+        checks, since a check that fails leaves a gap in the search.
+        """
+        if unknown not in self.variables:
+            raise ValueError(f"{unknown} is not a variable of this equation")
+        candidates = [branch for branch in self.branches.values() if unknown in branch.names]
+        if unknown in self.branches or not candidates:
+            raise ValueError(f"Cannot solve for {unknown} with this equation.")
+        return min(candidates, key=lambda branch: len(branch.checks))
+
+    def checks_for(self, unknown: str) -> Tuple[Check, ...]:
+        """Prelude checks that apply when solving for an unknown, then the branch checks"""
+        shared = tuple(check for check in self.checks if unknown not in check.names)
+        if unknown in self.branches or unknown not in self.numeric_unknowns:
+            return shared + self.branch(unknown).checks
+        return shared
+
+    def domain_checks(self, unknown: str) -> Tuple[Check, ...]:
+        """
+        Checks a candidate value of a numeric unknown must pass: the prelude
+        checks that inspect it and the checks of the inverted branch
+        """
+        shared = tuple(check for check in self.checks if unknown in check.names)
+        return shared + self.inverse(unknown).checks
+
+    def solve(self, unknown: str, knowns: Mapping[str, float]) -> float:
+        """
+        Solves for a single unknown from scalar knowns.
+
+        Raises:
+            ValueError: the message of the first failed check.
+
+        Returns:
+            float: the value of the unknown
+        """
+
+        return self.compiled(unknown)(**knowns)
+
+    def compiled(self, unknown: str) -> Callable[..., float]:
+        """Returns the specialized scalar solver for an unknown, compiling it once"""
+        try:
+            return self._compiled[unknown]
+        except KeyError:
+            function = self._compiled[unknown] = self.compile(unknown)
+            return function
+
+    def compile(self, unknown: str) -> Callable[..., float]:
+        """
+        Builds a scalar solver specialized for one unknown. The branch and
+        the checks that apply are resolved here, once, and bound into a
+        function taking the knowns as keyword-only parameters, so a call
+        only evaluates the checks and the formula for that unknown.
+
+        Returns:
+            Callable[..., float]: takes the knowns as keyword arguments.
+        """
+
+        if unknown not in self.branches and unknown in self.numeric_unknowns:
+            return self._compile_numeric(unknown)
+
+        branch = self.branch(unknown)
+        pre, post = _split_checks(self.checks_for(unknown))
+        knowns = [var for var in self.variables if var != unknown]
+        name = f"solve_{unknown}"
+
+        # Only variable names go into the generated source. The formula and
+        # the checks stay the branch's own callables and are passed in, so
+        # the body reads them as closure variables.
+        helpers: Dict[str, Any] = {
+            "_formula": branch.formula,
+            "_xp": SCALAR_MATH,
+            "_missing": _missing_values,
+            "_Failed": _CheckFailed,
+            "_NON_FINITE": NON_FINITE_MESSAGE,
+            "_LOW": -inf,
+            "_HIGH": inf,
+        }
+        pre_lines: List[str] = []
+        post_lines: List[str] = []
+        for index, check in enumerate(pre + post):
+            helpers[f"_check{index}"] = check.invalid
+            helpers[f"_message{index}"] = check.message
+            (pre_lines if index < len(pre) else post_lines).extend([
+                f"            if _check{index}({_arguments(check.names)}):",
+                f"                raise _Failed(_message{index})",
+            ])
+
+        lines = [
+            f"def _make({', '.join(helpers)}):",
+            f"    def {name}(*, {', '.join(f'{var}=None' for var in knowns)}):",
+            f"        if {' or '.join(f'{var} is None' for var in knowns)}:",
+            f"            raise _missing({', '.join(f'{var}={var}' for var in knowns)})",
+            # Failed checks raise _Failed so that they are reported as is
+            # rather than by the handlers that translate arithmetic errors
+            "        try:",
+            *pre_lines,
+            f"            _result = _formula(_xp, {_arguments(branch.names)})",
+            *post_lines,
+            # Both comparisons are false for nan, so this flags every non-finite result
+            "            if not _LOW < _result < _HIGH:",
+            "                raise _Failed(_NON_FINITE)",
+            "        except _Failed as error:",
+            "            raise ValueError(*error.args) from None",
+            "        except ZeroDivisionError:",
+            "            raise ValueError('Division by zero is undefined.') from None",
+            "        except (OverflowError, ValueError):",
+            "            raise ValueError(_NON_FINITE) from None",
+            "        return _result",
+            f"    return {name}",
+        ]
+
+        # Calls to lambdas whose expression is found in their source are
+        # replaced by that expression, so the common checks cost no call
+        tree = ast.parse("\n".join(lines))
+        scope: Dict[str, Any] = {}
+        _Inliner(helpers, scope).visit(tree)
+        exec(compile(ast.fix_missing_locations(tree), f"<{self.qualname or 'EquationSolver'}>", "exec"), scope)
+        solve: Callable[..., float] = scope["_make"](**helpers)
+        solve.__qualname__ = f"{self.qualname or 'EquationSolver'}.{name}"
+
+        return solve
+
+    def solve_array(self, unknown: str, knowns: Mapping[str, Any]) -> ArrayResult:
+        """
+        Solves for an unknown element-wise. Knowns may be scalars or arrays
+        of any mutually broadcastable shape; failed elements are reported in
+        the result's status array instead of raising.
+        """
+
+        if unknown not in self.branches and unknown in self.numeric_unknowns:
+            return self._solve_array_numeric(unknown, knowns)
+
+        branch = self.branch(unknown)
+        checks = self.checks_for(unknown)
+        pre, post = _split_checks(checks)
+
+        names = [var for var in self.variables if var != unknown]
+        missing = [name for name in names if knowns.get(name) is None]
+        if missing:
+            raise ValueError(f"Missing values for: {', '.join(missing)}")
+
+        arrays = np.broadcast_arrays(*(np.asarray(knowns[name], dtype=float) for name in names))
+        scope: Dict[str, Any] = dict(zip(names, arrays))
+        shape = arrays[0].shape if arrays else ()
+
+        ordered = pre + post
+        status = np.zeros(shape, dtype=np.int16)
+        messages: Tuple[str, ...] = ("",) + tuple(check.message for check in ordered) + (
+            NON_FINITE_MESSAGE,
+        )
+
+        with np.errstate(all="ignore"):
+            values = np.asarray(
+                branch.formula(ARRAY_MATH, *(scope[name] for name in branch.names)),
+                dtype=float,
+            )
+            if values.shape != shape or any(values is array for array in arrays):
+                values = np.broadcast_to(values, shape).copy()
+            scope["result"] = values
+
+            # Codes are written from lowest to highest priority, so each
+            # element ends up with the first check it fails
+            _flag(status, ~np.isfinite(values), len(messages) - 1)
+            for code in range(len(ordered), 0, -1):
+                check = ordered[code - 1]
+                _flag(status, check.invalid(*_bind(check.names, scope, ARRAY_MATH)), code)
+
+        np.copyto(values, np.nan, where=status != 0)
+
+        return ArrayResult(unknown, values, status, messages)
+
+    def _compile_numeric(self, unknown: str) -> Callable[..., float]:
+        """
+        Builds a scalar solver for an unknown without a closed form. The
+        inverted branch is evaluated at trial values of the unknown, and
+        find_root picks the same root for the same knowns on every call.
+        """
+
+        forward = self.inverse(unknown)
+        pre = _split_checks(self.checks_for(unknown))[0]
+        domain, domain_post = _split_checks(self.domain_checks(unknown))
+        knowns = [var for var in self.variables if var != unknown]
+        lower, upper = self.bounds.get(unknown, (-inf, inf))
+        stats = self.stats[unknown]
+        no_solution = f"No real solution for {unknown} with these values."
+
+        def solve(**values: float) -> float:
+            missing = [var for var in knowns if values.get(var) is None]
+            if missing:
+                raise ValueError(f"Missing values for: {', '.join(missing)}")
+
+            scope = dict(values)
+            for check in pre:
+                if check.invalid(*_bind(check.names, scope, SCALAR_MATH)):
+                    raise ValueError(check.message)
+
+            target = scope[forward.unknown]
+
+            def residual(x: float) -> float:
+                scope[unknown] = x
+                for check in domain:
+                    if check.invalid(*_bind(check.names, scope, SCALAR_MATH)):
+                        return nan
+                result = scope["result"] = forward.formula(
+                    SCALAR_MATH, *_bind(forward.names, scope, SCALAR_MATH)
+                )
+                for check in domain_post:
+                    if check.invalid(*_bind(check.names, scope, SCALAR_MATH)):
+                        return nan
+                return result - target
+
+            try:
+                return find_root(residual, initial_guess(), lower, upper, stats=stats)
+            except NoRootError:
+                raise ValueError(no_solution) from None
+
+        solve.__name__ = f"solve_{unknown}"
+        solve.__qualname__ = f"{self.qualname or 'EquationSolver'}.solve_{unknown}"
+
+        return solve
+
+    def _solve_array_numeric(self, unknown: str, knowns: Mapping[str, Any]) -> ArrayResult:
+        """Array counterpart of _compile_numeric"""
+
+        forward = self.inverse(unknown)
+        pre = _split_checks(self.checks_for(unknown))[0]
+        domain, domain_post = _split_checks(self.domain_checks(unknown))
+        lower, upper = self.bounds.get(unknown, (-inf, inf))
+        stats = self.stats[unknown]
+
+        names = [var for var in self.variables if var != unknown]
+        missing = [name for name in names if knowns.get(name) is None]
+        if missing:
+            raise ValueError(f"Missing values for: {', '.join(missing)}")
+
+        arrays = np.broadcast_arrays(*(np.asarray(knowns[name], dtype=float) for name in names))
+        shape = arrays[0].shape if arrays else ()
+        flat: Dict[str, Any] = {name: array.ravel() for name, array in zip(names, arrays)}
+        size = int(np.prod(shape))
+
+        status = np.zeros(size, dtype=np.int16)
+        messages: Tuple[str, ...] = (
+            ("",)
+            + tuple(check.message for check in pre)
+            + (f"No real solution for {unknown} with these values.",)
+        )
+
+        # Every element starts out unsolved, and a failed check takes precedence
+        with np.errstate(all="ignore"):
+            _flag(status, True, len(messages) - 1)
+            for code in range(len(pre), 0, -1):
+                check = pre[code - 1]
+                _flag(status, check.invalid(*_bind(check.names, flat, ARRAY_MATH)), code)
+
+        def residual(x: np.ndarray, index: np.ndarray) -> np.ndarray:
+            scope = {name: flat[name][index] for name in names}
+            scope[unknown] = x
+            result = scope["result"] = np.broadcast_to(
+                forward.formula(ARRAY_MATH, *_bind(forward.names, scope, ARRAY_MATH)), x.shape
+            )
+            difference = result - scope[forward.unknown]
+            for check in domain + domain_post:
+                invalid = check.invalid(*_bind(check.names, scope, ARRAY_MATH))
+                np.copyto(difference, np.nan, where=np.asarray(invalid, dtype=bool))
+            return difference
+
+        pending = status == len(messages) - 1
+        values, found = find_roots(
+            residual, size, initial_guess(), lower, upper, active=pending, stats=stats
+        )
+        status[found] = 0
+
+        return ArrayResult(unknown, values.reshape(shape), status.reshape(shape), messages)
+
+    def array(self, **values: Any) -> ArrayResult:
+        """
+        Array mode of the matching Calculate method: pass every known as a
+        scalar or array and leave the unknown out (or None).
+        """
+
+        unknown = self.unknown_of(values)
+        return self.solve_array(unknown, values)
+
+
+def _split_checks(checks: Sequence[Check]) -> Tuple[Tuple[Check, ...], Tuple[Check, ...]]:
+    """Separates checks on the inputs from checks on the result"""
+    pre = tuple(check for check in checks if "result" not in check.names)
+    post = tuple(check for check in checks if "result" in check.names)
+    return pre, post
+
+
+def _arguments(names: Sequence[str]) -> str:
+    """Argument list passing the named variables to a check or formula in generated source"""
+    aliases = {"xp": "_xp", "result": "_result"}
+    return ", ".join(aliases.get(name, name) for name in names)
+
+
+def _missing_values(**values: Optional[float]) -> ValueError:
+    """Error listing the knowns a compiled solver was called without"""
+    missing = [var for var, value in values.items() if value is None]
+    return ValueError(f"Missing values for: {', '.join(missing)}")
+
+
+def _bind(names: Sequence[str], scope: Mapping[str, Any], xp: SimpleNamespace) -> List[Any]:
+    """Collects the positional arguments for a check or formula"""
+    return [xp if name == "xp" else scope[name] for name in names]
+
+
+@lru_cache(maxsize=None)
+def _source_lambdas(filename: str) -> Dict[Tuple[int, Tuple[str, ...]], List[ast.Lambda]]:
+    """The lambdas in a source file, by first line and parameter names"""
+    try:
+        tree = ast.parse("".join(linecache.getlines(filename)))
+    except (SyntaxError, ValueError):
+        return {}
+    found: Dict[Tuple[int, Tuple[str, ...]], List[ast.Lambda]] = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Lambda):
+            key = (node.lineno, tuple(arg.arg for arg in node.args.args))
+            found.setdefault(key, []).append(node)
+    return found
+
+
+def _lambda_expression(function: Callable[..., Any], scope: Dict[str, Any], prefix: str) -> Optional[ast.expr]:
+    """
+    The body of a lambda as an expression tree, with `xp` and `result`
+    renamed to the locals of a generated solver and the globals it reads
+    bound in `scope` under `prefix`. None when the source cannot be found,
+    is ambiguous or no longer compiles to the lambda's own code.
+    """
+
+    code = getattr(function, "__code__", None)
+    if (
+        code is None
+        or function.__name__ != "<lambda>"
+        or code.co_freevars
+        or code.co_kwonlyargcount
+        or function.__defaults__
+    ):
+        return None
+    params = _arg_names(function)
+    candidates = _source_lambdas(code.co_filename).get((code.co_firstlineno, params), [])
+    if len(candidates) != 1:
+        return None
+
+    # Line and parameters can match an edited file; the bytecode cannot
+    node = candidates[0]
+    module = compile(ast.Expression(node), code.co_filename, "eval")
+    source = next(const for const in module.co_consts if isinstance(const, CodeType))
+    if (source.co_code, source.co_consts, source.co_names) != (code.co_code, code.co_consts, code.co_names):
+        return None
+
+    body = copy.deepcopy(node.body)
+    for child in ast.walk(body):
+        if isinstance(child, (ast.Lambda, ast.comprehension, ast.NamedExpr)):
+            return None
+        if not isinstance(child, ast.Name):
+            continue
+        if child.id in params:
+            if child.id in ("xp", "result"):
+                child.id = f"_{child.id}"
+        elif child.id in function.__globals__:
+            scope[prefix + child.id] = function.__globals__[child.id]
+            child.id = prefix + child.id
+        elif not hasattr(builtins, child.id):
+            return None
+    expression: ast.expr = _ScalarExpression(scope).visit(body)
+    return expression
+
+
+class _ScalarExpression(ast.NodeTransformer):
+    """
+    Rewrites an inlined expression for scalar inputs: `_xp.name` becomes a
+    global bound to SCALAR_MATH.name, saving the lookup per call, and whole
+    numbers compared against become floats, which compare with floats
+    without a conversion and give the same result.
+    """
+
+    def __init__(self, scope: Dict[str, Any]) -> None:
+        self.scope = scope
+
+    def visit_Attribute(self, node: ast.Attribute) -> ast.AST:
+        self.generic_visit(node)
+        if not (isinstance(node.value, ast.Name) and node.value.id == "_xp" and hasattr(SCALAR_MATH, node.attr)):
+            return node
+        name = f"_xp_{node.attr}"
+        self.scope[name] = getattr(SCALAR_MATH, node.attr)
+        return ast.copy_location(ast.Name(name, ast.Load()), node)
+
+    def visit_Compare(self, node: ast.Compare) -> ast.AST:
+        self.generic_visit(node)
+        node.left, *node.comparators = (
+            ast.copy_location(ast.Constant(float(operand.value)), operand)
+            if isinstance(operand, ast.Constant)
+            and type(operand.value) is int
+            and -(2**53) <= operand.value <= 2**53
+            else operand
+            for operand in (node.left, *node.comparators)
+        )
+        return node
+
+
+class _Inliner(ast.NodeTransformer):
+    """Replaces calls to the helpers of a generated solver by the lambdas' expressions"""
+
+    def __init__(self, helpers: Mapping[str, Any], scope: Dict[str, Any]) -> None:
+        self.helpers = helpers
+        self.scope = scope
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        self.generic_visit(node)
+        if not isinstance(node.func, ast.Name) or node.func.id not in self.helpers:
+            return node
+        expression = _lambda_expression(self.helpers[node.func.id], self.scope, f"{node.func.id}_")
+        if expression is None:
+            return node
+        for child in ast.walk(expression):
+            ast.copy_location(child, node)
+        return expression
+
+
+class _CheckFailed(ValueError):
+    """Raised by compiled solvers when a check rejects the knowns"""
+
+
+def _flag(status: np.ndarray, invalid: Any, code: int) -> None:
+    """Records `code` for the invalid elements"""
+    np.copyto(status, code, where=np.asarray(invalid, dtype=bool))
+
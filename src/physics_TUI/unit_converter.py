@@ -1,45 +1,306 @@
-from typing import Dict, Any
+from array import array
+from decimal import Decimal
+from fractions import Fraction
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple, Type, Union
 from math import fabs, pow
 
+import numpy as np
 
-class Quantity:
+# Buffers convert_many works on in place
+FloatBuffer = Union[np.ndarray, array]
+
+# Values accepted by exact conversions
+ExactValue = Union[int, float, str, Decimal, Fraction]
+
+# (unit, factor relating the unit to the base unit of the quantity), or
+# (unit, factor, offset) for units offset from the base unit
+UnitEntry = Union[Tuple[str, Fraction], Tuple[str, Fraction, Fraction]]
+
+
+def to_fraction(value: ExactValue) -> Fraction:
     """
-    Class describes the quantity object.
+    Exact Fraction of a number. Floats are read as their shortest decimal
+    representation, so 0.1 becomes 1/10 rather than its binary value.
+    """
+    if isinstance(value, float):
+        return Fraction(repr(value))
+    return Fraction(value)
+
+
+def _offset(unit: UnitEntry) -> Fraction:
+    """Offset of a UNITS entry from the base unit"""
+    return unit[2] if len(unit) == 3 else Fraction(0)
+
+
+def _compose(source: UnitEntry, target: UnitEntry) -> Tuple[Fraction, Fraction]:
+    """Exact factor and offset converting between two UNITS entries"""
+    return source[1] / target[1], (_offset(source) - _offset(target)) / target[1]
+
+
+@lru_cache(maxsize=None)
+def _exact_transform(quantity: "Quantity", from_unit: str, to_unit: str) -> Tuple[Fraction, Fraction]:
+    """Exact factor and offset between two units of a quantity, computed once per pair"""
+    index = quantity.unit_index
+    return _compose(quantity.UNITS[index[from_unit]], quantity.UNITS[index[to_unit]])
+
+
+def scale_in_place(values: FloatBuffer, factor: float, offset: float = 0.0) -> FloatBuffer:
     """
+    Replaces every value v of a float NumPy array or buffer by
+    v * factor + offset, without intermediate copies.
+
+    Raises:
+        TypeError: if the values are not a writable buffer of floats.
+
+    Returns:
+        FloatBuffer: the same `values` object
+    """
+
+    if isinstance(values, np.ndarray):
+        target = values
+    else:
+        try:
+            # A view that keeps the buffer's own item type, e.g. float32 for array('f')
+            target = np.asarray(memoryview(values))
+        except TypeError:
+            raise TypeError("Values must be a NumPy array or a buffer of floats") from None
+
+    if target.dtype.kind != "f" or not target.flags.writeable:
+        raise TypeError("Values must be a writable array of floats")
 
-    def __init__(self) -> None:
-        self.name: str = ""
+    if factor != 1.0:
+        np.multiply(target, factor, out=target)
+    if offset != 0.0:
+        np.add(target, offset, out=target)
+    return values
 
-        # Holds a map of units of lengths and their relative conversion unit from
-        # the base meters
-        self.units: Dict[str, float] = {}
 
-    def get_units(self) -> Dict[str, float]:
+# The one instance of each Quantity subclass, built on first construction
+_SHARED: Dict[Type["Quantity"], "Quantity"] = {}
+
+
+class Quantity:
+    """
+    Class describes the quantity object.
+
+    The units of each quantity are declared as class data, NAME and UNITS,
+    and built into one shared instance per class on first construction:
+    calling `Length()` again returns the same object. Instances are
+    immutable and use __slots__, and their units are read-only mappings
+    backed by tuples of factors, so they can be shared across screens and
+    threads freely.
+
+    A unit may also have an offset from the base unit, as temperatures do.
+    A value v in the unit is then v * factor + offset in the base unit, and
+    each pair of units is compiled into one affine transform, a factor and
+    an offset, applied in a single pass by the bulk conversions.
+
+    Conversions can also be exact. UNITS declares every factor and offset
+    as a Fraction, e.g. exactly 254/10000 for the inch and 1000/3600 for
+    km/h, and the transform of each unit pair is cached the first time it
+    is used. The float tables are rounded once from those Fractions.
+    """
+
+    NAME: str = ""
+    UNITS: Tuple[UnitEntry, ...] = ()
+
+    __slots__ = (
+        "name", "id", "units", "factors", "offsets", "affine", "unit_index",
+        "factor_matrix", "offset_matrix", "_to_base",
+    )
+
+    name: str
+    id: str  # stable id of the quantity, e.g. "length"
+    units: Mapping[str, float]
+    factors: Tuple[float, ...]  # factor of each unit to the base unit, in order
+    offsets: Tuple[float, ...]  # offset of each unit from the base unit, in order
+    affine: bool  # whether any unit has an offset
+    unit_index: Mapping[str, int]  # row and column of each unit in factor_matrix
+    factor_matrix: np.ndarray  # read-only, factor_matrix[i, j] converts unit i to unit j
+    offset_matrix: np.ndarray  # read-only, offset added after factor_matrix[i, j]
+    _to_base: Dict[str, float]  # factor of each unit to the base unit, by name
+
+    def __new__(cls) -> "Quantity":
+        instance = _SHARED.get(cls)
+        if instance is None:
+            instance = _SHARED.setdefault(cls, cls._build())
+        return instance
+
+    @classmethod
+    def _build(cls) -> "Quantity":
+        """Builds the shared instance and its conversion tables from the class data"""
+
+        instance = object.__new__(cls)
+        names = tuple(unit[0] for unit in cls.UNITS)
+        factors = tuple(float(unit[1]) for unit in cls.UNITS)
+        offsets = tuple(float(_offset(unit)) for unit in cls.UNITS)
+        to_base = dict(zip(names, factors))
+
+        # Converting unit i to unit j is (v * f_i + o_i - o_j) / f_j. With
+        # offsets, each pair is composed exactly and rounded once
+        if any(offsets):
+            pairs = [[_compose(source, target) for target in cls.UNITS] for source in cls.UNITS]
+            matrix = np.array([[float(factor) for factor, _ in row] for row in pairs])
+            offset_matrix = np.array([[float(offset) for _, offset in row] for row in pairs])
+        else:
+            scale = np.array(factors)
+            matrix = scale[:, np.newaxis] / scale[np.newaxis, :]
+            offset_matrix = np.zeros_like(matrix)
+        matrix.flags.writeable = False
+        offset_matrix.flags.writeable = False
+
+        for attribute, value in (
+            ("name", cls.NAME),
+            ("id", cls.NAME.lower()),
+            ("units", MappingProxyType(to_base)),
+            ("factors", factors),
+            ("offsets", offsets),
+            ("affine", any(offsets)),
+            ("unit_index", MappingProxyType({unit: i for i, unit in enumerate(names)})),
+            ("factor_matrix", matrix),
+            ("offset_matrix", offset_matrix),
+            ("_to_base", to_base),
+        ):
+            object.__setattr__(instance, attribute, value)
+        return instance
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self) -> Tuple[Type["Quantity"], Tuple[()]]:
+        # Unpickling and copying return the shared instance
+        return type(self), ()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+    def get_units(self) -> Mapping[str, float]:
         """
         Returns the dictionary of the quantities corresponding
         units and their conversion factor.
         """
         return self.units
 
-    def conversion(self, scalar: float, from_unit: str, to_unit: str) -> float:
+    def conversion(
+        self, scalar: ExactValue, from_unit: str, to_unit: str, exact: bool = False
+    ) -> Union[float, Fraction]:
         """
         Method handles conversions from a unit to aother. This is implemented
         by relating every unit to the base unit.
 
         Args:
-            scalar (float): The scalar value (distance)
+            scalar (ExactValue): The scalar value (distance)
             from_unit (str): The unit which the user want to convert from
             to_unit (str): The unit which the user wats to convert to
+            exact (bool): Convert with rational arithmetic. Floats are taken
+                as the decimal they are written as, e.g. 0.1 as 1/10.
 
         Returns:
-            float: the value of the conversion
+            float: the value of the conversion, or a Fraction if exact
         """
 
-        base_unit: float = scalar * self.units[from_unit]
-        conversion: float = base_unit / self.units[to_unit]
+        if exact:
+            exact_factor, exact_offset = self.exact_transform(from_unit, to_unit)
+            return to_fraction(scalar) * exact_factor + exact_offset
+
+        value = float(scalar)
+        if self.affine:
+            factor, offset = self.transform(from_unit, to_unit)
+            return value * factor + offset
+
+        base_unit: float = value * self._to_base[from_unit]
+        conversion: float = base_unit / self._to_base[to_unit]
 
         return conversion
 
+    def factor(self, from_unit: str, to_unit: str) -> float:
+        """
+        Returns the factor that converts a value in from_unit to to_unit.
+
+        Raises:
+            KeyError: if either unit does not belong to the quantity.
+        """
+
+        index = self.unit_index
+        return float(self.factor_matrix[index[from_unit], index[to_unit]])
+
+    def transform(self, from_unit: str, to_unit: str) -> Tuple[float, float]:
+        """
+        Returns the factor and offset that convert a value v in from_unit to
+        v * factor + offset in to_unit.
+
+        Raises:
+            KeyError: if either unit does not belong to the quantity.
+        """
+
+        i, j = self.unit_index[from_unit], self.unit_index[to_unit]
+        return float(self.factor_matrix[i, j]), float(self.offset_matrix[i, j])
+
+    def exact_factor(self, from_unit: str, to_unit: str) -> Fraction:
+        """
+        Returns the exact factor that converts a value in from_unit to
+        to_unit, computed once per unit pair.
+
+        Raises:
+            KeyError: if either unit does not belong to the quantity.
+        """
+        return self.exact_transform(from_unit, to_unit)[0]
+
+    def exact_transform(self, from_unit: str, to_unit: str) -> Tuple[Fraction, Fraction]:
+        """
+        Returns the exact factor and offset that convert a value in from_unit
+        to to_unit, computed once per unit pair.
+
+        Raises:
+            KeyError: if either unit does not belong to the quantity.
+        """
+
+        return _exact_transform(self, from_unit, to_unit)
+
+    def convert_to_all(self, scalar: float, from_unit: str) -> np.ndarray:
+        """
+        Converts a value to every unit of the quantity in one pass over the
+        factor and offset matrix rows of `from_unit`.
+
+        Raises:
+            KeyError: if the unit does not belong to the quantity.
+
+        Returns:
+            np.ndarray: the value in each unit, in the order of get_units()
+        """
+        row = self.unit_index[from_unit]
+        values = scalar * self.factor_matrix[row]
+        if self.affine:
+            values += self.offset_matrix[row]
+        return values
+
+    def convert_many(self, values: FloatBuffer, from_unit: str, to_unit: str) -> FloatBuffer:
+        """
+        Converts every value of a float64 NumPy array or an array('d') buffer
+        from one unit to another in place, with one multiplication (and for
+        offset units one addition) per value and no intermediate copies.
+
+        Args:
+            values (FloatBuffer): The values to convert, overwritten with the result
+            from_unit (str): The unit which the values are in
+            to_unit (str): The unit which the values are converted to
+
+        Raises:
+            KeyError: if either unit does not belong to the quantity.
+            TypeError: if the values are not a writable buffer of floats.
+
+        Returns:
+            FloatBuffer: the same `values` object, now holding the converted values
+        """
+
+        factor, offset = self.transform(from_unit, to_unit)
+        return scale_in_place(values, factor, offset)
+
 
 class Length(Quantity):
     """
@@ -50,23 +311,23 @@ class Length(Quantity):
         Quantities (class): base class
     """
 
-    def __init__(self) -> None:
-        super().__init__()
-        self.name: str = "Length"
-        self.units: Dict[str, float] = {
-            "angstrom": 1.0E-10,
-            "nanometer": 1.0E-9,
-            "micrometer": 1.0E-6,
-            "millimeter": 1.0E-3,
-            "centimeter": 1.0E-2,
-            "decimeter": 1.0E-1,
-            "meter": 1.0,
-            "kilometer": 1.0E+3,
-            "inch": 0.0254,
-            "foot": 0.3048,
-            "yard": 0.9144,
-            "mile": 1609.34
-        }
+    __slots__ = ()
+
+    NAME = "Length"
+    UNITS = (
+        ("angstrom", Fraction("1.0E-10")),
+        ("nanometer", Fraction("1.0E-9")),
+        ("micrometer", Fraction("1.0E-6")),
+        ("millimeter", Fraction("1.0E-3")),
+        ("centimeter", Fraction("1.0E-2")),
+        ("decimeter", Fraction("1.0E-1")),
+        ("meter", Fraction("1.0")),
+        ("kilometer", Fraction("1.0E+3")),
+        ("inch", Fraction("0.0254")),
+        ("foot", Fraction("0.3048")),
+        ("yard", Fraction("0.9144")),
+        ("mile", Fraction("1609.344")),
+    )
 
 
 class Mass(Quantity):
@@ -78,22 +339,22 @@ class Mass(Quantity):
         Quantities (class): base class
     """
 
-    def __init__(self) -> None:
-        super().__init__()
-        self.name: str = "Mass"
-        self.units: Dict[str, float] = {
-            "atomic mass unit": 1.66E-24,
-            "nanogram": 1.0E-9,
-            "microgram": 1.0E-6,
-            "milligram": 1.0E-3,
-            "centigram": 1.0E-2,
-            "decimgram": 1.0E-1,
-            "gram": 1.0,
-            "kilogram": 1.0E+3,
-            "ounce": 28.349,
-            "pound": 453.59,
-            "ton": 907_184.74
-        }
+    __slots__ = ()
+
+    NAME = "Mass"
+    UNITS = (
+        ("atomic mass unit", Fraction("1.66E-24")),
+        ("nanogram", Fraction("1.0E-9")),
+        ("microgram", Fraction("1.0E-6")),
+        ("milligram", Fraction("1.0E-3")),
+        ("centigram", Fraction("1.0E-2")),
+        ("decimgram", Fraction("1.0E-1")),
+        ("gram", Fraction("1.0")),
+        ("kilogram", Fraction("1.0E+3")),
+        ("ounce", Fraction("28.349523125")),
+        ("pound", Fraction("453.59237")),
+        ("ton", Fraction("907184.74")),
+    )
 
 
 class Pressure(Quantity):
@@ -105,22 +366,22 @@ class Pressure(Quantity):
         Quantities (class): base class
     """
 
-    def __init__(self) -> None:
-        super().__init__()
-        self.name: str = "Pressure"
-        self.units: Dict[str, float] = {
-            "nanopascal": 1.0E-9,
-            "micropascal": 1.0E-6,
-            "millipascal": 1.0E-3,
-            "centipascal": 1.0E-2,
-            "decipascal": 1.0E-1,
-            "pascal": 1.0,
-            "kilopascal": 1.0E+3,
-            "bar": 1.0E+5,
-            "psi": 6894.7572,
-            "ksi": 6894757.2932,
-            "atm": 101325
-        }
+    __slots__ = ()
+
+    NAME = "Pressure"
+    UNITS = (
+        ("nanopascal", Fraction("1.0E-9")),
+        ("micropascal", Fraction("1.0E-6")),
+        ("millipascal", Fraction("1.0E-3")),
+        ("centipascal", Fraction("1.0E-2")),
+        ("decipascal", Fraction("1.0E-1")),
+        ("pascal", Fraction("1.0")),
+        ("kilopascal", Fraction("1.0E+3")),
+        ("bar", Fraction("1.0E+5")),
+        ("psi", Fraction("6894.757293168361")),
+        ("ksi", Fraction("6894757.293168361")),
+        ("atm", Fraction(101325)),
+    )
 
 
 class Energy(Quantity):
@@ -132,27 +393,27 @@ class Energy(Quantity):
         Quantities (class): base class
     """
 
-    def __init__(self) -> None:
-        super().__init__()
-        self.name: str = "Energy"
-        self.units: Dict[str, float] = {
-            "nanojoule": 1.0E-9,
-            "microjoule": 1.0E-6,
-            "millijoule": 1.0E-3,
-            "centijoule": 1.0E-2,
-            "decijoule": 1.0E-1,
-            "joule": 1.0,
-            "kilojoule": 1.0E+3,
-            "megajoule": 1.0E+6,
-            "watt-hour": 3.6E+3,
-            "kilowatt-hour": 3.6E+6,
-            "megawatt-hour": 3.6E+6,
-            "calorie": 4186.8,
-            "electron-volt": 1.60217E-19,
-            "kiloelectron-volt": 1.60217E-16,
-            "megaelectron-volt": 1.60217E-13,
-            "erg": 1.0E-7,
-        }
+    __slots__ = ()
+
+    NAME = "Energy"
+    UNITS = (
+        ("nanojoule", Fraction("1.0E-9")),
+        ("microjoule", Fraction("1.0E-6")),
+        ("millijoule", Fraction("1.0E-3")),
+        ("centijoule", Fraction("1.0E-2")),
+        ("decijoule", Fraction("1.0E-1")),
+        ("joule", Fraction("1.0")),
+        ("kilojoule", Fraction("1.0E+3")),
+        ("megajoule", Fraction("1.0E+6")),
+        ("watt-hour", Fraction("3.6E+3")),
+        ("kilowatt-hour", Fraction("3.6E+6")),
+        ("megawatt-hour", Fraction("3.6E+9")),
+        ("calorie", Fraction("4186.8")),
+        ("electron-volt", Fraction("1.60217E-19")),
+        ("kiloelectron-volt", Fraction("1.60217E-16")),
+        ("megaelectron-volt", Fraction("1.60217E-13")),
+        ("erg", Fraction("1.0E-7")),
+    )
 
 
 class Speed(Quantity):
@@ -164,32 +425,32 @@ class Speed(Quantity):
         Quantities (class): base class
     """
 
-    def __init__(self) -> None:
-        super().__init__()
-        self.name: str = "Speed"
-        self.units: Dict[str, float] = {
-            "mm/s": 1.0E-3,
-            "mm/min": 1.66666E-5,
-            "mm/h": 2.77777E-7,
-            "cm/s": 1.0E-2,
-            "cm/min": 1.66666E-4,
-            "cm/hr": 2.7778E-6,
-            "m/s": 1.0,
-            "m/min": 1.66666E-2,
-            "m/h": 2.7777E-4,
-            "km/s": 1.0E+3,
-            "km/min": 16.66666,
-            "km/h": 0.277777,
-            "ft/s": 0.3048,
-            "ft/min": 5.08E-3,
-            "ft/h": 8.46667E-5,
-            "yd/s": 0.9144,
-            "yd/min": 1.524E-2,
-            "yd/h": 2.54E-4,
-            "mi/s": 1609.344,
-            "mi/min": 26.8224,
-            "mi/h": 0.44704,
-        }
+    __slots__ = ()
+
+    NAME = "Speed"
+    UNITS = (
+        ("mm/s", Fraction(1, 1000)),
+        ("mm/min", Fraction(1, 1000 * 60)),
+        ("mm/h", Fraction(1, 1000 * 3600)),
+        ("cm/s", Fraction(1, 100)),
+        ("cm/min", Fraction(1, 100 * 60)),
+        ("cm/hr", Fraction(1, 100 * 3600)),
+        ("m/s", Fraction(1)),
+        ("m/min", Fraction(1, 60)),
+        ("m/h", Fraction(1, 3600)),
+        ("km/s", Fraction(1000)),
+        ("km/min", Fraction(1000, 60)),
+        ("km/h", Fraction(1000, 3600)),
+        ("ft/s", Fraction("0.3048")),
+        ("ft/min", Fraction("0.3048") / 60),
+        ("ft/h", Fraction("0.3048") / 3600),
+        ("yd/s", Fraction("0.9144")),
+        ("yd/min", Fraction("0.9144") / 60),
+        ("yd/h", Fraction("0.9144") / 3600),
+        ("mi/s", Fraction("1609.344")),
+        ("mi/min", Fraction("1609.344") / 60),
+        ("mi/h", Fraction("1609.344") / 3600),
+    )
 
 
 class Force(Quantity):
@@ -201,21 +462,21 @@ class Force(Quantity):
         Quantities (class): base class
     """
 
-    def __init__(self) -> None:
-        super().__init__()
-        self.name: str = "Force"
-        self.units: Dict[str, float] = {
-            "nanonewton": 1.0E-9,
-            "micronewton": 1.0E-6,
-            "millinewton": 1.0E-3,
-            "centinewton": 1.0E-2,
-            "decinewton": 1.0E-1,
-            "newton": 1.0,
-            "kilonewton": 1.0E+3,
-            "meganewton": 1.0E+6,
-            "pound-force": 4.44822,
-            "ounce-fource": 0.27801
-        }
+    __slots__ = ()
+
+    NAME = "Force"
+    UNITS = (
+        ("nanonewton", Fraction("1.0E-9")),
+        ("micronewton", Fraction("1.0E-6")),
+        ("millinewton", Fraction("1.0E-3")),
+        ("centinewton", Fraction("1.0E-2")),
+        ("decinewton", Fraction("1.0E-1")),
+        ("newton", Fraction("1.0")),
+        ("kilonewton", Fraction("1.0E+3")),
+        ("meganewton", Fraction("1.0E+6")),
+        ("pound-force", Fraction("4.4482216152605")),
+        ("ounce-fource", Fraction("0.27801385095378125")),
+    )
 
 
 class Time(Quantity):
@@ -227,18 +488,50 @@ class Time(Quantity):
         Quantity (class): base Cass
     """
 
-    def __init__(self) -> None:
-        super().__init__()
-        self.name: str = "Time"
-        self.units: Dict[str, float] = {
-            "nanosecond": 1.0E-9,
-            "microsecond": 1.0E-6,
-            "millisecond": 1.0E-3,
-            "second": 1.0,
-            "minute": 60,
-            "hour": 3600,
-            "day": 8.64E+5,
-            "week": 6.048E+5,
-            "month": 2.628E+6,
-            "year": 3.15576E+7,
-        }
+    __slots__ = ()
+
+    NAME = "Time"
+    UNITS = (
+        ("nanosecond", Fraction("1.0E-9")),
+        ("microsecond", Fraction("1.0E-6")),
+        ("millisecond", Fraction("1.0E-3")),
+        ("second", Fraction("1.0")),
+        ("minute", Fraction(60)),
+        ("hour", Fraction(3600)),
+        ("day", Fraction("8.64E+4")),
+        ("week", Fraction("6.048E+5")),
+        ("month", Fraction("2.628E+6")),
+        ("year", Fraction("3.15576E+7")),
+    )
+
+
+class Temperature(Quantity):
+    """
+    Represents the set of units of temperature.
+    The base unit for the conversion method is kelvin [K]. Unlike the other
+    quantities, units are offset from the base unit as well as scaled.
+
+    Args:
+        Quantity (class): base class
+    """
+
+    __slots__ = ()
+
+    NAME = "Temperature"
+    UNITS = (
+        ("kelvin", Fraction(1)),
+        ("celsius", Fraction(1), Fraction("273.15")),
+        ("fahrenheit", Fraction(5, 9), Fraction(45967, 180)),
+        ("rankine", Fraction(5, 9)),
+    )
+
+
+# Every quantity shipped with the app, in the order they are listed
+QUANTITIES: Tuple[Type[Quantity], ...] = (
+    Length, Time, Mass, Force, Energy, Pressure, Speed, Temperature
+)
+
+
+def catalog() -> Tuple[Quantity, ...]:
+    """The shared instances of every quantity shipped with the app"""
+    return tuple(quantity() for quantity in QUANTITIES)
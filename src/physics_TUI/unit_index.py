@@ -0,0 +1,138 @@
+"""
+Index of every unit name and symbol across all quantities, so that a unit
+can be found without first choosing its quantity. Keys are case folded and
+kept in a sorted list: exact lookups are a dictionary hit and prefix
+lookups a binary search, whatever the size of the catalog. When nothing
+matches, close spellings with the same first letter are suggested instead.
+"""
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from difflib import get_close_matches
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .unit_converter import Quantity
+
+
+@dataclass(frozen=True)
+class UnitMatch:
+    """A unit found in the index, with the name or symbol it was found by"""
+
+    key: str
+    quantity_id: str
+    unit: str
+
+
+class UnitIndex:
+    """
+    Sorted index of unit names and aliases. Lookups fold case, except that a
+    key matching a unit exactly wins, so `mN` and `MN` stay distinct.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, str, str]]) -> None:
+        """
+        Args:
+            entries: (name or alias, quantity id, unit) triples
+        """
+
+        matches = sorted(
+            {UnitMatch(key, quantity_id, unit) for key, quantity_id, unit in entries},
+            key=lambda match: (match.key.casefold(), match.key, match.quantity_id),
+        )
+        self._matches: List[UnitMatch] = matches
+        self._folded: List[str] = [match.key.casefold() for match in matches]
+        self._exact: Dict[str, UnitMatch] = {}
+        self._by_folded: Dict[str, List[UnitMatch]] = {}
+        for folded, match in zip(self._folded, matches):
+            self._exact.setdefault(match.key, match)
+            self._by_folded.setdefault(folded, []).append(match)
+
+    @classmethod
+    def from_quantities(
+        cls, quantities: Iterable[Quantity], aliases: Optional[Dict[str, Tuple[str, str]]] = None
+    ) -> "UnitIndex":
+        """
+        Builds the index of every unit of `quantities`, plus `aliases` given
+        as {alias: (quantity id, unit)}.
+        """
+
+        entries = [
+            (unit, quantity.id, unit) for quantity in quantities for unit in quantity.get_units()
+        ]
+        entries += [(alias, quantity_id, unit) for alias, (quantity_id, unit) in (aliases or {}).items()]
+        return cls(entries)
+
+    def __len__(self) -> int:
+        return len(self._matches)
+
+    def resolve(self, text: str) -> Optional[UnitMatch]:
+        """
+        Returns the unit named exactly by `text`, ignoring case unless that
+        is ambiguous, or None.
+        """
+
+        text = text.strip()
+        match = self._exact.get(text)
+        if match is not None:
+            return match
+        candidates = self._by_folded.get(text.casefold(), [])
+        if len({(match.quantity_id, match.unit) for match in candidates}) == 1:
+            return candidates[0]
+        return None
+
+    def prefix(self, text: str, limit: int = 10) -> List[UnitMatch]:
+        """Returns up to `limit` units whose name or alias starts with `text`"""
+
+        folded = text.strip().casefold()
+        found: List[UnitMatch] = []
+        for i in range(bisect_left(self._folded, folded), len(self._folded)):
+            if len(found) == limit or not self._folded[i].startswith(folded):
+                break
+            found.append(self._matches[i])
+        return found
+
+    def search(self, text: str, limit: int = 10) -> List[UnitMatch]:
+        """
+        Returns the exact match and then prefix matches of `text`, or if
+        there are none the units spelled closest to it.
+        """
+
+        exact = self.resolve(text)
+        found = [exact] if exact is not None else []
+        found += [match for match in self.prefix(text, limit) if match not in found]
+        if found:
+            return found[:limit]
+
+        # Only keys with the same first letter are compared, which keeps a
+        # misspelling cheap to look up in a large catalog
+        folded = text.strip().casefold()
+        start = bisect_left(self._folded, folded[:1])
+        end = bisect_left(self._folded, folded[:1] + "\U0010ffff")
+        candidates = dict.fromkeys(self._folded[start:end])
+        close = get_close_matches(folded, candidates, n=limit, cutoff=0.6)
+        return [self._by_folded[key][0] for key in close]
+
+
+# Symbols of units outside the unit parser, which only handles linear units
+TEMPERATURE_SYMBOLS: Dict[str, Tuple[str, str]] = {
+    "K": ("temperature", "kelvin"),
+    "°C": ("temperature", "celsius"),
+    "degC": ("temperature", "celsius"),
+    "°F": ("temperature", "fahrenheit"),
+    "degF": ("temperature", "fahrenheit"),
+    "°R": ("temperature", "rankine"),
+    "degR": ("temperature", "rankine"),
+}
+
+
+@lru_cache(maxsize=None)
+def default_unit_index() -> UnitIndex:
+    """Index of the units of every registered quantity and their usual symbols"""
+
+    from .registry import default_registry
+    from .unit_parser import SYMBOLS
+
+    return UnitIndex.from_quantities(
+        default_registry().get_quantities(), {**SYMBOLS, **TEMPERATURE_SYMBOLS}
+    )
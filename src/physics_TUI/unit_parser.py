@@ -0,0 +1,409 @@
+"""
+Parser for compound unit expressions such as `N·m`, `kg/m³`, `ft*lbf` or
+`m/s^2`. Every unit of the `unit_converter` quantities, by name or by its
+usual symbol, is an atom with a dimension over mass, length and time and a
+scale factor to SI. Expressions combine atoms with products (`*`, `·`, `×`
+or a space), quotients (`/`), powers (`^`, `**`, trailing digits as in `s-2`,
+or superscripts) and parentheses, and reduce to a `CompoundUnit`. Parsed
+expressions are cached, so parsing the same text again is a dictionary hit.
+
+Values typed with a unit, such as `36 km/h`, are parsed by
+`parse_measurement` and converted to the unit of an equation variable,
+taken from the parentheses ending its description, by `parse_value`.
+"""
+
+import re
+from dataclasses import dataclass
+from math import pi
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+Dimension = Tuple[int, int, int]  # exponents of mass, length and time
+
+BASE_SYMBOLS: Tuple[str, ...] = ("kg", "m", "s")
+
+# Dimension of each quantity id and the SI value of its base unit
+QUANTITY_DIMENSIONS: Dict[str, Dimension] = {
+    "mass": (1, 0, 0),
+    "length": (0, 1, 0),
+    "time": (0, 0, 1),
+    "speed": (0, 1, -1),
+    "force": (1, 1, -2),
+    "energy": (1, 2, -2),
+    "pressure": (1, -1, -2),
+}
+BASE_SCALES: Dict[str, float] = {"mass": 1.0E-3}  # the Mass table is in grams
+
+# Usual symbols and abbreviations of the units in the quantity tables
+SYMBOLS: Dict[str, Tuple[str, str]] = {
+    "Å": ("length", "angstrom"),
+    "nm": ("length", "nanometer"),
+    "µm": ("length", "micrometer"),
+    "um": ("length", "micrometer"),
+    "mm": ("length", "millimeter"),
+    "cm": ("length", "centimeter"),
+    "dm": ("length", "decimeter"),
+    "m": ("length", "meter"),
+    "km": ("length", "kilometer"),
+    "in": ("length", "inch"),
+    "ft": ("length", "foot"),
+    "yd": ("length", "yard"),
+    "mi": ("length", "mile"),
+    "u": ("mass", "atomic mass unit"),
+    "amu": ("mass", "atomic mass unit"),
+    "ng": ("mass", "nanogram"),
+    "µg": ("mass", "microgram"),
+    "ug": ("mass", "microgram"),
+    "mg": ("mass", "milligram"),
+    "cg": ("mass", "centigram"),
+    "dg": ("mass", "decimgram"),
+    "g": ("mass", "gram"),
+    "kg": ("mass", "kilogram"),
+    "oz": ("mass", "ounce"),
+    "lb": ("mass", "pound"),
+    "ns": ("time", "nanosecond"),
+    "µs": ("time", "microsecond"),
+    "us": ("time", "microsecond"),
+    "ms": ("time", "millisecond"),
+    "s": ("time", "second"),
+    "min": ("time", "minute"),
+    "h": ("time", "hour"),
+    "hr": ("time", "hour"),
+    "d": ("time", "day"),
+    "wk": ("time", "week"),
+    "mo": ("time", "month"),
+    "yr": ("time", "year"),
+    "mph": ("speed", "mi/h"),
+    "nN": ("force", "nanonewton"),
+    "µN": ("force", "micronewton"),
+    "uN": ("force", "micronewton"),
+    "mN": ("force", "millinewton"),
+    "cN": ("force", "centinewton"),
+    "dN": ("force", "decinewton"),
+    "N": ("force", "newton"),
+    "kN": ("force", "kilonewton"),
+    "MN": ("force", "meganewton"),
+    "lbf": ("force", "pound-force"),
+    "ozf": ("force", "ounce-fource"),
+    "nJ": ("energy", "nanojoule"),
+    "µJ": ("energy", "microjoule"),
+    "uJ": ("energy", "microjoule"),
+    "mJ": ("energy", "millijoule"),
+    "cJ": ("energy", "centijoule"),
+    "dJ": ("energy", "decijoule"),
+    "J": ("energy", "joule"),
+    "kJ": ("energy", "kilojoule"),
+    "MJ": ("energy", "megajoule"),
+    "Wh": ("energy", "watt-hour"),
+    "kWh": ("energy", "kilowatt-hour"),
+    "MWh": ("energy", "megawatt-hour"),
+    "cal": ("energy", "calorie"),
+    "eV": ("energy", "electron-volt"),
+    "keV": ("energy", "kiloelectron-volt"),
+    "MeV": ("energy", "megaelectron-volt"),
+    "nPa": ("pressure", "nanopascal"),
+    "µPa": ("pressure", "micropascal"),
+    "uPa": ("pressure", "micropascal"),
+    "mPa": ("pressure", "millipascal"),
+    "cPa": ("pressure", "centipascal"),
+    "dPa": ("pressure", "decipascal"),
+    "Pa": ("pressure", "pascal"),
+    "kPa": ("pressure", "kilopascal"),
+}
+
+# Number at the start of a measurement such as "36 km/h" or "-1.5e3 N"
+MEASUREMENT = re.compile(r"\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*(.*?)\s*$")
+
+# Unit at the end of a variable description, e.g. "Initial velocity (m/s)"
+DESCRIPTION_UNIT = re.compile(r"\(([^()]+)\)\s*$")
+
+SUPERSCRIPTS = str.maketrans("⁰¹²³⁴⁵⁶⁷⁸⁹⁻⁺", "0123456789-+")
+
+TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<name>[^\W\d_¹²³⁰⁴-⁹]+(?:-[^\W\d_¹²³⁰⁴-⁹]+)*)(?P<power>-?\d+)?
+      | (?P<superscript>[⁻⁺]?[⁰¹²³⁴⁵⁶⁷⁸⁹]+)
+      | (?P<number>[-+]?\d+)
+      | (?P<op>\*\*|[*·⋅×/^()])
+    )""",
+    re.VERBOSE,
+)
+
+
+@dataclass(frozen=True)
+class CompoundUnit:
+    """
+    A unit reduced to its dimension over (mass, length, time) and the
+    factor that converts a value in the unit to SI base units.
+    """
+
+    scale: float
+    dimension: Dimension
+
+    def __mul__(self, other: "CompoundUnit") -> "CompoundUnit":
+        (m1, l1, t1), (m2, l2, t2) = self.dimension, other.dimension
+        return CompoundUnit(self.scale * other.scale, (m1 + m2, l1 + l2, t1 + t2))
+
+    def __truediv__(self, other: "CompoundUnit") -> "CompoundUnit":
+        (m1, l1, t1), (m2, l2, t2) = self.dimension, other.dimension
+        return CompoundUnit(self.scale / other.scale, (m1 - m2, l1 - l2, t1 - t2))
+
+    def __pow__(self, exponent: int) -> "CompoundUnit":
+        m, l, t = self.dimension
+        return CompoundUnit(self.scale**exponent, (m * exponent, l * exponent, t * exponent))
+
+    def factor_to(self, other: "CompoundUnit") -> float:
+        """
+        Returns the factor converting a value in this unit to `other`.
+
+        Raises:
+            ValueError: if the units have different dimensions.
+        """
+
+        if self.dimension != other.dimension:
+            raise ValueError(
+                f"Cannot convert {format_dimension(self.dimension)} "
+                f"to {format_dimension(other.dimension)}"
+            )
+        return self.scale / other.scale
+
+    def __str__(self) -> str:
+        return f"{self.scale:g} {format_dimension(self.dimension)}"
+
+
+DIMENSIONLESS = CompoundUnit(1.0, (0, 0, 0))
+
+# Units used by the chapters, and units of power, that are not in the quantity tables
+EXTRA_ATOMS: Dict[str, CompoundUnit] = {
+    "W": CompoundUnit(1.0, (1, 2, -3)),
+    "kW": CompoundUnit(1.0E+3, (1, 2, -3)),
+    "hp": CompoundUnit(745.69987158227022, (1, 2, -3)),  # mechanical horsepower
+    "rad": DIMENSIONLESS,
+    "deg": CompoundUnit(pi / 180, (0, 0, 0)),
+    "degree": CompoundUnit(pi / 180, (0, 0, 0)),
+}
+
+
+def format_dimension(dimension: Dimension) -> str:
+    """Canonical SI form of a dimension, e.g. `kg·m²·s⁻²`"""
+
+    parts = []
+    for symbol, exponent in zip(BASE_SYMBOLS, dimension):
+        if exponent == 1:
+            parts.append(symbol)
+        elif exponent:
+            parts.append(symbol + str(exponent).translate(str.maketrans("0123456789-", "⁰¹²³⁴⁵⁶⁷⁸⁹⁻")))
+    return "·".join(parts) or "1"
+
+
+@lru_cache(maxsize=None)
+def unit_atoms() -> Dict[str, CompoundUnit]:
+    """
+    Every unit name and symbol that can appear in an expression. Names come
+    from the registered quantities, except those containing `/` or spaces,
+    which are parsed as expressions or reached through their symbols.
+    """
+
+    from .registry import default_registry
+
+    registry = default_registry()
+    atoms: Dict[str, CompoundUnit] = {}
+
+    def atom(quantity_id: str, unit: str) -> CompoundUnit:
+        factor = registry.quantity(quantity_id).get_units()[unit]
+        return CompoundUnit(
+            factor * BASE_SCALES.get(quantity_id, 1.0), QUANTITY_DIMENSIONS[quantity_id]
+        )
+
+    for quantity_id in QUANTITY_DIMENSIONS:
+        for unit in registry.quantity(quantity_id).get_units():
+            if "/" not in unit and " " not in unit:
+                atoms[unit] = atom(quantity_id, unit)
+    for symbol, (quantity_id, unit) in SYMBOLS.items():
+        atoms[symbol] = atom(quantity_id, unit)
+    atoms.update(EXTRA_ATOMS)
+    return atoms
+
+
+@lru_cache(maxsize=4096)
+def parse_unit(expression: str) -> CompoundUnit:
+    """
+    Parses a unit expression into its scale and dimension.
+
+    Raises:
+        ValueError: if the expression is malformed or names an unknown unit.
+    """
+
+    parser = _Parser(_tokenize(expression), expression)
+    unit = parser.expression()
+    if parser.peek() is not None:
+        raise ValueError(f"Invalid unit expression: {expression}")
+    return unit
+
+
+def conversion_factor(from_expression: str, to_expression: str) -> float:
+    """
+    Returns the factor converting a value in one unit expression to another.
+
+    Raises:
+        ValueError: if an expression cannot be parsed or the dimensions differ.
+    """
+    return parse_unit(from_expression).factor_to(parse_unit(to_expression))
+
+
+def convert(value: float, from_expression: str, to_expression: str) -> float:
+    """Converts a value between two unit expressions of the same dimension"""
+    return value * conversion_factor(from_expression, to_expression)
+
+
+@lru_cache(maxsize=4096)
+def parse_measurement(text: str) -> Tuple[float, Optional[CompoundUnit]]:
+    """
+    Splits text such as `36 km/h` into its number and parsed unit. Plain
+    numbers have no unit.
+
+    Raises:
+        ValueError: if the text is not a number optionally followed by a unit.
+    """
+
+    try:
+        return float(text), None
+    except ValueError:
+        pass
+
+    match = MEASUREMENT.match(text)
+    if match is None or not match.group(2):
+        raise ValueError(f"'{text.strip()}' is not a valid number")
+    return float(match.group(1)), parse_unit(match.group(2))
+
+
+@lru_cache(maxsize=None)
+def description_unit(description: str) -> Optional[CompoundUnit]:
+    """
+    The unit ending a variable description, e.g. m/s for "Initial velocity
+    (m/s)", or None if it has none that can be parsed.
+    """
+
+    match = DESCRIPTION_UNIT.search(description)
+    if match is None:
+        return None
+    try:
+        return parse_unit(match.group(1))
+    except ValueError:
+        return None
+
+
+def parse_value(text: str, unit: Optional[CompoundUnit] = None) -> float:
+    """
+    Parses a number with an optional unit and returns it in `unit`.
+
+    Raises:
+        ValueError: if the text cannot be parsed, has a unit when `unit` is
+            None, or has a unit of a different dimension.
+    """
+
+    value, given = parse_measurement(text)
+    if given is None:
+        return value
+    if unit is None:
+        raise ValueError(f"'{text.strip()}' has a unit, but the variable's unit is not known")
+    return value * given.factor_to(unit)
+
+
+Token = Tuple[str, str]  # kind and text
+
+
+def _tokenize(expression: str) -> List[Token]:
+    tokens: List[Token] = []
+    position = 0
+    expression = expression.rstrip()
+    while position < len(expression):
+        match = TOKEN.match(expression, position)
+        if match is None:
+            raise ValueError(f"Invalid unit expression: {expression}")
+        position = match.end()
+        kind = match.lastgroup if match.lastgroup != "power" else "name"
+        if kind == "name":
+            tokens.append(("name", match.group("name")))
+            if match.group("power"):
+                tokens += [("op", "^"), ("number", match.group("power"))]
+        elif kind == "superscript":
+            tokens += [("op", "^"), ("number", match.group(kind).translate(SUPERSCRIPTS))]
+        else:
+            tokens.append((kind, match.group(kind)))
+    return tokens
+
+
+class _Parser:
+    """Recursive descent over the tokens of one expression"""
+
+    def __init__(self, tokens: List[Token], expression: str) -> None:
+        self.tokens = tokens
+        self.position = 0
+        self.text = expression
+
+    def peek(self) -> Optional[Token]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def take(self) -> Token:
+        token = self.peek()
+        if token is None:
+            raise ValueError(f"Invalid unit expression: {self.text}")
+        self.position += 1
+        return token
+
+    def expression(self) -> CompoundUnit:
+        # expression := power (("*" | "/" | juxtaposition) power)*
+        unit = self.power()
+        while True:
+            token = self.peek()
+            if token is None or token == ("op", ")"):
+                return unit
+            if token[1] == "/":
+                self.take()
+                unit = unit / self.power()
+            elif token[1] in ("*", "·", "⋅", "×"):
+                self.take()
+                unit = unit * self.power()
+            elif token[0] == "name" or token == ("op", "("):
+                unit = unit * self.power()
+            else:
+                raise ValueError(f"Invalid unit expression: {self.text}")
+
+    def power(self) -> CompoundUnit:
+        # power := atom (("^" | "**") number)?
+        unit = self.atom()
+        if self.peek() in (("op", "^"), ("op", "**")):
+            self.take()
+            kind, text = self.take()
+            if kind != "number":
+                raise ValueError(f"Invalid unit expression: {self.text}")
+            unit = unit ** int(text)
+        return unit
+
+    def atom(self) -> CompoundUnit:
+        # atom := name | "1" | "(" expression ")"
+        kind, text = self.take()
+        if kind == "name":
+            return _lookup_atom(text)
+        if (kind, text) == ("number", "1"):
+            return DIMENSIONLESS
+        if (kind, text) == ("op", "("):
+            unit = self.expression()
+            if self.take() != ("op", ")"):
+                raise ValueError(f"Invalid unit expression: {self.text}")
+            return unit
+        raise ValueError(f"Invalid unit expression: {self.text}")
+
+
+def _lookup_atom(name: str) -> CompoundUnit:
+    atoms = unit_atoms()
+    name = name.replace("μ", "µ")  # Greek mu for the micro sign
+    unit = atoms.get(name)
+    if unit is None and len(name) > 3:
+        # Full names are matched case-insensitively and in the plural, e.g. "Meters"
+        name = name.lower()
+        unit = atoms.get(name) or (atoms.get(name[:-1]) if name.endswith("s") else None)
+    if unit is None:
+        raise ValueError(f"Unknown unit: {name}")
+    return unit
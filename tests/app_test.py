@@ -0,0 +1,179 @@
+import threading
+import unittest
+from typing import Dict
+from unittest import mock
+
+from textual.pilot import Pilot
+from textual.widgets import DataTable, Input, Static
+
+from physics_TUI.app import CONVERSION_DEBOUNCE, CalculatorScreen, UnitConverterScreen, physicsTUIApp
+from physics_TUI.chapters.chapter7 import Chapter7
+
+
+class TestCalculatorScreen(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests the calculator form running in the app.
+    """
+
+    async def test_invalid_value_keeps_running(self) -> None:
+        """
+        Function tests that a calculation raising an error is shown instead of closing the app.
+        """
+        chapter = Chapter7()
+        equation = next(eq for eq in chapter.equations if eq.name == "Kinetic energy")
+        app = physicsTUIApp()
+
+        async with app.run_test(size=(120, 50)) as pilot:
+            screen = CalculatorScreen(equation, chapter)
+            await app.push_screen(screen)
+            screen.query_one("#input-m", Input).value = "-1"
+            screen.query_one("#input-v", Input).value = "3"
+
+            await pilot.click("#calc-button")
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            self.assertTrue(app.is_running)
+            self.assertIs(app.screen, screen)
+            result = str(screen.query_one("#calc-result", Static).render())
+            self.assertIn("Mass must be greater than zero", result)
+
+    async def start_slow_calculation(self, pilot: Pilot, screen: CalculatorScreen, release: threading.Event) -> None:
+        """Starts a calculation that blocks its worker thread until `release` is set"""
+
+        def slow_solve(unknown: str, knowns: Dict[str, float]) -> float:
+            release.wait(5)
+            return 42.0
+
+        patcher = mock.patch.object(screen.equation, "solve", slow_solve)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(release.set)
+
+        screen.query_one("#input-m", Input).value = "2"
+        screen.query_one("#input-v", Input).value = "3"
+        await pilot.click("#calc-button")
+        await pilot.pause()
+
+    async def test_escape_discards_running_calculation(self) -> None:
+        """
+        Function tests that Escape cancels a running calculation and its result is never shown.
+        """
+        chapter = Chapter7()
+        equation = next(eq for eq in chapter.equations if eq.name == "Kinetic energy")
+        app = physicsTUIApp()
+        release = threading.Event()
+
+        async with app.run_test(size=(120, 50)) as pilot:
+            screen = CalculatorScreen(equation, chapter)
+            await app.push_screen(screen)
+            await self.start_slow_calculation(pilot, screen, release)
+            self.assertIn("Calculating", str(screen.query_one("#calc-result", Static).render()))
+
+            await pilot.press("escape")
+            release.set()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            self.assertIs(app.screen, screen)
+            self.assertIsNone(screen.calculation)
+            result = str(screen.query_one("#calc-result", Static).render())
+            self.assertIn("Calculation cancelled", result)
+            self.assertNotIn("42", result)
+
+    async def test_calculation_timeout(self) -> None:
+        """
+        Function tests that a calculation running longer than the screen's timeout is dropped.
+        """
+        chapter = Chapter7()
+        equation = next(eq for eq in chapter.equations if eq.name == "Kinetic energy")
+        app = physicsTUIApp()
+        release = threading.Event()
+
+        async with app.run_test(size=(120, 50)) as pilot:
+            screen = CalculatorScreen(equation, chapter, timeout=0.2)
+            await app.push_screen(screen)
+            await self.start_slow_calculation(pilot, screen, release)
+
+            await pilot.pause(0.5)
+            release.set()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            self.assertIs(app.screen, screen)
+            result = str(screen.query_one("#calc-result", Static).render())
+            self.assertIn("Calculation timed out after 0.2 seconds", result)
+            self.assertNotIn("42", result)
+
+
+class TestChapterPages(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests the cache of rendered chapter pages.
+    """
+
+    async def test_render_cache(self) -> None:
+        """
+        Function tests that a chapter page is rendered once per chapter and view and reused after a resize.
+        """
+        app = physicsTUIApp()
+
+        async with app.run_test(size=(120, 50)) as pilot:
+            chapter, other = app.registry.get_chapters()[:2]
+            with mock.patch.object(app, "render_equations", wraps=app.render_equations) as render:
+                app.show_chapter_page(chapter, "equations")
+                page = app.chapter_page(chapter, "equations")
+                app.show_chapter_page(chapter, "equations")
+                self.assertEqual(render.call_count, 1)
+
+                await pilot.resize_terminal(80, 40)
+                await pilot.pause()
+                self.assertIs(app.chapter_page(chapter, "equations"), page)
+                self.assertEqual(render.call_count, 1)
+
+                app.show_chapter_page(other, "equations")
+                self.assertEqual(render.call_count, 2)
+                self.assertIsNot(app.render_cache[(other.id, "equations")], page)
+
+            self.assertIsNot(app.chapter_page(chapter, "definitions"), page)
+            self.assertEqual(set(app.render_cache), {
+                (chapter.id, "equations"), (other.id, "equations"), (chapter.id, "definitions"),
+            })
+            content = str(app.query_one("#content", Static).render())
+            self.assertIn(other.title.upper(), content)
+
+
+class TestUnitConverterScreen(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests the all-units table of the unit converter.
+    """
+
+    async def test_all_units_table(self) -> None:
+        """
+        Function tests that the table shows the typed value in every unit once typing pauses.
+        """
+        app = physicsTUIApp()
+
+        async with app.run_test(size=(120, 50)) as pilot:
+            screen = UnitConverterScreen(app.registry)
+            await app.push_screen(screen)
+            table = screen.query_one("#all-units-table", DataTable)
+            value = screen.query_one("#unit-converter-input", Input)
+
+            screen.select_unit("length", "meter")
+            value.value = "1000"
+            await pilot.pause(CONVERSION_DEBOUNCE * 3)
+
+            units = list(screen.registry.quantity("length").get_units())
+            rows = {unit: shown for unit, shown in map(table.get_row_at, range(table.row_count))}
+            self.assertEqual(list(rows), units)
+            self.assertEqual(rows["meter"], "1000")
+            self.assertEqual(rows["kilometer"], "1")
+            self.assertEqual(rows["foot"], "3280.84")
+
+            value.value = "2500"
+            await pilot.pause(CONVERSION_DEBOUNCE * 3)
+            self.assertEqual(table.get_row_at(units.index("kilometer")), ["kilometer", "2.5"])
+
+            value.value = "25e"
+            await pilot.pause(CONVERSION_DEBOUNCE * 3)
+            self.assertEqual(table.row_count, 0)
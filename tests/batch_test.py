@@ -0,0 +1,85 @@
+import io
+import json
+import unittest
+
+from physics_TUI.base_chapter import Equation
+from physics_TUI.batch import BatchSolver, run_batch
+from physics_TUI.registry import default_registry
+
+
+def solver_for(equation_id: str, unknown: str, workers: int = 0) -> BatchSolver:
+    """Batch solver for a registered equation, run in-process by default"""
+    registry = default_registry()
+    equation = registry.equation(equation_id)
+    return BatchSolver(equation, unknown, registry.chapter_of(equation).var_mapping, workers)
+
+
+class TestBatch(unittest.TestCase):
+    """
+    Tests streaming rows through the batch solver.
+    """
+
+    def test_csv(self) -> None:
+        """
+        Function tests solving CSV rows, with failures reported per row.
+        """
+        source = io.StringIO("id,t,x_0,v_0,a\n1,2,0,3,1\n2,abc,0,3,1\n3,-1,0,3,1\n")
+        sink = io.StringIO()
+
+        stats = run_batch(solver_for("ch3.position_from_vel_and_accel", "x_f"), source, sink, chunk_size=2)
+
+        self.assertEqual((stats.rows, stats.failed), (3, 2))
+        self.assertEqual(
+            sink.getvalue().splitlines(),
+            [
+                "id,t,x_0,v_0,a,x_f,error",
+                "1,2,0,3,1,8.0,",
+                "2,abc,0,3,1,,'abc' is not a valid number for t",
+                "3,-1,0,3,1,,Time cannot be a negative value",
+            ],
+        )
+
+    def test_jsonl(self) -> None:
+        """
+        Function tests solving JSON Lines with display symbols as keys.
+        """
+        source = io.StringIO('{"K": 9.0, "m": 2.0}\n\n{"K": 8.0, "m": 4.0}\n')
+        sink = io.StringIO()
+
+        run_batch(solver_for("ch7.kinetic_energy", "v"), source, sink, "jsonl")
+
+        rows = [json.loads(line) for line in sink.getvalue().splitlines()]
+        self.assertAlmostEqual(rows[0]["velocity"], 3.0)
+        self.assertAlmostEqual(rows[1]["velocity"], 2.0)
+        self.assertEqual(rows[1]["error"], "")
+
+    def test_missing_column(self) -> None:
+        """
+        Function tests that an input without a known variable is rejected.
+        """
+        with self.assertRaises(ValueError) as context:
+            run_batch(
+                solver_for("ch7.kinetic_energy", "velocity"),
+                io.StringIO("kinetic_E\n9.0\n"),
+                io.StringIO(),
+            )
+
+        self.assertEqual(str(context.exception), "Missing columns for: mass")
+
+    def test_calculation_fallback(self) -> None:
+        """
+        Function tests rows solved through a calculation without an array solver.
+        """
+
+        def double(x=None, y=None):
+            if x is None:
+                return y / 2
+            return 2 * x
+
+        equation = Equation(name="Double", formula="y = 2x", variables={}, calculation=double)
+        sink = io.StringIO()
+
+        stats = run_batch(BatchSolver(equation, "y", workers=0), io.StringIO("x\n1\n\n2.5\n"), sink)
+
+        self.assertEqual(stats.rows, 2)
+        self.assertEqual(sink.getvalue().splitlines()[1:], ["1,2.0,", "2.5,5.0,"])
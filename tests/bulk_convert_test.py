@@ -0,0 +1,58 @@
+import io
+import unittest
+
+import numpy as np
+
+from physics_TUI.bulk_convert import convert_csv, convert_raw
+from physics_TUI.unit_converter import Length
+
+
+class TestBulkConvert(unittest.TestCase):
+    """
+    Tests streaming unit conversion of CSV and raw float files.
+    """
+
+    def test_csv(self) -> None:
+        """
+        Function tests converting one CSV column, keeping cells that are not numbers.
+        """
+        source = io.StringIO("t,d,note\n0,1,a\n1,2.5,\n2,x,b\n")
+        sink = io.StringIO()
+
+        stats = convert_csv(Length(), "kilometer", "meter", source, sink, ["d"], chunk_size=2)
+
+        self.assertEqual((stats.rows, stats.failed), (3, 1))
+        self.assertEqual(
+            sink.getvalue().splitlines(),
+            ["t,d,note", "0,1000.0,a", "1,2500.0,", "2,x,b"],
+        )
+
+    def test_csv_missing_column(self) -> None:
+        """
+        Function tests that a column missing from the header is rejected.
+        """
+        with self.assertRaises(ValueError) as context:
+            convert_csv(Length(), "meter", "foot", io.StringIO("a\n1\n"), io.StringIO(), ["d"])
+
+        self.assertEqual(str(context.exception), "Missing columns: d")
+
+    def test_raw(self) -> None:
+        """
+        Function tests converting packed floats across several blocks.
+        """
+        values = np.arange(25, dtype=np.float32)
+        sink = io.BytesIO()
+
+        stats = convert_raw(
+            Length(), "meter", "centimeter", io.BytesIO(values.tobytes()), sink, "float32", chunk_size=4
+        )
+
+        self.assertEqual(stats.rows, 25)
+        np.testing.assert_allclose(np.frombuffer(sink.getvalue(), dtype=np.float32), values * 100)
+
+    def test_raw_partial_value(self) -> None:
+        """
+        Function tests that input ending partway through a value is rejected.
+        """
+        with self.assertRaises(ValueError):
+            convert_raw(Length(), "meter", "foot", io.BytesIO(bytes(12)), io.BytesIO())
@@ -57,6 +57,27 @@ class Testposition_from_vel_and_accel(unittest.TestCase):
                 )
                 self.assertAlmostEqual(result, expected[i], places=7)
 
+    def test_solving_for_t_edge_cases(self) -> None:
+        """
+        Function tests solving for time when both roots are non-negative and
+        when the position is never reached.
+        """
+        # Braking from 10 m/s at -2 m/s² passes 16 m at t = 2 s and again at t = 8 s
+        result = Chapter3.Calculate.position_from_vel_and_accel(
+            x_0=0.0, v_0=10.0, accel=-2.0, x_f=16.0
+        )
+        self.assertAlmostEqual(result, 2.0, places=7)
+
+        # The same motion never gets past 25 m
+        with self.assertRaises(ValueError) as context:
+            Chapter3.Calculate.position_from_vel_and_accel(x_0=0.0, v_0=10.0, accel=-2.0, x_f=30.0)
+        self.assertEqual(str(context.exception), "No real solution for time")
+
+        # Moving away from a position behind the start never reaches it
+        with self.assertRaises(ValueError) as context:
+            Chapter3.Calculate.position_from_vel_and_accel(x_0=0.0, v_0=10.0, accel=0.0, x_f=-5.0)
+        self.assertEqual(str(context.exception), "No positive time solution")
+
     def test_solving_for_accel(self) -> None:
         """
         Tests solving for acceleration (accel)
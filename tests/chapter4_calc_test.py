@@ -58,15 +58,14 @@ class TestTimeoOfFlight(unittest.TestCase):
         """
 
         # initial conditions
-        v_0: List[float] = [0.0, 10.0, 56.41]
-        t: List[float] = [0.0, -10.0, 20.0]
+        v_0: List[float] = [0.0, 10.0, 56.41, 20.0]
+        t: List[float] = [0.0, -10.0, 20.0, 2.0]
 
-        #TO DO: DOUBLE CHECK WHY SOLUTIONS TO THE ANGLE ARE COMPLEX AND SOLVE FOR EXPECTED VALUES TO COMPLETE TESTING
-
-        expected: List[ValueError] = [
-            ValueError("Cannot solve for theta with this equation. Yields complex numbers. \n Please input a value for theta."),
-            ValueError("Cannot solve for theta with this equation. Yields complex numbers. \n Please input a value for theta."),
-            ValueError("Cannot solve for theta with this equation. Yields complex numbers. \n Please input a value for theta.")]
+        expected: List[Any] = [
+            ValueError("Division by zero is undefined."),
+            ValueError("Time cannot be a negative value"),
+            ValueError("No real solution exists. Time too long for given velocity."),
+            29.41]
 
         for i in range(len(expected)):
             if isinstance(expected[i], ValueError):
@@ -83,6 +82,17 @@ class TestTimeoOfFlight(unittest.TestCase):
                     )
                 self.assertAlmostEqual(result, expected[i], places=2)
 
+    def test_theta_round_trip(self) -> None:
+        """
+        Tests the launch angle is solved back from a computed time of flight
+        """
+
+        t = Chapter4.Calculate.time_of_flight(v_0=25.0, theta=35.0)
+
+        result = Chapter4.Calculate.time_of_flight(v_0=25.0, t=t)
+
+        self.assertAlmostEqual(result, 35.0, places=8)
+
 class TestTrajectory(unittest.TestCase):
     """
     Tests the trajectory calculation method
@@ -124,14 +134,16 @@ class TestTrajectory(unittest.TestCase):
         """
 
         # Initial conditions
-        theta: List[float] = [0.0, 45.0, 30.0]
-        x: List[float] = [0.0, -10.0, 50]
-        y: List[float] = [0.0, 20, 30]
+        theta: List[float] = [0.0, 45.0, 30.0, 45.0]
+        x: List[float] = [0.0, -10.0, 50, 10.0]
+        y: List[float] = [0.0, 20, 30, 5.0]
 
+        # At 30 degrees the path only reaches y = 50 tan(30) = 28.9 m at x = 50 m
         expected: List[Any] = [
             ValueError("Division by zero is undefined"),
             ValueError("Radicand cannot be negative. Outputs imaginary number."),
-            4.626]
+            ValueError("Radicand cannot be negative. Outputs imaginary number."),
+            14.01]
 
         for i in range(len(expected)):
             if isinstance(expected[i], ValueError):
@@ -150,6 +162,17 @@ class TestTrajectory(unittest.TestCase):
                     )
                 self.assertAlmostEqual(result, expected[i], places=2)
 
+    def test_v_0_round_trip(self) -> None:
+        """
+        Test solves v_0 back from a height computed with it
+        """
+
+        y = Chapter4.Calculate.trajectory(theta=40.0, v_0=18.0, x=12.0)
+
+        result = Chapter4.Calculate.trajectory(theta=40.0, x=12.0, y=y)
+
+        self.assertAlmostEqual(result, 18.0, places=8)
+
     def test_solving_for_x(self) -> None:
         """
         Function tests solving for horizontal position (x)
@@ -362,8 +362,8 @@ class Testideal_ang_banked_curve(unittest.TestCase):
         expected: List[Any] = [
             ValueError("Division by zero is undefined."),
             ValueError("Reconsider if theta can physically be a negative value."),
-            7.59,
-            13.206,
+            20.0,
+            183.94,
         ]
 
         for i in range(len(expected)):
@@ -379,6 +379,17 @@ class Testideal_ang_banked_curve(unittest.TestCase):
                 )
                 self.assertAlmostEqual(result, expected[i], places=2)
 
+    def test_radius_round_trip(self) -> None:
+        """
+        Function tests that the radius reproduces the angle it was solved from.
+        """
+
+        theta = Chapter6.Calculate.ideal_ang_banked_curve(velocity=25.0, radius=80.0)
+
+        result = Chapter6.Calculate.ideal_ang_banked_curve(theta=theta, velocity=25.0)
+
+        self.assertAlmostEqual(result, 80.0, places=8)
+
 
 class Testdrag_force(unittest.TestCase):
     """
@@ -757,7 +768,8 @@ class Testterminal_velocity(unittest.TestCase):
         area: List[float] = [2.5, 2.5, 2.5]
         fluid_dens: List[float] = [1.225, 1.225, 70.0]
 
-        expected = [0.861, 1.216, 49.14]
+        # m = v_t^2 * C * A * rho / (2g)
+        expected = [65.68, 262.71, 3753.05]
 
         for i in range(len(expected)):
             if isinstance(expected[i], ValueError):
@@ -777,3 +789,15 @@ class Testterminal_velocity(unittest.TestCase):
                     fluid_dens=fluid_dens[i],
                 )
                 self.assertAlmostEqual(result, expected[i], places=2)
+
+    def test_round_trip(self) -> None:
+        """
+        Function tests that each variable reproduces the terminal velocity it was solved from.
+        """
+
+        values = {"mass": 80.0, "drag_coeff": 1.0, "area": 0.7, "fluid_dens": 1.2}
+        values["terminal_vel"] = Chapter6.Calculate.terminal_velocity(**values)
+
+        for var in ("mass", "drag_coeff", "area", "fluid_dens"):
+            knowns = {name: value for name, value in values.items() if name != var}
+            self.assertAlmostEqual(Chapter6.Calculate.terminal_velocity(**knowns), values[var], places=8)
@@ -321,7 +321,7 @@ class TestWorkBySpring(unittest.TestCase):
         spring_const: List[float] = [10.0,1000.0]
         final_xpos: List[float] = [0.0, -10.0]
 
-        expected: List[Any] = [100.0, 100.2]
+        expected: List[Any] = [10.0, 10.01]
 
         for i in range(len(expected)):
             result = Chapter7.Calculate.work_by_spring(
@@ -341,15 +341,41 @@ class TestWorkBySpring(unittest.TestCase):
         spring_const: List[float] = [10.0, 1000.0]
         initial_xpos: List[float] = [0.0, -10.0]
 
-        expected: List[Any] = [-100.0, 99.8]
+        # Stretching from rest takes work, so 500 J done by the spring has no real solution
+        expected: List[Any] = [
+            ValueError("Negative radicand produces an imaginary number. Check your signs."),
+            9.99,
+        ]
 
         for i in range(len(expected)):
-            result = Chapter7.Calculate.work_by_spring(
-                work=work[i],
-                spring_const=spring_const[i],
-                initial_xpos=initial_xpos[i]
-            )
-            self.assertAlmostEqual(result, expected[i], places=2) 
+            if isinstance(expected[i], ValueError):
+                with self.assertRaises(ValueError) as context:
+                    Chapter7.Calculate.work_by_spring(
+                        work=work[i],
+                        spring_const=spring_const[i],
+                        initial_xpos=initial_xpos[i]
+                    )
+                self.assertEqual(str(context.exception), str(expected[i]))
+            else:
+                result = Chapter7.Calculate.work_by_spring(
+                    work=work[i],
+                    spring_const=spring_const[i],
+                    initial_xpos=initial_xpos[i]
+                )
+                self.assertAlmostEqual(result, expected[i], places=2)
+
+    def test_position_round_trip(self) -> None:
+        """
+        Function tests that each position reproduces the work it was solved from.
+        """
+
+        work = Chapter7.Calculate.work_by_spring(spring_const=40.0, initial_xpos=0.5, final_xpos=0.2)
+
+        initial_xpos = Chapter7.Calculate.work_by_spring(work=work, spring_const=40.0, final_xpos=0.2)
+        final_xpos = Chapter7.Calculate.work_by_spring(work=work, spring_const=40.0, initial_xpos=0.5)
+
+        self.assertAlmostEqual(initial_xpos, 0.5, places=8)
+        self.assertAlmostEqual(final_xpos, 0.2, places=8)
 
 class TestKineticEnergy(unittest.TestCase):
     """
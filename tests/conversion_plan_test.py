@@ -0,0 +1,85 @@
+import unittest
+from array import array
+
+import numpy as np
+
+from physics_TUI.conversion_plan import convert_expression, plan_conversion
+from physics_TUI.unit_parser import convert
+
+
+class TestConversionPlan(unittest.TestCase):
+    """
+    Tests planning and applying conversions between derived units.
+    """
+
+    def test_derived_units(self) -> None:
+        """
+        Function tests conversions whose units belong to no single quantity table.
+        """
+        self.assertAlmostEqual(plan_conversion("J/s", "hp").apply(745.69987158227022), 1.0, places=12)
+        self.assertAlmostEqual(plan_conversion("psi·in^2", "lbf").factor, 1.0, places=12)
+        self.assertAlmostEqual(plan_conversion("kW·h", "J").factor, 3.6E+6)
+
+    def test_matches_unit_parser(self) -> None:
+        """
+        Function tests that plans convert exactly as the unit parser does.
+        """
+        for source, target in (("J/s", "hp"), ("km/h", "m/s"), ("psi", "Pa"), ("N·m", "ft·lbf")):
+            self.assertEqual(plan_conversion(source, target).apply(2.5), convert(2.5, source, target))
+
+    def test_path(self) -> None:
+        """
+        Function tests the plan runs through the SI base units of its dimension.
+        """
+        plan = plan_conversion("J/s", "hp")
+        self.assertEqual(plan.path, ("J/s", "kg·m²·s⁻³", "hp"))
+        self.assertEqual(str(plan), "J/s → kg·m²·s⁻³ → hp")
+
+    def test_plans_are_cached(self) -> None:
+        """
+        Function tests the same pair of expressions reuses one plan.
+        """
+        self.assertIs(plan_conversion("N·m", "ft·lbf"), plan_conversion("N·m", "ft·lbf"))
+
+    def test_apply_many(self) -> None:
+        """
+        Function tests converting arrays and buffers in place.
+        """
+        plan = plan_conversion("km/h", "m/s")
+        values = np.array([36.0, 72.0])
+        self.assertIs(plan.apply_many(values), values)
+        np.testing.assert_allclose(values, [10.0, 20.0])
+
+        buffer = array("d", [3.6])
+        plan.apply_many(memoryview(buffer))
+        self.assertAlmostEqual(buffer[0], 1.0)
+
+    def test_expressions(self) -> None:
+        """
+        Function tests parsing a value, its unit and the target unit from text.
+        """
+        value, plan = convert_expression("500 J/s to hp")
+        self.assertAlmostEqual(value, 0.670511, places=6)
+        self.assertEqual(plan.target, "hp")
+
+        value, _ = convert_expression("2 in in cm")
+        self.assertAlmostEqual(value, 5.08)
+        value, _ = convert_expression("1 km -> m")
+        self.assertAlmostEqual(value, 1000.0)
+
+    def test_errors(self) -> None:
+        """
+        Function tests mismatched dimensions and malformed expressions are rejected.
+        """
+        with self.assertRaises(ValueError):
+            convert_expression("3 N to J")
+        with self.assertRaises(ValueError):
+            convert_expression("500 J/s")
+        with self.assertRaises(ValueError):
+            convert_expression("500 to hp")
+        with self.assertRaises(ValueError):
+            plan_conversion("J/s", "furlong")
+
+
+if __name__ == "__main__":
+    unittest.main()
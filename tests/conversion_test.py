@@ -1,8 +1,14 @@
+import copy
 import unittest
+from array import array
+from decimal import Decimal
+from fractions import Fraction
 from typing import List
 from unittest.case import TestCase
 
-from physics_TUI.unit_converter import Length
+import numpy as np
+
+from physics_TUI.unit_converter import Length, Mass, Speed, Temperature, catalog
 
 
 class TestLengthUnitConversion(unittest.TestCase):
@@ -119,3 +125,183 @@ class TestLengthUnitConversion(unittest.TestCase):
                 to_unit=to_unit[i]
             )
             self.assertAlmostEqual(result, expected[i], places=2)
+
+
+class TestBulkConversion(unittest.TestCase):
+    """
+    Tests the factor matrices and the in place convert_many method
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up the quantities for testing
+        """
+        self.length_converter = Length()
+        self.speed_converter = Speed()
+
+    def test_factor_matrix_matches_scalar_conversion(self) -> None:
+        """
+        Function tests that every factor agrees with the scalar conversion
+        """
+
+        for quantity in (self.length_converter, self.speed_converter):
+            for from_unit in quantity.get_units():
+                for to_unit in quantity.get_units():
+                    self.assertAlmostEqual(
+                        quantity.factor(from_unit, to_unit),
+                        quantity.conversion(1.0, from_unit, to_unit),
+                        delta=1e-12 * quantity.conversion(1.0, from_unit, to_unit),
+                    )
+
+    def test_convert_many_numpy_in_place(self) -> None:
+        """
+        Function tests converting a NumPy array in place
+        """
+
+        values = np.array([1.0, 30.0, 1000.0, 1500.0])
+        result = self.length_converter.convert_many(values, "meter", "kilometer")
+
+        self.assertIs(result, values)
+        np.testing.assert_allclose(values, [0.001, 0.03, 1.0, 1.5])
+
+    def test_convert_many_array_buffer(self) -> None:
+        """
+        Function tests converting array('d') and array('f') buffers in place
+        """
+
+        doubles = array("d", [1.0, 2.0])
+        singles = array("f", [1.0, 2.0])
+
+        self.speed_converter.convert_many(doubles, "km/s", "m/s")
+        self.speed_converter.convert_many(singles, "km/s", "m/s")
+
+        self.assertEqual(list(doubles), [1000.0, 2000.0])
+        self.assertEqual(list(singles), [1000.0, 2000.0])
+
+    def test_convert_to_all(self) -> None:
+        """
+        Function tests converting one value to every unit of a quantity
+        """
+
+        values = self.length_converter.convert_to_all(2.0, "kilometer")
+        units = list(self.length_converter.get_units())
+
+        self.assertEqual(len(values), len(units))
+        self.assertAlmostEqual(values[units.index("meter")], 2000.0)
+        self.assertAlmostEqual(values[units.index("mile")], 2.0 / 1.609344, places=6)
+
+    def test_convert_many_errors(self) -> None:
+        """
+        Function tests the errors for unknown units and non-float buffers
+        """
+
+        with self.assertRaises(KeyError):
+            self.length_converter.convert_many(np.ones(2), "meter", "parsec")
+        with self.assertRaises(TypeError):
+            self.length_converter.convert_many(np.arange(3), "meter", "foot")
+        with self.assertRaises(TypeError):
+            self.length_converter.convert_many(array("i", [1]), "meter", "foot")
+        with self.assertRaises(TypeError):
+            self.length_converter.convert_many([1.0, 2.0], "meter", "foot")
+
+
+class TestSharedCatalog(unittest.TestCase):
+    """
+    Tests that quantities are built once and shared as immutable objects
+    """
+
+    def test_quantities_are_shared(self) -> None:
+        """
+        Function tests that constructing a quantity again returns the same object
+        """
+
+        self.assertIs(Length(), Length())
+        self.assertIs(copy.deepcopy(Length()), Length())
+        self.assertIn(Speed(), catalog())
+
+    def test_quantities_are_immutable(self) -> None:
+        """
+        Function tests that quantities and their units cannot be changed
+        """
+
+        length = Length()
+
+        with self.assertRaises(AttributeError):
+            length.name = "Distance"
+        with self.assertRaises(TypeError):
+            length.units["meter"] = 2.0
+        self.assertFalse(hasattr(length, "__dict__"))
+        self.assertEqual(length.factors[length.unit_index["foot"]], 0.3048)
+
+
+class TestExactConversion(unittest.TestCase):
+    """
+    Tests conversions with rational arithmetic
+    """
+
+    def test_exact_definitions(self) -> None:
+        """
+        Function tests the exact values of the inch, pound and speed units
+        """
+
+        self.assertEqual(Length().conversion(1, "inch", "meter", exact=True), Fraction(254, 10000))
+        self.assertEqual(
+            Mass().conversion(Decimal("1"), "pound", "kilogram", exact=True), Fraction("0.45359237")
+        )
+        self.assertEqual(Speed().conversion(36, "km/h", "m/s", exact=True), 10)
+        self.assertEqual(Speed().conversion(1, "mi/h", "m/s", exact=True), Fraction("0.44704"))
+
+    def test_no_float_error(self) -> None:
+        """
+        Function tests that exact conversions do not accumulate float error
+        """
+
+        length = Length()
+        value = length.conversion(0.1, "foot", "inch", exact=True)
+        self.assertEqual(value, Fraction(6, 5))
+        self.assertEqual(length.conversion(value, "inch", "foot", exact=True), Fraction(1, 10))
+        self.assertIs(length.exact_factor("foot", "inch"), length.exact_factor("foot", "inch"))
+
+
+class TestTemperatureConversion(unittest.TestCase):
+    """
+    Tests the affine conversions between temperature units
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up the Temperature instance for testing
+        """
+        self.temperature_converter = Temperature()
+
+    def test_scalar_conversions(self) -> None:
+        """
+        Function tests converting fixed points between temperature scales
+        """
+
+        cases = [
+            (100.0, "celsius", "fahrenheit", 212.0),
+            (-40.0, "fahrenheit", "celsius", -40.0),
+            (0.0, "celsius", "kelvin", 273.15),
+            (0.0, "kelvin", "rankine", 0.0),
+            (98.6, "fahrenheit", "celsius", 37.0),
+        ]
+        for scalar, from_unit, to_unit, expected in cases:
+            result = self.temperature_converter.conversion(scalar, from_unit, to_unit)
+            self.assertAlmostEqual(result, expected, places=10)
+
+    def test_bulk_and_exact_conversions(self) -> None:
+        """
+        Function tests that bulk and exact conversions apply the offset too
+        """
+
+        values = np.array([0.0, 100.0, -40.0])
+        self.temperature_converter.convert_many(values, "celsius", "fahrenheit")
+        np.testing.assert_allclose(values, [32.0, 212.0, -40.0])
+
+        row = self.temperature_converter.convert_to_all(20.0, "celsius")
+        np.testing.assert_allclose(row, [293.15, 20.0, 68.0, 527.67])
+
+        self.assertEqual(
+            self.temperature_converter.conversion(98.6, "fahrenheit", "celsius", exact=True), 37
+        )
@@ -0,0 +1,70 @@
+import unittest
+
+import numpy as np
+
+from physics_TUI.chapters.chapter3 import Chapter3
+from physics_TUI.grid import free_fall_grid, linear_grid
+
+
+class TestFreeFallGrid(unittest.TestCase):
+    """
+    Tests evaluating the free-fall equations over a grid of times or heights.
+    """
+
+    def test_time_grid_matches_calculate(self) -> None:
+        """
+        Function tests every row of a time grid agrees with the scalar calculation.
+        """
+        grid = free_fall_grid(100.0, 5.0, "time", 0.0, 4.0, 9)
+
+        self.assertEqual(grid.columns, ("t (s)", "y (m)", "v (m/s)"))
+        self.assertTrue(grid.valid.all())
+        for t, y, v in grid.values:
+            self.assertAlmostEqual(
+                y, Chapter3.Calculate.height_of_free_fall(y_0=100.0, v_0=5.0, t=t), places=4
+            )
+            self.assertAlmostEqual(v, 5.0 - 9.82 * t)
+
+    def test_height_grid(self) -> None:
+        """
+        Function tests a height grid gives the first time each height is reached,
+        with the velocity signed by the direction of travel.
+        """
+        grid = free_fall_grid(0.0, 9.82, "height", 0.0, 4.0, 5)
+
+        t, v = grid.values[:, 1], grid.values[:, 2]
+        np.testing.assert_allclose(v, np.sqrt(9.82**2 - 2 * 9.82 * grid.values[:, 0]))
+        self.assertEqual(t[0], 0.0)
+        self.assertTrue(np.all(np.diff(t) > 0))
+
+        falling = free_fall_grid(100.0, 0.0, "height", 100.0, 0.0, 11)
+        self.assertTrue(np.all(falling.values[1:, 2] < 0))
+
+    def test_unreachable_rows(self) -> None:
+        """
+        Function tests rows that cannot be solved are flagged without failing the grid.
+        """
+        grid = free_fall_grid(100.0, 0.0, "height", 90.0, 110.0, 3)
+
+        np.testing.assert_array_equal(grid.valid, [True, True, False])
+        self.assertEqual(grid.error(2), "No real solution for time")
+        self.assertEqual(grid.error(0), "")
+        self.assertTrue(np.isnan(grid.values[2, 1:]).all())
+        self.assertEqual(grid.values[2, 0], 110.0)
+
+        negative = free_fall_grid(100.0, 0.0, "time", -1.0, 1.0, 3)
+        self.assertEqual(negative.error(0), "Time cannot be a negative value")
+
+    def test_invalid_grids(self) -> None:
+        """
+        Function tests unknown axes and out-of-range step counts are rejected.
+        """
+        with self.assertRaises(ValueError):
+            free_fall_grid(0.0, 0.0, "velocity")
+        with self.assertRaises(ValueError):
+            linear_grid(0.0, 1.0, 1)
+        self.assertEqual(len(free_fall_grid(10.0, 0.0, steps=10_000)), 10_000)
+
+
+if __name__ == "__main__":
+    unittest.main()
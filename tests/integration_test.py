@@ -0,0 +1,121 @@
+import io
+import unittest
+
+import numpy as np
+
+from physics_TUI.integration import (
+    CumulativeIntegrator,
+    MotionIntegrator,
+    cumulative_integral,
+    integrate_csv,
+    integrate_motion,
+)
+
+
+class TestIntegration(unittest.TestCase):
+    """
+    Tests cumulative integration of sampled acceleration into velocity and position.
+    """
+
+    def setUp(self) -> None:
+        self.t = np.cumsum(np.random.default_rng(3).uniform(0.01, 0.03, 500))
+
+    def test_exact_polynomials(self) -> None:
+        """
+        Function tests the trapezoid rule is exact for lines and Simpson's rule for parabolas.
+        """
+        t = self.t
+        np.testing.assert_allclose(
+            cumulative_integral(2 * t, t, method="trapezoid"), t**2 - t[0] ** 2, atol=1e-12
+        )
+        np.testing.assert_allclose(
+            cumulative_integral(3 * t**2, t, method="simpson"), t**3 - t[0] ** 3, atol=1e-10
+        )
+
+    def test_constant_acceleration(self) -> None:
+        """
+        Function tests v = v₀ + at and x = x₀ + v₀t + (1/2)at² are recovered.
+        """
+        t = np.linspace(0.0, 10.0, 101)
+        for method in ("trapezoid", "simpson"):
+            v, x = integrate_motion(-9.82, t, v_0=5.0, x_0=2.0, method=method)
+            np.testing.assert_allclose(v, 5.0 - 9.82 * t, atol=1e-10)
+            np.testing.assert_allclose(x, 2.0 + 5.0 * t - 0.5 * 9.82 * t * t, atol=1e-9)
+
+    def test_function_of_time(self) -> None:
+        """
+        Function tests integrating an acceleration given as a function of time.
+        """
+        t = self.t
+        v, x = integrate_motion(np.cos, t, v_0=np.sin(t[0]), x_0=-np.cos(t[0]))
+        np.testing.assert_allclose(v, np.sin(t), atol=1e-8)
+        np.testing.assert_allclose(x, -np.cos(t), atol=1e-7)
+
+    def test_streaming_matches_whole_series(self) -> None:
+        """
+        Function tests the result does not depend on how the samples are split into blocks.
+        """
+        t, a = self.t, np.sin(3 * self.t)
+        for method in ("trapezoid", "simpson"):
+            v, x = integrate_motion(a, t, v_0=1.0, method=method)
+            integrator = MotionIntegrator(v_0=1.0, method=method)
+            blocks, start = [], 0
+            for size in (1, 1, 0, 2, 7, 120, 500):
+                blocks.append(integrator.push(t[start : start + size], a[start : start + size]))
+                start += size
+            blocks.append(integrator.finish())
+
+            times, velocities, positions = (np.concatenate(column) for column in zip(*blocks))
+            np.testing.assert_array_equal(times, t)
+            np.testing.assert_allclose(velocities, v, atol=1e-12)
+            np.testing.assert_allclose(positions, x, atol=1e-12)
+
+    def test_short_series(self) -> None:
+        """
+        Function tests series of one and two samples.
+        """
+        np.testing.assert_array_equal(cumulative_integral([3.0], [0.0], initial=5.0), [5.0])
+        np.testing.assert_array_equal(cumulative_integral([1.0, 2.0], [0.0, 1.0]), [0.0, 1.5])
+
+    def test_errors(self) -> None:
+        """
+        Function tests times that do not increase and unknown methods are rejected.
+        """
+        with self.assertRaises(ValueError):
+            cumulative_integral([1.0, 2.0, 3.0], [0.0, 1.0, 1.0])
+        integrator = CumulativeIntegrator()
+        integrator.push([0.0, 1.0, 2.0], [0.0, 0.0, 0.0])
+        with self.assertRaises(ValueError):
+            integrator.push([1.5], [0.0])
+        with self.assertRaises(ValueError):
+            CumulativeIntegrator(method="euler")
+
+    def test_csv(self) -> None:
+        """
+        Function tests integrating a CSV column, keeping the other columns of each row.
+        """
+        source = io.StringIO("t,a,note\n0,2,a\n1,2,\n2,2,b\n3,2,c\n")
+        sink = io.StringIO()
+
+        stats = integrate_csv(source, sink, "t", "a", v_0=1.0, chunk_size=2)
+
+        self.assertEqual(stats.rows, 4)
+        self.assertEqual(
+            sink.getvalue().splitlines(),
+            ["t,a,note,v,x", "0,2,a,1.0,0.0", "1,2,,3.0,2.0", "2,2,b,5.0,6.0", "3,2,c,7.0,12.0"],
+        )
+
+    def test_csv_errors(self) -> None:
+        """
+        Function tests missing columns and non-numeric samples are rejected.
+        """
+        with self.assertRaises(ValueError) as context:
+            integrate_csv(io.StringIO("t,b\n0,1\n"), io.StringIO(), "t", "a")
+        self.assertEqual(str(context.exception), "Missing columns: a")
+
+        with self.assertRaises(ValueError):
+            integrate_csv(io.StringIO("t,a\n0,1\n1,x\n"), io.StringIO(), "t", "a")
+
+
+if __name__ == "__main__":
+    unittest.main()
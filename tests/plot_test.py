@@ -0,0 +1,86 @@
+import unittest
+
+import numpy as np
+
+from physics_TUI.plot import PLOT_CACHE, braille_raster, plot_trajectory
+
+
+class TestBrailleRaster(unittest.TestCase):
+    """
+    Tests drawing curves with braille dots.
+    """
+
+    def test_dots(self) -> None:
+        """
+        Function tests single points land on the right dot of the right cell.
+        """
+        lines, size = braille_raster([([0.0], [0.0]), ([3.0], [7.0])], 2, 2)
+
+        # The bounds span exactly the 4 by 8 dots, so one dot per unit
+        self.assertEqual(size, 1.0)
+        self.assertEqual(lines, ("⠀⠈", "⡀⠀"))
+
+        lines, _ = braille_raster([([0.0, 3.0], [0.0, 0.0])], 2, 1)
+        self.assertEqual(lines, ("⣀⣀",))
+
+    def test_equal_scales(self) -> None:
+        """
+        Function tests a square stays square on a wide canvas.
+        """
+        x = [0.0, 1.0, 1.0, 0.0, 0.0]
+        y = [0.0, 0.0, 1.0, 1.0, 0.0]
+        lines, size = braille_raster([(x, y)], 20, 2)
+
+        self.assertAlmostEqual(size, 1.0 / 7)
+        self.assertEqual([line.rstrip("⠀") for line in lines], ["⡏⠉⠉⢹", "⣇⣀⣀⣸"])
+
+    def test_errors(self) -> None:
+        """
+        Function tests an empty canvas or curve is rejected.
+        """
+        with self.assertRaises(ValueError):
+            braille_raster([([0.0], [0.0])], 0, 4)
+        with self.assertRaises(ValueError):
+            braille_raster([([], [])], 4, 4)
+
+
+class TestPlotTrajectory(unittest.TestCase):
+    """
+    Tests plotting projectile paths.
+    """
+
+    def test_plot(self) -> None:
+        """
+        Function tests the plot fits the canvas and reports the flight.
+        """
+        plot = plot_trajectory(45.0, 20.0, 0.0, 60, 15)
+
+        self.assertEqual(len(plot.lines), 15)
+        self.assertTrue(all(len(line) == 60 for line in plot.lines))
+        self.assertAlmostEqual(plot.range, 400.0 / 9.82)
+        self.assertAlmostEqual(plot.apex, 100.0 / 9.82)
+        self.assertAlmostEqual(plot.metres_per_dot, plot.range / 119)
+
+        # Launch and landing are on the ground, in the bottom row
+        self.assertNotEqual(plot.lines[-1][0], "⠀")
+        self.assertNotEqual(plot.lines[-1][-1], "⠀")
+
+    def test_cache(self) -> None:
+        """
+        Function tests plots are reused for the same launch and size only.
+        """
+        PLOT_CACHE.clear()
+        PLOT_CACHE.reset_stats()
+
+        first = plot_trajectory(30.0, 15.0, 2.0, 40, 10)
+        self.assertIs(plot_trajectory(30, 15, 2, 40, 10), first)
+        self.assertIsNot(plot_trajectory(30.0, 15.0, 2.0, 41, 10), first)
+        self.assertEqual((PLOT_CACHE.stats().hits, PLOT_CACHE.stats().misses), (1, 2))
+
+        with self.assertRaises(ValueError):
+            plot_trajectory(80.0, 1.0, -10.0, 40, 10)
+        self.assertEqual(len(PLOT_CACHE), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
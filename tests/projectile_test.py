@@ -0,0 +1,172 @@
+import unittest
+
+import numpy as np
+
+from physics_TUI.chapters.chapter4 import Chapter4, g
+from physics_TUI.projectile import best_launch_angle, flight, projectile_sweep, trajectory_path
+
+
+class TestProjectileSweep(unittest.TestCase):
+    """
+    Tests sweeping projectile launches over grids of angle, speed and height.
+    """
+
+    def test_matches_calculate(self) -> None:
+        """
+        Function tests a sweep from the ground agrees with the Chapter 4 point solvers.
+        """
+        theta = np.array([15.0, 30.0, 45.0, 60.0, 75.0])
+        v_0 = np.array([5.0, 20.0, 42.0])
+
+        sweep = projectile_sweep(theta, v_0)
+
+        self.assertEqual(sweep.range.shape, (5, 3))
+        for i, angle in enumerate(theta):
+            for j, speed in enumerate(v_0):
+                self.assertAlmostEqual(
+                    sweep.range[i, j], Chapter4.Calculate.projectile_range(v_0=speed, theta=angle)
+                )
+                self.assertAlmostEqual(
+                    sweep.flight_time[i, j], Chapter4.Calculate.time_of_flight(v_0=speed, theta=angle)
+                )
+                v_y = speed * np.sin(np.radians(angle))
+                self.assertAlmostEqual(sweep.apex[i, j], v_y * v_y / (2 * g))
+
+    def test_launch_heights(self) -> None:
+        """
+        Function tests an array of heights adds a third axis and lengthens the flight.
+        """
+        sweep = projectile_sweep(np.linspace(-30.0, 90.0, 13), np.linspace(1.0, 30.0, 7), [0.0, 5.0, 20.0])
+
+        self.assertEqual(sweep.range.shape, (13, 7, 3))
+        self.assertTrue(sweep.valid[:, :, 1:].all())
+        self.assertTrue(np.all(np.diff(sweep.flight_time[:, :, 1:], axis=2) > 0))
+
+        # Landing from 20 m when dropped horizontally takes √(2h/g)
+        _, time, apex = flight(0.0, 10.0, 20.0)
+        self.assertAlmostEqual(float(time), np.sqrt(40.0 / g))
+        self.assertEqual(float(apex), 20.0)
+
+    def test_never_lands(self) -> None:
+        """
+        Function tests launches that never come down to height zero are NaN.
+        """
+        sweep = projectile_sweep([80.0, 90.0], [5.0], -10.0)
+        self.assertFalse(sweep.valid.any())
+        self.assertTrue(np.isnan(sweep.range).all())
+
+
+class TestBestLaunchAngle(unittest.TestCase):
+    """
+    Tests the launch angle of longest range under constraints.
+    """
+
+    def brute_force(self, v_0: float, height: float, allowed) -> float:
+        theta = np.linspace(-90.0, 90.0, 180_001)
+        sweep = projectile_sweep(theta, [v_0], height)
+        ok = allowed(sweep) & sweep.valid[:, 0]
+        return float(np.nanmax(sweep.range[ok, 0]))
+
+    def test_unconstrained(self) -> None:
+        """
+        Function tests 45° from the ground and a flatter angle from a height.
+        """
+        best = best_launch_angle([10.0, 20.0], 0.0)
+        np.testing.assert_allclose(best.theta, [45.0, 45.0])
+        np.testing.assert_allclose(best.range, np.array([100.0, 400.0]) / g)
+
+        best = best_launch_angle(20.0, 10.0)
+        self.assertLess(float(best.theta), 45.0)
+        self.assertAlmostEqual(float(best.range), self.brute_force(20.0, 10.0, lambda s: True), places=5)
+
+    def test_constraints(self) -> None:
+        """
+        Function tests the apex and flight time caps against a brute-force sweep.
+        """
+        best = best_launch_angle(20.0, 10.0, max_apex=15.0)
+        self.assertAlmostEqual(float(best.apex), 15.0)
+        self.assertAlmostEqual(
+            float(best.range), self.brute_force(20.0, 10.0, lambda s: s.apex[:, 0] <= 15.0), places=3
+        )
+
+        best = best_launch_angle(20.0, 0.0, max_flight_time=1.0, min_angle=-90.0)
+        self.assertAlmostEqual(float(best.flight_time), 1.0)
+        self.assertAlmostEqual(
+            float(best.range), self.brute_force(20.0, 0.0, lambda s: s.flight_time[:, 0] <= 1.0), places=3
+        )
+
+        best = best_launch_angle(20.0, 0.0, min_angle=50.0, max_angle=70.0)
+        self.assertEqual(float(best.theta), 50.0)
+
+    def test_infeasible(self) -> None:
+        """
+        Function tests launches no angle can satisfy are NaN, and bad limits are rejected.
+        """
+        best = best_launch_angle([20.0, 20.0], [10.0, 100.0], max_apex=12.0, max_flight_time=2.0)
+        np.testing.assert_array_equal(best.valid, [True, False])
+        self.assertTrue(np.isnan(best.range[1]))
+
+        with self.assertRaises(ValueError):
+            best_launch_angle(20.0, min_angle=60.0, max_angle=30.0)
+
+    def test_large_grids(self) -> None:
+        """
+        Function tests a million launches are solved in one call.
+        """
+        best = best_launch_angle(np.linspace(1.0, 100.0, 1_000_000), 2.0, max_apex=50.0)
+        self.assertEqual(best.theta.shape, (1_000_000,))
+        self.assertTrue(best.valid.all())
+        self.assertTrue(np.all(best.apex <= 50.0 + 1e-9))
+
+
+class TestTrajectoryPath(unittest.TestCase):
+    """
+    Tests sampling the path of one launch.
+    """
+
+    def test_path(self) -> None:
+        """
+        Function tests the path follows the trajectory equation from launch to landing.
+        """
+        path = trajectory_path(30.0, 20.0, 0.0, 101)
+
+        self.assertEqual(len(path.t), 101)
+        self.assertTrue(np.all(np.diff(path.t) > 0))
+        self.assertAlmostEqual(path.x[-1], Chapter4.Calculate.projectile_range(v_0=20.0, theta=30.0))
+        self.assertAlmostEqual(path.y[-1], 0.0)
+        for x, y in zip(path.x[1:-1:10], path.y[1:-1:10]):
+            self.assertAlmostEqual(y, Chapter4.Calculate.trajectory(theta=30.0, v_0=20.0, x=x), places=3)
+
+    def test_adaptive(self) -> None:
+        """
+        Function tests samples crowd at launch, apex and impact.
+        """
+        path = trajectory_path(60.0, 20.0, 5.0, 200)
+        steps = np.diff(path.t)
+        apex = int(np.argmax(path.y))
+
+        # The apex itself is sampled
+        self.assertAlmostEqual(path.t[apex], 20.0 * np.sin(np.radians(60.0)) / g)
+        middle = len(steps) // 2
+        for end in (0, apex - 1, apex, len(steps) - 1):
+            self.assertLess(steps[end], steps[(end + middle) % len(steps)] / 10)
+
+    def test_errors(self) -> None:
+        """
+        Function tests launches that never land, bad angles and too few samples are rejected.
+        """
+        with self.assertRaises(ValueError):
+            trajectory_path(45.0, 1.0, -10.0)
+        with self.assertRaises(ValueError):
+            trajectory_path(120.0, 10.0)
+        with self.assertRaises(ValueError):
+            trajectory_path(45.0, 10.0, samples=2)
+
+        # Dropped from rest, there is only a fall
+        path = trajectory_path(0.0, 0.0, 10.0, 50)
+        self.assertTrue(np.all(path.x == 0.0))
+        self.assertAlmostEqual(path.t[-1], np.sqrt(20.0 / g))
+
+
+if __name__ == "__main__":
+    unittest.main()
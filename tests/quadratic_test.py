@@ -0,0 +1,111 @@
+import unittest
+
+import numpy as np
+
+from physics_TUI.chapters.chapter3 import Chapter3
+from physics_TUI.chapters.chapter10 import Chapter10
+from physics_TUI.quadratic import earliest_time, quadratic_roots, scalar_roots
+
+
+class TestQuadraticRoots(unittest.TestCase):
+    """
+    Tests the shared quadratic root kernel.
+    """
+
+    def test_array_roots_and_mask(self) -> None:
+        """
+        Function tests both roots and the validity mask match the scalar kernel.
+        """
+        a = np.array([1.0, 1.0, 0.0, 0.0, 2.0])
+        b = np.array([-3.0, 0.0, 2.0, 0.0, 4.0])
+        c = np.array([2.0, 1.0, -4.0, 1.0, 2.0])
+
+        roots = quadratic_roots(a, b, c)
+
+        np.testing.assert_array_equal(roots.valid, [True, False, True, False, True])
+        for i in range(len(a)):
+            low, high = scalar_roots(a[i], b[i], c[i])
+            np.testing.assert_array_equal([roots.low[i], roots.high[i]], [low, high])
+        self.assertEqual((roots.low[4], roots.high[4]), (-1.0, -1.0))
+
+    def test_small_root_keeps_precision(self) -> None:
+        """
+        Function tests the root near zero is accurate when b² dwarfs 4ac.
+        """
+        roots = quadratic_roots(1.0, 1e8, np.array([1.0, 2.0]))
+        np.testing.assert_allclose(roots.high, [-1e-8, -2e-8], rtol=1e-12)
+
+    def test_broadcasting(self) -> None:
+        """
+        Function tests scalar coefficients broadcast against arrays.
+        """
+        c = -np.arange(1.0, 5.0) ** 2
+        roots = quadratic_roots(1.0, 0.0, c)
+        np.testing.assert_allclose(roots.high, np.arange(1.0, 5.0))
+        np.testing.assert_allclose(roots.low, -np.arange(1.0, 5.0))
+
+    def test_earliest_time(self) -> None:
+        """
+        Function tests the earliest non-negative root and its errors.
+        """
+        self.assertAlmostEqual(earliest_time(-1.0, 10.0, -16.0), 2.0)
+        self.assertAlmostEqual(earliest_time(1.0, 0.0, -4.0), 2.0)
+        with self.assertRaises(ValueError):
+            earliest_time(1.0, 0.0, 4.0)
+        with self.assertRaises(ValueError):
+            earliest_time(1.0, 3.0, 2.0)
+
+    def test_time_branches_match_calculate(self) -> None:
+        """
+        Function tests the bulk time solves of chapters 3 and 10 agree with Calculate,
+        including their errors.
+        """
+        v_0 = np.array([10.0, 10.0, 10.0, 0.0])
+        x_f = np.array([16.0, 30.0, -5.0, -8.0])
+        cases = (
+            (
+                Chapter3.Calculate.position_from_vel_and_accel,
+                Chapter3.Solvers.position_from_vel_and_accel,
+                {"x_0": 0.0, "v_0": v_0, "accel": -2.0, "x_f": x_f},
+            ),
+            (
+                Chapter10.Calculate.angular_displacement_const_accel,
+                Chapter10.Solvers.angular_displacement_const_accel,
+                {"theta_init": 0.0, "init_angular_vel": v_0, "const_angular_accel": -2.0, "theta_final": x_f},
+            ),
+        )
+
+        for calculate, solver, knowns in cases:
+            result = solver.array(**knowns)
+            for i in range(len(v_0)):
+                row = {name: float(np.broadcast_to(value, v_0.shape)[i]) for name, value in knowns.items()}
+                try:
+                    expected = calculate(**row)
+                except ValueError as e:
+                    self.assertEqual(result.message(result.status[i]), str(e))
+                else:
+                    self.assertAlmostEqual(result.values[i], expected, places=4)
+
+    def test_calculate_uses_earliest_time(self) -> None:
+        """
+        Function tests the scalar time solves of chapters 3 and 10 return the earliest root to 4 places.
+        """
+        # -t² + 10t - 7 = 0 has roots 5 ∓ √18, the earlier at t = 0.75736; the free
+        # fall is the same equation scaled by g/2 = 4.91
+        expected = round(earliest_time(-1.0, 10.0, -7.0), 4)
+
+        results = (
+            Chapter3.Calculate.position_from_vel_and_accel(x_0=0.0, v_0=10.0, accel=-2.0, x_f=7.0),
+            Chapter3.Calculate.height_of_free_fall(y_0=0.0, v_0=10.0 * 4.91, y_f=7.0 * 4.91),
+            Chapter10.Calculate.angular_displacement_const_accel(
+                theta_final=7.0, theta_init=0.0, init_angular_vel=10.0, const_angular_accel=-2.0
+            ),
+        )
+
+        self.assertEqual(expected, 0.7574)
+        for result in results:
+            self.assertEqual(result, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
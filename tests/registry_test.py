@@ -0,0 +1,111 @@
+import os
+import subprocess
+import sys
+import unittest
+
+from physics_TUI.chapters import MANIFEST, Chapter3, Chapter13, Chapter14
+from physics_TUI.registry import Registry, chapter_id, default_registry, slugify
+from physics_TUI.unit_converter import Length
+
+
+class TestRegistry(unittest.TestCase):
+    """
+    Tests the id-based registry of chapters, equations and quantities.
+    """
+
+    def test_stable_ids(self) -> None:
+        """
+        Function tests the ids assigned to chapters, equations and quantities.
+        """
+        registry = Registry([Chapter13()], [Length()])
+
+        chapter = registry.chapter("ch13")
+        equation = registry.equation("ch13.escape_velocity")
+
+        self.assertIsInstance(chapter, Chapter13)
+        self.assertEqual(equation.name, "Escape velocity")
+        self.assertEqual(equation.id, "ch13.escape_velocity")
+        self.assertIs(registry.chapter_of(equation), chapter)
+        self.assertEqual(registry.quantity("length").name, "Length")
+
+    def test_ids_are_unique(self) -> None:
+        """
+        Function tests that equations sharing a name get distinct ids.
+        """
+        registry = Registry([Chapter3()])
+        ids = [equation.id for equation in registry.chapter("ch3").equations]
+
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertIn("ch3.position_from_vel_and_accel", ids)
+        self.assertIs(
+            registry.equation("ch3.position_from_velocity_and_acceleration"),
+            registry.equation("ch3.position_from_vel_and_accel"),
+        )
+
+    def test_unknown_id(self) -> None:
+        """
+        Function tests that looking up a missing id raises KeyError.
+        """
+        registry = Registry([Chapter13()])
+
+        with self.assertRaises(KeyError):
+            registry.equation("ch13.warp_speed")
+
+    def test_default_registry(self) -> None:
+        """
+        Function tests that the default registry holds every chapter in order.
+        """
+        registry = default_registry()
+
+        self.assertIs(registry, default_registry())
+        self.assertEqual(list(registry.entries)[0], "ch3")
+        self.assertIsInstance(registry.chapter("ch14"), Chapter14)
+        self.assertEqual(len(registry.quantities), 8)
+
+    def test_lazy_loading(self) -> None:
+        """
+        Function tests that manifest chapters are only built when looked up.
+        """
+        registry = Registry(manifest=MANIFEST)
+
+        self.assertEqual(registry.chapters, {})
+        equation = registry.equation("ch13.escape_velocity")
+
+        self.assertEqual(equation.name, "Escape velocity")
+        self.assertEqual(list(registry.chapters), ["ch13"])
+        self.assertTrue(registry.is_loaded("ch13"))
+        self.assertFalse(registry.is_loaded("ch3"))
+
+    def test_app_import_loads_no_chapter(self) -> None:
+        """
+        Function tests that importing the app, in a fresh interpreter, loads no chapter or tool module.
+        """
+        modules = ("physics_TUI.chapters.chapter4", "physics_TUI.grid", "physics_TUI.plot")
+        loaded = subprocess.run(
+            [sys.executable, "-c", f"import sys, physics_TUI.app; print([m for m in {modules!r} if m in sys.modules])"],
+            env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)),
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+
+        self.assertEqual(loaded.strip(), "[]")
+
+    def test_manifest_matches_chapters(self) -> None:
+        """
+        Function tests that every manifest entry describes the chapter it loads.
+        """
+        for entry in MANIFEST:
+            chapter = entry.load()
+            self.assertEqual(chapter.title, entry.title)
+            self.assertEqual(chapter_id(chapter), entry.id)
+
+    def test_slugify(self) -> None:
+        """
+        Function tests turning names into ids.
+        """
+        self.assertEqual(slugify("Newton's law of gravitation"), "newtons_law_of_gravitation")
+        self.assertEqual(
+            slugify("Average velocity (constant acceleration)"),
+            "average_velocity_constant_acceleration",
+        )
@@ -0,0 +1,160 @@
+import unittest
+
+from physics_TUI.chapters.chapter3 import Chapter3
+from physics_TUI.chapters.chapter4 import Chapter4
+from physics_TUI.chapters.chapter7 import Chapter7
+from physics_TUI.result_cache import ResultCache
+
+
+class TestResultCache(unittest.TestCase):
+    """
+    Tests the bounded result cache.
+    """
+
+    def test_hits_and_misses(self) -> None:
+        """
+        Function tests that a repeated key is answered from the cache.
+        """
+        cache = ResultCache()
+        calls = []
+
+        def compute() -> float:
+            calls.append(1)
+            return 42.0
+
+        key = cache.key("eq", "x", {"a": 1.0})
+        self.assertEqual(cache.get_or_compute(key, compute), 42.0)
+        self.assertEqual(cache.get_or_compute(key, compute), 42.0)
+
+        stats = cache.stats()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual((stats.hits, stats.misses, stats.entries), (1, 1, 1))
+        self.assertEqual(stats.hit_rate, 0.5)
+
+    def test_canonical_key(self) -> None:
+        """
+        Function tests that equal inputs share a key regardless of order and type.
+        """
+        self.assertEqual(
+            ResultCache.key("eq", "x", {"a": 1, "b": -0.0}),
+            ResultCache.key("eq", "x", {"b": 0.0, "a": 1.0}),
+        )
+        self.assertNotEqual(
+            ResultCache.key("eq", "x", {"a": 1.0}), ResultCache.key("eq", "y", {"a": 1.0})
+        )
+
+    def test_uncacheable_key(self) -> None:
+        """
+        Function tests that missing, non-numeric and non-finite knowns have no key.
+        """
+        for value in (None, "fast", float("nan"), float("inf")):
+            self.assertIsNone(ResultCache.key("eq", "x", {"a": 1.0, "b": value}))
+
+    def test_entry_limit(self) -> None:
+        """
+        Function tests that the least recently used entry is evicted first.
+        """
+        cache = ResultCache(max_entries=2)
+        cache.put("a", 1.0)
+        cache.put("b", 2.0)
+        cache.get_or_compute("a", lambda: 0.0)
+        cache.put("c", 3.0)
+
+        self.assertEqual(cache.get_or_compute("a", lambda: 0.0), 1.0)
+        self.assertEqual(cache.get_or_compute("b", lambda: 0.0), 0.0)
+        self.assertEqual(cache.stats().evictions, 2)
+        self.assertEqual(len(cache), 2)
+
+    def test_memory_limit(self) -> None:
+        """
+        Function tests that the estimated size never exceeds the byte limit.
+        """
+        cache = ResultCache(max_bytes=2000)
+        for i in range(100):
+            cache.put(cache.key("eq", "x", {"a": float(i)}), float(i))
+
+        stats = cache.stats()
+        self.assertLessEqual(stats.bytes, 2000)
+        self.assertGreater(stats.evictions, 0)
+        self.assertEqual(stats.entries + stats.evictions, 100)
+
+    def test_errors_not_cached(self) -> None:
+        """
+        Function tests that failed computations are retried.
+        """
+        cache = ResultCache()
+
+        def fail() -> float:
+            raise ValueError("bad input")
+
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                cache.get_or_compute("k", fail)
+        self.assertEqual(cache.stats().misses, 2)
+        self.assertEqual(len(cache), 0)
+
+
+class TestEquationSolve(unittest.TestCase):
+    """
+    Tests solving equations through the result cache.
+    """
+
+    def test_solve_uses_cache(self) -> None:
+        """
+        Function tests that Equation.solve memoizes by equation and inputs.
+        """
+        cache = ResultCache()
+        equation = Chapter7().equations[3]
+
+        first = equation.solve("velocity", {"kinetic_E": 9.0, "mass": 2.0}, cache=cache)
+        second = equation.solve("velocity", {"mass": 2, "kinetic_E": 9}, cache=cache)
+
+        self.assertAlmostEqual(first, 3.0)
+        self.assertEqual(first, second)
+        self.assertEqual(cache.stats().hits, 1)
+
+    def test_solve_without_cache(self) -> None:
+        """
+        Function tests solving with caching turned off.
+        """
+        equation = Chapter7().equations[3]
+
+        self.assertAlmostEqual(
+            equation.solve("kinetic_E", {"mass": 2.0, "velocity": 3.0}, cache=None), 9.0
+        )
+        with self.assertRaises(ValueError):
+            equation.solve("kinetic_E", {"mass": -2.0, "velocity": 3.0}, cache=None)
+
+    def test_missing_known_not_cached(self) -> None:
+        """
+        Function tests that a None known is reported by the solver, not the cache key.
+        """
+        cache = ResultCache()
+        equation = next(
+            equation
+            for equation in Chapter3().equations
+            if equation.solver is Chapter3.Solvers.height_of_free_fall
+        )
+
+        with self.assertRaisesRegex(ValueError, "Missing values for: v_0"):
+            equation.solve("t", {"y_0": 10.0, "v_0": None, "y_f": 0.0}, cache=cache)
+        self.assertEqual(len(cache), 0)
+
+    def test_numeric_solve_independent_of_order(self) -> None:
+        """
+        Function tests that cached numeric roots do not depend on what was solved first.
+        """
+        equation = next(
+            equation
+            for equation in Chapter4().equations
+            if equation.solver is Chapter4.Solvers.trajectory
+        )
+        first = {"v_0": 20.0, "x": 20.0, "y": 5.0}
+        second = {"v_0": 20.0, "x": 2.0, "y": 10.0}
+
+        cache = ResultCache()
+        forward = [equation.solve("theta", knowns, cache=cache) for knowns in (first, second)]
+        cache = ResultCache()
+        backward = [equation.solve("theta", knowns, cache=cache) for knowns in (second, first)]
+
+        self.assertEqual(forward, backward[::-1])
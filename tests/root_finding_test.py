@@ -0,0 +1,119 @@
+import unittest
+
+from math import cos, cosh, inf, sqrt, tan
+
+import numpy as np
+
+from physics_TUI.root_finding import NoRootError, RootStats, find_root, find_roots
+
+
+class TestFindRoot(unittest.TestCase):
+    """
+    Tests the scalar root finder.
+    """
+
+    def test_polynomial(self) -> None:
+        """
+        Function tests a simple polynomial root from a nearby guess.
+        """
+        self.assertAlmostEqual(find_root(lambda x: x * x - 2.0, 1.0), sqrt(2.0), places=12)
+
+    def test_transcendental(self) -> None:
+        """
+        Function tests a root of cos(x) = x.
+        """
+        root = find_root(lambda x: cos(x) - x, 0.0)
+        self.assertAlmostEqual(root, cos(root), places=12)
+
+    def test_bounds(self) -> None:
+        """
+        Function tests that the root is searched for inside the bounds.
+        """
+        root = find_root(lambda x: x * x - 4.0, 1.0, lower=-inf, upper=0.0)
+        self.assertAlmostEqual(root, -2.0, places=12)
+
+    def test_smallest_root(self) -> None:
+        """
+        Function tests that a bounded search returns the smallest root whatever the guess.
+        """
+        for guess in (0.5, 2.9, 8.0):
+            root = find_root(lambda x: (x - 1.0) * (x - 3.0), guess, lower=0.0, upper=10.0)
+            self.assertAlmostEqual(root, 1.0, places=12)
+
+        root = find_root(lambda x: (x - 1.0) * (x - 3.0), 2.9, lower=0.0)
+        self.assertAlmostEqual(root, 1.0, places=12)
+
+    def test_outside_domain(self) -> None:
+        """
+        Function tests that points where f fails are skipped over.
+        """
+        root = find_root(lambda x: sqrt(x) - 3.0, -5.0)
+        self.assertAlmostEqual(root, 9.0, places=10)
+
+    def test_pole_is_not_a_root(self) -> None:
+        """
+        Function tests that a sign change across a pole is rejected.
+        """
+        with self.assertRaises(NoRootError):
+            find_root(lambda x: 1.0 / x, 1.0)
+
+        root = find_root(lambda x: tan(x) - 1.0, 1.4, lower=0.0, upper=1.5)
+        self.assertAlmostEqual(root, 0.7853981633974483, places=12)
+
+    def test_no_root(self) -> None:
+        """
+        Function tests that a function without a root raises NoRootError.
+        """
+        with self.assertRaises(NoRootError):
+            find_root(lambda x: cosh(x) + 1.0, 0.5)
+
+    def test_stats(self) -> None:
+        """
+        Function tests that solves, failures and evaluations are counted.
+        """
+        stats = RootStats()
+        find_root(lambda x: x * x - 2.0, 1.0, stats=stats)
+        with self.assertRaises(NoRootError):
+            find_root(lambda x: x * x + 2.0, 1.0, stats=stats)
+
+        self.assertEqual(stats.solves, 2)
+        self.assertEqual(stats.failures, 1)
+        self.assertGreater(stats.evaluations, 0)
+        self.assertGreater(stats.mean_latency, 0.0)
+
+        stats.reset()
+        self.assertEqual(stats, RootStats())
+
+
+class TestFindRoots(unittest.TestCase):
+    """
+    Tests the vectorized root finder.
+    """
+
+    def test_matches_scalar(self) -> None:
+        """
+        Function tests that every element matches the scalar solve.
+        """
+        targets = np.array([0.5, 2.0, 10.0, 1e4, -1.0])
+
+        roots, found = find_roots(lambda x, index: x * x * x - targets[index], len(targets), 1.0)
+
+        self.assertTrue(found.all())
+        for i, target in enumerate(targets):
+            expected = find_root(lambda x: x * x * x - target, 1.0)
+            self.assertAlmostEqual(roots[i], expected, delta=1e-9 * max(1.0, abs(expected)))
+
+    def test_unsolvable_elements(self) -> None:
+        """
+        Function tests that elements without a root or left inactive are NaN.
+        """
+        targets = np.array([4.0, -4.0, 9.0])
+        active = np.array([True, True, False])
+
+        roots, found = find_roots(
+            lambda x, index: x * x - targets[index], 3, 1.0, lower=0.0, active=active
+        )
+
+        self.assertEqual(found.tolist(), [True, False, False])
+        self.assertAlmostEqual(roots[0], 2.0, places=12)
+        self.assertTrue(np.isnan(roots[1:]).all())
@@ -0,0 +1,561 @@
+import unittest
+
+import numpy as np
+
+from math import atan, cos, degrees, log, pi, radians, sin, sqrt, tan
+from typing import Any, Callable, Dict, List, Tuple
+from physics_TUI.chapters import MANIFEST
+from physics_TUI.chapters.chapter3 import Chapter3
+from physics_TUI.chapters.chapter4 import Chapter4
+from physics_TUI.chapters.chapter5 import Chapter5
+from physics_TUI.chapters.chapter6 import Chapter6
+from physics_TUI.chapters.chapter7 import Chapter7
+from physics_TUI.chapters.chapter9 import Chapter9
+from physics_TUI.chapters.chapter10 import Chapter10
+from physics_TUI.chapters.chapter11 import Chapter11
+from physics_TUI.chapters.chapter12 import Chapter12
+from physics_TUI.chapters.chapter13 import Chapter13
+from physics_TUI.chapters.chapter14 import Chapter14
+from physics_TUI.base_chapter import Equation
+from physics_TUI.solver import ARRAY_MATH, SCALAR_MATH, Branch, Check, EquationSolver
+
+
+class TestArraySolving(unittest.TestCase):
+    """
+    Tests solving equations for whole arrays of inputs at once.
+    """
+
+    def test_array_matches_calculate(self) -> None:
+        """
+        Function tests that array results match the scalar Calculate methods.
+        """
+        x_0: List[float] = [0.0, 1.0, -2.5, 10.0]
+        v_0: List[float] = [1.0, 0.0, 3.0, -4.0]
+        t: List[float] = [0.0, 2.0, 1.5, 3.0]
+        accel: List[float] = [9.8, -9.8, 0.0, 2.0]
+
+        result = Chapter3.Solvers.position_from_vel_and_accel.array(
+            x_0=np.array(x_0), v_0=np.array(v_0), t=np.array(t), accel=np.array(accel)
+        )
+
+        self.assertEqual(result.unknown, "x_f")
+        self.assertTrue(result.valid.all())
+        for i in range(len(x_0)):
+            expected = Chapter3.Calculate.position_from_vel_and_accel(
+                x_0=x_0[i], v_0=v_0[i], t=t[i], accel=accel[i]
+            )
+            self.assertAlmostEqual(result.values[i], expected, places=4)
+
+    def test_scalars_broadcast(self) -> None:
+        """
+        Function tests that scalar arguments broadcast against arrays.
+        """
+        theta = np.linspace(0.0, 60.0, 7)
+
+        result = Chapter5.Solvers.normal_force.array(mass=10.0, theta=theta)
+
+        self.assertEqual(result.values.shape, theta.shape)
+        for i in range(len(theta)):
+            expected = Chapter5.Calculate.normal_force(mass=10.0, theta=float(theta[i]))
+            self.assertAlmostEqual(result.values[i], expected, places=6)
+
+    def test_invalid_elements_are_masked(self) -> None:
+        """
+        Function tests that invalid rows get a status instead of raising.
+        """
+        mass: List[float] = [2.0, -1.0, 4.0, 0.0]
+        velocity: List[float] = [3.0, 3.0, -1.0, 2.0]
+
+        expected: List[Any] = [
+            9.0,
+            ValueError("We are operating with massive objects. Mass must be greater than zero."),
+            ValueError("This is a scalar product. Velocity cannot be negative"),
+            ValueError("We are operating with massive objects. Mass must be greater than zero."),
+        ]
+
+        result = Chapter7.Solvers.kinetic_energy.array(
+            mass=np.array(mass), velocity=np.array(velocity)
+        )
+
+        for i in range(len(expected)):
+            if isinstance(expected[i], ValueError):
+                self.assertFalse(result.valid[i])
+                self.assertTrue(np.isnan(result.values[i]))
+                self.assertEqual(result.message(result.status[i]), str(expected[i]))
+            else:
+                self.assertTrue(result.valid[i])
+                self.assertAlmostEqual(result.values[i], expected[i], places=6)
+
+    def test_scalar_solve_raises_same_message(self) -> None:
+        """
+        Function tests that the scalar solve raises the message the array
+        solve reports for the same input.
+        """
+        solver = Chapter7.Solvers.kinetic_energy
+        array_result = solver.array(mass=np.array([-1.0]), velocity=3.0)
+
+        with self.assertRaises(ValueError) as context:
+            solver.solve("kinetic_E", {"mass": -1.0, "velocity": 3.0})
+
+        self.assertEqual(
+            str(context.exception), array_result.message(array_result.status[0])
+        )
+
+    def test_time_picks_first_nonnegative_root(self) -> None:
+        """
+        Function tests solving the free fall height for time element-wise.
+        """
+        y_0: List[float] = [10.0, 0.0, 0.0]
+        v_0: List[float] = [0.0, 10.0, 0.0]
+        y_f: List[float] = [0.0, 0.0, 10.0]
+
+        result = Chapter3.Solvers.height_of_free_fall.array(
+            y_0=np.array(y_0), v_0=np.array(v_0), y_f=np.array(y_f)
+        )
+
+        self.assertAlmostEqual(result.values[0], 1.4271, places=4)
+        self.assertAlmostEqual(result.values[1], 0.0, places=4)
+        self.assertEqual(result.message(result.status[2]), "No real solution for time")
+
+    def test_unsolvable_unknown(self) -> None:
+        """
+        Function tests that variables without a closed form are rejected.
+        """
+        with self.assertRaises(ValueError):
+            Chapter13.Solvers.conservation_of_grav_energy.array(
+                mass_body=5.97e24,
+                velocity_1=11e3,
+                velocity_2=0.0,
+                distance_1=6.37e6,
+                distance_2=1.0e7,
+            )
+
+    def test_exactly_one_unknown(self) -> None:
+        """
+        Function tests that exactly one variable must be left out.
+        """
+        with self.assertRaises(ValueError):
+            Chapter7.Solvers.kinetic_energy.array(mass=1.0)
+
+
+class TestRoots(unittest.TestCase):
+    """
+    Tests the scalar and array quadratic root kernels agree.
+    """
+
+    def test_roots(self) -> None:
+        """
+        Function tests ascending roots, linear fallback and complex roots.
+        """
+        a: List[float] = [1.0, 0.0, 1.0, 1.0, 1e-8]
+        b: List[float] = [-3.0, 2.0, 0.0, 0.0, 1.0]
+        c: List[float] = [2.0, -4.0, 1.0, 0.0, -1.0]
+
+        expected: List[Any] = [(1.0, 2.0), (2.0, 2.0), None, (0.0, 0.0), (-1e8 - 1.0, 1.0)]
+
+        low, high = ARRAY_MATH.roots(np.array(a), np.array(b), np.array(c))
+
+        for i in range(len(expected)):
+            scalar_low, scalar_high = SCALAR_MATH.roots(a[i], b[i], c[i])
+            if expected[i] is None:
+                self.assertTrue(np.isnan(low[i]) and np.isnan(scalar_low))
+                continue
+            self.assertTrue(np.isclose(low[i], expected[i][0], rtol=1e-9))
+            self.assertTrue(np.isclose(high[i], expected[i][1], rtol=1e-9))
+            self.assertEqual((low[i], high[i]), (scalar_low, scalar_high))
+
+
+class TestSolverFor(unittest.TestCase):
+    """
+    Tests the pre-bound per-unknown solvers on Equation.
+    """
+
+    def test_matches_solve(self) -> None:
+        """
+        Function tests that each pre-bound solver matches the generic solve.
+        """
+        equation = Chapter7().equations[3]
+        solver = equation.solver
+
+        for unknown, knowns in [
+            ("kinetic_E", {"mass": 2.0, "velocity": 3.0}),
+            ("mass", {"kinetic_E": 9.0, "velocity": 3.0}),
+            ("velocity", {"kinetic_E": 9.0, "mass": 2.0}),
+        ]:
+            self.assertAlmostEqual(
+                equation.solver_for(unknown)(**knowns), solver.solve(unknown, knowns)
+            )
+
+    def test_is_built_once(self) -> None:
+        """
+        Function tests that repeated lookups return the same callable.
+        """
+        equation = Chapter7().equations[3]
+
+        self.assertIs(equation.solver_for("mass"), equation.solver_for("mass"))
+
+    def test_is_built_on_first_use(self) -> None:
+        """
+        Function tests that registering an equation does not build its solvers.
+        """
+        solver = EquationSolver(
+            ("a", "b"), Branch("a", lambda xp, b: 2 * b), Branch("b", lambda xp, a: a / 2)
+        )
+        equation = Equation("Double", "a = 2b", {"a": "a", "b": "b"}, solver=solver)
+
+        self.assertEqual(solver._compiled, {})
+        self.assertEqual(equation.solver_for("b")(a=3.0), 1.5)
+        self.assertEqual(list(solver._compiled), ["b"])
+
+    def test_unsolvable_unknown(self) -> None:
+        """
+        Function tests that unknowns without a solver are rejected.
+        """
+        equation = Chapter7().equations[3]
+
+        with self.assertRaises(ValueError):
+            equation.solver_for("momentum")
+
+    def test_missing_known(self) -> None:
+        """
+        Function tests that a known left as None is reported by name.
+        """
+        equation = Chapter7().equations[3]
+
+        with self.assertRaises(ValueError) as context:
+            equation.solver_for("mass")(kinetic_E=9.0, velocity=None)
+
+        self.assertEqual(str(context.exception), "Missing values for: velocity")
+
+    def test_without_source(self) -> None:
+        """
+        Function tests that lambdas whose source cannot be read are called instead of inlined.
+        """
+        solver = EquationSolver(
+            ("a", "b"),
+            Branch("a", eval("lambda xp, b: xp.sqrt(b)")),
+            Branch("b", eval("lambda xp, a: a * a")),
+            checks=(Check(eval("lambda b: b < 0"), "Negative b"),),
+        )
+        solve = solver.compiled("a")
+
+        self.assertIn("_formula", solve.__code__.co_freevars)
+        self.assertEqual(solve(b=9.0), 3.0)
+        with self.assertRaisesRegex(ValueError, "Negative b"):
+            solve(b=-1.0)
+
+    def test_chapter_lambdas_are_inlined(self) -> None:
+        """
+        Function tests that every closed-form chapter solver evaluates its checks and formula without calls.
+        """
+        for entry in MANIFEST:
+            for equation in entry.load().get_calculable_equations():
+                if equation.solver is None:
+                    continue
+                for unknown in equation.solver.branches:
+                    with self.subTest(solver=equation.solver.qualname, unknown=unknown):
+                        names = equation.solver_for(unknown).__code__.co_freevars
+                        self.assertFalse([name for name in names if name.startswith(("_formula", "_check"))])
+
+
+class TestNumericInverse(unittest.TestCase):
+    """
+    Tests solving for variables that have no closed-form branch.
+    """
+
+    def test_trajectory_round_trip(self) -> None:
+        """
+        Function tests that theta and x are recovered from a forward solve.
+        """
+        solver = Chapter4.Solvers.trajectory
+        y = solver.solve("y", {"theta": 30.0, "v_0": 20.0, "x": 10.0})
+
+        theta = solver.solve("theta", {"v_0": 20.0, "x": 10.0, "y": y})
+        x = solver.solve("x", {"theta": 30.0, "v_0": 20.0, "y": y})
+
+        self.assertAlmostEqual(theta, 30.0, places=8)
+        self.assertAlmostEqual(x, 10.0, places=8)
+
+    def test_independent_of_history(self) -> None:
+        """
+        Function tests that the root does not depend on earlier solves and is the smallest one.
+        """
+        solver = Chapter4.Solvers.trajectory
+        first = {"v_0": 20.0, "x": 20.0, "y": 5.0}
+        second = {"v_0": 20.0, "x": 2.0, "y": 10.0}
+
+        forward = (solver.solve("theta", first), solver.solve("theta", second))
+        backward = (solver.solve("theta", second), solver.solve("theta", first))
+        ascending = solver.solve("x", {"theta": 45.0, "v_0": 20.0, "y": 5.0})
+        solver.solve("x", {"theta": 80.0, "v_0": 20.0, "y": 5.0})
+        again = solver.solve("x", {"theta": 45.0, "v_0": 20.0, "y": 5.0})
+
+        self.assertEqual(forward, backward[::-1])
+        self.assertAlmostEqual(forward[0], 30.0, places=2)
+        self.assertEqual(ascending, again)
+        self.assertAlmostEqual(ascending, 5.8362, places=4)
+
+    def test_array_matches_scalar(self) -> None:
+        """
+        Function tests that the array solve agrees with the scalar solve.
+        """
+        solver = Chapter4.Solvers.trajectory
+        x = np.array([5.0, 10.0, 20.0, 1e6])
+
+        result = solver.solve_array("theta", {"v_0": 20.0, "x": x, "y": 2.0})
+
+        self.assertEqual(result.valid.tolist(), [True, True, True, False])
+        for i in range(3):
+            expected = solver.solve("theta", {"v_0": 20.0, "x": x[i], "y": 2.0})
+            self.assertAlmostEqual(result.values[i], expected, places=8)
+
+    def test_no_solution(self) -> None:
+        """
+        Function tests that values with no solution raise ValueError.
+        """
+        solver = Chapter4.Solvers.trajectory
+
+        with self.assertRaises(ValueError) as context:
+            solver.solve("theta", {"v_0": 5.0, "x": 100.0, "y": 2.0})
+
+        self.assertEqual(str(context.exception), "No real solution for theta with these values.")
+
+    def test_stats(self) -> None:
+        """
+        Function tests that numeric solves are counted per unknown.
+        """
+        solver = Chapter4.Solvers.trajectory
+        solver.stats["x"].reset()
+
+        solver.solve("x", {"theta": 45.0, "v_0": 20.0, "y": 1.0})
+
+        self.assertEqual(solver.stats["x"].solves, 1)
+        self.assertGreater(solver.stats["x"].iterations, 0)
+
+
+# One consistent set of values per equation: the first variable is computed
+# from the others with the textbook formula, independently of the solvers.
+REFERENCE: List[Tuple[Any, str, Callable[..., float], Dict[str, float]]] = [
+    (Chapter3.Solvers.position_from_vel_and_accel, "x_f",
+     lambda x_0, v_0, t, accel: x_0 + v_0 * t + 0.5 * accel * t**2,
+     {"x_0": 2.0, "v_0": 3.0, "t": 4.0, "accel": 1.5}),
+    (Chapter3.Solvers.velocity_from_distance, "v_f",
+     lambda x_0, v_0, accel, x_f: sqrt(v_0**2 + 2 * accel * (x_f - x_0)),
+     {"x_0": 1.0, "v_0": 3.0, "accel": 2.0, "x_f": 5.0}),
+    (Chapter3.Solvers.height_of_free_fall, "y_f",
+     lambda y_0, v_0, t: y_0 + v_0 * t - 0.5 * 9.82 * t**2,
+     {"y_0": 10.0, "v_0": 5.0, "t": 0.3}),
+    (Chapter3.Solvers.vel_free_fall_from_height, "v_f",
+     lambda y_0, v_0, y_f: sqrt(v_0**2 - 2 * 9.82 * (y_f - y_0)),
+     {"y_0": 20.0, "v_0": 4.0, "y_f": 5.0}),
+    (Chapter4.Solvers.time_of_flight, "t",
+     lambda v_0, theta: 2 * v_0 * sin(radians(theta)) / 9.82,
+     {"v_0": 20.0, "theta": 35.0}),
+    (Chapter4.Solvers.trajectory, "y",
+     lambda theta, v_0, x: x * tan(radians(theta)) - 9.82 * x**2 / (2 * (v_0 * cos(radians(theta)))**2),
+     {"theta": 30.0, "v_0": 20.0, "x": 10.0}),
+    (Chapter4.Solvers.projectile_range, "r_total",
+     lambda v_0, theta: v_0**2 * sin(radians(2 * theta)) / 9.82,
+     {"v_0": 20.0, "theta": 30.0}),
+    (Chapter4.Solvers.centripetal_accel, "accel",
+     lambda velocity, radius: velocity**2 / radius,
+     {"velocity": 6.0, "radius": 3.0}),
+    (Chapter5.Solvers.normal_force, "normal_F",
+     lambda mass, theta: mass * 9.82 * cos(radians(theta)),
+     {"mass": 5.0, "theta": 20.0}),
+    (Chapter5.Solvers.hookes_law, "force",
+     lambda spring_const, displacement: -spring_const * displacement,
+     {"spring_const": 50.0, "displacement": 0.2}),
+    (Chapter6.Solvers.centripetal_force_tang_vel, "centripetal_F",
+     lambda mass, velocity, radius: mass * velocity**2 / radius,
+     {"mass": 2.0, "velocity": 3.0, "radius": 1.5}),
+    (Chapter6.Solvers.centripetal_force_ang_vel, "centripetal_F",
+     lambda mass, angular_vel, radius: mass * angular_vel**2 * radius,
+     {"mass": 2.0, "angular_vel": 3.0, "radius": 1.5}),
+    (Chapter6.Solvers.ideal_ang_banked_curve, "theta",
+     lambda velocity, radius: degrees(atan(velocity**2 / (radius * 9.82))),
+     {"velocity": 15.0, "radius": 50.0}),
+    (Chapter6.Solvers.drag_force, "drag_F",
+     lambda drag_coeff, fluid_dens, area, velocity: -0.5 * drag_coeff * fluid_dens * area * velocity**2,
+     {"drag_coeff": 0.5, "fluid_dens": 1.2, "area": 0.7, "velocity": 12.0}),
+    (Chapter6.Solvers.stokes_law, "drag_Fs",
+     lambda radius, viscosity, velocity: -6 * pi * radius * viscosity * velocity,
+     {"radius": 0.01, "viscosity": 1.5, "velocity": 0.2}),
+    (Chapter6.Solvers.terminal_velocity, "terminal_vel",
+     lambda mass, drag_coeff, area, fluid_dens: sqrt(2 * mass * 9.82 / (drag_coeff * fluid_dens * area)),
+     {"mass": 80.0, "drag_coeff": 1.0, "area": 0.7, "fluid_dens": 1.2}),
+    (Chapter7.Solvers.work_constant_force, "work",
+     lambda const_F, distance, theta: const_F * distance * cos(radians(theta)),
+     {"const_F": 10.0, "distance": 5.0, "theta": 30.0}),
+    (Chapter7.Solvers.work_by_gravity, "work",
+     lambda mass, initial_height, final_height: -mass * 9.82 * (final_height - initial_height),
+     {"mass": 3.0, "initial_height": 10.0, "final_height": 4.0}),
+    (Chapter7.Solvers.work_by_spring, "work",
+     lambda spring_const, initial_xpos, final_xpos: 0.5 * spring_const * (initial_xpos**2 - final_xpos**2),
+     {"spring_const": 40.0, "initial_xpos": 0.5, "final_xpos": 0.2}),
+    (Chapter7.Solvers.kinetic_energy, "kinetic_E",
+     lambda mass, velocity: 0.5 * mass * velocity**2,
+     {"mass": 4.0, "velocity": 3.0}),
+    (Chapter7.Solvers.kinetic_energy_momentum, "kinetic_E",
+     lambda mass, momentum: momentum**2 / (2 * mass),
+     {"mass": 4.0, "momentum": 12.0}),
+    (Chapter7.Solvers.work_energy_theorem, "net_work",
+     lambda mass, final_vel, initial_vel: 0.5 * mass * (final_vel**2 - initial_vel**2),
+     {"mass": 2.0, "final_vel": 5.0, "initial_vel": 3.0}),
+    (Chapter9.Solvers.inelastic_collision_momentum, "velocity_f",
+     lambda mass_1, mass_2, velocity_1, velocity_2, mass_f: (mass_1 * velocity_1 + mass_2 * velocity_2) / mass_f,
+     {"mass_1": 2.0, "mass_2": 3.0, "velocity_1": 4.0, "velocity_2": -1.0, "mass_f": 5.0}),
+    (Chapter9.Solvers.elastic_collision_momentum, "velocity_f2",
+     lambda mass_1, mass_2, velocity_i1, velocity_i2, velocity_f1:
+         (mass_1 * velocity_i1 + mass_2 * velocity_i2 - mass_1 * velocity_f1) / mass_2,
+     {"mass_1": 2.0, "mass_2": 3.0, "velocity_i1": 4.0, "velocity_i2": -1.0, "velocity_f1": -2.0}),
+    (Chapter9.Solvers.rocket_equation, "delta_v",
+     lambda vel_exhaust, initial_mass, final_mass: vel_exhaust * log(initial_mass / final_mass),
+     {"vel_exhaust": 2500.0, "initial_mass": 1000.0, "final_mass": 400.0}),
+    (Chapter10.Solvers.angular_position, "theta",
+     lambda arc_length, radius: arc_length / radius,
+     {"arc_length": 3.0, "radius": 2.0}),
+    (Chapter10.Solvers.tangential_speed, "tang_speed",
+     lambda radius, angular_vel: radius * angular_vel,
+     {"radius": 2.0, "angular_vel": 3.0}),
+    (Chapter10.Solvers.average_angular_vel, "ave_angular_vel",
+     lambda init_angular_vel, final_angular_vel: (init_angular_vel + final_angular_vel) / 2,
+     {"init_angular_vel": 2.0, "final_angular_vel": 6.0}),
+    (Chapter10.Solvers.angular_displacement, "theta_final",
+     lambda theta_init, ave_angular_vel, time: theta_init + ave_angular_vel * time,
+     {"theta_init": 1.0, "ave_angular_vel": 2.0, "time": 3.0}),
+    (Chapter10.Solvers.angular_vel_const_accel, "final_angular_vel",
+     lambda init_angular_vel, const_angular_accel, time: init_angular_vel + const_angular_accel * time,
+     {"init_angular_vel": 2.0, "const_angular_accel": 1.5, "time": 4.0}),
+    (Chapter10.Solvers.angular_displacement_const_accel, "theta_final",
+     lambda theta_init, init_angular_vel, time, const_angular_accel:
+         theta_init + init_angular_vel * time + 0.5 * const_angular_accel * time**2,
+     {"theta_init": 1.0, "init_angular_vel": 2.0, "time": 3.0, "const_angular_accel": 0.5}),
+    (Chapter10.Solvers.change_angular_velocity, "final_angular_vel",
+     lambda init_angular_vel, const_angular_accel, delta_theta:
+         sqrt(init_angular_vel**2 + 2 * const_angular_accel * delta_theta),
+     {"init_angular_vel": 2.0, "const_angular_accel": 1.5, "delta_theta": 4.0}),
+    (Chapter10.Solvers.rotational_ke, "kinetic_energy",
+     lambda moment_inertia, angular_vel: 0.5 * moment_inertia * angular_vel**2,
+     {"moment_inertia": 2.0, "angular_vel": 3.0}),
+    (Chapter10.Solvers.magnitude_of_torque, "torque",
+     lambda radius, force, theta: radius * force * sin(radians(theta)),
+     {"radius": 0.5, "force": 20.0, "theta": 60.0}),
+    (Chapter11.Solvers.accel_without_slipping, "accel",
+     lambda mass, moment_inertia, radius, theta:
+         mass * 9.82 * sin(radians(theta)) / (mass + moment_inertia / radius**2),
+     {"mass": 2.0, "moment_inertia": 0.04, "radius": 0.2, "theta": 30.0}),
+    (Chapter11.Solvers.ang_momentum_rigid_body, "angular_momentum",
+     lambda moment_inertia, angular_vel: moment_inertia * angular_vel,
+     {"moment_inertia": 2.0, "angular_vel": 3.0}),
+    (Chapter11.Solvers.processional_ang_vel, "processional_ang_vel",
+     lambda radius, mass, moment_inertia, angular_vel: radius * mass * 9.82 / (moment_inertia * angular_vel),
+     {"radius": 0.1, "mass": 0.5, "moment_inertia": 0.002, "angular_vel": 100.0}),
+    (Chapter12.Solvers.young_modulus, "young_mod",
+     lambda force, cross_section, init_length, delta_length: force * init_length / (cross_section * delta_length),
+     {"force": 1000.0, "cross_section": 0.001, "init_length": 2.0, "delta_length": 0.001}),
+    (Chapter12.Solvers.bulk_modulus, "bulk_mod",
+     lambda delta_pressure, init_volume, delta_volume: -delta_pressure * init_volume / delta_volume,
+     {"delta_pressure": 1e5, "init_volume": 2.0, "delta_volume": -0.001}),
+    (Chapter12.Solvers.shear_modulus, "shear_mod",
+     lambda force, cross_section, init_length, delta_layers: force * init_length / (cross_section * delta_layers),
+     {"force": 1000.0, "cross_section": 0.01, "init_length": 0.5, "delta_layers": 0.002}),
+    (Chapter13.Solvers.law_of_gravitation, "force_12",
+     lambda mass_1, mass_2, distance: 6.674e-11 * mass_1 * mass_2 / distance**2,
+     {"mass_1": 5.97e24, "mass_2": 7.35e22, "distance": 3.84e8}),
+    (Chapter13.Solvers.gravitational_acceleration, "g",
+     lambda mass_body, distance: 6.674e-11 * mass_body / distance**2,
+     {"mass_body": 5.97e24, "distance": 6.37e6}),
+    (Chapter13.Solvers.gravitational_potential, "potential_energy",
+     lambda mass_body, mass_object, distance: -6.674e-11 * mass_body * mass_object / distance,
+     {"mass_body": 5.97e24, "mass_object": 1000.0, "distance": 7e6}),
+    (Chapter13.Solvers.conservation_of_grav_energy, "velocity_2",
+     lambda mass_object, mass_body, velocity_1, distance_1, distance_2:
+         sqrt(velocity_1**2 + 2 * 6.674e-11 * mass_body * (1 / distance_2 - 1 / distance_1)),
+     {"mass_object": 1000.0, "mass_body": 5.97e24, "velocity_1": 8000.0, "distance_1": 7e6, "distance_2": 8e6}),
+    (Chapter13.Solvers.escape_velocity, "escape_vel",
+     lambda mass_body, radius: sqrt(2 * 6.674e-11 * mass_body / radius),
+     {"mass_body": 5.97e24, "radius": 6.37e6}),
+    (Chapter13.Solvers.orbital_velocity, "orbital_vel",
+     lambda mass_body, distance: sqrt(6.674e-11 * mass_body / distance),
+     {"mass_body": 5.97e24, "distance": 7e6}),
+    (Chapter13.Solvers.orbital_period, "period",
+     lambda distance, mass_body: 2 * pi * sqrt(distance**3 / (6.674e-11 * mass_body)),
+     {"distance": 7e6, "mass_body": 5.97e24}),
+    (Chapter13.Solvers.orbital_equation, "semi_latus_rectum",
+     lambda eccentricity, distance, theta: distance * (1 + eccentricity * cos(radians(theta))),
+     {"eccentricity": 0.2, "distance": 7e6, "theta": 60.0}),
+    (Chapter13.Solvers.keplers_third_law, "period",
+     lambda semi_major_axis, mass_body: 2 * pi * sqrt(semi_major_axis**3 / (6.674e-11 * mass_body)),
+     {"semi_major_axis": 1.5e11, "mass_body": 1.99e30}),
+    (Chapter13.Solvers.schwarzschild_radius, "schwarz_radius",
+     lambda mass_body: 2 * 6.674e-11 * mass_body / 2.998e8**2,
+     {"mass_body": 1.99e30}),
+    (Chapter14.Solvers.hydrostatic_pressure, "pressure",
+     lambda pressure_atm, density, depth: pressure_atm + density * 9.82 * depth,
+     {"pressure_atm": 101325.0, "density": 1000.0, "depth": 10.0}),
+    (Chapter14.Solvers.pascals_principle, "force_2",
+     lambda force_1, area_1, area_2: force_1 * area_2 / area_1,
+     {"force_1": 100.0, "area_1": 0.01, "area_2": 0.5}),
+    (Chapter14.Solvers.continuity_const_density, "velocity_2",
+     lambda area_1, velocity_1, area_2: area_1 * velocity_1 / area_2,
+     {"area_1": 0.02, "velocity_1": 3.0, "area_2": 0.01}),
+    (Chapter14.Solvers.continuity_const_general, "velocity_2",
+     lambda density_1, area_1, velocity_1, density_2, area_2: density_1 * area_1 * velocity_1 / (density_2 * area_2),
+     {"density_1": 1.2, "area_1": 0.02, "velocity_1": 3.0, "density_2": 1.5, "area_2": 0.01}),
+    (Chapter14.Solvers.bernoullis_equation, "pressure_2",
+     lambda density, pressure_1, velocity_1, height_1, velocity_2, height_2:
+         pressure_1 + 0.5 * density * (velocity_1**2 - velocity_2**2) + density * 9.82 * (height_1 - height_2),
+     {"density": 1000.0, "pressure_1": 2e5, "velocity_1": 2.0, "height_1": 5.0, "velocity_2": 4.0, "height_2": 1.0}),
+    (Chapter14.Solvers.viscocity, "viscocity",
+     lambda force, distance, area, velocity: force * distance / (area * velocity),
+     {"force": 2.0, "distance": 0.01, "area": 0.5, "velocity": 0.4}),
+    (Chapter14.Solvers.poiseuilles_law_resistance, "resistance",
+     lambda viscocity, length, radius: 8 * viscocity * length / (pi * radius**4),
+     {"viscocity": 0.001, "length": 2.0, "radius": 0.01}),
+    (Chapter14.Solvers.poiseuilles_law, "flow",
+     lambda viscocity, length, radius, pressure_1, pressure_2:
+         (pressure_1 - pressure_2) * pi * radius**4 / (8 * viscocity * length),
+     {"viscocity": 0.001, "length": 2.0, "radius": 0.01, "pressure_1": 2000.0, "pressure_2": 1000.0}),
+]
+
+
+class TestEveryEquation(unittest.TestCase):
+    """
+    Tests every solver against values computed with the reference formulas.
+    """
+
+    def test_covers_every_equation(self) -> None:
+        """
+        Function tests that every equation with a calculation has a reference entry.
+        """
+        solvers = [solver for solver, _, _, _ in REFERENCE]
+
+        for entry in MANIFEST:
+            for equation in entry.load().get_calculable_equations():
+                self.assertIn(equation.solver, solvers, equation.name)
+
+    def test_calculation_matches_solver(self) -> None:
+        """
+        Function tests that every equation is wired to the calculation and solver of the same name.
+        """
+        for entry in MANIFEST:
+            for equation in entry.load().get_calculable_equations():
+                if equation.solver is not None:
+                    self.assertEqual(
+                        equation.calculation.__name__, equation.solver.qualname.rsplit(".", 1)[-1], equation.name
+                    )
+
+    def test_matches_reference(self) -> None:
+        """
+        Function tests that each solver recovers every variable of the reference values.
+        """
+        for solver, forward, reference, knowns in REFERENCE:
+            values = dict(knowns, **{forward: reference(**knowns)})
+            for unknown in sorted(solver.unknowns):
+                with self.subTest(solver=solver.qualname, unknown=unknown):
+                    expected = values[unknown]
+                    others = {name: value for name, value in values.items() if name != unknown}
+                    self.assertAlmostEqual(
+                        solver.solve(unknown, others), expected, delta=1e-6 * max(1.0, abs(expected))
+                    )
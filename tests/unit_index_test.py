@@ -0,0 +1,52 @@
+import unittest
+
+from physics_TUI.unit_index import UnitIndex, default_unit_index
+
+
+class TestUnitIndex(unittest.TestCase):
+    """
+    Tests finding units across every quantity by name, symbol and prefix.
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up the index of the shipped units
+        """
+        self.index = default_unit_index()
+
+    def test_resolve(self) -> None:
+        """
+        Function tests exact lookups of names and symbols, with case folding.
+        """
+        match = self.index.resolve("mi/h")
+        self.assertEqual((match.quantity_id, match.unit), ("speed", "mi/h"))
+        match = self.index.resolve("PSI")
+        self.assertEqual((match.quantity_id, match.unit), ("pressure", "psi"))
+        self.assertEqual(self.index.resolve("lbf").unit, "pound-force")
+        self.assertIsNone(self.index.resolve("parsec"))
+
+    def test_case_ambiguity(self) -> None:
+        """
+        Function tests that symbols differing only in case stay distinct.
+        """
+        self.assertEqual(self.index.resolve("mN").unit, "millinewton")
+        self.assertEqual(self.index.resolve("MN").unit, "meganewton")
+        self.assertIsNone(self.index.resolve("mn"))
+
+    def test_prefix_and_fuzzy_search(self) -> None:
+        """
+        Function tests prefix matches and the fallback to close spellings.
+        """
+        self.assertEqual([match.key for match in self.index.prefix("kilom")], ["kilometer"])
+        self.assertEqual(self.index.search("metre")[0].unit, "meter")
+        self.assertEqual(self.index.search("xyzzy"), [])
+
+    def test_large_catalog(self) -> None:
+        """
+        Function tests lookups in an index of thousands of units.
+        """
+        index = UnitIndex((f"unit{i:05d}", "q", f"u{i}") for i in range(5000))
+
+        self.assertEqual(len(index), 5000)
+        self.assertEqual(index.resolve("UNIT04321").unit, "u4321")
+        self.assertEqual(len(index.prefix("unit01", limit=1000)), 1000)
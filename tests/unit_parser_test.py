@@ -0,0 +1,83 @@
+import unittest
+
+from physics_TUI.chapters.chapter3 import Chapter3
+from physics_TUI.unit_parser import convert, description_unit, format_dimension, parse_unit, parse_value
+
+
+class TestUnitParser(unittest.TestCase):
+    """
+    Tests parsing compound unit expressions into a scale and a dimension.
+    """
+
+    def test_dimensions(self) -> None:
+        """
+        Function tests the dimension products, quotients and powers reduce to.
+        """
+        cases = {
+            "N·m": "kg·m²·s⁻²",
+            "kg/m³": "kg·m⁻³",
+            "m/s^2": "m·s⁻²",
+            "kg m2 s-2": "kg·m²·s⁻²",
+            "kg/(m·s**2)": "kg·m⁻¹·s⁻²",
+            "1/s": "s⁻¹",
+            "J/J": "1",
+        }
+        for expression, expected in cases.items():
+            self.assertEqual(format_dimension(parse_unit(expression).dimension), expected, expression)
+
+    def test_conversions(self) -> None:
+        """
+        Function tests converting between compound units of the same dimension.
+        """
+        self.assertAlmostEqual(convert(1.0, "ft·lbf", "J"), 0.3048 * 4.4482216152605)
+        self.assertAlmostEqual(convert(36.0, "km/h", "m/s"), 10.0)
+        self.assertAlmostEqual(convert(1.0, "g/cm³", "kg/m³"), 1000.0)
+        self.assertAlmostEqual(convert(1.0, "lbf/in^2", "psi"), 1.0, places=4)
+        self.assertAlmostEqual(convert(2.0, "kilometers", "meter"), 2000.0)
+
+    def test_errors(self) -> None:
+        """
+        Function tests unknown units, malformed expressions and mismatched dimensions.
+        """
+        for expression in ("parsec", "m^", "(m", "2m", "m//s"):
+            with self.assertRaises(ValueError):
+                parse_unit(expression)
+        with self.assertRaises(ValueError):
+            convert(1.0, "N", "J")
+
+    def test_parse_cache(self) -> None:
+        """
+        Function tests that a repeated expression is served from the cache.
+        """
+        first = parse_unit("kg·m/s²")
+        hits = parse_unit.cache_info().hits
+
+        self.assertIs(parse_unit("kg·m/s²"), first)
+        self.assertEqual(parse_unit.cache_info().hits, hits + 1)
+
+    def test_values_with_units(self) -> None:
+        """
+        Function tests converting typed values to the unit of a variable description.
+        """
+        velocity = description_unit("Initial velocity (m/s)")
+        angle = description_unit("Launch angle (degrees)")
+
+        self.assertEqual(parse_value("12", velocity), 12.0)
+        self.assertAlmostEqual(parse_value("36 km/h", velocity), 10.0)
+        self.assertAlmostEqual(parse_value("-1.5e3 mm/s", velocity), -1.5)
+        self.assertAlmostEqual(parse_value("1 rad", angle), 57.29577951308232)
+        self.assertIsNone(description_unit("Gravitational constant (constant)"))
+
+        for text, unit in (("2 ft", velocity), ("abc", velocity), ("3 parsec", velocity), ("2 m", None)):
+            with self.assertRaises(ValueError):
+                parse_value(text, unit)
+
+    def test_free_fall_heights(self) -> None:
+        """
+        Function tests that both heights of a free fall are entered in metres.
+        """
+        equation = next(eq for eq in Chapter3().equations if eq.name == "Height of free fall")
+
+        for var in ("y₀", "y"):
+            self.assertEqual(description_unit(equation.variables[var]), parse_unit("m"))
+        self.assertAlmostEqual(parse_value("250 cm", description_unit(equation.variables["y"])), 2.5)